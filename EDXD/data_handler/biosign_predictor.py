@@ -0,0 +1,85 @@
+"""
+biosign_predictor.py – biosign prediction off the GUI thread
+
+The GUI submits a request on every refresh; it is a no-op while the model revision did not
+change. A request carries shallow copies of the bodies and a copy of the topology the model
+keeps, so estimating never holds Model.lock, never blocks the journal controller and never
+re-derives the parent tree. Only the newest request is kept: one that is still waiting when a
+newer snapshot arrives is dropped. Finished predictions are stored in the model and handed to
+the listeners on this thread - GUI listeners wrap themselves in wx.CallAfter.
+"""
+import inspect
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from EDXD.data_handler.helper.biosign_estimator import estimate_system_biosigns
+from EDXD.data_handler.helper.pausable_thread import PausableThread
+from EDXD.data_handler.model import Model, PredictionRequest
+from EDXD.globals import logging, log_context
+
+
+class BiosignPredictor(PausableThread, threading.Thread):
+    def __init__(self, model: Model, poll: float = 0.5):
+        super().__init__()
+        self.name       = "BiosignPredictor"
+        self.model      = model
+        self.poll       = poll
+        self.submitted  = 0     # requests queued
+        self.dropped    = 0     # requests superseded before they were estimated
+        self.estimated  = 0     # requests estimated
+        self._cond      : threading.Condition                           = threading.Condition()
+        self._pending   : Optional[PredictionRequest]                   = None
+        self._last_key  : Optional[Tuple[Optional[int], int]]           = None  # (system_addr, revision) last queued
+        self._memo      : Dict[str, tuple]                              = {}    # body_id -> (signature, predictions)
+        self._memo_addr : Optional[int]                                 = None
+        self._result_cbs: List[Callable[[Dict[str, List[dict]]], None]] = []
+
+    # ----- listeners ---------------------------------------------------------
+    def register_listener(self, cb):
+        """cb(predictions: {body_id: [prediction, ...]}) → None, called on the predictor thread"""
+        self._result_cbs.append(cb)
+
+    # ----- requests ----------------------------------------------------------
+    def submit(self, force: bool = False) -> bool:
+        """Queue the current state of the model; False if it did not change since the last request."""
+        with self.model.lock:
+            key = (self.model.system_addr, self.model.revision)
+        if key == self._last_key and not force:
+            return False
+
+        request = self.model.snapshot_prediction_request()
+        with self._cond:
+            if self._pending is not None:
+                self.dropped += 1
+            self._pending = request
+            self._last_key = (request.system_addr, request.revision)
+            self.submitted += 1
+            self._cond.notify()
+        return True
+
+    def _process_data(self):
+        with self._cond:
+            if self._pending is None:
+                self._cond.wait(self.poll)
+            request, self._pending = self._pending, None
+        if request is None:
+            return
+
+        try:
+            predictions = self._estimate(request)
+        except Exception as e:
+            log_context(level=logging.ERROR, frame=inspect.currentframe(), e=e)
+            return
+        self.estimated += 1
+        if not self.model.store_biosign_predictions(request, predictions):
+            return
+        for cb in self._result_cbs:
+            cb(predictions)
+
+    def _estimate(self, request: PredictionRequest) -> Dict[str, List[dict]]:
+        if request.system_addr != self._memo_addr:
+            self._memo.clear()
+            self._memo_addr = request.system_addr
+        if not request.bodies:
+            return {}
+        return estimate_system_biosigns(request.bodies, memo=self._memo, topology=request.topology)
@@ -1,52 +1,57 @@
+"""
+bio_helper.py – species catalogue: genus, codex key, base value and clonal range
 
-def bio_get_range(genus_name: str) -> int:
-    if genus_name in ["$Codex_Ent_Fumerolas_Genus_Name;"]:
-        return 100
+The tables below are the source; at import they are folded into one immutable catalogue
+(SPECIES / GENERA) plus a prefix index, so every lookup below is a single dict access.
+Raw codex ids of organic scans are mapped to their genus key by normalize_genus.
+"""
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+
+FALLBACK_RANGE = 10000
+
+# ---------------------------------------------------------------------------
+# Genus table (Codex Key -> Localised Genus, Clonal Colony Range in m)
+# ---------------------------------------------------------------------------
+GENUS_TABLE = {
+    "$Codex_Ent_Fumerolas_Genus_Name;":     ("Fumerola",            100),
 
-    if genus_name in ["$Codex_Ent_Aleoids_Genus_Name;",
-                      "$Codex_Ent_Clypeus_Genus_Name;",
-                      "$Codex_Ent_Conchas_Genus_Name;",
-                      "$Codex_Ent_Shrubs_Genus_Name;",
-                      "$Codex_Ent_Recepta_Genus_Name;"]:
-        return 150
+    "$Codex_Ent_Aleoids_Genus_Name;":       ("Aleoida",             150),
+    "$Codex_Ent_Clypeus_Genus_Name;":       ("Clypeus",             150),
+    "$Codex_Ent_Conchas_Genus_Name;":       ("Concha",              150),
+    "$Codex_Ent_Shrubs_Genus_Name;":        ("Frutexa",             150),
+    "$Codex_Ent_Recepta_Genus_Name;":       ("Recepta",             150),
 
-    if genus_name in ["$Codex_Ent_Tussocks_Genus_Name;"]:
-        return 200
+    "$Codex_Ent_Tussocks_Genus_Name;":      ("Tussock",             200),
 
-    if genus_name in ["$Codex_Ent_Cactoid_Genus_Name;",
-                      "$Codex_Ent_Fungoids_Genus_Name;"]:
-        return 300
+    "$Codex_Ent_Cactoid_Genus_Name;":       ("Cactoida",            300),
+    "$Codex_Ent_Fungoids_Genus_Name;":      ("Fungoida",            300),
 
-    if genus_name in ["$Codex_Ent_Bacterial_Genus_Name;",
-                      "$Codex_Ent_Fonticulus_Genus_Name;",
-                      "$Codex_Ent_Stratum_Genus_Name;"]:
-        return 500
+    "$Codex_Ent_Bacterial_Genus_Name;":     ("Bacterium",           500),
+    "$Codex_Ent_Fonticulus_Genus_Name;":    ("Fonticulua",          500),
+    "$Codex_Ent_Stratum_Genus_Name;":       ("Stratum",             500),
 
-    if genus_name in ["$Codex_Ent_Osseus_Genus_Name;",
-                      "$Codex_Ent_Tubus_Genus_Name;"]:
-        return 800
+    "$Codex_Ent_Osseus_Genus_Name;":        ("Osseus",              800),
+    "$Codex_Ent_Tubus_Genus_Name;":         ("Tubus",               800),
 
-    if genus_name in ["$Codex_Ent_Electricae_Genus_Name;"]:
-        return 1000
+    "$Codex_Ent_Electricae_Genus_Name;":    ("Electricae",          1000),
 
     # From Horizons
-    if genus_name in ["$Codex_Ent_Vents_Name;",
-                      "$Codex_Ent_Sphere_Name;",
-                      "$Codex_Ent_Cone_Name;",
-                      "$Codex_Ent_Brancae_Name;",
-                      "$Codex_Ent_Ground_Struct_Ice_Name;",
-                      "$Codex_Ent_Tube_Name;"]:
-        return 100
+    "$Codex_Ent_Vents_Name;":               ("Amphora Plant",       100),
+    "$Codex_Ent_Sphere_Name;":              ("Anemone",             100),
+    "$Codex_Ent_Cone_Name;":                ("Bark Mound",          100),
+    "$Codex_Ent_Brancae_Name;":             ("Brain Tree",          100),
+    "$Codex_Ent_Ground_Struct_Ice_Name;":   ("Crystalline Shards",  100),
+    "$Codex_Ent_Tube_Name;":                ("Sinuous Tubers",      100),
 
     # Odyssey Thargoid
-    if genus_name in ["$Codex_Ent_Barnacles_Name;",
-                      "$Codex_Ent_Thargoid_Coral_Name;",
-                      "$Codex_Ent_Thargoid_Tower_Name;"]:
-        return 85
-
-    # fall back, if all else fails
-    else:
-        return 10000
+    "$Codex_Ent_Barnacles_Name;":           ("Thargoid Barnacles",  85),
+    "$Codex_Ent_Thargoid_Coral_Name;":      ("Thargoid Coral",      85),
+    "$Codex_Ent_Thargoid_Tower_Name;":      ("Thargoid Spires",     85),
+}
 
 # ---------------------------------------------------------------------------
 # Mapping Bridge (Localised Name -> Codex Key)
@@ -59,18 +64,18 @@ SPECIES_TO_CODEX = {
     "Aleoida Laminiae": "$Codex_Ent_Aleoids_Genus_Name;",
     "Aleoida Spica": "$Codex_Ent_Aleoids_Genus_Name;",
 
-    # Amphora Plant (Shrubs)
-    "Amphora Plant": "$Codex_Ent_Shrubs_Genus_Name;",
+    # Amphora Plant
+    "Amphora Plant": "$Codex_Ent_Vents_Name;",
 
-    # Anemone (Clypeus)
-    "Blatteum Bioluminescent Anemone": "$Codex_Ent_Clypeus_Genus_Name;",
-    "Croceum Anemone": "$Codex_Ent_Clypeus_Genus_Name;",
-    "Luteolum Anemone": "$Codex_Ent_Clypeus_Genus_Name;",
-    "Prasinum Bioluminescent Anemone": "$Codex_Ent_Clypeus_Genus_Name;",
-    "Puniceum Anemone": "$Codex_Ent_Clypeus_Genus_Name;",
-    "Roseum Anemone": "$Codex_Ent_Clypeus_Genus_Name;",
-    "Roseum Bioluminescent Anemone": "$Codex_Ent_Clypeus_Genus_Name;",
-    "Rubeum Bioluminescent Anemone": "$Codex_Ent_Clypeus_Genus_Name;",
+    # Anemone
+    "Blatteum Bioluminescent Anemone": "$Codex_Ent_Sphere_Name;",
+    "Croceum Anemone": "$Codex_Ent_Sphere_Name;",
+    "Luteolum Anemone": "$Codex_Ent_Sphere_Name;",
+    "Prasinum Bioluminescent Anemone": "$Codex_Ent_Sphere_Name;",
+    "Puniceum Anemone": "$Codex_Ent_Sphere_Name;",
+    "Roseum Anemone": "$Codex_Ent_Sphere_Name;",
+    "Roseum Bioluminescent Anemone": "$Codex_Ent_Sphere_Name;",
+    "Rubeum Bioluminescent Anemone": "$Codex_Ent_Sphere_Name;",
 
     # Bacterium
     "Bacterium Nebulus": "$Codex_Ent_Bacterial_Genus_Name;",
@@ -87,18 +92,18 @@ SPECIES_TO_CODEX = {
     "Bacterium Cerbrus": "$Codex_Ent_Bacterial_Genus_Name;",
     "Bacterium Tela": "$Codex_Ent_Bacterial_Genus_Name;",
 
-    # Bark Mound (Shrubs)
-    "Bark Mound": "$Codex_Ent_Shrubs_Genus_Name;",
+    # Bark Mound
+    "Bark Mound": "$Codex_Ent_Cone_Name;",
 
-    # Brain Tree (Shrubs)
-    "Brain Tree Aureum": "$Codex_Ent_Shrubs_Genus_Name;",
-    "Brain Tree Gypseeum": "$Codex_Ent_Shrubs_Genus_Name;",
-    "Brain Tree Lindigoticum": "$Codex_Ent_Shrubs_Genus_Name;",
-    "Brain Tree Lividum": "$Codex_Ent_Shrubs_Genus_Name;",
-    "Brain Tree Ostrinum": "$Codex_Ent_Shrubs_Genus_Name;",
-    "Brain Tree Puniceum": "$Codex_Ent_Shrubs_Genus_Name;",
-    "Brain Tree Roseum": "$Codex_Ent_Shrubs_Genus_Name;",
-    "Brain Tree Viride": "$Codex_Ent_Shrubs_Genus_Name;",
+    # Brain Tree
+    "Brain Tree Aureum": "$Codex_Ent_Brancae_Name;",
+    "Brain Tree Gypseeum": "$Codex_Ent_Brancae_Name;",
+    "Brain Tree Lindigoticum": "$Codex_Ent_Brancae_Name;",
+    "Brain Tree Lividum": "$Codex_Ent_Brancae_Name;",
+    "Brain Tree Ostrinum": "$Codex_Ent_Brancae_Name;",
+    "Brain Tree Puniceum": "$Codex_Ent_Brancae_Name;",
+    "Brain Tree Roseum": "$Codex_Ent_Brancae_Name;",
+    "Brain Tree Viride": "$Codex_Ent_Brancae_Name;",
 
     # Cactoida
     "Cactoida Cortexum": "$Codex_Ent_Cactoid_Genus_Name;",
@@ -118,8 +123,8 @@ SPECIES_TO_CODEX = {
     "Concha Labiata": "$Codex_Ent_Conchas_Genus_Name;",
     "Concha Renibus": "$Codex_Ent_Conchas_Genus_Name;",
 
-    # Crystalline Shard (Shrubs)
-    "Crystalline Shard": "$Codex_Ent_Shrubs_Genus_Name;",
+    # Crystalline Shard
+    "Crystalline Shards": "$Codex_Ent_Ground_Struct_Ice_Name;",
 
     # Electricae
     "Electricae Pluma": "$Codex_Ent_Electricae_Genus_Name;",
@@ -167,15 +172,15 @@ SPECIES_TO_CODEX = {
     "Recepta Deltahedronix": "$Codex_Ent_Recepta_Genus_Name;",
     "Recepta Umbrux": "$Codex_Ent_Recepta_Genus_Name;",
 
-    # Sinuous Tuber (Tubus)
-    "Sinuous Tuber Albidum": "$Codex_Ent_Tubus_Genus_Name;",
-    "Sinuous Tuber Blatteum": "$Codex_Ent_Tubus_Genus_Name;",
-    "Sinuous Tuber Caeruleum": "$Codex_Ent_Tubus_Genus_Name;",
-    "Sinuous Tuber Lindigoticum": "$Codex_Ent_Tubus_Genus_Name;",
-    "Sinuous Tuber Prasinum": "$Codex_Ent_Tubus_Genus_Name;",
-    "Sinuous Tuber Roseus": "$Codex_Ent_Tubus_Genus_Name;",
-    "Sinuous Tuber Violaceum": "$Codex_Ent_Tubus_Genus_Name;",
-    "Sinuous Tuber Viride": "$Codex_Ent_Tubus_Genus_Name;",
+    # Sinuous Tuber
+    "Albidum Sinuous Tubers": "$Codex_Ent_Tube_Name;",
+    "Blatteum Sinuous Tubers": "$Codex_Ent_Tube_Name;",
+    "Caeruleum Sinuous Tubers": "$Codex_Ent_Tube_Name;",
+    "Lindigoticum Sinuous Tubers": "$Codex_Ent_Tube_Name;",
+    "Prasinum Sinuous Tubers": "$Codex_Ent_Tube_Name;",
+    "Roseum Sinuous Tubers": "$Codex_Ent_Tube_Name;",
+    "Violaceum Sinuous Tubers": "$Codex_Ent_Tube_Name;",
+    "Viride Sinuous Tubers": "$Codex_Ent_Tube_Name;",
 
     # Stratum
     "Stratum Araneamus": "$Codex_Ent_Stratum_Genus_Name;",
@@ -188,11 +193,11 @@ SPECIES_TO_CODEX = {
     "Stratum Tectonicas": "$Codex_Ent_Stratum_Genus_Name;",
 
     # Tubus
-    "Tubas Cavas": "$Codex_Ent_Tubus_Genus_Name;",
-    "Tubas Compagibus": "$Codex_Ent_Tubus_Genus_Name;",
-    "Tubas Conifer": "$Codex_Ent_Tubus_Genus_Name;",
-    "Tubas Rosarium": "$Codex_Ent_Tubus_Genus_Name;",
-    "Tubas Sororibus": "$Codex_Ent_Tubus_Genus_Name;",
+    "Tubus Cavas": "$Codex_Ent_Tubus_Genus_Name;",
+    "Tubus Compagibus": "$Codex_Ent_Tubus_Genus_Name;",
+    "Tubus Conifer": "$Codex_Ent_Tubus_Genus_Name;",
+    "Tubus Rosarium": "$Codex_Ent_Tubus_Genus_Name;",
+    "Tubus Sororibus": "$Codex_Ent_Tubus_Genus_Name;",
 
     # Tussock
     "Tussock Albata": "$Codex_Ent_Tussocks_Genus_Name;",
@@ -218,6 +223,11 @@ SPECIES_TO_CODEX = {
     "Thargoid Coral Root": "$Codex_Ent_Thargoid_Coral_Name;",
 }
 
+# Other spellings of catalogue names (estimator rule names, older tables)
+SPECIES_ALIASES = {
+    "Crystalline Shard": "Crystalline Shards",
+}
+
 FULL_SPECIES_VALUE_MAPPING = {
     # Aleoida
     "Aleoida Arcus": 7252500,
@@ -389,17 +399,84 @@ FULL_SPECIES_VALUE_MAPPING = {
 }
 
 # ---------------------------------------------------------------------------
-# NEW: Wrapper Function for Estimator
+# Catalogue (built once at import, read-only afterwards)
+# ---------------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class SpeciesInfo:
+    name            : str
+    genus           : Optional[str]
+    codex_key       : Optional[str]
+    value           : int
+    clonal_range    : int
+
+
+@dataclass(frozen=True, slots=True)
+class GenusInfo:
+    codex_key       : str
+    name            : str
+    clonal_range    : int
+    min_value       : int
+    max_value       : int
+    species         : Tuple[str, ...]
+
+
+def _value_span(values) -> Tuple[int, int]:
+    values = [value for value in values if value > 0]
+    return (min(values), max(values)) if values else (0, 0)
+
+
+def _build_catalogue() -> Tuple[Mapping[str, SpeciesInfo], Mapping[str, GenusInfo], Mapping[str, Tuple[int, int]]]:
+    species: Dict[str, SpeciesInfo] = {}
+    for name in list(FULL_SPECIES_VALUE_MAPPING) + [n for n in SPECIES_TO_CODEX if n not in FULL_SPECIES_VALUE_MAPPING]:
+        codex_key = SPECIES_TO_CODEX.get(name)
+        genus_name, clonal_range = GENUS_TABLE.get(codex_key, (None, FALLBACK_RANGE))
+        species[name] = SpeciesInfo(name, genus_name, codex_key, FULL_SPECIES_VALUE_MAPPING.get(name, 0), clonal_range)
+    for alias, name in SPECIES_ALIASES.items():
+        species.setdefault(alias, species[name])
+
+    genera: Dict[str, GenusInfo] = {}
+    for codex_key, (genus_name, clonal_range) in GENUS_TABLE.items():
+        members = tuple(info.name for name, info in species.items() if info.codex_key == codex_key and name == info.name)
+        genera[codex_key] = GenusInfo(codex_key, genus_name, clonal_range,
+                                      *_value_span(species[name].value for name in members), members)
+
+    # every prefix of every valued species name -> (min, max) of the species it starts
+    prefix_values: Dict[str, list] = {}
+    for name, value in FULL_SPECIES_VALUE_MAPPING.items():
+        for end in range(len(name) + 1):
+            prefix_values.setdefault(name[:end], []).append(value)
+    prefixes = {prefix: _value_span(values) for prefix, values in prefix_values.items()}
+
+    return MappingProxyType(species), MappingProxyType(genera), MappingProxyType(prefixes)
+
+
+SPECIES, GENERA, VALUE_RANGE_BY_PREFIX = _build_catalogue()
+
+
+def species_info(species_localised: str) -> Optional[SpeciesInfo]:
+    return SPECIES.get(species_localised)
+
+
+def genus_info(codex_key: str) -> Optional[GenusInfo]:
+    return GENERA.get(codex_key)
+
+
+def bio_get_range(genus_name: str) -> int:
+    """Clonal colony range in m for a genus codex key."""
+    genus = GENERA.get(genus_name)
+    # fall back, if all else fails
+    return genus.clonal_range if genus is not None else FALLBACK_RANGE
+
+# ---------------------------------------------------------------------------
+# Wrapper Functions for Estimator
 # ---------------------------------------------------------------------------
 def get_scan_range_for_species(species_localised: str) -> int:
     """
     Bridges the gap: Localised Species Name -> Codex Key -> Range.
     """
-    codex_key = SPECIES_TO_CODEX.get(species_localised)
-    if not codex_key:
-        # Fallback for unknown species (e.g. new DLC or typo)
-        return 10000
-    return bio_get_range(codex_key)
+    info = SPECIES.get(species_localised)
+    # Fallback for unknown species (e.g. new DLC or typo)
+    return info.clonal_range if info is not None else FALLBACK_RANGE
 
 def get_genus_value(species_localised: str) -> int:
     """
@@ -411,28 +488,35 @@ def get_genus_value(species_localised: str) -> int:
     Returns:
         int: The base scan value for the species.
     """
-    return FULL_SPECIES_VALUE_MAPPING.get(species_localised, 0)
+    info = SPECIES.get(species_localised)
+    return info.value if info is not None else 0
 
 def get_genus_value_range(species_localised: str) -> tuple[int, int]:
-    min: int = 0
-    max: int = 0
-
+    """(min, max) base value of all species whose name starts with species_localised, (0, 0) if none."""
+    return VALUE_RANGE_BY_PREFIX.get(species_localised, (0, 0))
 
-    for item in FULL_SPECIES_VALUE_MAPPING.keys():
-        temp: int = 0
-        if item.startswith(species_localised):
-            temp = int(FULL_SPECIES_VALUE_MAPPING.get(item, 0))
-
-        if temp > 0:
-            if min == 0:
-                min = temp
-            if max == 0:
-                max = temp
-            if min > temp:
-                min = temp
-            if max < temp:
-                max = temp
-
-    result: tuple[int, int] = (min, max)
-
-    return result
+# ---------------------------------------------------------------------------
+# Genus normalisation (Raw Codex Id -> Genus Codex Key)
+# ---------------------------------------------------------------------------
+# Map known patterns to their base names
+GENUS_ID_REPLACEMENTS = (
+    ("SphereEFGH",  "Sphere"),
+    ("TubeABCD",    "Tube"),
+    ("TubeEFGH",    "Tube"),
+)
+# the numeric part and any trailing suffix before "_Name"
+_RE_SPECIES_SUFFIX = re.compile(r'(\w+)_\d+[^_]*_Name;')
+_RE_VARIANT_SUFFIX = re.compile(r'_\d+_[^_]+(?=_Name;)')
+
+
+def _normalize_genus(genus_id: str) -> str:
+    for old, new in GENUS_ID_REPLACEMENTS:
+        genus_id = genus_id.replace(old, new)
+    genus_id = _RE_SPECIES_SUFFIX.sub(r'\1_Name;', genus_id)
+    return _RE_VARIANT_SUFFIX.sub('_Genus', genus_id)
+
+
+@lru_cache(maxsize=1024)
+def normalize_genus(genus_id: str) -> str:
+    """Genus codex key of a raw codex id (genus, species or variant) from CodexEntry / ScanOrganic."""
+    return _normalize_genus(genus_id)
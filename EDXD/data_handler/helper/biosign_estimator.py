@@ -2,44 +2,38 @@ import sys
 
 import EDXD.data_handler.helper.data_helper as dh
 
-from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
-from EDXD.data_handler.helper.system_params import (
-    StarClass, StarLuminosity, PlanetType,
-    PT_GROUP_HMC_ROCKY, PT_GROUP_ICE,
-    SC_WHITE_DWARFS
+from EDXD.data_handler.helper.system_params import PlanetType
+from EDXD.data_handler.helper.system_topology import Star, SystemTopology
+from EDXD.data_handler.helper.species_scoring import score_species, score_batch, species_ids
+from EDXD.data_handler.helper.species_rules import (
+    STR_LIST_NONE, candidate_rules, volcanism_tokens,
+    VOLCANIC, IN_NEBULA, EARTH_LIKE, AMMONIA_WORLD, WATER_GIANT, GG_WATER_LIFE, GG_AMMONIA_LIFE
 )
+from EDXD.data_handler.helper.biosign_priors import get_priors
 from EDXD.data_handler.helper.bio_helper import (
     get_genus_value,
     get_scan_range_for_species
 )
 
 from EDXD.data_handler.model import Body
-from EDXD.globals import BODY_ID_PREFIX
-bip = BODY_ID_PREFIX
 
-STR_LIST_NONE = {None, "", "None", "none"}
 
-@dataclass
-class Star:
-    star_id: int
-    star_class_enum: StarClass
-    star_luminosity_enum: StarLuminosity
+def estimate_system_biosigns(model_bodies: Dict[str, Body], memo: Optional[Dict[str, tuple]] = None,
+                             topology: Optional[SystemTopology] = None) -> Dict[str, List[Dict]]:
+    """
+    Predict the biosigns of every landable body with biosignals.
 
-
-def estimate_system_biosigns(model_bodies: Dict[str, Body]) -> Dict[str, List[Dict]]:
+    With a memo (body_id -> (signature, predictions)) only bodies whose prediction signature changed
+    since the last call are estimated again; the memo is updated in place and bodies that are
+    gone are dropped from it.
+    Parent stars and star distances come from topology - Model keeps one up to date, without it
+    one is built from model_bodies.
+    """
     results = {}
 
-    # 1. System Flags (Same as before)
-    system_has_earth_like = False
-    system_has_ammonia_world = False
-    system_has_water_giant = False
-    system_has_gas_giant_with_water_life = False
-    system_has_gas_giant_with_ammonia_life = False
-
-    potential_parent_stars: Dict[int, Star] = _get_system_stars(model_bodies)
-
-    in_nebula = False
+    if topology is None:
+        topology = SystemTopology.from_bodies(model_bodies.values())
 
     for body_id in model_bodies:
         body: Body = model_bodies[body_id]
@@ -49,194 +43,242 @@ def estimate_system_biosigns(model_bodies: Dict[str, Body]) -> Dict[str, List[Di
         if not body.biosignals:
             continue
 
-        body_parent_stars: Dict[int, Star] = {}
-        for parent_item in body.parents:
-            if list(parent_item.keys())[0] == "Star":
-                try:
-                    body_parent_stars[list(parent_item.values())[0]] = potential_parent_stars[list(parent_item.values())[0]]
-                except KeyError as ke:
-                    if sys.gettrace():
-                        print(f"KeyError: key -> {ke} -> Missing parent star for {body.body_name}[{body_id}]: {parent_item}")
+        body_parent_stars = topology.parent_stars(body_id)
+        distance_from_parent_star = topology.star_distance(body_id)
 
+        if memo is None:
+            predictions = _estimate_body_biosigns(body_id, body, body_parent_stars, distance_from_parent_star)
+        else:
+            signature = _prediction_signature(body, body_parent_stars, distance_from_parent_star)
+            cached = memo.get(body_id)
+            if cached is not None and cached[0] == signature:
+                predictions = cached[1]
+            else:
+                predictions = _estimate_body_biosigns(body_id, body, body_parent_stars, distance_from_parent_star)
+                memo[body_id] = (signature, predictions)
 
-        # 2. Map Body Data
-        atm_raw = _safe_get_atmosphere_type(body.atmosphere)
-        pt_raw = body.body_type if isinstance(body.body_type, str) else str(body.body_type)
-        pt_enum = _safe_get_enum(pt_raw, PlanetType, PlanetType.ROCKY)
-        volc_raw = body.volcanism or "None"
-
-        gravity = body.g_force
-        mean_temp = body.mean_temp
-        distance_from_parent_star = _get_distance_to_parent_star(model_bodies, body_id)
-        #distance_from_parent_star = getattr(body, 'parent_distance', None)
-        distance_ls = dh.km_to_ls(distance_from_parent_star)
-        body_name = body.body_name
-        pressure_atm = dh.pressure_as_atm_from_pascals(body.pressure)
-        present_signal_count = body.biosignals
-
-        # 3. Check DSS & Codex Data
-        bio_found_data = body.bio_found
-
-        scanned_genus_localised = set()
-        scanned_genus_species_localised = set()
-        for genus in bio_found_data.items():
-            # safe handling of species. Especially relevant for Radicoida Unica
-            if genus[1].localised is not None:
-                scanned_genus_localised.add(genus[1].localised)
-            elif genus[1].species_localised is not None:
-                scanned_genus_localised.add(genus[1].species_localised)
-            elif genus[1].variant_localised is not None:
-                scanned_genus_localised.add(genus[1].variant_localised.split(" ")[0])
+        if predictions:
+            results[body_id] = predictions
 
-            if genus[1].species_localised is not None:
-                scanned_genus_species_localised.add(genus[1].species_localised)
-            elif genus[1].variant_localised is not None:
-                scanned_genus_species_localised.add(str(genus[1].variant_localised).split(" - ")[0])
+    if memo is not None:
+        for body_id in memo.keys() - model_bodies.keys():
+            del memo[body_id]
 
-        # New: Track Confirmed Species
-        confirmed_species_names = set()
-        confirmed_variants = {}  # Map species_name -> color
+    return results
 
-        if scanned_genus_localised:
-            for key, data in bio_found_data.items():
-                # data is a dict: { "genusid": "...", "variant_localised": "Bacterium Cerbrus - Green", ... }
-                if data.variant_localised is not None:
-                    variant_raw = data.variant_localised
-                elif data.localised is not None:
-                    variant_raw = data.localised
-                elif data.species_localised is not None:
-                    variant_raw = data.species_localised
-                if variant_raw:
-                    # Parse "Bacterium Cerbrus - Green" -> "Bacterium Cerbrus", "Green"
-                    if " - " in variant_raw:
-                        sp_name, color = variant_raw.rsplit(" - ", 1)
-                    else:
-                        sp_name, color = variant_raw, "Unknown"
 
-                    confirmed_species_names.add(sp_name)
-                    confirmed_variants[sp_name] = color
+def _prediction_signature(body: Body, body_parent_stars: Dict[int, Star], distance_from_parent_star: float) -> tuple:
+    """Everything _estimate_body_biosigns reads - equal signatures give equal predictions."""
+    return (
+        body.body_name,
+        body.body_type,
+        _safe_get_atmosphere_type(body.atmosphere),
+        body.mean_temp,
+        body.g_force,
+        body.pressure,
+        body.volcanism,
+        body.biosignals,
+        body.bio_complete,
+        distance_from_parent_star,
+        tuple((star_id, star.star_class_enum, star.star_luminosity_enum) for star_id, star in body_parent_stars.items()),
+        tuple(
+            (key, genus.genusid, genus.localised, genus.species_localised, genus.variant_localised)
+            for key, genus in body.bio_found.items()
+        ),
+    )
+
+
+def _estimate_body_biosigns(body_id: str, body: Body, body_parent_stars: Dict[int, Star], distance_from_parent_star: float) -> List[Dict]:
+    # 1. System Flags (Same as before)
+    system_has_earth_like = False
+    system_has_ammonia_world = False
+    system_has_water_giant = False
+    system_has_gas_giant_with_water_life = False
+    system_has_gas_giant_with_ammonia_life = False
 
-        # 4. Generate Candidates
-        try:
-            potential_species = estimate_biosigns(
-                planet_type=pt_enum, atmosphere=atm_raw, mean_temp_k=mean_temp,
-                volcanism=volc_raw, gravity=gravity, in_nebula=in_nebula,
-                system_has_earth_like=system_has_earth_like,
-                system_has_ammonia_world=system_has_ammonia_world,
-                system_has_water_giant=system_has_water_giant,
-                system_has_gas_giant_with_water_life=system_has_gas_giant_with_water_life,
-                system_has_gas_giant_with_ammonia_life=system_has_gas_giant_with_ammonia_life,
-                distance_from_star_ls=distance_ls,
-                parent_stars=body_parent_stars,
-            )
-        except Exception as e:
-            if sys.gettrace():
-                print(f"Error estimating {body_id}: {e}")
-            potential_species = []
+    in_nebula = False
+    body_results: List[Dict] = []
+
+    # 2. Map Body Data
+    atm_raw = _safe_get_atmosphere_type(body.atmosphere)
+    pt_raw = body.body_type if isinstance(body.body_type, str) else str(body.body_type)
+    pt_enum = _safe_get_enum(pt_raw, PlanetType, PlanetType.ROCKY)
+    volc_raw = body.volcanism or "None"
+
+    gravity = body.g_force
+    mean_temp = body.mean_temp
+    #distance_from_parent_star = getattr(body, 'parent_distance', None)
+    distance_ls = dh.km_to_ls(distance_from_parent_star)
+    body_name = body.body_name
+    pressure_atm = dh.pressure_as_atm_from_pascals(body.pressure)
+    present_signal_count = body.biosignals
+
+    # 3. Check DSS & Codex Data
+    bio_found_data = body.bio_found
+
+    scanned_genus_localised = set()
+    scanned_genus_species_localised = set()
+    for genus in bio_found_data.items():
+        # safe handling of species. Especially relevant for Radicoida Unica
+        if genus[1].localised is not None:
+            scanned_genus_localised.add(genus[1].localised)
+        elif genus[1].species_localised is not None:
+            scanned_genus_localised.add(genus[1].species_localised)
+        elif genus[1].variant_localised is not None:
+            scanned_genus_localised.add(genus[1].variant_localised.split(" ")[0])
+
+        if genus[1].species_localised is not None:
+            scanned_genus_species_localised.add(genus[1].species_localised)
+        elif genus[1].variant_localised is not None:
+            scanned_genus_species_localised.add(str(genus[1].variant_localised).split(" - ")[0])
+
+    # New: Track Confirmed Species
+    confirmed_species_names = set()
+    confirmed_variants = {}  # Map species_name -> color
+
+    if scanned_genus_localised:
+        for key, data in bio_found_data.items():
+            # data is a dict: { "genusid": "...", "variant_localised": "Bacterium Cerbrus - Green", ... }
+            if data.variant_localised is not None:
+                variant_raw = data.variant_localised
+            elif data.localised is not None:
+                variant_raw = data.localised
+            elif data.species_localised is not None:
+                variant_raw = data.species_localised
+            if variant_raw:
+                # Parse "Bacterium Cerbrus - Green" -> "Bacterium Cerbrus", "Green"
+                if " - " in variant_raw:
+                    sp_name, color = variant_raw.rsplit(" - ", 1)
+                else:
+                    sp_name, color = variant_raw, "Unknown"
 
-        # 5. Filter & Refine based on Codex Data
-        final_species = []
+                confirmed_species_names.add(sp_name)
+                confirmed_variants[sp_name] = color
 
+    # 4. Generate Candidates
+    try:
+        potential_species = estimate_biosigns(
+            planet_type=pt_enum, atmosphere=atm_raw, mean_temp_k=mean_temp,
+            volcanism=volc_raw, gravity=gravity, in_nebula=in_nebula,
+            system_has_earth_like=system_has_earth_like,
+            system_has_ammonia_world=system_has_ammonia_world,
+            system_has_water_giant=system_has_water_giant,
+            system_has_gas_giant_with_water_life=system_has_gas_giant_with_water_life,
+            system_has_gas_giant_with_ammonia_life=system_has_gas_giant_with_ammonia_life,
+            distance_from_star_ls=distance_ls,
+            parent_stars=body_parent_stars,
+        )
+    except Exception as e:
+        if sys.gettrace():
+            print(f"Error estimating {body_id}: {e}")
+        potential_species = []
+
+    # 5. Filter & Refine based on Codex Data
+    final_species = []
+
+    for item in scanned_genus_localised:
+        potential_species.append(item)
+
+    if potential_species:
+        # CODEX PHASE: We know exactly what is here.
+        # 1. Keep ONLY the confirmed species.
+        # 2. Discard all other candidates of the same genus.
+        for sp in potential_species:
+            if any(sp.startswith(p) for p in scanned_genus_species_localised):
+                if sp not in final_species:
+                    final_species.append(sp)
+
+    if scanned_genus_localised:
+        # DSS PHASE (Genus known, species unknown): Filter by Genus Prefix (as before)
+        allowed_prefixes = set()
         for item in scanned_genus_localised:
-            potential_species.append(item)
-
-        if potential_species:
-            # CODEX PHASE: We know exactly what is here.
-            # 1. Keep ONLY the confirmed species.
-            # 2. Discard all other candidates of the same genus.
-            for sp in potential_species:
-                if any(sp.startswith(p) for p in scanned_genus_species_localised):
-                    if sp not in final_species:
+            is_confirmed = False
+            for confirmed in confirmed_species_names:
+                if item is not None and item in confirmed:
+                    is_confirmed = True
+                    break
+            if not is_confirmed:
+                allowed_prefixes.add(item)
+        for sp in potential_species:
+            for p in allowed_prefixes:
+                if p is not None:
+                    matches = p in sp
+                    # Special Anemone/Clypeus handling
+                    if "Anemone" in sp:
+                        matches = True
+                    if "Sinuous Tubers" in sp:
+                        matches = True
+                    if "Clypeus" in allowed_prefixes:
+                        matches = True
+
+                    if matches and sp not in final_species:
                         final_species.append(sp)
 
-        if scanned_genus_localised:
-            # DSS PHASE (Genus known, species unknown): Filter by Genus Prefix (as before)
-            allowed_prefixes = set()
-            for item in scanned_genus_localised:
-                is_confirmed = False
-                for confirmed in confirmed_species_names:
-                    if item is not None and item in confirmed:
-                        is_confirmed = True
-                        break
-                if not is_confirmed:
-                    allowed_prefixes.add(item)
-            for sp in potential_species:
-                for p in allowed_prefixes:
-                    if p is not None:
-                        matches = p in sp
-                        # Special Anemone/Clypeus handling
-                        if "Anemone" in sp:
-                            matches = True
-                        if "Sinuous Tubers" in sp:
-                            matches = True
-                        if "Clypeus" in allowed_prefixes:
-                            matches = True
-
-                        if matches and sp not in final_species:
-                            final_species.append(sp)
-
-        else:
-            # PRE-SCAN PHASE: Keep all physics candidates
-            final_species = potential_species
-
-        # 6. Enrich Results
-        if final_species:
-            results[body_id] = []
-
-            #237 - check if confirmed species are all present in final_species and append if not
-            for conf_species in confirmed_species_names:
-                if not conf_species in final_species:
-                    final_species.append(conf_species)
-
-            for species_name in final_species:
-                # If confirmed, probability is 100%, otherwise calculate.
-                prob = 0.0
-                if species_name in confirmed_species_names or any(species_name.startswith(p) for p in scanned_genus_localised):
-                    if "Sinuous Tubers" in species_name and species_name not in confirmed_species_names:
-                        continue
-                    # check if found species is already unique in list
-                    current_genus = species_name.split(" ")[0]
-                    genus_occurrence = 0
-                    for fs in final_species:
-                        if fs.startswith(current_genus):
-                            genus_occurrence += 1
-                    if genus_occurrence == 1:
-                        prob = 1.0
-                    else:
-                        prob = calculate_probability(
-                            species_name=species_name,
-                            planet_type=pt_enum,
-                            pressure_atm=pressure_atm,
-                            mean_temp_k=mean_temp,
-                            gravity=gravity
-                        )
-                else:
-                    if "Sinuous Tubers" in species_name and species_name not in confirmed_species_names:
-                        continue
-                    prob = calculate_probability(
-                        species_name=species_name,
-                        planet_type=pt_enum,
-                        pressure_atm=pressure_atm,
-                        mean_temp_k=mean_temp,
-                        gravity=gravity
-                    )
-
-                results[body_id].append({
-                    "body_id": body_id,
-                    "body_name": body_name,
-                    "present_signal_count": present_signal_count,
-                    "name": species_name,
-                    "base_value": get_genus_value(species_name),
-                    "scan_range": get_scan_range_for_species(species_name),
-                    "probability": round(prob, 2),
-                    "confirmed_by_dss": scanned_genus_localised,  # True if only genus known
-                    "confirmed_by_codex": species_name in confirmed_species_names,  # True if exact species known
-                    "variant_color": confirmed_variants.get(species_name),  # e.g. "Green"
-                    "dss_complete": body.bio_complete
-                })
-            results[body_id] = _remove_duplicates(results[body_id])
-
-    return results
+    else:
+        # PRE-SCAN PHASE: Keep all physics candidates
+        final_species = potential_species
+
+    # 6. Enrich Results
+    if final_species:
+
+        #237 - check if confirmed species are all present in final_species and append if not
+        for conf_species in confirmed_species_names:
+            if not conf_species in final_species:
+                final_species.append(conf_species)
+
+        # If confirmed, probability is 100%, otherwise calculate - all calculated ones in one batch.
+        kept_species: List[str] = []
+        probabilities: List[Optional[float]] = []
+        for species_name in final_species:
+            if "Sinuous Tubers" in species_name and species_name not in confirmed_species_names:
+                continue
+            prob = None
+            if species_name in confirmed_species_names or any(species_name.startswith(p) for p in scanned_genus_localised):
+                # check if found species is already unique in list
+                current_genus = species_name.split(" ")[0]
+                genus_occurrence = 0
+                for fs in final_species:
+                    if fs.startswith(current_genus):
+                        genus_occurrence += 1
+                if genus_occurrence == 1:
+                    prob = 1.0
+            kept_species.append(species_name)
+            probabilities.append(prob)
+
+        to_score = [i for i, prob in enumerate(probabilities) if prob is None]
+        if to_score:
+            names_to_score = [kept_species[i] for i in to_score]
+            scores = calculate_probabilities(
+                species_names=names_to_score,
+                planet_type=pt_enum,
+                pressure_atm=pressure_atm,
+                mean_temp_k=mean_temp,
+                gravity=gravity
+            )
+            # blend with what the user's own cache shows for bodies like this one (if priors were built)
+            priors = get_priors()
+            if priors is not None:
+                scores = priors.blend(priors.key(pt_raw, atm_raw, mean_temp, gravity), names_to_score, scores)
+            for i, score in zip(to_score, scores):
+                probabilities[i] = score
+
+        for species_name, prob in zip(kept_species, probabilities):
+            body_results.append({
+                "body_id": body_id,
+                "body_name": body_name,
+                "present_signal_count": present_signal_count,
+                "name": species_name,
+                "base_value": get_genus_value(species_name),
+                "scan_range": get_scan_range_for_species(species_name),
+                "probability": round(prob, 2),
+                "confirmed_by_dss": scanned_genus_localised,  # True if only genus known
+                "confirmed_by_codex": species_name in confirmed_species_names,  # True if exact species known
+                "variant_color": confirmed_variants.get(species_name),  # e.g. "Green"
+                "dss_complete": body.bio_complete
+            })
+        body_results = _remove_duplicates(body_results)
+
+    return body_results
 
 
 def _remove_duplicates(data_list):
@@ -265,61 +307,6 @@ def _remove_duplicates(data_list):
 
     return unique_list
 
-def _get_system_stars(model_bodies: Dict[str, Body]) -> Dict[int, Star]:
-    parent_stars: Dict[int, Star] = {}
-    for body_id in model_bodies:
-        body: Body = model_bodies[body_id]
-        b_type = body.body_type if isinstance(body.body_type, str) else str(body.body_type)
-        if b_type == "Earthlike body": system_has_earth_like = True
-        if b_type == "Ammonia world": system_has_ammonia_world = True
-        if b_type == "Water world": system_has_water_giant = True
-        if "water based life" in b_type.lower(): system_has_gas_giant_with_water_life = True
-        if "ammonia based life" in b_type.lower(): system_has_gas_giant_with_ammonia_life = True
-
-        if body.is_star:
-            star_id : int = int(body.body_id.split("_")[1])
-            star_luminosity_enum = None
-            s_type = body.body_type
-            star_class_enum = _safe_get_enum(s_type, StarClass, None)
-            if star_class_enum is None and "_" in s_type:
-                star_class_enum = _safe_get_enum(s_type.split("_")[0], StarClass, None)
-            lum_raw = body.luminosity or body.raw_luminosity
-            if lum_raw:
-                star_luminosity_enum = _safe_get_enum(dh.get_clean_luminosity(lum_raw), StarLuminosity, None)
-
-            parent_star = Star(int(star_id), star_class_enum, star_luminosity_enum)
-            parent_stars[star_id] = parent_star
-
-    return parent_stars
-
-def _get_distance_to_parent_star(model_bodies: Dict[str, Body], body_id: str) -> float:
-    while True:
-        try:
-            body : Body = model_bodies[body_id]
-        except KeyError as ke:
-            if sys.gettrace():
-                print(f"KeyError: key not found -> {ke} in model_bodies (first item in system: {model_bodies[list(model_bodies)[0]].body_name})")
-                print("If this message occurs only once for that system, it's due to a race condition (system scan not yet complete)")
-            parent_star_distance = 0.0
-            break
-
-        if len(body.parents) == 0:
-            parent_star_distance = 0.0
-            break
-
-        is_last_parent_before_star = (not any("Planet" in parent for parent in body.parents)) and any("Star" in parent for parent in body.parents)
-        if is_last_parent_before_star:
-            parent_star_distance = body.parent_distance
-            break
-
-        for parent in body.parents:
-            if list(parent)[0] == "Planet":
-                body_id = bip + str(list(parent.values())[0])
-                break
-
-    return parent_star_distance
-
-# ... [Keep _safe_get_atmosphere_type, _safe_get_enum, calculate_probability, estimate_biosigns from previous steps] ...
 def _safe_get_atmosphere_type(body_atmosphere: Any) -> str:
     if body_atmosphere is None: return "None"
     if isinstance(body_atmosphere, dict): return body_atmosphere.get("raw", "None") or "None"
@@ -346,74 +333,21 @@ def calculate_probability(
         mean_temp_k: float,
         gravity: Optional[float] = None,
 ) -> float:
-    # Calculates a relative probability score (0.5 to 1.0).
+    # Calculates a relative probability score (0.25 to 1.0), see species_scoring.
     # Hard pre-checks already done at this point
-    score = 0.25
-
-    if "Aleoida" in species_name:
-        score += score_aleoida_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
-
-    if "Amphora" in species_name:
-        score += score_amphora_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
-
-    if "Anemone" in species_name:
-        score += score_anemone_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
-
-    if "Bacterium" in species_name:
-        score += score_bacteria_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
-
-    if "Bark" in species_name:
-        score += score_bark_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
-
-    if "Brain" in species_name:
-        score += score_brain_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
+    return score_species(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
 
-    if "Cactoida" in species_name:
-        score += score_cactoida_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
 
-    if "Clypeus" in species_name:
-        score += score_clypeus_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
-
-    if "Concha" in species_name:
-        score += score_concha_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
-
-    if "Crystalline" in species_name:
-        score += score_crystal_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
-
-    if "Electricae" in species_name:
-        score += score_electricae_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
-
-    if "Fonticulua" in species_name:
-        score += score_fonticulua_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
-
-    if "Frutexa" in species_name:
-        score += score_frutexa_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
-
-    if "Fumerola" in species_name:
-        score += score_fumerola_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
-
-    if "Fungoida" in species_name:
-        score += score_fungoida_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
-
-    if "Osseus" in species_name:
-        score += score_osseus_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
-
-    if "Recepta" in species_name:
-        score += score_recepta_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
-
-    if "Sinuous Tubers" in species_name:
-        score += score_sinuous_tubers_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
-
-    if "Stratum" in species_name:
-        score += score_stratum_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
-
-    if "Tubus" in species_name:
-        score += score_tubus_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
-
-    if "Tussock" in species_name:
-        score += score_tussock_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
-
-    return min(score, 1.0)
+def calculate_probabilities(
+        species_names: List[str],
+        planet_type: PlanetType,
+        pressure_atm: float,
+        mean_temp_k: float,
+        gravity: Optional[float] = None,
+) -> List[float]:
+    """calculate_probability for several species on the same body, scored in one batch."""
+    n = len(species_names)
+    return score_batch(species_ids(species_names), [mean_temp_k] * n, [pressure_atm] * n, [gravity] * n, [planet_type] * n)
 
 
 def estimate_biosigns(
@@ -426,637 +360,33 @@ def estimate_biosigns(
         distance_from_star_ls: Optional[float] = None,
         parent_stars: Optional[Dict[int, Star]] = None,
 ) -> List[str]:
+    """Candidate species per parent star, evaluated from the compiled rule tables in species_rules."""
     possible_species: List[str] = []
 
-    for parent_star_id, parent_star in parent_stars.items():
-        star_class = parent_star.star_class_enum
-        star_luminosity = parent_star.star_luminosity_enum
-
-        # Aleoida
-        if "thin" in atmosphere and planet_type in PT_GROUP_HMC_ROCKY and gravity is not None and gravity <= 0.28:
-            if "carbon dioxide" in atmosphere:
-                if 175 <= mean_temp_k <= 180:
-                    possible_species.append("Aleoida Arcus")
-                if 179 <= mean_temp_k <= 190:
-                    possible_species.append("Aleoida Coronamus")
-                if 190 <= mean_temp_k <= 197:
-                    possible_species.append("Aleoida Gravis")
-            if "ammonia" in atmosphere:
-                if 152 <= mean_temp_k <= 177:
-                    possible_species.append("Aleoida Laminiae")
-                if 170 <= mean_temp_k <= 177:
-                    possible_species.append("Aleoida Spica")
-
-        # Amphora Plant
-        if (
-                atmosphere in {None, "", "None", "none"} and StarClass.A == star_class and
-                (
-                        system_has_earth_like or
-                        system_has_ammonia_world or
-                        system_has_water_giant or
-                        system_has_gas_giant_with_water_life or
-                        system_has_gas_giant_with_ammonia_life
-                )
-        ):
-            possible_species.append("Amphora Plant")
-
-        # Anemone (Mapped to Clypeus genus)
-        if star_class in [StarClass.A, StarClass.B, StarClass.O]:
-            if star_class == StarClass.A:
-                if star_luminosity == StarLuminosity.III:
-                    if planet_type == PlanetType.ROCKY: possible_species.append("Croceum Anemone")
-                    if planet_type in [PlanetType.METAL_RICH, PlanetType.HMC]: possible_species.append("Rubeum Bioluminescent Anemone")
-            if star_class == StarClass.B:
-                if star_luminosity in [StarLuminosity.I, StarLuminosity.II, StarLuminosity.III] and planet_type in [PlanetType.METAL_RICH, PlanetType.HMC]:
-                    possible_species.extend("Roseum Bioluminescent Anemone")
-                if star_luminosity in [StarLuminosity.I, StarLuminosity.II, StarLuminosity.III] and planet_type in [PlanetType.ROCKY]:
-                    possible_species.extend("Roseum Anemone")
-                if star_luminosity in [StarLuminosity.IV, StarLuminosity.V] and planet_type in [PlanetType.METAL_RICH, PlanetType.HMC]:
-                    possible_species.append("Blatteum Bioluminescent Anemone")
-                if star_luminosity in [StarLuminosity.IV, StarLuminosity.V] and planet_type in [PlanetType.ROCKY]:
-                    possible_species.append("Luteolum Anemone")
-                if star_luminosity == StarLuminosity.VI:
-                    if planet_type in [PlanetType.METAL_RICH, PlanetType.HMC]: possible_species.append("Rubeum Bioluminescent Anemone")
-                    if planet_type == PlanetType.ROCKY: possible_species.append("Croceum Anemone")
-            if star_class == StarClass.O:
-                if planet_type in [PlanetType.ROCKY_ICE, PlanetType.ICY]:
-                    possible_species.append("Puniceum Anemone")
-                if planet_type in [PlanetType.METAL_RICH, PlanetType.HMC, PlanetType.ROCKY]:
-                    possible_species.append("Prasinum Bioluminescent Anemone")
-
-        # Bacterium
-        if "thin" in atmosphere:
-            if "helium" in atmosphere:
-                possible_species.append("Bacterium Nebulus")
-            if "neon" in atmosphere:
-                if any(opt in volcanism for opt in ("nitrogen", "ammonia")):
-                    possible_species.append("Bacterium Omentum")
-                elif any(opt in volcanism for opt in ("carbon", "methane")):
-                    possible_species.append("Bacterium Scopulum")
-                elif "water" in volcanism:
-                    possible_species.append("Bacterium Verrata")
-                else:
-                    possible_species.append("Bacterium Acies")
-            if "methane" in atmosphere:
-                possible_species.append("Bacterium Bullaris")
-            if "argon" in atmosphere:
-                possible_species.append("Bacterium Vesicula")
-            if "nitrogen" in atmosphere:
-                possible_species.append("Bacterium Informem")
-            if "oxygen" in atmosphere:
-                possible_species.append("Bacterium Volu")
-            if "ammonia" in atmosphere:
-                possible_species.append("Bacterium Alcyoneum")
-            if "carbon" in atmosphere:
-                possible_species.append("Bacterium Aurasus")
-            if any(opt in atmosphere for opt in ("water", "sulfur")):
-                possible_species.append("Bacterium Cerbrus")
-            if any(opt in volcanism for opt in ("helium", "metallic", "silicate")):
-                possible_species.append("Bacterium Tela")
-
-        # Bark Mound
-        if (atmosphere in STR_LIST_NONE
-                and (in_nebula or (volcanism not in STR_LIST_NONE))):
-            possible_species.append("Bark Mound")
-
-        # Brain Tree
-        if volcanism not in STR_LIST_NONE and atmosphere in STR_LIST_NONE:
-            if 200 <= mean_temp_k <= 500:
-                possible_species.append("Brain Tree Roseum")
-            if system_has_earth_like or system_has_gas_giant_with_water_life:
-                if planet_type in [PlanetType.METAL_RICH, PlanetType.HMC] and 300 <= mean_temp_k <= 500:
-                    possible_species.append("Brain Tree Aureum")
-                if planet_type == PlanetType.ROCKY and 200 <= mean_temp_k <= 300:
-                    possible_species.append("Brain Tree Gypseeum")
-                if planet_type in [PlanetType.HMC, PlanetType.ROCKY] and 300 <= mean_temp_k <= 500:
-                    possible_species.append("Brain Tree Lindigoticum")
-                if planet_type == PlanetType.ROCKY and 300 <= mean_temp_k <= 500:
-                    possible_species.append("Brain Tree Lividum")
-                if planet_type in [PlanetType.METAL_RICH, PlanetType.HMC]:
-                    possible_species.extend(["Brain Tree Ostrinum", "Brain Tree Puniceum"])
-                if planet_type == PlanetType.ROCKY_ICE and 100 <= mean_temp_k <= 270:
-                    possible_species.append("Brain Tree Viride")
-
-        # Cactoida
-        if "thin" in atmosphere and planet_type in PT_GROUP_HMC_ROCKY and gravity and gravity <= 0.28:
-            if (
-                    ("carbon" in atmosphere and "rich" not in atmosphere)
-                    or ("rich" in atmosphere and 180 <= mean_temp_k <= 195)
-            ):
-                possible_species.extend(["Cactoida Cortexum", "Cactoida Pullulanta"])
-            if "ammonia" in atmosphere:
-                possible_species.extend(["Cactoida Lapis", "Cactoida Peperatis"])
-            if "water" in atmosphere:
-                possible_species.append("Cactoida Vermis")
-
-        # Clypeus
-        if (planet_type in PT_GROUP_HMC_ROCKY
-                and ("thin" in atmosphere and any(opt in atmosphere for opt in ("water", "carbon")))
-                and mean_temp_k > 190 and gravity and gravity <= 0.27):
-            possible_species.extend(["Clypeus Lacrimam", "Clypeus Margaritus"])
-            if distance_from_star_ls and distance_from_star_ls > 2500:
-                possible_species.append("Clypeus Speculumi")
-
-        # Concha
-        if planet_type in PT_GROUP_HMC_ROCKY and (gravity and gravity <= 0.28) and "thin" in atmosphere:
-            if "ammonia" in atmosphere:
-                possible_species.append("Concha Aureolas")
-            if "nitrogen" in atmosphere:
-                possible_species.append("Concha Biconcavis")
-            if "carbon" in atmosphere:
-                if mean_temp_k < 190:
-                    possible_species.append("Concha Labiata")
-                if 180 <= mean_temp_k <= 195:
-                    possible_species.append("Concha Renibus")
-            if "water" in atmosphere:
-                possible_species.append("Concha Renibus")
-
-        # Crystalline Shard
-        if (atmosphere in STR_LIST_NONE
-                and star_class in [StarClass.A,
-                                   StarClass.F,
-                                   StarClass.G,
-                                   StarClass.K,
-                                   StarClass.M,
-                                   StarClass.S]
-                and (system_has_earth_like
-                     or system_has_ammonia_world
-                     or system_has_water_giant
-                     or system_has_gas_giant_with_water_life
-                     or system_has_gas_giant_with_ammonia_life)
-                and (distance_from_star_ls is None or distance_from_star_ls > 12000)):
-
-            possible_species.append("Crystalline Shard")
-
-        # Electricae
-        if planet_type == PlanetType.ICY and ("thin" in atmosphere and any(opt in atmosphere for opt in ("helium", "neon", "argon"))) and gravity and gravity <= 0.28:
-            if ((star_class == StarClass.A and star_luminosity in [StarLuminosity.V, StarLuminosity.VI, StarLuminosity.VII])
-                    or star_class in [StarClass.O, StarClass.B, StarClass.N, StarClass.BlackHole, *SC_WHITE_DWARFS]):
-                possible_species.append("Electricae Pluma")
-            if in_nebula:
-                possible_species.append("Electricae Radialem")
-
-        # Fonticulua
-        if atmosphere and "thin" in atmosphere and planet_type in PT_GROUP_ICE and gravity and gravity <= 0.28:
-            if "neon" in atmosphere:
-                possible_species.append("Fonticulua Segmentatus")
-            if "methane" in atmosphere:
-                possible_species.append("Fonticulua Digitos")
-            if "argon" in atmosphere:
-                if "rich" in atmosphere:
-                    possible_species.append("Fonticulua Upupam")
-                else:
-                    possible_species.append("Fonticulua Campestris")
-            if "nitrogen" in atmosphere:
-                possible_species.append("Fonticulua Lapida")
-            if "oxygen" in atmosphere:
-                possible_species.append("Fonticulua Fluctus")
-
-        # Frutexa
-        if "thin" in atmosphere:
-            if "ammonia" in atmosphere:
-                if planet_type == PlanetType.ROCKY:
-                    possible_species.extend(["Frutexa Flabellum", "Frutexa Flammasis"])
-                if planet_type == PlanetType.HMC:
-                    possible_species.append("Frutexa Metallicum")
-            if "carbon" in atmosphere and mean_temp_k < 195:
-                if planet_type == PlanetType.ROCKY:
-                    possible_species.extend(["Frutexa Fera", "Frutexa Acus"])
-                if planet_type == PlanetType.HMC:
-                    possible_species.append("Frutexa Metallicum")
-            if "sulfur" in atmosphere:
-                possible_species.append("Frutexa Collum")
-            if "water" in atmosphere and planet_type == PlanetType.ROCKY:
-                possible_species.append("Frutexa Sponsae")
-
-        # Fumerola
-        if volcanism not in STR_LIST_NONE and "thin" in atmosphere and gravity and gravity <= 0.28:
-            if (planet_type in PT_GROUP_ICE
-                    and "water" in volcanism):
-                possible_species.append("Fumerola Aquatis")
-            if (planet_type in PT_GROUP_ICE
-                    and any(opt in volcanism for opt in ("methane", "carbon"))):
-                possible_species.append("Fumerola Carbosis")
-            if (planet_type in PT_GROUP_HMC_ROCKY
-                    and any(opt in volcanism for opt in ("metallic", "rocky", "silicate"))):
-                possible_species.append("Fumerola Extremus")
-            if (planet_type in PT_GROUP_ICE
-                    and any(opt in volcanism for opt in ("nitrogen", "ammonia"))):
-                possible_species.append("Fumerola Nitris")
-
-        # Fungoida
-        if gravity and gravity <= 0.28 and "thin" in atmosphere:
-            if any(opt in atmosphere for opt in ("methane", "ammonia")):
-                possible_species.append("Fungoida Setisis")
-            if "argon" in atmosphere:
-                possible_species.append("Fungoida Bullarum")
-            if ("water" in atmosphere
-                    or ("carbon" in atmosphere and 180 <= mean_temp_k <= 195)):
-                possible_species.extend(["Fungoida Gelata", "Fungoida Stabitis"])
-
-        # Osseus
-        if "thin" in atmosphere and gravity and gravity <= 0.28:
-            if (planet_type == PlanetType.ROCKY_ICE
-                    and any(opt in atmosphere for opt in ("methane", "argon", "nitrogen"))):
-                possible_species.append("Osseus Pumice")
-            if planet_type in PT_GROUP_HMC_ROCKY:
-                if "carbon" in atmosphere:
-                    if 180 <= mean_temp_k <= 195:
-                        possible_species.extend(["Osseus Cornibus", "Osseus Pellebantus"])
-                    if 180 >= mean_temp_k <= 190:
-                        possible_species.append("Osseus Fractus")
-                if "water" in atmosphere:
-                    possible_species.append("Osseus Discus")
-                if "ammonia" in atmosphere:
-                    possible_species.append("Osseus Spiralis")
-
-        # Recepta
-        if "thin sulfur" in atmosphere and gravity and gravity < 0.28:
-            if planet_type in PT_GROUP_ICE:
-                possible_species.append("Recepta Conditivus")
-            if planet_type in PT_GROUP_HMC_ROCKY:
-                possible_species.append("Recepta Deltahedronix")
-            if planet_type in [*PT_GROUP_HMC_ROCKY, *PT_GROUP_ICE]:
-                possible_species.append("Recepta Umbrux")
-
-        # Sinuous Tuber
-        if volcanism not in STR_LIST_NONE and atmosphere in STR_LIST_NONE:
-            if "silicate magma" in volcanism:
-                possible_species.append("Roseum Sinuous Tubers")
-            if planet_type == PlanetType.ROCKY:
-                possible_species.extend(["Albidum Sinuous Tubers", "Caeruleum Sinuous Tubers", "Lindigoticum Sinuous Tubers"])
-            if planet_type in [PlanetType.METAL_RICH, PlanetType.HMC]:
-                possible_species.extend(["Blatteum Sinuous Tubers", "Prasinum Sinuous Tubers", "Violaceum Sinuous Tubers", "Viride Sinuous Tubers"])
-
-        # Stratum
-        if "thin" in atmosphere:
-            if (planet_type == PlanetType.HMC
-                    and mean_temp_k > 165):
-                possible_species.append("Stratum Tectonicas")
-            if planet_type == PlanetType.ROCKY:
-                if "ammonia" in atmosphere and mean_temp_k > 165:
-                    possible_species.extend(["Stratum Paleas", "Stratum Laminamus"])
-                if "water" in atmosphere:
-                    possible_species.append("Stratum Paleas")
-                if "carbon" in atmosphere:
-                    if mean_temp_k > 165:
-                        possible_species.append("Stratum Paleas")
-                    if mean_temp_k > 190:
-                        possible_species.extend(["Stratum Cucumisis", "Stratum Frigus"])
-                    if 165 <= mean_temp_k <= 190:
-                        possible_species.extend(["Stratum Limaxus", "Stratum Excutitus"])
-                if "sulfur" in atmosphere:
-                    if mean_temp_k > 165:
-                        possible_species.append("Stratum Araneamus")
-                    if mean_temp_k > 190:
-                        possible_species.extend(["Stratum Cucumisis", "Stratum Frigus"])
-                    if 165 <= mean_temp_k <= 190:
-                        possible_species.extend(["Stratum Limaxus", "Stratum Excutitus"])
-
-        # Tubus
-        if "thin" in atmosphere and gravity and gravity <= 0.16:
-            if planet_type == PlanetType.HMC and any(opt in atmosphere for opt in ("ammonia", "carbon")):
-                possible_species.append("Tubus Sororibus")
-            if planet_type == PlanetType.ROCKY:
-                if "ammonia" in atmosphere:
-                    possible_species.append("Tubus Rosarium")
-                if "carbon" in atmosphere:
-                    possible_species.append("Tubus Cavas")
-                if "carbon" in atmosphere and 160 <= mean_temp_k <= 190:
-                    possible_species.extend(["Tubus Compagibus", "Tubus Conifer"])
-
-        # Tussock
-        if planet_type in [PlanetType.ROCKY, PlanetType.HMC] and "thin" in atmosphere and gravity and gravity <= 0.28:
-            if "carbon" in atmosphere:
-                if 175 <= mean_temp_k <= 180:
-                    possible_species.append("Tussock Albata")
-                if 180 <= mean_temp_k <= 190:
-                    possible_species.append("Tussock Caputus")
-                if 160 <= mean_temp_k <= 170:
-                    possible_species.append("Tussock Ignis")
-                if 145 <= mean_temp_k <= 155:
-                    possible_species.append("Tussock Pennata")
-                if mean_temp_k < 195:
-                    possible_species.extend(["Tussock Pennatis", "Tussock Propagito"])
-                if 170 <= mean_temp_k <= 175:
-                    possible_species.append("Tussock Serrati")
-                if 190 <= mean_temp_k <= 195:
-                    possible_species.append("Tussock Triticum")
-                if 155 <= mean_temp_k <= 160:
-                    possible_species.append("Tussock Ventusa")
-            if any(opt in atmosphere for opt in ("methane", "argon")):
-                possible_species.append("Tussock Capillum")
-            if "ammonia" in atmosphere:
-                possible_species.extend(["Tussock Catena", "Tussock Cultro", "Tussock Divisa"])
-            if "sulfur" in atmosphere:
-                possible_species.append("Tussock Stigmasis")
-            if "water" in atmosphere:
-                possible_species.append("Tussock Virgam")
+    if not parent_stars:
+        return possible_species
+    candidates = candidate_rules(planet_type, atmosphere)
+    if not candidates:
+        return possible_species
+
+    conditions = set()
+    if volcanism not in STR_LIST_NONE:          conditions.add(VOLCANIC)
+    if in_nebula:                               conditions.add(IN_NEBULA)
+    if system_has_earth_like:                   conditions.add(EARTH_LIKE)
+    if system_has_ammonia_world:                conditions.add(AMMONIA_WORLD)
+    if system_has_water_giant:                  conditions.add(WATER_GIANT)
+    if system_has_gas_giant_with_water_life:    conditions.add(GG_WATER_LIFE)
+    if system_has_gas_giant_with_ammonia_life:  conditions.add(GG_AMMONIA_LIFE)
+
+    # everything but the star conditions is the same for every parent star
+    volc_tokens = volcanism_tokens(volcanism)
+    matching = [
+        rule for rule in candidates
+        if rule.matches_body(mean_temp_k, volc_tokens, gravity, conditions, distance_from_star_ls)
+    ]
+    for parent_star in parent_stars.values():
+        for rule in matching:
+            if rule.matches_star(parent_star.star_class_enum, parent_star.star_luminosity_enum):
+                possible_species.extend(rule.species)
 
     return possible_species
-
-# Calculate probabilities
-def score_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType, modes: dict) -> float:
-    score = 0.0
-    name_lower = species_name.lower()
-
-    # Identify the target mode for this species
-    target = None
-    for key, val in modes.items():
-        if key in name_lower:
-            target = val
-            break
-
-    # Safety fallback if species name is unrecognised
-    if target is None:
-        return 0.0
-
-    target_temp, tolerance_temp, target_press, tolerance_pressure, target_grav, tolerance_gravity, target_planet_type = target
-
-    # Check planet type(s)
-    if planet_type in target_planet_type:
-        score += 0.25
-    else:
-        score += 0.1
-
-    # Check Temperature (Tolerance: ±{tolerance_temp} K)
-    if target_temp is not None:
-        if abs(mean_temp_k - target_temp) <= tolerance_temp:
-            score += 0.16
-
-    # Check Pressure (Tolerance: ±{tolerance_pressure} atm)
-    if target_press is not None:
-        if abs(pressure_atm - target_press) <= tolerance_pressure:
-            score += 0.16
-
-    # Check Gravity (Tolerance: ±{tolerance_gravity} g)
-    if target_grav is not None:
-        if abs(gravity - target_grav) <= tolerance_gravity:
-            score += 0.16
-
-    return score
-
-def score_aleoida_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
-    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
-    modes = {
-        "arcus"     : (177.0, 5.0, 0.024, 0.005,  0.12, 0.05, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "coronamus" : (181.0, 5.0, 0.035, 0.005,  0.17, 0.05, [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
-        "gravis"    : (190.1, 5.0, 0.074, 0.005,  0.21, 0.05, [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY, PlanetType.ROCKY_ICE]),
-        "laminiae"  : (171.0, 5.0, 0.001, 0.0005, 0.14, 0.05, [PlanetType.HMC, PlanetType.ROCKY]),
-        "spica"     : (173.0, 5.0, 0.001, 0.0005, 0.16, 0.05, [PlanetType.HMC, PlanetType.ROCKY])
-    }
-
-    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
-
-def score_amphora_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
-    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
-    modes = {
-        "plant"     : (1090.0, 70.0, None, None,  1.0, 0.9, [PlanetType.HMC, PlanetType.METAL_RICH, PlanetType.ROCKY])
-    }
-
-    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
-
-def score_anemone_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
-    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
-    modes = {
-        "blatteum bioluminescent"   : (1000.0, 500.0, 0.0035,  0.0035,  1.42,   0.66,   [PlanetType.HMC, PlanetType.METAL_RICH, PlanetType.ROCKY]),
-        "croceum"                   : (390.0,  50.0,  0.0035,  0.0035,  0.09,   0.05,   [PlanetType.HMC, PlanetType.ROCKY]),
-        "luteolum"                  : (349.0,  75.0,  0.0035,  0.0035,  0.1,    0.06,   [PlanetType.HMC, PlanetType.ROCKY]),
-        "prasinum bioluminescent"   : (1275.0, 475.0, 0.0035,  0.0035,  0.5665, 0.5295, [PlanetType.HMC, PlanetType.METAL_RICH, PlanetType.ROCKY]),
-        "puniceum"                  : (550.0,  150.0, 0.00075, 0.00075, 2.25,   0.35,   [PlanetType.ICY]),
-        "roseum"                    : (410.0,  30.0,  0.003,   0.003,   0.095,  0.051,  [PlanetType.HMC, PlanetType.ROCKY]),
-        "roseum bioluminescent"     : (970.0,  480.0, 0.0035,  0.0035,  1.305,  0.495,  [PlanetType.HMC, PlanetType.METAL_RICH, PlanetType.ROCKY]),
-        "rubeum bioluminescent"     : (895.0,  245.0, 0.0035,  0.0035,  1.17,   0.38,   [PlanetType.HMC, PlanetType.METAL_RICH, PlanetType.ROCKY])
-    }
-
-    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
-
-def score_bacteria_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
-    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity, PlanetType)
-    modes = {
-        "acies"     : (22.0,    20.0,   0.015,  0.005,  0.4,    0.1,    [PlanetType.ICY]),
-        "alcyoneum" : (168.0,   25.0,   0.001,  0.001,  0.15,   0.05,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
-        "aurasus"   : (177.0,   25.0,   0.1,    0.05,   0.2,    0.01,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
-        "bullaris"  : (95.0,    10.0,   0.045,  0.005,  0.05,   0.005,  [PlanetType.ICY]),
-        "cerbrus"   : (180.0,   30.0,   0.05,   0.005,  0.3,    0.05,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY, PlanetType.ROCKY_ICE]),
-        "informem"  : (75.0,    20.0,   0.01,   0.005,  0.27,   0.05,   [PlanetType.HMC, PlanetType.ICY]),
-        "nebulus"   : (20.0,    15.0,   0.08,   0.03,   0.5,    0.1,    [PlanetType.ICY]),
-        "omentum"   : (30.0,    20.0,   0.005,  0.002,  0.4,    0.1,    [PlanetType.ICY]),
-        "scopulum"  : (30.0,    20.0,   0.005,  0.002,  0.4,    0.1,    [PlanetType.ICY]),
-        "tela"      : (350.0,   50.0,   0.005,  0.002,  0.5,    0.1,    [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
-        "verrata"   : (40.0,    20.0,   0.005,  0.002,  0.5,    0.1,    [PlanetType.ICY]),
-        "vesicula"  : (50.0,    20.0,   0.005,  0.002,  0.2,    0.05,   [PlanetType.HMC, PlanetType.ICY]),
-        "volu"      : (170.0,   25.0,   0.05,   0.005,  0.4,    0.1,    [PlanetType.HMC, PlanetType.ICY])
-    }
-
-    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
-
-def score_bark_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
-    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
-    modes = {
-        "mounds"     : (250.0, 45.0, 69.0, 69.0,  0.168, 0.142, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY])
-    }
-
-    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
-
-def score_brain_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
-    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
-    modes = {
-        "aureum"        : (571.0, 269.0, 0.00185, 0.00185,  0.198,  0.162,  [PlanetType.HMC, PlanetType.ROCKY]),
-        "gypseeum"      : (226.0, 26.0,  0.0035,  0.0035,   0.1,    0.06,   [PlanetType.ROCKY]),
-        "lindigoticum"  : (475.0, 25.0,  0.0004,  0.0004,   0.152,  0.108,  [PlanetType.HMC, PlanetType.ROCKY]),
-        "lividum"       : (503.0, 272.0, 0.0004,  0.0004,   0.084,  0.055,  [PlanetType.HMC, PlanetType.ROCKY]),
-        "ostrinum"      : (685.0, 222.0, 0.0004,  0.0004,   0.7675, 0.7325, [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
-        "puniceum"      : (748.0, 292.0, 0.0004,  0.0004,   0.82,   0.78,   [PlanetType.HMC, PlanetType.ROCKY]),
-        "roseum"        : (392.5, 277.5, 0.0004,  0.0004,   0.201,  0.174,  [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
-        "viride"        : (113.0, 13.0,  0.0004,  0.0004,   0.079,  0.044,  [PlanetType.ROCKY_ICE, PlanetType.ICY])
-    }
-
-    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
-
-def score_cactoida_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
-    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
-    modes = {
-        "cortexum"      : (188.0, 9.0,   0.06,   0.05,   0.2,  0.05, [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
-        "lapis"         : (170.0, 15.0,  0.001,  0.001,  0.15, 0.05, [PlanetType.HMC, PlanetType.ROCKY]),
-        "peperatis"     : (170.0, 10.0,  0.0015, 0.007,  0.27, 0.1,  [PlanetType.HMC, PlanetType.ROCKY]),
-        "pullulanta"    : (188.0, 9.0,   0.06,   0.04,   0.15, 0.12, [PlanetType.HMC, PlanetType.ROCKY]),
-        "vermis"        : (250.0, 200.0, 0.05,   0.05,   0.15, 0.12, [PlanetType.HMC, PlanetType.ROCKY])
-    }
-
-    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
-
-def score_clypeus_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
-    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
-    modes = {
-        "lacrimam"     : (320.0, 130.0, 0.085, 0.015,  0.07,  0.031, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "margaritus"   : (310.0, 120.0, 0.085, 0.015,  0.145, 0.105, [PlanetType.HMC, PlanetType.ICY]),
-        "speculumi"    : (321.0, 131.0, 0.085, 0.015,  0.12,  0.085, [PlanetType.HMC, PlanetType.ROCKY])
-    }
-
-    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
-
-def score_concha_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
-    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
-    modes = {
-        "aureolas"      : (165.0, 20.0, 0.005, 0.007,  0.6,   0.6,  [PlanetType.HMC, PlanetType.ROCKY]),
-        "biconcavis"    : (46.0,  7.0,  0.005, 0.005,  0.15,  0.13, [PlanetType.HMC, PlanetType.ROCKY]),
-        "labiata"       : (175.0, 26.0, 0.007, 0.005,  0.15,  0.13, [PlanetType.ROCKY]),
-        "renibus"       : (188.0, 20.0, 0.07,  0.02,   0.045, 0.02, [PlanetType.HMC, PlanetType.ROCKY])
-    }
-
-    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
-
-def score_crystal_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
-    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
-    modes = {
-        "shards"     : (102.0, 22.0, 0.004, 0.004,  0.1055, 0.0805, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-    }
-
-    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
-
-def score_electricae_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
-    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
-    modes = {
-        "pluma"     : (250.0, 45.0, 0.10,    0.10,    0.168,  0.142,  [PlanetType.ICY]),
-        "radialem"  : (44.5,  15.5, 0.00549, 0.00451, 0.1495, 0.1005, [PlanetType.ICY])
-    }
-
-    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
-
-def score_fonticulua_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
-    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
-    modes = {
-        "campestris"    : (97.0,  47.0, 0.01549,  0.01451,  0.155,  0.105,  [PlanetType.ICY]),
-        "digitos"       : (97.0,  8.0,  0.067,    0.028,    0.0365, 0.0085, [PlanetType.ICY]),
-        "fluctus"       : (150.0, 5.0,  0.035,    0.015,    0.255,  0.015,  [PlanetType.ICY]),
-        "lapida"        : (67.5,  12.5, 0.009495, 0.008505, 0.255,  0.025,  [PlanetType.ICY]),
-        "segmentatus"   : (65.0,  5.0,  0.003,    0.001,    0.27,   0.01,   [PlanetType.ICY]),
-        "upupam"        : (81.0,  11.0, 0.055,    0.035,    0.148,  0.128,  [PlanetType.ICY])
-    }
-
-    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
-
-def score_frutexa_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
-    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
-    modes = {
-        "acus"       : (175.0, 15.0, 0.0255,  0.0245,  0.09,   0.05,   [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "collum"     : (135.0, 5.0,  0.00199, 0.00101, 0.255,  0.025,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "fera"       : (172.0, 18.0, 0.0485,  0.0465,  0.1275, 0.0925, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "flabellum"  : (165.0, 15.0, 0.00274, 0.00176, 0.15,   0.05,   [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "flammasis"  : (166.5, 8.5,  0.00174, 0.00076, 0.16,   0.06,   [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "metallicum" : (170.0, 25.0, 0.00499, 0.00401, 0.205,  0.065,  [PlanetType.HMC, PlanetType.ICY]),
-        "sponsae"    : (425.0, 25.0, 0.084,   0.014,   0.05,   0.005,  [PlanetType.HMC, PlanetType.ROCKY])
-    }
-
-    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
-
-def score_fumerola_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
-    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
-    modes = {
-        "aquatis"   : (80.0, 25.0, 0.013,    0.012,   0.2025, 0.0325, [PlanetType.ICY]),
-        "carbosis"  : (95.0, 20.0, 0.05,     0.049,   0.036,  0.011,  [PlanetType.ICY]),
-        "extremus"  : (91.5, 12.5, 0.04475,  0.03525, 0.0775, 0.0425, [PlanetType.ICY, PlanetType.ROCKY]),
-        "nitris"    : (77.0, 38.0, 0.00505,  0.00405, 0.0469, 0.0211, [PlanetType.ICY])
-    }
-
-    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
-
-def score_fungoida_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
-    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
-    modes = {
-        "bullarum"  : (77.5,  27.5, 0.013,    0.012,    0.25,   0.03,   [PlanetType.ICY, PlanetType.ROCKY_ICE]),
-        "gelata"    : (189.0, 18.0, 0.0655,   0.0335,   0.18,   0.05,   [PlanetType.ICY, PlanetType.ROCKY_ICE, PlanetType.HMC]),
-        "setisis"   : (165.5, 11.5, 0.005075, 0.004075, 0.1925, 0.0825, [PlanetType.ICY, PlanetType.ROCKY, PlanetType.HMC]),
-        "stabitis"  : (185.5, 24.5, 0.0655,   0.0335,   0.175,  0.055,  [PlanetType.ICY, PlanetType.ROCKY, PlanetType.HMC])
-    }
-
-    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
-
-def score_osseus_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
-    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
-    modes = {
-        "cornibus"     : (186.0, 6.0,  0.063,   0.36,    0.2,    0.07,   [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "discus"       : (429.0, 41.0, 0.0825,  0.0165,  0.0465, 0.0125, [PlanetType.HMC, PlanetType.ROCKY]),
-        "fractus"      : (185.0, 5.0,  0.0645,  0.0345,  0.19,   0.06,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
-        "pellebantus"  : (193.0, 3.0,  0.0795,  0.0195,  0.23,   0.04,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
-        "pumice"       : (82.5,  27.5, 0.01325, 0.01225, 0.2425, 0.0325, [PlanetType.ROCKY_ICE, PlanetType.ICY]),
-        "spiralis"     : (168.0, 8.0,  0.0025,  0.0015,  0.2,    0.07,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY])
-    }
-
-    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
-
-def score_recepta_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
-    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
-    modes = {
-        "conditivus"    : (171.0, 39.0, 0.005,    0.004,    0.2325, 0.0425, [PlanetType.HMC, PlanetType.ICY]),
-        "deltahedronix" : (138.0, 6.0,  0.005,    0.004,    0.2425, 0.0325, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "umbrux"        : (166.0, 34.0, 0.004975, 0.004025, 0.2375, 0.0375, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY])
-    }
-
-    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
-
-def score_sinuous_tubers_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
-    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
-    modes = {
-        "albidum"      : (350.0, 150.0, 0.00005,  0.00005,  0.187,  0.143,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "blatteum"     : (350.0, 150.0, 0.0005,   0.0005,   0.172,  0.128,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "caeruleum"    : (350.0, 150.0, 0.00235,  0.00235,  0.186,  0.144,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "lindigoticum" : (350.0, 150.0, None,     None,     0.138,  0.102,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "prasinum"     : (350.0, 150.0, 0.0045,   0.0045,   0.7065, 0.6635, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "roseum"       : (350.0, 150.0, 0.004,    0.004,    0.1865, 0.1435, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "violaceum"    : (350.0, 150.0, 0.0003,   0.0003,   0.16,   0.115,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "viride"       : (350.0, 150.0, 0.000285, 0.000285, 0.16,   0.117,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY])
-    }
-
-    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
-
-def score_stratum_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
-    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
-    modes = {
-        "araneamus"     : (208.5, 43.5, 0.00504,  0.00406,  0.375,  0.065,  [PlanetType.HMC, PlanetType.ROCKY]),
-        "cucumisis"     : (225.0, 35.0, 0.005,    0.005,    0.315,  0.105,  [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
-        "excutitus"     : (177.5, 12.5, 0.02549,  0.02451,  0.25,   0.15,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
-        "frigus"        : (220.0, 30.0, 0.010495, 0.009505, 0.35,   0.15,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
-        "laminamus"     : (220.0, 30.0, 0.007,    0.006,    0.19,   0.09,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
-        "limaxus"       : (177.5, 12.5, 0.025495, 0.024505, 0.265,  0.235,  [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
-        "paleas"        : (176.5, 18.5, 0.0005,   0.0005,   0.16,   0.08,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
-        "tectonicas"    : (170.0, 25.0, 0.00455,  0.00455,  0.2475, 0.2025, [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY])
-    }
-
-    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
-
-def score_tubus_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
-    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
-    modes = {
-        "cavas"      : (170.0, 10.0, 0.019,   0.016,   0.9,   0.04,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "compagibus" : (170.0, 10.0, 0.0165,  0.0135,  0.095, 0.045, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "conifer"    : (170.0, 10.0, 0.019,   0.016,   0.095, 0.035, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "rosarium"   : (170.0, 10.0, 0.00149, 0.00051, 0.135, 0.015, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "sororibus"  : (170.0, 10.0, 0.0179,  0.0081,  0.115, 0.035, [PlanetType.HMC, PlanetType.ICY])
-    }
-
-    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
-
-def score_tussock_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
-    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
-    modes = {
-        "albata"     : (177.5, 2.5,  0.0355,  0.0195,  0.175,  0.075,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "capillum"   : (100.0, 20.0, 0.01299, 0.01201, 0.24,   0.04,   [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY, PlanetType.ROCKY_ICE]),
-        "caputus"    : (183.0, 7.0,  0.065,   0.033,   0.2075, 0.0725, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "catena"     : (166.5, 8.5,  0.00199, 0.00101, 0.199,  0.081,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "cultro"     : (160.0, 20.0, 0.00249, 0.00151, 0.199,  0.081,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "divisa"     : (168.5, 8.5,  0.00249, 0.00151, 0.2,    0.08,   [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "ignis"      : (165.5, 4.5,  0.0149,  0.0121,  0.095,  0.035,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "pennata"    : (151.5, 2.5,  0.0053,  0.0018,  0.057,  0.014,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "pennatis"   : (177.0, 19.0, 0.05035, 0.04765, 0.134,  0.096,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "propagito"  : (176.5, 18.5, 0.02295, 0.02005, 0.1545, 0.1155, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "serrati"    : (172.0, 2.0,  0.025,   0.015,   0.1235, 0.0365, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "stigmasis"  : (135.0, 3.0,  0.00199, 0.00101, 0.253,  0.023,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "triticum"   : (193.0, 2.0,  0.082,   0.017,   0.235,  0.045,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "ventusa"    : (155.0, 5.0,  0.009,   0.006,   0.07,   0.03,   [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
-        "virgam"     : (425.0, 20.0, 0.0825,  0.0155,  0.053,  0.008,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY])
-    }
-
-    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
-
@@ -0,0 +1,215 @@
+"""
+biosign_priors.py – empirical species frequencies from the user's own system cache
+
+The heuristic scores of biosign_estimator rate how well a body matches the known conditions
+of a species. build_priors() counts instead what was actually found: every cached body whose
+biosignals are all identified contributes one observation to its bin (planet type, atmosphere,
+temperature band, gravity band) and one hit for each of its species. Files are counted one
+system per task on a process pool and the counts merged - serially in a frozen build.
+
+The result is saved as one compact JSON artifact next to the config. get_priors() loads it
+once; with it the estimator blends every heuristic score with the frequency of its bin - the
+heuristic counts as PRIOR_WEIGHT bodies, so sparse bins stay close to it and well observed
+bins follow the data. Without an artifact (or for empty bins) the heuristic is used unchanged.
+
+Build it with `EDXD --build-priors`.
+"""
+import json
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import EDXD.data_handler.helper.data_helper as dh
+
+PRIORS_VERSION  = 1
+PRIORS_NAME     = "biosign_priors.json"
+TEMP_BIN_K      = 25.0      # width of a temperature band
+GRAVITY_BIN_G   = 0.1       # width of a gravity band
+PRIOR_WEIGHT    = 4.0       # the heuristic score counts as this many observed bodies
+
+# bin key -> (bodies observed, {species: bodies it was found on})
+BinCounts = Dict[str, Tuple[int, Dict[str, int]]]
+
+
+def bin_key(planet_type: str, atmosphere: str, mean_temp_k: Optional[float], gravity: Optional[float],
+            temp_bin_k: float = TEMP_BIN_K, gravity_bin_g: float = GRAVITY_BIN_G) -> str:
+    """Bin of a body; planet type and atmosphere as the journal spells them."""
+    temp_band = int((mean_temp_k or 0.0) // temp_bin_k)
+    gravity_band = int((gravity or 0.0) // gravity_bin_g)
+    return f"{planet_type}|{atmosphere}|{temp_band}|{gravity_band}"
+
+
+def identified_species(body) -> List[str]:
+    """Species names known on body from DSS/surface scans and codex entries."""
+    species = set()
+    for genus in body.bio_found.values():
+        if genus is None:
+            continue
+        if genus.species_localised:
+            species.add(genus.species_localised)
+        elif genus.variant_localised:
+            species.add(genus.variant_localised.split(" - ")[0])
+    return sorted(species)
+
+
+class Priors:
+    """Observed species counts per bin, O(1) per lookup."""
+    __slots__ = ("bins", "bodies", "systems", "temp_bin_k", "gravity_bin_g")
+
+    def __init__(self, bins: BinCounts = None, bodies: int = 0, systems: int = 0,
+                 temp_bin_k: float = TEMP_BIN_K, gravity_bin_g: float = GRAVITY_BIN_G):
+        self.bins           : BinCounts = bins if bins is not None else {}
+        self.bodies         : int       = bodies
+        self.systems        : int       = systems
+        self.temp_bin_k     : float     = temp_bin_k
+        self.gravity_bin_g  : float     = gravity_bin_g
+
+    # ----- counting ----------------------------------------------------------
+    def add_body(self, key: str, species: Iterable[str]):
+        observed, counts = self.bins.get(key, (0, {}))
+        for name in species:
+            counts[name] = counts.get(name, 0) + 1
+        self.bins[key] = (observed + 1, counts)
+        self.bodies += 1
+
+    def merge(self, other: "Priors"):
+        for key, (observed, counts) in other.bins.items():
+            mine_observed, mine = self.bins.get(key, (0, {}))
+            for name, hits in counts.items():
+                mine[name] = mine.get(name, 0) + hits
+            self.bins[key] = (mine_observed + observed, mine)
+        self.bodies += other.bodies
+        self.systems += other.systems
+
+    # ----- lookups -----------------------------------------------------------
+    def key(self, planet_type: str, atmosphere: str, mean_temp_k: Optional[float], gravity: Optional[float]) -> str:
+        return bin_key(planet_type, atmosphere, mean_temp_k, gravity, self.temp_bin_k, self.gravity_bin_g)
+
+    def blend(self, key: str, species_names: List[str], scores: List[float]) -> List[float]:
+        """Heuristic scores of species_names on a body of bin key, blended with what was observed there."""
+        observed, counts = self.bins.get(key, (0, None))
+        if not observed:
+            return scores
+        denominator = observed + PRIOR_WEIGHT
+        return [(counts.get(name, 0) + PRIOR_WEIGHT * min(max(score, 0.0), 1.0)) / denominator
+                for name, score in zip(species_names, scores)]
+
+    # ----- artifact ----------------------------------------------------------
+    def to_dict(self) -> dict:
+        species = sorted({name for _, counts in self.bins.values() for name in counts})
+        index = {name: i for i, name in enumerate(species)}
+        bins = {}
+        for key, (observed, counts) in sorted(self.bins.items()):
+            # [bodies, species index, hits, species index, hits, ...]
+            row = [observed]
+            for name, hits in sorted(counts.items()):
+                row += (index[name], hits)
+            bins[key] = row
+        return {
+            "version"       : PRIORS_VERSION,
+            "temp_bin_k"    : self.temp_bin_k,
+            "gravity_bin_g" : self.gravity_bin_g,
+            "systems"       : self.systems,
+            "bodies"        : self.bodies,
+            "species"       : species,
+            "bins"          : bins,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Optional["Priors"]:
+        if not isinstance(data, dict) or data.get("version") != PRIORS_VERSION:
+            return None
+        species = data.get("species", [])
+        bins = {}
+        for key, row in data.get("bins", {}).items():
+            bins[key] = (row[0], {species[row[i]]: row[i + 1] for i in range(1, len(row) - 1, 2)})
+        return cls(bins, data.get("bodies", 0), data.get("systems", 0),
+                   data.get("temp_bin_k", TEMP_BIN_K), data.get("gravity_bin_g", GRAVITY_BIN_G))
+
+
+# ---------------------------------------------------------------------------
+# batch job over the system cache
+# ---------------------------------------------------------------------------
+def _count_cache_file(path: Path) -> Priors:
+    """Counts of one cached system: bodies whose biosignals are all identified."""
+    from EDXD.data_handler.helper.biosign_estimator import _safe_get_atmosphere_type
+    from EDXD.data_handler.model import LazyBody
+
+    priors = Priors(systems=1)
+    data = dh.load(path, {})
+    bodies = data.get("bodies") if isinstance(data, dict) else None
+    if not isinstance(bodies, dict):
+        return priors
+
+    for body_id, raw in bodies.items():
+        if not isinstance(raw, dict) or not raw.get("biosignals") or not raw.get("bio_found"):
+            continue
+        body = LazyBody(body_id, raw)
+        species = identified_species(body)
+        # a body with unidentified signals would count as "not found" for species that are there
+        if len(species) < body.biosignals:
+            continue
+        planet_type = body.body_type if isinstance(body.body_type, str) else str(body.body_type)
+        priors.add_body(priors.key(planet_type, _safe_get_atmosphere_type(body.atmosphere), body.mean_temp, body.g_force),
+                        species)
+    return priors
+
+
+def build_priors(cache_dir: Path = None, workers: Optional[int] = None) -> Priors:
+    """Count the species of all cached systems, one system file per task on a process pool."""
+    if cache_dir is None:
+        from EDXD.globals import CACHE_DIR
+        cache_dir = CACHE_DIR
+    paths = sorted(Path(cache_dir).glob("*.json"))
+    priors = Priors()
+    if not paths:
+        return priors
+
+    workers = dh.pool_workers(len(paths), workers)
+    if workers <= 1:
+        for path in paths:
+            priors.merge(_count_cache_file(path))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for result in pool.map(_count_cache_file, paths, chunksize=16):
+                priors.merge(result)
+    return priors
+
+
+def priors_path() -> Path:
+    from EDXD.globals import APP_DIR
+    return APP_DIR / PRIORS_NAME
+
+
+def save_priors(priors: Priors, path: Path = None):
+    path = path or priors_path()
+    # compact - the artifact is read on every start
+    path.write_text(json.dumps(priors.to_dict(), separators=(",", ":")))
+    get_priors.cache_clear()
+
+
+def load_priors(path: Path = None) -> Optional[Priors]:
+    path = path or priors_path()
+    try:
+        return Priors.from_dict(dh.load(path, None))
+    except (IndexError, KeyError, TypeError, ValueError) as e:
+        logging.getLogger(__name__).warning("ignoring broken biosign priors %s: %s", path, e)
+        return None
+
+
+@lru_cache(maxsize=1)
+def get_priors() -> Optional[Priors]:
+    """The saved priors, loaded once; None if none were built yet."""
+    return load_priors()
+
+
+def build_and_save(cache_dir: Path = None, workers: Optional[int] = None) -> Priors:
+    t0 = time.perf_counter()
+    priors = build_priors(cache_dir, workers)
+    save_priors(priors)
+    logging.getLogger(__name__).info("biosign priors: %d systems, %d bodies, %d bins in %.1fs",
+                                     priors.systems, priors.bodies, len(priors.bins), time.perf_counter() - t0)
+    return priors
@@ -125,154 +125,193 @@ terraform_states = {
     'Terraforming': 3
 }
 
-def encode_body_type(body_info):
-    if 'PlanetClass' not in body_info:
-        return None  # Belt clusters for example do not have a planet class
-    return body_types[body_info['PlanetClass']]
+# journal keys appraise_body reads - kept with every scanned body so it can be revalued later
+APPRAISAL_KEYS = ("StarType", "PlanetClass", "MassEM", "TerraformState", "WasDiscovered", "WasMapped")
 
 
-def encode_terraform_state(body_info):
-    if 'TerraformState' not in body_info or len(body_info['TerraformState']) == 0:
-        return None
-    return terraform_states[body_info['TerraformState']]
+def appraisal_inputs(body_info):
+    return {key: body_info[key] for key in APPRAISAL_KEYS if key in body_info}
 
 
-def encode_star_type(body_info):
-    return star_types[body_info['StarType']]
-
+# ---------------------------------------------------------------------------
+# value tables (keyed by the encoded types above)
+# ---------------------------------------------------------------------------
+STAR_DEFAULT_VALUE = 1200
+STAR_VALUES = {
+    # White Dwarf Star
+    **{specific_type: 14057 for specific_type in (51, 501, 502, 503, 504, 505, 506, 507, 508, 509, 510, 511, 512, 513, 514)},
+    # Neutron Star, Black Hole
+    91: 22628,
+    92: 22628,
+    # Super-massive Black Hole
+    # this is applying the same scaling to the 3.2 value as a normal black hole, not confirmed in game
+    93: 33.5678,
+}
 
-def appraise_body(body_info, just_scanned_value=True):
-    if "StarType" in body_info:
-        main_type = 'Star'
-        specific_type = encode_star_type(body_info)
-    else:
-        # Planet
-        main_type = 'Planet'
-        specific_type = encode_body_type(body_info)
+PLANET_DEFAULT_VALUE = 300
+PLANET_VALUES = {
+    1:  21790,      # Metal-rich body
+    51: 96932,      # Ammonia world
+    71: 1656,       # Class I gas giant
+    2:  9654,       # High metal content world
+    72: 9654,       # Class II gas giant
+    31: 64831,      # Earth-like world
+    41: 64831,      # Water world
+}
 
-    if "MassEM" in body_info:
-        mass = body_info['MassEM']
-    else:
-        mass = 0  # belts don't have a mass attribute
+TERRAFORM_DEFAULT_BONUS = 93328
+TERRAFORM_BONUS = {
+    1:  65631,      # Metal-rich body
+    2:  100677,     # High metal content world
+    72: 100677,     # Class II gas giant
+    31: 116295,     # Earth-like world
+    41: 116295,     # Water world
+}
+# bonus regardless of the terraform state
+PLANET_BONUS = {
+    31: 116295,     # Earth Like...
+}
 
-    terraform_state = encode_terraform_state(body_info)
+# (value + bonus) by (encoded planet type, terraformable); types outside the table use the defaults
+PLANET_BASE_VALUES = {
+    (specific_type, terraformable): PLANET_VALUES.get(specific_type, PLANET_DEFAULT_VALUE)
+        + (TERRAFORM_BONUS.get(specific_type, TERRAFORM_DEFAULT_BONUS) if terraformable else PLANET_BONUS.get(specific_type, 0))
+    for specific_type in set(body_types.values()) | {None}
+    for terraformable in (False, True)
+}
 
-    first_discoverer = "WasDiscovered" in body_info.keys()
-    if first_discoverer:
-        first_discoverer = not body_info['WasDiscovered']
+Q = 0.56591828
+FIRST_DISCOVERER_FACTOR = 2.6
 
-    first_mapper = "WasMapped" in body_info.keys()
-    if first_mapper:
-        first_mapper = not body_info['WasMapped']
 
-    options = {
-        'haveMapped': not just_scanned_value,  # Always indicate we mapped it so we can tell the max worth
-        'efficiencyBonus': True,
-#        'isFirstDiscoverer': not body_info['WasDiscovered'],
-        'isFirstDiscoverer': first_discoverer,
-        'isFirstMapper': first_mapper,
-    }
+def calculate_map_multiplier(have_mapped, first_discoverer, first_mapper, efficiency_bonus=True):
+    map_multiplier = 1.0
 
-    return calculate_estimated_value(main_type, specific_type, mass, terraform_state, options)
+    if have_mapped:
+        map_multiplier = 3.3333333333
 
+        if first_discoverer and first_mapper:
+            map_multiplier = 3.699622554
 
-def calculate_estimated_star_value(specific_type, mass):
-    value = 1200
+        elif not first_discoverer and first_mapper:
+            map_multiplier = 8.0956
 
-    # White Dwarf Star
-    if specific_type in [51, 501, 502, 503, 504, 505, 506, 507, 508, 509, 510, 511, 512, 513, 514]:
-        value = 14057
+        if efficiency_bonus:
+            map_multiplier *= 1.25
 
-    # Neutron Star, Black Hole
-    if specific_type in [91, 92]:
-        value = 22628
+    return map_multiplier
 
-    # Super-massive Black Hole
-    if specific_type in [93]:
-        # this is applying the same scaling to the 3.2 value as a normal black hole, not confirmed in game
-        value = 33.5678
 
-    return round(value + (mass * value / 66.25))
+# map multiplier by (have_mapped, first_discoverer, first_mapper), efficiency bonus included
+MAP_MULTIPLIERS = {
+    (have_mapped, first_discoverer, first_mapper): calculate_map_multiplier(have_mapped, first_discoverer, first_mapper)
+    for have_mapped in (False, True) for first_discoverer in (False, True) for first_mapper in (False, True)
+}
 
 
-def calculate_planet_bonus(specific_type, terraform_state):
-    bonus = 0
+def encode_body_type(body_info):
+    if 'PlanetClass' not in body_info:
+        return None  # Belt clusters for example do not have a planet class
+    return body_types[body_info['PlanetClass']]
 
-    if terraform_state is not None and terraform_state > 0:
-        bonus = 93328
 
-    # Metal-rich body
-    if specific_type in [1]:
-        if terraform_state is not None and terraform_state > 0:
-            bonus = 65631
+def encode_terraform_state(body_info):
+    if 'TerraformState' not in body_info or len(body_info['TerraformState']) == 0:
+        return None
+    return terraform_states[body_info['TerraformState']]
 
-    # High metal content world / Class II gas giant
-    if specific_type in [2, 72]:
-        if terraform_state is not None and terraform_state > 0:
-            bonus = 100677
 
-    # Earth-like world / Water world
-    if specific_type in [31, 41]:
-        if terraform_state is not None and terraform_state > 0:
-            bonus = 116295
+def encode_star_type(body_info):
+    return star_types[body_info['StarType']]
 
-        if specific_type == 31:  # Earth Like...
-            bonus = 116295
 
-    return bonus
+def _first_flags(body_info):
+    first_discoverer = "WasDiscovered" in body_info and not body_info['WasDiscovered']
+    first_mapper = "WasMapped" in body_info and not body_info['WasMapped']
+    return first_discoverer, first_mapper
 
 
-def calculate_planet_value(specific_type):
-    value = 300
+def _encode(body_info):
+    if "StarType" in body_info:
+        return True, encode_star_type(body_info)
+    # Planet
+    return False, encode_body_type(body_info)
 
-    # Metal-rich body
-    if specific_type in [1]:
-        value = 21790
 
-    # Ammonia world
-    if specific_type in [51]:
-        value = 96932
+def appraise_body(body_info, just_scanned_value=True):
+    is_star, specific_type = _encode(body_info)
+    # belts don't have a mass attribute
+    mass = body_info['MassEM'] if "MassEM" in body_info else 0
+    first_discoverer, first_mapper = _first_flags(body_info)
+    # Always indicate we mapped it so we can tell the max worth
+    return estimate_value(is_star, specific_type, mass, encode_terraform_state(body_info),
+                          first_discoverer, first_mapper, have_mapped=not just_scanned_value)
+
+
+def appraise_values(body_info):
+    """(scanned value, mapped value) of one Scan event - the mass term is computed once for both."""
+    is_star, specific_type = _encode(body_info)
+    mass = body_info['MassEM'] if "MassEM" in body_info else 0
+    if mass is None:
+        mass = 1
+    if is_star:
+        value = calculate_estimated_star_value(specific_type, mass)
+        return value, value
+    first_discoverer, first_mapper = _first_flags(body_info)
+    base, mass_term = _planet_base(specific_type, mass, encode_terraform_state(body_info))
+    # bodies without mass (belts) are always valued as mapped
+    return (_planet_value(base, mass_term, mass == 0, first_discoverer, first_mapper),
+            _planet_value(base, mass_term, True, first_discoverer, first_mapper))
+
+
+def estimate_value(is_star, specific_type, mass, terraform_state, first_discoverer, first_mapper, have_mapped=True):
+    """Pure form of appraise_body for batch callers: encoded type, mass in earth masses, flags as bools."""
+    if mass is None:
+        mass = 1
+    if is_star:
+        return calculate_estimated_star_value(specific_type, mass)
+    base, mass_term = _planet_base(specific_type, mass, terraform_state)
+    return _planet_value(base, mass_term, have_mapped or mass == 0, first_discoverer, first_mapper)
 
-    # Class I gas giant
-    if specific_type in [71]:
-        value = 1656
 
-    # High metal content world / Class II gas giant
-    if specific_type in [2, 72]:
-        value = 9654
+def _planet_base(specific_type, mass, terraform_state):
+    terraformable = terraform_state is not None and terraform_state > 0
+    base = PLANET_BASE_VALUES.get((specific_type, terraformable))
+    if base is None:
+        base = calculate_planet_value(specific_type) + calculate_planet_bonus(specific_type, terraform_state)
+    return base, base * pow(mass, 0.2) * Q
 
-    # Earth-like world / Water world
-    if specific_type in [31, 41]:
-        value = 64831
 
-    return value
+def _planet_value(base, mass_term, have_mapped, first_discoverer, first_mapper):
+    value = max((base + mass_term) * MAP_MULTIPLIERS[(have_mapped, bool(first_discoverer), bool(first_mapper))], 500)
+    if first_discoverer:
+        value *= FIRST_DISCOVERER_FACTOR
+    return round(value)
 
 
-def calculate_estimated_planet_value(specific_type, mass, terraform_state, options):
-    value = calculate_planet_value(specific_type)
-    bonus = calculate_planet_bonus(specific_type, terraform_state)
+def calculate_estimated_star_value(specific_type, mass):
+    value = STAR_VALUES.get(specific_type, STAR_DEFAULT_VALUE)
+    return round(value + (mass * value / 66.25))
 
-    # CALCULATION
-    q = 0.56591828
-    value = value + bonus
-    map_multiplier = 1.0
 
-    if options['haveMapped']:
-        map_multiplier = 3.3333333333
+def calculate_planet_bonus(specific_type, terraform_state):
+    if terraform_state is not None and terraform_state > 0:
+        return TERRAFORM_BONUS.get(specific_type, TERRAFORM_DEFAULT_BONUS)
+    return PLANET_BONUS.get(specific_type, 0)
 
-        if options['isFirstDiscoverer'] and options['isFirstMapper']:
-            map_multiplier = 3.699622554
 
-        elif not options['isFirstDiscoverer'] and options['isFirstMapper']:
-            map_multiplier = 8.0956
+def calculate_planet_value(specific_type):
+    return PLANET_VALUES.get(specific_type, PLANET_DEFAULT_VALUE)
 
-        if options['efficiencyBonus']:
-            map_multiplier *= 1.25
 
-    value = max((value + (value * pow(mass, 0.2) * q)) * map_multiplier, 500)
+def calculate_estimated_planet_value(specific_type, mass, terraform_state, options):
+    base, mass_term = _planet_base(specific_type, mass, terraform_state)
+    map_multiplier = calculate_map_multiplier(options['haveMapped'], options['isFirstDiscoverer'],
+                                              options['isFirstMapper'], options['efficiencyBonus'])
+    value = max((base + mass_term) * map_multiplier, 500)
 
     if options['isFirstDiscoverer']:
-        value *= 2.6
+        value *= FIRST_DISCOVERER_FACTOR
 
     return round(value)
 
@@ -1,6 +1,8 @@
 import inspect
 import json
+import os
 import re
+import sys
 import wx
 from datetime import datetime
 from pathlib import Path
@@ -28,11 +30,21 @@ def load(path: Path, default):
 
 def save(path: Path, data):
     try:
-        logging.debug(f"{data}\n{json.dumps(data, indent=4)}")
+        if logging.root.isEnabledFor(logging.DEBUG):
+            logging.debug("%s\n%s", data, json.dumps(data, indent=4))
         path.write_text(json.dumps(data, indent=2))
     except Exception as e:
         log_context(level=logging.ERROR, frame=inspect.currentframe(), e=e)
 
+def pool_workers(jobs: int, workers: Optional[int] = None) -> int:
+    """
+    Processes for a batch of jobs on a process pool. A frozen (PyInstaller) build gets 1 - its
+    children would start the executable again - so the batch runs in this process.
+    """
+    if getattr(sys, "frozen", False):
+        return 1
+    return workers or min(jobs, os.cpu_count() or 1)
+
 #133 - change sorting of journal files
 def _extract_timestamp_from_filename(path: Path) -> Optional[datetime]:
     """
@@ -269,7 +281,7 @@ def latest_journal(folder: Path) -> Optional[Path]:
     for f in files:
         ts = _extract_timestamp_from_filename(f)
         if ts is None:
-            logging.debug(f"Could not parse timestamp from journal filename: {f.name}")
+            logging.debug("Could not parse timestamp from journal filename: %s", f.name)
             continue
         parsed.append((ts, f))
 
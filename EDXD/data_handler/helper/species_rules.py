@@ -0,0 +1,385 @@
+"""
+species_rules.py – exobiology species constraints as data
+
+Every SpeciesRule lists the conditions a body (and its parent star) must meet for the species to
+be a candidate. compile_rules() buckets the rules by planet type and atmosphere class, so
+estimate_biosigns() only evaluates the handful of rules that can match a given body.
+
+New Codex data is a table edit: add or change a SpeciesRule in SPECIES_RULES. Rules are evaluated
+in table order and a species may appear in several rules - the output keeps that order and
+multiplicity, exactly like the former if-cascade.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import AbstractSet, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from EDXD.data_handler.helper.system_params import (
+    StarClass, StarLuminosity, PlanetType,
+    PT_GROUP_HMC_ROCKY, PT_GROUP_ICE,
+    SC_WHITE_DWARFS
+)
+
+STR_LIST_NONE = {None, "", "None", "none"}
+
+# ---------------------------------------------------------------------------
+# atmosphere classes (index key next to the planet type)
+# ---------------------------------------------------------------------------
+ATM_NONE    = "none"    # no atmosphere
+ATM_THIN    = "thin"    # "thin ..." atmospheres, where almost all species live
+ATM_OTHER   = "other"   # anything else (thick, hot, ...)
+ATM_ANY     = "any"     # rule only: matches every class
+
+ATM_CLASSES = (ATM_NONE, ATM_THIN, ATM_OTHER)
+
+
+def atmosphere_class(atmosphere: Optional[str]) -> str:
+    if atmosphere in STR_LIST_NONE:
+        return ATM_NONE
+    if "thin" in atmosphere:
+        return ATM_THIN
+    return ATM_OTHER
+
+
+# ---------------------------------------------------------------------------
+# body conditions usable in SpeciesRule.requires
+# ---------------------------------------------------------------------------
+VOLCANIC            = "volcanic"
+IN_NEBULA           = "in_nebula"
+EARTH_LIKE          = "earth_like"
+AMMONIA_WORLD       = "ammonia_world"
+WATER_GIANT         = "water_giant"
+GG_WATER_LIFE       = "gg_water_life"
+GG_AMMONIA_LIFE     = "gg_ammonia_life"
+
+SYSTEM_HAS_LIFE_WORLD = frozenset({EARTH_LIKE, AMMONIA_WORLD, WATER_GIANT, GG_WATER_LIFE, GG_AMMONIA_LIFE})
+
+
+@dataclass(frozen=True, slots=True)
+class Range:
+    """Numeric range; None on either side is unbounded. A missing value only matches if none_ok."""
+    lo          : Optional[float] = None
+    hi          : Optional[float] = None
+    lo_open     : bool = False
+    hi_open     : bool = False
+    none_ok     : bool = False
+
+    def contains(self, value: Optional[float]) -> bool:
+        if value is None:
+            return self.none_ok
+        if self.lo is not None and (value <= self.lo if self.lo_open else value < self.lo):
+            return False
+        if self.hi is not None and (value >= self.hi if self.hi_open else value > self.hi):
+            return False
+        return True
+
+
+def between(lo: float, hi: float) -> Range:
+    return Range(lo, hi)
+
+def above(lo: float) -> Range:
+    return Range(lo=lo, lo_open=True)
+
+def below(hi: float) -> Range:
+    return Range(hi=hi, hi_open=True)
+
+def at_most(hi: float) -> Range:
+    return Range(hi=hi)
+
+
+# gravity checks written as "gravity and gravity <= x" - a zero or missing gravity never matches
+LOW_G   = Range(0.0, 0.28, lo_open=True)
+
+
+@dataclass(frozen=True, slots=True)
+class SpeciesRule:
+    species         : Tuple[str, ...]
+    planets         : Optional[FrozenSet[PlanetType]]       = None  # None: any planet type
+    atmosphere      : str                                   = ATM_THIN
+    atm_all         : Tuple[str, ...]                       = ()    # all of these must be in the atmosphere
+    atm_any         : Tuple[str, ...]                       = ()    # one of these must be in the atmosphere
+    atm_none        : Tuple[str, ...]                       = ()    # none of these may be in the atmosphere
+    temp            : Optional[Range]                       = None  # mean temperature [K]
+    gravity         : Optional[Range]                       = None  # [g]
+    volc_any        : FrozenSet[str]                        = frozenset()
+    volc_none       : FrozenSet[str]                        = frozenset()
+    requires        : Tuple[FrozenSet[str], ...]            = ()    # every group needs one condition present
+    distance        : Optional[Range]                       = None  # distance to the parent star [Ls]
+    stars           : Optional[FrozenSet[StarClass]]        = None
+    luminosities    : Optional[FrozenSet[StarLuminosity]]   = None
+
+    def matches_atmosphere(self, atmosphere: str) -> bool:
+        if self.atm_all and not all(token in atmosphere for token in self.atm_all):
+            return False
+        if self.atm_any and not any(token in atmosphere for token in self.atm_any):
+            return False
+        if self.atm_none and any(token in atmosphere for token in self.atm_none):
+            return False
+        return True
+
+    def matches_body(self, mean_temp_k: float, volcanism_tokens: FrozenSet[str], gravity: Optional[float],
+                     conditions: AbstractSet[str], distance_ls: Optional[float]) -> bool:
+        """Everything but atmosphere and star - volcanism_tokens comes from volcanism_tokens()."""
+        if self.temp is not None and not self.temp.contains(mean_temp_k):
+            return False
+        if self.gravity is not None and not self.gravity.contains(gravity):
+            return False
+        if self.volc_any and self.volc_any.isdisjoint(volcanism_tokens):
+            return False
+        if self.volc_none and not self.volc_none.isdisjoint(volcanism_tokens):
+            return False
+        for group in self.requires:
+            if group.isdisjoint(conditions):
+                return False
+        if self.distance is not None and not self.distance.contains(distance_ls):
+            return False
+        return True
+
+    def matches_star(self, star_class: Optional[StarClass], star_luminosity: Optional[StarLuminosity]) -> bool:
+        if self.stars is not None and star_class not in self.stars:
+            return False
+        if self.luminosities is not None and star_luminosity not in self.luminosities:
+            return False
+        return True
+
+
+def _rule(*species: str, planets: Iterable[PlanetType] = None, stars: Iterable[StarClass] = None,
+          luminosities: Iterable[StarLuminosity] = None, requires: Iterable[Iterable[str]] = (),
+          volc_any: Iterable[str] = (), volc_none: Iterable[str] = (), **kwargs) -> SpeciesRule:
+    return SpeciesRule(
+        species         = species,
+        volc_any        = frozenset(volc_any),
+        volc_none       = frozenset(volc_none),
+        planets         = frozenset(planets) if planets is not None else None,
+        stars           = frozenset(stars) if stars is not None else None,
+        luminosities    = frozenset(luminosities) if luminosities is not None else None,
+        requires        = tuple(frozenset(group) for group in requires),
+        **kwargs
+    )
+
+
+# ---------------------------------------------------------------------------
+# the species table
+# ---------------------------------------------------------------------------
+_METAL          = (PlanetType.METAL_RICH, PlanetType.HMC)
+_ROCKY          = (PlanetType.ROCKY,)
+_HMC            = (PlanetType.HMC,)
+_TUSSOCK        = (PlanetType.ROCKY, PlanetType.HMC)
+_LUM_GIANT      = (StarLuminosity.I, StarLuminosity.II, StarLuminosity.III)
+_LUM_DWARF      = (StarLuminosity.IV, StarLuminosity.V)
+_LIFE_WORLD     = (SYSTEM_HAS_LIFE_WORLD,)
+
+SPECIES_RULES: Tuple[SpeciesRule, ...] = (
+    # Aleoida - gravity is only checked for presence, 0 g passes
+    _rule("Aleoida Arcus",              planets=PT_GROUP_HMC_ROCKY, gravity=at_most(0.28), atm_any=("carbon dioxide",), temp=between(175, 180)),
+    _rule("Aleoida Coronamus",          planets=PT_GROUP_HMC_ROCKY, gravity=at_most(0.28), atm_any=("carbon dioxide",), temp=between(179, 190)),
+    _rule("Aleoida Gravis",             planets=PT_GROUP_HMC_ROCKY, gravity=at_most(0.28), atm_any=("carbon dioxide",), temp=between(190, 197)),
+    _rule("Aleoida Laminiae",           planets=PT_GROUP_HMC_ROCKY, gravity=at_most(0.28), atm_any=("ammonia",), temp=between(152, 177)),
+    _rule("Aleoida Spica",              planets=PT_GROUP_HMC_ROCKY, gravity=at_most(0.28), atm_any=("ammonia",), temp=between(170, 177)),
+
+    # Amphora Plant
+    _rule("Amphora Plant",              atmosphere=ATM_NONE, stars=(StarClass.A,), requires=_LIFE_WORLD),
+    # Anemone (Sphere) - depends on the parent star only
+    # Anemone (Mapped to Clypeus genus) - depends on the parent star only
+    _rule("Croceum Anemone",                    atmosphere=ATM_ANY, stars=(StarClass.A,), luminosities=(StarLuminosity.III,), planets=_ROCKY),
+    _rule("Rubeum Bioluminescent Anemone",      atmosphere=ATM_ANY, stars=(StarClass.A,), luminosities=(StarLuminosity.III,), planets=_METAL),
+    _rule("Roseum Bioluminescent Anemone",      atmosphere=ATM_ANY, stars=(StarClass.B,), luminosities=_LUM_GIANT, planets=_METAL),
+    _rule("Roseum Anemone",                     atmosphere=ATM_ANY, stars=(StarClass.B,), luminosities=_LUM_GIANT, planets=_ROCKY),
+    _rule("Blatteum Bioluminescent Anemone",    atmosphere=ATM_ANY, stars=(StarClass.B,), luminosities=_LUM_DWARF, planets=_METAL),
+    _rule("Luteolum Anemone",                   atmosphere=ATM_ANY, stars=(StarClass.B,), luminosities=_LUM_DWARF, planets=_ROCKY),
+    _rule("Rubeum Bioluminescent Anemone",      atmosphere=ATM_ANY, stars=(StarClass.B,), luminosities=(StarLuminosity.VI,), planets=_METAL),
+    _rule("Croceum Anemone",                    atmosphere=ATM_ANY, stars=(StarClass.B,), luminosities=(StarLuminosity.VI,), planets=_ROCKY),
+    _rule("Puniceum Anemone",                   atmosphere=ATM_ANY, stars=(StarClass.O,), planets=(PlanetType.ROCKY_ICE, PlanetType.ICY)),
+    _rule("Prasinum Bioluminescent Anemone",    atmosphere=ATM_ANY, stars=(StarClass.O,), planets=(*_METAL, PlanetType.ROCKY)),
+
+    # Bacterium
+    _rule("Bacterium Nebulus",          atm_any=("helium",)),
+    _rule("Bacterium Omentum",          atm_any=("neon",), volc_any=("nitrogen", "ammonia")),
+    _rule("Bacterium Scopulum",         atm_any=("neon",), volc_any=("carbon", "methane"), volc_none=("nitrogen", "ammonia")),
+    _rule("Bacterium Verrata",          atm_any=("neon",), volc_any=("water",), volc_none=("nitrogen", "ammonia", "carbon", "methane")),
+    _rule("Bacterium Acies",            atm_any=("neon",), volc_none=("nitrogen", "ammonia", "carbon", "methane", "water")),
+    _rule("Bacterium Bullaris",         atm_any=("methane",)),
+    _rule("Bacterium Vesicula",         atm_any=("argon",)),
+    _rule("Bacterium Informem",         atm_any=("nitrogen",)),
+    _rule("Bacterium Volu",             atm_any=("oxygen",)),
+    _rule("Bacterium Alcyoneum",        atm_any=("ammonia",)),
+    _rule("Bacterium Aurasus",          atm_any=("carbon",)),
+    _rule("Bacterium Cerbrus",          atm_any=("water", "sulfur")),
+    _rule("Bacterium Tela",             volc_any=("helium", "metallic", "silicate")),
+
+    # Bark Mound
+    _rule("Bark Mound",                 atmosphere=ATM_NONE, requires=({IN_NEBULA, VOLCANIC},)),
+
+    # Brain Tree
+    _rule("Brain Tree Roseum",          atmosphere=ATM_NONE, requires=({VOLCANIC},), temp=between(200, 500)),
+    _rule("Brain Tree Aureum",          atmosphere=ATM_NONE, requires=({VOLCANIC}, {EARTH_LIKE, GG_WATER_LIFE}), planets=_METAL, temp=between(300, 500)),
+    _rule("Brain Tree Gypseeum",        atmosphere=ATM_NONE, requires=({VOLCANIC}, {EARTH_LIKE, GG_WATER_LIFE}), planets=_ROCKY, temp=between(200, 300)),
+    _rule("Brain Tree Lindigoticum",    atmosphere=ATM_NONE, requires=({VOLCANIC}, {EARTH_LIKE, GG_WATER_LIFE}), planets=(PlanetType.HMC, PlanetType.ROCKY), temp=between(300, 500)),
+    _rule("Brain Tree Lividum",         atmosphere=ATM_NONE, requires=({VOLCANIC}, {EARTH_LIKE, GG_WATER_LIFE}), planets=_ROCKY, temp=between(300, 500)),
+    _rule("Brain Tree Ostrinum", "Brain Tree Puniceum",
+                                        atmosphere=ATM_NONE, requires=({VOLCANIC}, {EARTH_LIKE, GG_WATER_LIFE}), planets=_METAL),
+    _rule("Brain Tree Viride",          atmosphere=ATM_NONE, requires=({VOLCANIC}, {EARTH_LIKE, GG_WATER_LIFE}), planets=(PlanetType.ROCKY_ICE,), temp=between(100, 270)),
+
+    # Cactoida
+    _rule("Cactoida Cortexum", "Cactoida Pullulanta",
+                                        planets=PT_GROUP_HMC_ROCKY, gravity=LOW_G, atm_any=("carbon",), atm_none=("rich",)),
+    _rule("Cactoida Cortexum", "Cactoida Pullulanta",
+                                        planets=PT_GROUP_HMC_ROCKY, gravity=LOW_G, atm_any=("rich",), temp=between(180, 195)),
+    _rule("Cactoida Lapis", "Cactoida Peperatis",
+                                        planets=PT_GROUP_HMC_ROCKY, gravity=LOW_G, atm_any=("ammonia",)),
+    _rule("Cactoida Vermis",            planets=PT_GROUP_HMC_ROCKY, gravity=LOW_G, atm_any=("water",)),
+
+    # Clypeus
+    _rule("Clypeus Lacrimam", "Clypeus Margaritus",
+                                        planets=PT_GROUP_HMC_ROCKY, gravity=Range(0.0, 0.27, lo_open=True), atm_any=("water", "carbon"), temp=above(190)),
+    _rule("Clypeus Speculumi",          planets=PT_GROUP_HMC_ROCKY, gravity=Range(0.0, 0.27, lo_open=True), atm_any=("water", "carbon"), temp=above(190),
+                                        distance=above(2500)),
+
+    # Concha
+    _rule("Concha Aureolas",            planets=PT_GROUP_HMC_ROCKY, gravity=LOW_G, atm_any=("ammonia",)),
+    _rule("Concha Biconcavis",          planets=PT_GROUP_HMC_ROCKY, gravity=LOW_G, atm_any=("nitrogen",)),
+    _rule("Concha Labiata",             planets=PT_GROUP_HMC_ROCKY, gravity=LOW_G, atm_any=("carbon",), temp=below(190)),
+    _rule("Concha Renibus",             planets=PT_GROUP_HMC_ROCKY, gravity=LOW_G, atm_any=("carbon",), temp=between(180, 195)),
+    _rule("Concha Renibus",             planets=PT_GROUP_HMC_ROCKY, gravity=LOW_G, atm_any=("water",)),
+
+    # Crystalline Shard
+    _rule("Crystalline Shard",          atmosphere=ATM_NONE, requires=_LIFE_WORLD,
+                                        stars=(StarClass.A, StarClass.F, StarClass.G, StarClass.K, StarClass.M, StarClass.S),
+                                        distance=Range(lo=12000, lo_open=True, none_ok=True)),
+
+    # Electricae
+    _rule("Electricae Pluma",           planets=(PlanetType.ICY,), gravity=LOW_G, atm_any=("helium", "neon", "argon"),
+                                        stars=(StarClass.A,), luminosities=(StarLuminosity.V, StarLuminosity.VI, StarLuminosity.VII)),
+    _rule("Electricae Pluma",           planets=(PlanetType.ICY,), gravity=LOW_G, atm_any=("helium", "neon", "argon"),
+                                        stars=(StarClass.O, StarClass.B, StarClass.N, StarClass.BlackHole, *SC_WHITE_DWARFS)),
+    _rule("Electricae Radialem",        planets=(PlanetType.ICY,), gravity=LOW_G, atm_any=("helium", "neon", "argon"), requires=({IN_NEBULA},)),
+
+    # Fonticulua
+    _rule("Fonticulua Segmentatus",     planets=PT_GROUP_ICE, gravity=LOW_G, atm_any=("neon",)),
+    _rule("Fonticulua Digitos",         planets=PT_GROUP_ICE, gravity=LOW_G, atm_any=("methane",)),
+    _rule("Fonticulua Upupam",          planets=PT_GROUP_ICE, gravity=LOW_G, atm_all=("argon", "rich")),
+    _rule("Fonticulua Campestris",      planets=PT_GROUP_ICE, gravity=LOW_G, atm_any=("argon",), atm_none=("rich",)),
+    _rule("Fonticulua Lapida",          planets=PT_GROUP_ICE, gravity=LOW_G, atm_any=("nitrogen",)),
+    _rule("Fonticulua Fluctus",         planets=PT_GROUP_ICE, gravity=LOW_G, atm_any=("oxygen",)),
+
+    # Frutexa
+    _rule("Frutexa Flabellum", "Frutexa Flammasis",
+                                        planets=_ROCKY, atm_any=("ammonia",)),
+    _rule("Frutexa Metallicum",         planets=_HMC, atm_any=("ammonia",)),
+    _rule("Frutexa Fera", "Frutexa Acus",
+                                        planets=_ROCKY, atm_any=("carbon",), temp=below(195)),
+    _rule("Frutexa Metallicum",         planets=_HMC, atm_any=("carbon",), temp=below(195)),
+    _rule("Frutexa Collum",             atm_any=("sulfur",)),
+    _rule("Frutexa Sponsae",            planets=_ROCKY, atm_any=("water",)),
+
+    # Fumerola
+    _rule("Fumerola Aquatis",           requires=({VOLCANIC},), gravity=LOW_G, planets=PT_GROUP_ICE, volc_any=("water",)),
+    _rule("Fumerola Carbosis",          requires=({VOLCANIC},), gravity=LOW_G, planets=PT_GROUP_ICE, volc_any=("methane", "carbon")),
+    _rule("Fumerola Extremus",          requires=({VOLCANIC},), gravity=LOW_G, planets=PT_GROUP_HMC_ROCKY, volc_any=("metallic", "rocky", "silicate")),
+    _rule("Fumerola Nitris",            requires=({VOLCANIC},), gravity=LOW_G, planets=PT_GROUP_ICE, volc_any=("nitrogen", "ammonia")),
+
+    # Fungoida
+    _rule("Fungoida Setisis",           gravity=LOW_G, atm_any=("methane", "ammonia")),
+    _rule("Fungoida Bullarum",          gravity=LOW_G, atm_any=("argon",)),
+    _rule("Fungoida Gelata", "Fungoida Stabitis",
+                                        gravity=LOW_G, atm_any=("water",)),
+    _rule("Fungoida Gelata", "Fungoida Stabitis",
+                                        gravity=LOW_G, atm_any=("carbon",), atm_none=("water",), temp=between(180, 195)),
+
+    # Osseus
+    _rule("Osseus Pumice",              gravity=LOW_G, planets=(PlanetType.ROCKY_ICE,), atm_any=("methane", "argon", "nitrogen")),
+    _rule("Osseus Cornibus", "Osseus Pellebantus",
+                                        gravity=LOW_G, planets=PT_GROUP_HMC_ROCKY, atm_any=("carbon",), temp=between(180, 195)),
+    # the cascade read "180 >= mean_temp_k <= 190", i.e. at most 180 K
+    _rule("Osseus Fractus",             gravity=LOW_G, planets=PT_GROUP_HMC_ROCKY, atm_any=("carbon",), temp=at_most(180)),
+    _rule("Osseus Discus",              gravity=LOW_G, planets=PT_GROUP_HMC_ROCKY, atm_any=("water",)),
+    _rule("Osseus Spiralis",            gravity=LOW_G, planets=PT_GROUP_HMC_ROCKY, atm_any=("ammonia",)),
+
+    # Recepta
+    _rule("Recepta Conditivus",         gravity=Range(0.0, 0.28, lo_open=True, hi_open=True), atm_any=("thin sulfur",), planets=PT_GROUP_ICE),
+    _rule("Recepta Deltahedronix",      gravity=Range(0.0, 0.28, lo_open=True, hi_open=True), atm_any=("thin sulfur",), planets=PT_GROUP_HMC_ROCKY),
+    _rule("Recepta Umbrux",             gravity=Range(0.0, 0.28, lo_open=True, hi_open=True), atm_any=("thin sulfur",), planets=(*PT_GROUP_HMC_ROCKY, *PT_GROUP_ICE)),
+
+    # Sinuous Tuber
+    _rule("Roseum Sinuous Tubers",      atmosphere=ATM_NONE, requires=({VOLCANIC},), volc_any=("silicate magma",)),
+    _rule("Albidum Sinuous Tubers", "Caeruleum Sinuous Tubers", "Lindigoticum Sinuous Tubers",
+                                        atmosphere=ATM_NONE, requires=({VOLCANIC},), planets=_ROCKY),
+    _rule("Blatteum Sinuous Tubers", "Prasinum Sinuous Tubers", "Violaceum Sinuous Tubers", "Viride Sinuous Tubers",
+                                        atmosphere=ATM_NONE, requires=({VOLCANIC},), planets=_METAL),
+
+    # Stratum
+    _rule("Stratum Tectonicas",         planets=_HMC, temp=above(165)),
+    _rule("Stratum Paleas", "Stratum Laminamus",
+                                        planets=_ROCKY, atm_any=("ammonia",), temp=above(165)),
+    _rule("Stratum Paleas",             planets=_ROCKY, atm_any=("water",)),
+    _rule("Stratum Paleas",             planets=_ROCKY, atm_any=("carbon",), temp=above(165)),
+    _rule("Stratum Cucumisis", "Stratum Frigus",
+                                        planets=_ROCKY, atm_any=("carbon",), temp=above(190)),
+    _rule("Stratum Limaxus", "Stratum Excutitus",
+                                        planets=_ROCKY, atm_any=("carbon",), temp=between(165, 190)),
+    _rule("Stratum Araneamus",          planets=_ROCKY, atm_any=("sulfur",), temp=above(165)),
+    _rule("Stratum Cucumisis", "Stratum Frigus",
+                                        planets=_ROCKY, atm_any=("sulfur",), temp=above(190)),
+    _rule("Stratum Limaxus", "Stratum Excutitus",
+                                        planets=_ROCKY, atm_any=("sulfur",), temp=between(165, 190)),
+
+    # Tubus
+    _rule("Tubus Sororibus",            gravity=Range(0.0, 0.16, lo_open=True), planets=_HMC, atm_any=("ammonia", "carbon")),
+    _rule("Tubus Rosarium",             gravity=Range(0.0, 0.16, lo_open=True), planets=_ROCKY, atm_any=("ammonia",)),
+    _rule("Tubus Cavas",                gravity=Range(0.0, 0.16, lo_open=True), planets=_ROCKY, atm_any=("carbon",)),
+    _rule("Tubus Compagibus", "Tubus Conifer",
+                                        gravity=Range(0.0, 0.16, lo_open=True), planets=_ROCKY, atm_any=("carbon",), temp=between(160, 190)),
+
+    # Tussock
+    _rule("Tussock Albata",             planets=_TUSSOCK, gravity=LOW_G, atm_any=("carbon",), temp=between(175, 180)),
+    _rule("Tussock Caputus",            planets=_TUSSOCK, gravity=LOW_G, atm_any=("carbon",), temp=between(180, 190)),
+    _rule("Tussock Ignis",              planets=_TUSSOCK, gravity=LOW_G, atm_any=("carbon",), temp=between(160, 170)),
+    _rule("Tussock Pennata",            planets=_TUSSOCK, gravity=LOW_G, atm_any=("carbon",), temp=between(145, 155)),
+    _rule("Tussock Pennatis", "Tussock Propagito",
+                                        planets=_TUSSOCK, gravity=LOW_G, atm_any=("carbon",), temp=below(195)),
+    _rule("Tussock Serrati",            planets=_TUSSOCK, gravity=LOW_G, atm_any=("carbon",), temp=between(170, 175)),
+    _rule("Tussock Triticum",           planets=_TUSSOCK, gravity=LOW_G, atm_any=("carbon",), temp=between(190, 195)),
+    _rule("Tussock Ventusa",            planets=_TUSSOCK, gravity=LOW_G, atm_any=("carbon",), temp=between(155, 160)),
+    _rule("Tussock Capillum",           planets=_TUSSOCK, gravity=LOW_G, atm_any=("methane", "argon")),
+    _rule("Tussock Catena", "Tussock Cultro", "Tussock Divisa",
+                                        planets=_TUSSOCK, gravity=LOW_G, atm_any=("ammonia",)),
+    _rule("Tussock Stigmasis",          planets=_TUSSOCK, gravity=LOW_G, atm_any=("sulfur",)),
+    _rule("Tussock Virgam",             planets=_TUSSOCK, gravity=LOW_G, atm_any=("water",)),
+)
+
+
+# ---------------------------------------------------------------------------
+# compiler
+# ---------------------------------------------------------------------------
+SpeciesIndex = Dict[Tuple[PlanetType, str], Tuple[SpeciesRule, ...]]
+
+
+def compile_rules(rules: Iterable[SpeciesRule]) -> SpeciesIndex:
+    """Bucket the rules by (planet type, atmosphere class), keeping the table order inside each bucket."""
+    index: Dict[Tuple[PlanetType, str], list] = {(pt, atm): [] for pt in PlanetType for atm in ATM_CLASSES}
+    for rule in rules:
+        planets = rule.planets if rule.planets is not None else PlanetType
+        atm_classes = ATM_CLASSES if rule.atmosphere == ATM_ANY else (rule.atmosphere,)
+        for pt in planets:
+            for atm in atm_classes:
+                index[(pt, atm)].append(rule)
+    return {key: tuple(bucket) for key, bucket in index.items()}
+
+
+SPECIES_INDEX: SpeciesIndex = compile_rules(SPECIES_RULES)
+VOLCANISM_TOKENS: FrozenSet[str] = frozenset(t for rule in SPECIES_RULES for t in (*rule.volc_any, *rule.volc_none))
+
+
+# atmospheres and volcanism come from a small, closed vocabulary, so the substring tests are
+# resolved once per distinct string instead of once per rule and call
+@lru_cache(maxsize=1024)
+def candidate_rules(planet_type: PlanetType, atmosphere: Optional[str]) -> Tuple[SpeciesRule, ...]:
+    """The rules of the (planet type, atmosphere class) bucket whose atmosphere conditions hold."""
+    bucket = SPECIES_INDEX.get((planet_type, atmosphere_class(atmosphere)), ())
+    return tuple(rule for rule in bucket if rule.matches_atmosphere(atmosphere))
+
+
+@lru_cache(maxsize=1024)
+def volcanism_tokens(volcanism: Optional[str]) -> FrozenSet[str]:
+    if not volcanism:
+        return frozenset()
+    return frozenset(token for token in VOLCANISM_TOKENS if token in volcanism)
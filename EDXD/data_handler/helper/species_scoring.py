@@ -0,0 +1,349 @@
+"""
+species_scoring.py – relative probability of candidate species
+
+Every genus has a table of modes, one per species, holding the typical temperature, pressure and
+gravity with tolerances and the planet types the species is usually found on:
+
+    (Target_Temp_K, tolerance_temp, Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity, PlanetTypes)
+
+A species name is resolved to its modes once (species_modes) - the genus keyword is a substring
+of the name, the first mode key found in the lower-case name wins, in table order.
+
+score_batch() scores many (species id, temperature, pressure, gravity, planet type) rows at once.
+It uses NumPy when it is installed and the batch is large enough to pay off, and a pure Python loop
+otherwise; both give the same scores as score_species().
+"""
+import threading
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from EDXD.data_handler.helper.system_params import PlanetType
+
+try:
+    import numpy as np
+except ImportError:     # optional - only speeds up large batches
+    np = None
+
+BASE_SCORE          = 0.25
+PLANET_MATCH        = 0.25
+PLANET_MISMATCH     = 0.1
+PARAMETER_MATCH     = 0.16
+
+NUMPY_MIN_BATCH     = 256   # below this the array setup costs more than the loop
+
+
+# ---------------------------------------------------------------------------
+# mode tables per genus keyword
+# ---------------------------------------------------------------------------
+GENUS_MODES: Dict[str, Dict[str, tuple]] = {
+    "Aleoida": {
+        "arcus"     : (177.0, 5.0, 0.024, 0.005,  0.12, 0.05, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "coronamus" : (181.0, 5.0, 0.035, 0.005,  0.17, 0.05, [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "gravis"    : (190.1, 5.0, 0.074, 0.005,  0.21, 0.05, [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY, PlanetType.ROCKY_ICE]),
+        "laminiae"  : (171.0, 5.0, 0.001, 0.0005, 0.14, 0.05, [PlanetType.HMC, PlanetType.ROCKY]),
+        "spica"     : (173.0, 5.0, 0.001, 0.0005, 0.16, 0.05, [PlanetType.HMC, PlanetType.ROCKY]),
+    },
+    "Amphora": {
+        "plant"     : (1090.0, 70.0, None, None,  1.0, 0.9, [PlanetType.HMC, PlanetType.METAL_RICH, PlanetType.ROCKY]),
+    },
+    "Anemone": {
+        "blatteum bioluminescent"   : (1000.0, 500.0, 0.0035,  0.0035,  1.42,   0.66,   [PlanetType.HMC, PlanetType.METAL_RICH, PlanetType.ROCKY]),
+        "croceum"                   : (390.0,  50.0,  0.0035,  0.0035,  0.09,   0.05,   [PlanetType.HMC, PlanetType.ROCKY]),
+        "luteolum"                  : (349.0,  75.0,  0.0035,  0.0035,  0.1,    0.06,   [PlanetType.HMC, PlanetType.ROCKY]),
+        "prasinum bioluminescent"   : (1275.0, 475.0, 0.0035,  0.0035,  0.5665, 0.5295, [PlanetType.HMC, PlanetType.METAL_RICH, PlanetType.ROCKY]),
+        "puniceum"                  : (550.0,  150.0, 0.00075, 0.00075, 2.25,   0.35,   [PlanetType.ICY]),
+        "roseum"                    : (410.0,  30.0,  0.003,   0.003,   0.095,  0.051,  [PlanetType.HMC, PlanetType.ROCKY]),
+        "roseum bioluminescent"     : (970.0,  480.0, 0.0035,  0.0035,  1.305,  0.495,  [PlanetType.HMC, PlanetType.METAL_RICH, PlanetType.ROCKY]),
+        "rubeum bioluminescent"     : (895.0,  245.0, 0.0035,  0.0035,  1.17,   0.38,   [PlanetType.HMC, PlanetType.METAL_RICH, PlanetType.ROCKY]),
+    },
+    "Bacterium": {
+        "acies"     : (22.0,    20.0,   0.015,  0.005,  0.4,    0.1,    [PlanetType.ICY]),
+        "alcyoneum" : (168.0,   25.0,   0.001,  0.001,  0.15,   0.05,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "aurasus"   : (177.0,   25.0,   0.1,    0.05,   0.2,    0.01,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "bullaris"  : (95.0,    10.0,   0.045,  0.005,  0.05,   0.005,  [PlanetType.ICY]),
+        "cerbrus"   : (180.0,   30.0,   0.05,   0.005,  0.3,    0.05,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY, PlanetType.ROCKY_ICE]),
+        "informem"  : (75.0,    20.0,   0.01,   0.005,  0.27,   0.05,   [PlanetType.HMC, PlanetType.ICY]),
+        "nebulus"   : (20.0,    15.0,   0.08,   0.03,   0.5,    0.1,    [PlanetType.ICY]),
+        "omentum"   : (30.0,    20.0,   0.005,  0.002,  0.4,    0.1,    [PlanetType.ICY]),
+        "scopulum"  : (30.0,    20.0,   0.005,  0.002,  0.4,    0.1,    [PlanetType.ICY]),
+        "tela"      : (350.0,   50.0,   0.005,  0.002,  0.5,    0.1,    [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "verrata"   : (40.0,    20.0,   0.005,  0.002,  0.5,    0.1,    [PlanetType.ICY]),
+        "vesicula"  : (50.0,    20.0,   0.005,  0.002,  0.2,    0.05,   [PlanetType.HMC, PlanetType.ICY]),
+        "volu"      : (170.0,   25.0,   0.05,   0.005,  0.4,    0.1,    [PlanetType.HMC, PlanetType.ICY]),
+    },
+    "Bark": {
+        "mounds"     : (250.0, 45.0, 69.0, 69.0,  0.168, 0.142, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+    },
+    "Brain": {
+        "aureum"        : (571.0, 269.0, 0.00185, 0.00185,  0.198,  0.162,  [PlanetType.HMC, PlanetType.ROCKY]),
+        "gypseeum"      : (226.0, 26.0,  0.0035,  0.0035,   0.1,    0.06,   [PlanetType.ROCKY]),
+        "lindigoticum"  : (475.0, 25.0,  0.0004,  0.0004,   0.152,  0.108,  [PlanetType.HMC, PlanetType.ROCKY]),
+        "lividum"       : (503.0, 272.0, 0.0004,  0.0004,   0.084,  0.055,  [PlanetType.HMC, PlanetType.ROCKY]),
+        "ostrinum"      : (685.0, 222.0, 0.0004,  0.0004,   0.7675, 0.7325, [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "puniceum"      : (748.0, 292.0, 0.0004,  0.0004,   0.82,   0.78,   [PlanetType.HMC, PlanetType.ROCKY]),
+        "roseum"        : (392.5, 277.5, 0.0004,  0.0004,   0.201,  0.174,  [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "viride"        : (113.0, 13.0,  0.0004,  0.0004,   0.079,  0.044,  [PlanetType.ROCKY_ICE, PlanetType.ICY]),
+    },
+    "Cactoida": {
+        "cortexum"      : (188.0, 9.0,   0.06,   0.05,   0.2,  0.05, [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "lapis"         : (170.0, 15.0,  0.001,  0.001,  0.15, 0.05, [PlanetType.HMC, PlanetType.ROCKY]),
+        "peperatis"     : (170.0, 10.0,  0.0015, 0.007,  0.27, 0.1,  [PlanetType.HMC, PlanetType.ROCKY]),
+        "pullulanta"    : (188.0, 9.0,   0.06,   0.04,   0.15, 0.12, [PlanetType.HMC, PlanetType.ROCKY]),
+        "vermis"        : (250.0, 200.0, 0.05,   0.05,   0.15, 0.12, [PlanetType.HMC, PlanetType.ROCKY]),
+    },
+    "Clypeus": {
+        "lacrimam"     : (320.0, 130.0, 0.085, 0.015,  0.07,  0.031, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "margaritus"   : (310.0, 120.0, 0.085, 0.015,  0.145, 0.105, [PlanetType.HMC, PlanetType.ICY]),
+        "speculumi"    : (321.0, 131.0, 0.085, 0.015,  0.12,  0.085, [PlanetType.HMC, PlanetType.ROCKY]),
+    },
+    "Concha": {
+        "aureolas"      : (165.0, 20.0, 0.005, 0.007,  0.6,   0.6,  [PlanetType.HMC, PlanetType.ROCKY]),
+        "biconcavis"    : (46.0,  7.0,  0.005, 0.005,  0.15,  0.13, [PlanetType.HMC, PlanetType.ROCKY]),
+        "labiata"       : (175.0, 26.0, 0.007, 0.005,  0.15,  0.13, [PlanetType.ROCKY]),
+        "renibus"       : (188.0, 20.0, 0.07,  0.02,   0.045, 0.02, [PlanetType.HMC, PlanetType.ROCKY]),
+    },
+    "Crystalline": {
+        "shards"     : (102.0, 22.0, 0.004, 0.004,  0.1055, 0.0805, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+    },
+    "Electricae": {
+        "pluma"     : (250.0, 45.0, 0.10,    0.10,    0.168,  0.142,  [PlanetType.ICY]),
+        "radialem"  : (44.5,  15.5, 0.00549, 0.00451, 0.1495, 0.1005, [PlanetType.ICY]),
+    },
+    "Fonticulua": {
+        "campestris"    : (97.0,  47.0, 0.01549,  0.01451,  0.155,  0.105,  [PlanetType.ICY]),
+        "digitos"       : (97.0,  8.0,  0.067,    0.028,    0.0365, 0.0085, [PlanetType.ICY]),
+        "fluctus"       : (150.0, 5.0,  0.035,    0.015,    0.255,  0.015,  [PlanetType.ICY]),
+        "lapida"        : (67.5,  12.5, 0.009495, 0.008505, 0.255,  0.025,  [PlanetType.ICY]),
+        "segmentatus"   : (65.0,  5.0,  0.003,    0.001,    0.27,   0.01,   [PlanetType.ICY]),
+        "upupam"        : (81.0,  11.0, 0.055,    0.035,    0.148,  0.128,  [PlanetType.ICY]),
+    },
+    "Frutexa": {
+        "acus"       : (175.0, 15.0, 0.0255,  0.0245,  0.09,   0.05,   [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "collum"     : (135.0, 5.0,  0.00199, 0.00101, 0.255,  0.025,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "fera"       : (172.0, 18.0, 0.0485,  0.0465,  0.1275, 0.0925, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "flabellum"  : (165.0, 15.0, 0.00274, 0.00176, 0.15,   0.05,   [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "flammasis"  : (166.5, 8.5,  0.00174, 0.00076, 0.16,   0.06,   [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "metallicum" : (170.0, 25.0, 0.00499, 0.00401, 0.205,  0.065,  [PlanetType.HMC, PlanetType.ICY]),
+        "sponsae"    : (425.0, 25.0, 0.084,   0.014,   0.05,   0.005,  [PlanetType.HMC, PlanetType.ROCKY]),
+    },
+    "Fumerola": {
+        "aquatis"   : (80.0, 25.0, 0.013,    0.012,   0.2025, 0.0325, [PlanetType.ICY]),
+        "carbosis"  : (95.0, 20.0, 0.05,     0.049,   0.036,  0.011,  [PlanetType.ICY]),
+        "extremus"  : (91.5, 12.5, 0.04475,  0.03525, 0.0775, 0.0425, [PlanetType.ICY, PlanetType.ROCKY]),
+        "nitris"    : (77.0, 38.0, 0.00505,  0.00405, 0.0469, 0.0211, [PlanetType.ICY]),
+    },
+    "Fungoida": {
+        "bullarum"  : (77.5,  27.5, 0.013,    0.012,    0.25,   0.03,   [PlanetType.ICY, PlanetType.ROCKY_ICE]),
+        "gelata"    : (189.0, 18.0, 0.0655,   0.0335,   0.18,   0.05,   [PlanetType.ICY, PlanetType.ROCKY_ICE, PlanetType.HMC]),
+        "setisis"   : (165.5, 11.5, 0.005075, 0.004075, 0.1925, 0.0825, [PlanetType.ICY, PlanetType.ROCKY, PlanetType.HMC]),
+        "stabitis"  : (185.5, 24.5, 0.0655,   0.0335,   0.175,  0.055,  [PlanetType.ICY, PlanetType.ROCKY, PlanetType.HMC]),
+    },
+    "Osseus": {
+        "cornibus"     : (186.0, 6.0,  0.063,   0.36,    0.2,    0.07,   [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "discus"       : (429.0, 41.0, 0.0825,  0.0165,  0.0465, 0.0125, [PlanetType.HMC, PlanetType.ROCKY]),
+        "fractus"      : (185.0, 5.0,  0.0645,  0.0345,  0.19,   0.06,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "pellebantus"  : (193.0, 3.0,  0.0795,  0.0195,  0.23,   0.04,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "pumice"       : (82.5,  27.5, 0.01325, 0.01225, 0.2425, 0.0325, [PlanetType.ROCKY_ICE, PlanetType.ICY]),
+        "spiralis"     : (168.0, 8.0,  0.0025,  0.0015,  0.2,    0.07,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+    },
+    "Recepta": {
+        "conditivus"    : (171.0, 39.0, 0.005,    0.004,    0.2325, 0.0425, [PlanetType.HMC, PlanetType.ICY]),
+        "deltahedronix" : (138.0, 6.0,  0.005,    0.004,    0.2425, 0.0325, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "umbrux"        : (166.0, 34.0, 0.004975, 0.004025, 0.2375, 0.0375, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+    },
+    "Sinuous Tubers": {
+        "albidum"      : (350.0, 150.0, 0.00005,  0.00005,  0.187,  0.143,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "blatteum"     : (350.0, 150.0, 0.0005,   0.0005,   0.172,  0.128,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "caeruleum"    : (350.0, 150.0, 0.00235,  0.00235,  0.186,  0.144,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "lindigoticum" : (350.0, 150.0, None,     None,     0.138,  0.102,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "prasinum"     : (350.0, 150.0, 0.0045,   0.0045,   0.7065, 0.6635, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "roseum"       : (350.0, 150.0, 0.004,    0.004,    0.1865, 0.1435, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "violaceum"    : (350.0, 150.0, 0.0003,   0.0003,   0.16,   0.115,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "viride"       : (350.0, 150.0, 0.000285, 0.000285, 0.16,   0.117,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+    },
+    "Stratum": {
+        "araneamus"     : (208.5, 43.5, 0.00504,  0.00406,  0.375,  0.065,  [PlanetType.HMC, PlanetType.ROCKY]),
+        "cucumisis"     : (225.0, 35.0, 0.005,    0.005,    0.315,  0.105,  [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "excutitus"     : (177.5, 12.5, 0.02549,  0.02451,  0.25,   0.15,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "frigus"        : (220.0, 30.0, 0.010495, 0.009505, 0.35,   0.15,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "laminamus"     : (220.0, 30.0, 0.007,    0.006,    0.19,   0.09,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "limaxus"       : (177.5, 12.5, 0.025495, 0.024505, 0.265,  0.235,  [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "paleas"        : (176.5, 18.5, 0.0005,   0.0005,   0.16,   0.08,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "tectonicas"    : (170.0, 25.0, 0.00455,  0.00455,  0.2475, 0.2025, [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+    },
+    "Tubus": {
+        "cavas"      : (170.0, 10.0, 0.019,   0.016,   0.9,   0.04,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "compagibus" : (170.0, 10.0, 0.0165,  0.0135,  0.095, 0.045, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "conifer"    : (170.0, 10.0, 0.019,   0.016,   0.095, 0.035, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "rosarium"   : (170.0, 10.0, 0.00149, 0.00051, 0.135, 0.015, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "sororibus"  : (170.0, 10.0, 0.0179,  0.0081,  0.115, 0.035, [PlanetType.HMC, PlanetType.ICY]),
+    },
+    "Tussock": {
+        "albata"     : (177.5, 2.5,  0.0355,  0.0195,  0.175,  0.075,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "capillum"   : (100.0, 20.0, 0.01299, 0.01201, 0.24,   0.04,   [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY, PlanetType.ROCKY_ICE]),
+        "caputus"    : (183.0, 7.0,  0.065,   0.033,   0.2075, 0.0725, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "catena"     : (166.5, 8.5,  0.00199, 0.00101, 0.199,  0.081,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "cultro"     : (160.0, 20.0, 0.00249, 0.00151, 0.199,  0.081,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "divisa"     : (168.5, 8.5,  0.00249, 0.00151, 0.2,    0.08,   [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "ignis"      : (165.5, 4.5,  0.0149,  0.0121,  0.095,  0.035,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "pennata"    : (151.5, 2.5,  0.0053,  0.0018,  0.057,  0.014,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "pennatis"   : (177.0, 19.0, 0.05035, 0.04765, 0.134,  0.096,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "propagito"  : (176.5, 18.5, 0.02295, 0.02005, 0.1545, 0.1155, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "serrati"    : (172.0, 2.0,  0.025,   0.015,   0.1235, 0.0365, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "stigmasis"  : (135.0, 3.0,  0.00199, 0.00101, 0.253,  0.023,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "triticum"   : (193.0, 2.0,  0.082,   0.017,   0.235,  0.045,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "ventusa"    : (155.0, 5.0,  0.009,   0.006,   0.07,   0.03,   [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "virgam"     : (425.0, 20.0, 0.0825,  0.0155,  0.053,  0.008,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+    },
+}
+
+
+class Mode(NamedTuple):
+    temp            : Optional[float]
+    temp_tol        : float
+    pressure        : Optional[float]
+    pressure_tol    : float
+    gravity         : Optional[float]
+    gravity_tol     : float
+    planet_types    : frozenset
+
+
+@lru_cache(maxsize=1024)
+def species_modes(species_name: str) -> Tuple[Mode, ...]:
+    """The modes scoring species_name - one per matching genus keyword, usually exactly one."""
+    name_lower = species_name.lower()
+    modes = []
+    for keyword, genus_modes in GENUS_MODES.items():
+        if keyword not in species_name:
+            continue
+        for key, (temp, temp_tol, press, press_tol, grav, grav_tol, planet_types) in genus_modes.items():
+            if key in name_lower:
+                modes.append(Mode(temp, temp_tol, press, press_tol, grav, grav_tol, frozenset(planet_types)))
+                break
+    return tuple(modes)
+
+
+def _score_mode(mode: Mode, mean_temp_k: Optional[float], pressure_atm: Optional[float], gravity: Optional[float],
+                planet_type: Optional[PlanetType]) -> float:
+    score = 0.0
+    score += PLANET_MATCH if planet_type in mode.planet_types else PLANET_MISMATCH
+    if mode.temp is not None and mean_temp_k is not None and abs(mean_temp_k - mode.temp) <= mode.temp_tol:
+        score += PARAMETER_MATCH
+    if mode.pressure is not None and pressure_atm is not None and abs(pressure_atm - mode.pressure) <= mode.pressure_tol:
+        score += PARAMETER_MATCH
+    if mode.gravity is not None and gravity is not None and abs(gravity - mode.gravity) <= mode.gravity_tol:
+        score += PARAMETER_MATCH
+    return score
+
+
+def score_species(species_name: str, mean_temp_k: Optional[float], pressure_atm: Optional[float],
+                  gravity: Optional[float], planet_type: Optional[PlanetType]) -> float:
+    """Relative probability (0.25 to 1.0) of one species; a missing value simply does not score."""
+    score = BASE_SCORE
+    for mode in species_modes(species_name):
+        score += _score_mode(mode, mean_temp_k, pressure_atm, gravity, planet_type)
+    return min(score, 1.0)
+
+
+# ---------------------------------------------------------------------------
+# species ids - batch rows refer to species by a small int
+# ---------------------------------------------------------------------------
+_ids_lock           = threading.Lock()
+_species_ids        : Dict[str, int] = {}
+_species_names      : List[str] = []
+_np_tables          = None      # (number of species, per mode slot parameter arrays)
+
+
+def species_id(species_name: str) -> int:
+    """Stable id of species_name for this process, assigned on first use."""
+    sid = _species_ids.get(species_name)
+    if sid is None:
+        with _ids_lock:
+            sid = _species_ids.get(species_name)
+            if sid is None:
+                sid = len(_species_names)
+                _species_names.append(species_name)
+                _species_ids[species_name] = sid
+    return sid
+
+
+def species_ids(species_names: Sequence[str]) -> List[int]:
+    return [species_id(name) for name in species_names]
+
+
+def species_name(sid: int) -> str:
+    return _species_names[sid]
+
+
+# ---------------------------------------------------------------------------
+# batch scoring
+# ---------------------------------------------------------------------------
+def score_batch(species: Sequence[int], mean_temps_k: Sequence[Optional[float]], pressures_atm: Sequence[Optional[float]],
+                gravities: Sequence[Optional[float]], planet_types: Sequence[Optional[PlanetType]],
+                use_numpy: Optional[bool] = None) -> List[float]:
+    """
+    Score row i = (species[i], mean_temps_k[i], pressures_atm[i], gravities[i], planet_types[i]).
+    species holds ids from species_id(). use_numpy=None picks NumPy for large batches if available.
+    """
+    if use_numpy is None:
+        use_numpy = np is not None and len(species) >= NUMPY_MIN_BATCH
+    if use_numpy and np is not None:
+        return _score_batch_numpy(species, mean_temps_k, pressures_atm, gravities, planet_types)
+    names = _species_names
+    return [
+        score_species(names[sid], temp, press, grav, pt)
+        for sid, temp, press, grav, pt in zip(species, mean_temps_k, pressures_atm, gravities, planet_types)
+    ]
+
+
+_PLANET_BIT = {pt: i for i, pt in enumerate(PlanetType)}
+_NO_PLANET  = len(_PLANET_BIT)   # bit that is never set in a mask
+
+
+def _mode_tables():
+    """Per mode slot k: valid, temp, temp_tol, pressure, pressure_tol, gravity, gravity_tol, planet mask - indexed by species id."""
+    global _np_tables
+    tables = _np_tables
+    count = len(_species_names)
+    if tables is not None and tables[0] == count:
+        return tables[1]
+
+    names = _species_names[:count]
+    modes = [species_modes(name) for name in names]
+    slots = max((len(m) for m in modes), default=0)
+    nan = float("nan")
+    columns = []
+    for k in range(slots):
+        rows = [m[k] if k < len(m) else None for m in modes]
+        columns.append((
+            np.array([row is not None for row in rows], dtype=bool),
+            *(np.array([nan if row is None or getattr(row, f) is None else getattr(row, f) for row in rows], dtype=np.float64)
+              for f in ("temp", "temp_tol", "pressure", "pressure_tol", "gravity", "gravity_tol")),
+            np.array([0 if row is None else sum(1 << _PLANET_BIT[pt] for pt in row.planet_types) for row in rows], dtype=np.int64),
+        ))
+    _np_tables = (count, columns)
+    return columns
+
+
+def _as_float_array(values) -> "np.ndarray":
+    return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+
+def _score_batch_numpy(species, mean_temps_k, pressures_atm, gravities, planet_types) -> List[float]:
+    ids = np.asarray(species, dtype=np.intp)
+    temps = _as_float_array(mean_temps_k)
+    pressures = _as_float_array(pressures_atm)
+    gravity = _as_float_array(gravities)
+    planet_bits = np.array([_PLANET_BIT.get(pt, _NO_PLANET) for pt in planet_types], dtype=np.int64)
+
+    # same order of additions as _score_mode / score_species, so the floats come out identical;
+    # NaN (missing target or value) never compares <= and scores nothing
+    score = np.full(len(ids), BASE_SCORE)
+    with np.errstate(invalid="ignore"):
+        for valid, temp, temp_tol, press, press_tol, grav, grav_tol, mask in _mode_tables():
+            contribution = np.where((mask[ids] >> planet_bits) & 1 == 1, PLANET_MATCH, PLANET_MISMATCH)
+            contribution = contribution + np.where(np.abs(temps - temp[ids]) <= temp_tol[ids], PARAMETER_MATCH, 0.0)
+            contribution = contribution + np.where(np.abs(pressures - press[ids]) <= press_tol[ids], PARAMETER_MATCH, 0.0)
+            contribution = contribution + np.where(np.abs(gravity - grav[ids]) <= grav_tol[ids], PARAMETER_MATCH, 0.0)
+            score = score + np.where(valid[ids], contribution, 0.0)
+    return np.minimum(score, 1.0).tolist()
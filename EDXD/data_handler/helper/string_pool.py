@@ -0,0 +1,71 @@
+"""
+string_pool.py – interning of closed-vocabulary journal strings
+
+Body types, material names, genus/species ids, atmosphere types and ring classes come from a
+small, fixed vocabulary but are repeated in every cached body and every journal line. Interning
+them keeps one copy per distinct value and makes `is` comparisons valid for these fields.
+Free text (body names, system names) is deliberately left alone.
+"""
+from sys import intern
+
+# scalar Body fields with a closed vocabulary
+BODY_VOCAB_FIELDS = ("body_type", "luminosity", "raw_luminosity", "volcanism", "present_life")
+GENUS_VOCAB_FIELDS = ("genusid", "localised", "species_localised", "variant_localised")
+
+
+def intern_str(value):
+    """Intern value if it is a str, pass anything else through."""
+    if type(value) is str:
+        return intern(value)
+    return value
+
+
+def intern_keys(mapping: dict) -> dict:
+    """Same mapping with interned keys - for material and atmosphere composition names."""
+    if not mapping:
+        return mapping
+    return {intern_str(k): v for k, v in mapping.items()}
+
+
+def _intern_fields(data: dict, names):
+    for name in names:
+        value = data.get(name)
+        if type(value) is str:
+            data[name] = intern(value)
+
+
+def intern_cached_body(data: dict) -> dict:
+    """Intern the closed-vocabulary values of one raw cached body, in place."""
+    _intern_fields(data, BODY_VOCAB_FIELDS)
+
+    materials = data.get("materials")
+    if materials:
+        data["materials"] = intern_keys(materials)
+
+    atmosphere = data.get("atmosphere")
+    if isinstance(atmosphere, dict):
+        _intern_fields(atmosphere, ("type", "raw"))
+        if atmosphere.get("composition"):
+            atmosphere["composition"] = intern_keys(atmosphere["composition"])
+
+    bio_found = data.get("bio_found")
+    if bio_found:
+        for genus in bio_found.values():
+            if isinstance(genus, dict):
+                _intern_fields(genus, GENUS_VOCAB_FIELDS)
+        data["bio_found"] = intern_keys(bio_found)
+
+    geo_found = data.get("geo_found")
+    if geo_found:
+        for codex in geo_found.values():
+            if isinstance(codex, dict):
+                _intern_fields(codex, ("codexid", "localised"))
+        data["geo_found"] = intern_keys(geo_found)
+
+    rings = data.get("rings")
+    if rings:
+        for ring in rings.values():
+            if isinstance(ring, dict):
+                _intern_fields(ring, ("ring_class",))
+
+    return data
@@ -0,0 +1,185 @@
+"""
+system_topology.py – parent tree and star data of the current system
+
+The journal describes the orbit of every body by its `Parents` list (nearest first, e.g.
+[{"Planet": 3}, {"Star": 1}, {"Null": 0}]). SystemTopology keeps that tree per body together
+with the star class/luminosity enums of every star, so the parent stars of a body and its
+distance to them are looked up instead of re-derived on every estimate.
+
+Model updates it whenever a body is added or changed; a body update that does not touch name,
+star data, parents or orbit is a no-op. Derived values are computed on first use and kept until
+the next change of the tree.
+"""
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import EDXD.data_handler.helper.data_helper as dh
+from EDXD.data_handler.helper.system_params import StarClass, StarLuminosity
+from EDXD.globals import BODY_ID_PREFIX
+
+
+@dataclass(slots=True)
+class Star:
+    star_id: int
+    star_class_enum: StarClass
+    star_luminosity_enum: StarLuminosity
+
+
+class _Links(NamedTuple):
+    """The parts of a body the topology depends on."""
+    body_name       : str
+    is_star         : bool
+    body_type       : str
+    luminosity      : str
+    parents         : Tuple[Tuple[str, int], ...]
+    parent_distance : float
+
+
+def _enum_or_none(enum_class, value):
+    if value is None:
+        return None
+    try:
+        return enum_class(value)
+    except ValueError:
+        return None
+
+
+def _star_from_body(star_id: int, links: _Links) -> Star:
+    s_type = links.body_type
+    star_class_enum = _enum_or_none(StarClass, s_type)
+    if star_class_enum is None and s_type and "_" in s_type:
+        star_class_enum = _enum_or_none(StarClass, s_type.split("_")[0])
+    star_luminosity_enum = None
+    if links.luminosity:
+        star_luminosity_enum = _enum_or_none(StarLuminosity, dh.get_clean_luminosity(links.luminosity))
+    return Star(star_id, star_class_enum, star_luminosity_enum)
+
+
+class SystemTopology:
+    """Parent tree, parent stars and star distances of the bodies of one system."""
+    __slots__ = ("_links", "_stars", "_star_ids_by_name", "_derived")
+
+    def __init__(self):
+        self._links             : Dict[str, _Links]                             = {}
+        self._stars             : Dict[int, Star]                               = {}
+        self._star_ids_by_name  : Dict[str, int]                                = {}
+        self._derived           : Dict[str, Tuple[Dict[int, Star], float]]      = {}
+
+    @classmethod
+    def from_bodies(cls, bodies: Iterable) -> "SystemTopology":
+        topology = cls()
+        topology.update_bodies(bodies)
+        return topology
+
+    def copy(self) -> "SystemTopology":
+        """Independent copy - entries are replaced, never changed in place, so only the dicts are copied."""
+        topology = SystemTopology()
+        topology._links.update(self._links)
+        topology._stars.update(self._stars)
+        topology._star_ids_by_name.update(self._star_ids_by_name)
+        topology._derived.update(self._derived)
+        return topology
+
+    # ----- mutators ----------------------------------------------------------
+    def clear(self):
+        self._links.clear()
+        self._stars.clear()
+        self._star_ids_by_name.clear()
+        self._derived.clear()
+
+    def update_bodies(self, bodies: Iterable):
+        for body in bodies:
+            self.update_body(body)
+
+    def update_body(self, body) -> bool:
+        """Take over the orbit and star data of body; True if the topology changed."""
+        links = _Links(
+            body_name       = body.body_name,
+            is_star         = bool(body.is_star),
+            body_type       = body.body_type if isinstance(body.body_type, str) or body.body_type is None else str(body.body_type),
+            luminosity      = body.luminosity or body.raw_luminosity,
+            parents         = tuple(next(iter(parent.items())) for parent in (body.parents or ()) if parent),
+            parent_distance = body.parent_distance,
+        )
+        body_id = body.body_id
+        previous = self._links.get(body_id)
+        if previous == links:
+            return False
+
+        self._links[body_id] = links
+        was_star = previous is not None and previous.is_star
+        if was_star:
+            self._star_ids_by_name.pop(previous.body_name, None)
+        if links.is_star or was_star:
+            star_id = int(body_id.split("_")[1])
+            if links.is_star:
+                self._stars[star_id] = _star_from_body(star_id, links)
+                self._star_ids_by_name[links.body_name] = star_id
+            else:
+                self._stars.pop(star_id, None)
+        self._derived.clear()
+        return True
+
+    # ----- lookups -----------------------------------------------------------
+    @property
+    def stars(self) -> Dict[int, Star]:
+        return self._stars
+
+    def star_id_by_name(self, body_name: str) -> Optional[int]:
+        return self._star_ids_by_name.get(body_name)
+
+    def parent_planet(self, body_id: str) -> Optional[str]:
+        """body_id of the planet body_id orbits, None if it orbits a star or barycentre."""
+        links = self._links.get(body_id)
+        if links is None:
+            return None
+        for kind, parent_id in links.parents:
+            if kind == "Planet":
+                return BODY_ID_PREFIX + str(parent_id)
+        return None
+
+    def parent_stars(self, body_id: str) -> Dict[int, Star]:
+        """The known stars among the parents of body_id, nearest first."""
+        return self._derive(body_id)[0]
+
+    def nearest_star(self, body_id: str) -> Optional[Star]:
+        return next(iter(self.parent_stars(body_id).values()), None)
+
+    def star_distance(self, body_id: str) -> float:
+        """Semi-major axis of the orbit around the parent star - for a moon the one of its planet."""
+        return self._derive(body_id)[1]
+
+    def star_distance_ls(self, body_id: str) -> float:
+        return dh.km_to_ls(self.star_distance(body_id))
+
+    def _derive(self, body_id: str) -> Tuple[Dict[int, Star], float]:
+        derived = self._derived.get(body_id)
+        if derived is None:
+            derived = (self._collect_parent_stars(body_id), self._walk_star_distance(body_id))
+            self._derived[body_id] = derived
+        return derived
+
+    def _collect_parent_stars(self, body_id: str) -> Dict[int, Star]:
+        links = self._links.get(body_id)
+        parent_stars: Dict[int, Star] = {}
+        if links is None:
+            return parent_stars
+        for kind, parent_id in links.parents:
+            if kind == "Star" and parent_id in self._stars:
+                parent_stars[parent_id] = self._stars[parent_id]
+        return parent_stars
+
+    def _walk_star_distance(self, body_id: str) -> float:
+        # follow the Planet parents up to the body that orbits a star directly
+        seen: List[str] = []
+        while body_id not in seen:
+            links = self._links.get(body_id)
+            if links is None or not links.parents:
+                return 0.0
+            seen.append(body_id)
+            kinds = [kind for kind, _ in links.parents]
+            if "Planet" not in kinds:
+                # orbits a star - or only barycentres, whose stars are unknown
+                return links.parent_distance if "Star" in kinds else 0.0
+            body_id = self.parent_planet(body_id)
+        return 0.0
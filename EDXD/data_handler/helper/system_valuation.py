@@ -0,0 +1,195 @@
+"""
+system_valuation.py – exploration value of the current system, and revaluation of the cache
+
+SystemValuation keeps running totals for the bodies of one system: what the scans are worth
+now, what mapping the remaining planets would add, first discoveries and the exobiology
+potential of the biosign predictions. Model feeds it every body it adds or changes; a body
+whose value-relevant fields did not change is a no-op, every other update only applies the
+difference of that one body.
+
+appraise_bodies() recomputes scan and mapped values of all cached systems from the appraisal
+inputs stored with every scanned body - for when the formulas in body_appraiser change. Run it
+with `EDXD --revalue-cache`.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import EDXD.data_handler.helper.data_helper as dh
+from EDXD.data_handler.helper.bio_helper import species_info
+from EDXD.data_handler.helper.body_appraiser import appraise_values
+
+FIRST_DISCOVERED = 2    # Body.first_discovered: 2 - I am first
+
+
+class _BodyValue(NamedTuple):
+    """What one body contributes to the system totals."""
+    counted         : bool  # counts as a scanned body on the dashboard
+    scan_value      : int   # FSS/DSS scan, not mapped
+    mapped_value    : int   # surface mapping included, 0 while not mapped
+    remaining_value : int   # still to gain by mapping it
+    first_discovery : bool
+    earned_value    : int
+
+
+def _body_value(body) -> _BodyValue:
+    estimated = body.estimated_value or 0
+    # bodies cached before scan_value existed only know their mapped value
+    scan = body.scan_value or (estimated if body.is_star else 0)
+    mapped = estimated if body.mapped else 0
+    remaining = 0 if body.mapped or body.is_star else max(estimated - scan, 0)
+    earned = mapped or scan
+    return _BodyValue(
+        counted         = "Belt Cluster" not in (body.body_name or ""),
+        scan_value      = scan,
+        mapped_value    = mapped,
+        remaining_value = remaining,
+        first_discovery = body.first_discovered == FIRST_DISCOVERED,
+        earned_value    = earned,
+    )
+
+
+def _bio_potential(predictions: List[dict]) -> int:
+    # one species per genus can be on a body - count the most valuable candidate of each genus
+    best: Dict[str, int] = {}
+    for prediction in predictions:
+        name = prediction.get("name")
+        info = species_info(name)
+        genus = info.codex_key if info is not None and info.codex_key else name
+        value = prediction.get("base_value") or 0
+        if value > best.get(genus, 0):
+            best[genus] = value
+    return sum(best.values())
+
+
+@dataclass(slots=True)
+class SystemValue:
+    """Totals of one system; credits unless noted."""
+    bodies_scanned          : int = 0       # count, belt clusters excluded
+    bodies_mapped           : int = 0       # count
+    current_value           : int = 0       # what the exploration data is worth now
+    scanned_value           : int = 0       # all scanned bodies, without mapping
+    mapped_value            : int = 0       # mapped bodies, mapping included
+    remaining_value         : int = 0       # scanned planets not mapped yet
+    first_discoveries       : int = 0       # count
+    first_discovery_value   : int = 0
+    bio_potential           : int = 0       # best predicted species per genus
+
+    @property
+    def potential_value(self) -> int:
+        """What is left to gain: mapping the rest plus the predicted exobiology."""
+        return self.remaining_value + self.bio_potential
+
+
+class SystemValuation:
+    """Running exploration-value totals of the bodies of one system."""
+    __slots__ = ("_bodies", "_bio", "_totals")
+
+    def __init__(self):
+        self._bodies    : Dict[str, _BodyValue] = {}
+        self._bio       : Dict[str, int]        = {}
+        self._totals    : SystemValue           = SystemValue()
+
+    # ----- mutators ----------------------------------------------------------
+    def clear(self):
+        self._bodies.clear()
+        self._bio.clear()
+        self._totals = SystemValue()
+
+    def update_bodies(self, bodies: Iterable):
+        for body in bodies:
+            self.update_body(body)
+
+    def update_body(self, body) -> bool:
+        """Take over the value of body; True if the totals changed."""
+        value = _body_value(body)
+        previous = self._bodies.get(body.body_id)
+        if previous == value:
+            return False
+        if previous is not None:
+            self._apply(previous, -1)
+        self._apply(value, 1)
+        self._bodies[body.body_id] = value
+        return True
+
+    def update_bio(self, predictions: Dict[str, List[dict]]):
+        """Take over the bio potential of the current biosign predictions {body_id: [prediction, ...]}."""
+        totals = self._totals
+        for body_id in [body_id for body_id in self._bio if body_id not in predictions]:
+            totals.bio_potential -= self._bio.pop(body_id)
+        for body_id, body_predictions in predictions.items():
+            potential = _bio_potential(body_predictions)
+            totals.bio_potential += potential - self._bio.get(body_id, 0)
+            self._bio[body_id] = potential
+
+    def _apply(self, value: _BodyValue, sign: int):
+        totals = self._totals
+        totals.bodies_scanned += sign * value.counted
+        totals.bodies_mapped += sign * bool(value.mapped_value)
+        totals.scanned_value += sign * value.scan_value
+        totals.mapped_value += sign * value.mapped_value
+        totals.current_value += sign * value.earned_value
+        totals.remaining_value += sign * value.remaining_value
+        if value.first_discovery:
+            totals.first_discoveries += sign
+            totals.first_discovery_value += sign * value.earned_value
+
+    # ----- lookups -----------------------------------------------------------
+    @property
+    def totals(self) -> SystemValue:
+        """A copy of the current totals."""
+        return replace(self._totals)
+
+    def body_value(self, body_id: str) -> Optional[_BodyValue]:
+        return self._bodies.get(body_id)
+
+
+# ---------------------------------------------------------------------------
+# batch revaluation of the system cache
+# ---------------------------------------------------------------------------
+def _appraise_cache_file(path: Path, write: bool) -> Tuple[int, int]:
+    """Revalue the bodies of one cached system; (bodies revalued, bodies changed)."""
+    data = dh.load(path, {})
+    bodies = data.get("bodies") if isinstance(data, dict) else None
+    if not isinstance(bodies, dict):
+        return 0, 0
+
+    revalued = changed = 0
+    for body in bodies.values():
+        appraisal = body.get("appraisal") if isinstance(body, dict) else None
+        if not appraisal:
+            continue
+        revalued += 1
+        scan_value, estimated_value = appraise_values(appraisal)
+        if body.get("scan_value") != scan_value or body.get("estimated_value") != estimated_value:
+            body["scan_value"] = scan_value
+            body["estimated_value"] = estimated_value
+            changed += 1
+
+    if changed and write:
+        dh.save(path, data)
+    return revalued, changed
+
+
+def appraise_bodies(cache_dir: Path = None, workers: Optional[int] = None, write: bool = True) -> Tuple[int, int, int]:
+    """
+    Recompute scan_value and estimated_value of every cached body with appraisal inputs, one
+    system file per task on a process pool (serially in a frozen build). Bodies cached before
+    the inputs were stored keep their values. Returns (systems, bodies revalued, bodies changed).
+    """
+    if cache_dir is None:
+        from EDXD.globals import CACHE_DIR
+        cache_dir = CACHE_DIR
+    paths = sorted(Path(cache_dir).glob("*.json"))
+    if not paths:
+        return 0, 0, 0
+
+    workers = dh.pool_workers(len(paths), workers)
+    if workers <= 1:
+        results = [_appraise_cache_file(path, write) for path in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_appraise_cache_file, paths, [write] * len(paths), chunksize=16))
+
+    return len(paths), sum(r[0] for r in results), sum(r[1] for r in results)
@@ -1,9 +1,10 @@
+import inspect
 import json
 import queue
-import re
 
 import EDXD.data_handler.helper.bio_helper as bio_helper
 from EDXD.data_handler.helper.pausable_thread import PausableThread
+from EDXD.data_handler.helper.string_pool import intern_str
 from EDXD.data_handler.model import *
 from EDXD.data_handler.planetary_surface_positioning_system import PSPSCoordinates
 from EDXD.data_handler.vessel_status import *
@@ -34,21 +35,7 @@ class JournalController(PausableThread, threading.Thread):
 
     @staticmethod
     def normalize_genus(genus_id):
-        # Map known patterns to their base names
-        replacements = {
-            "SphereEFGH":   "Sphere",
-            "TubeABCD"  :   "Tube",
-            "TubeEFGH"  :   "Tube",
-            # Add other mappings as needed
-        }
-
-        for old, new in replacements.items():
-            genus_id = genus_id.replace(old, new)
-
-        # This regex matches the numeric part and any trailing suffix before "_Name"
-        genus_id = re.sub(r'(\w+)_\d+[^_]*_Name;', r'\1_Name;', genus_id)
-        genus_id = re.sub(r'_\d+_[^_]+(?=_Name;)', '_Genus', genus_id)
-        return genus_id
+        return bio_helper.normalize_genus(genus_id)
 
     def get_parent_star_ids(self, body_name: str, body_parents: List[Dict[str, int]]) -> List[Dict[str, int]]:
         parent_stars: List[Dict[str, int]] = body_parents
@@ -71,13 +58,9 @@ class JournalController(PausableThread, threading.Thread):
         body_name_star_hint = body_name_without_system.split(" ")[0]
 
         for i in range(0, len(body_name_star_hint), 1):
-            star_name = system_name + " " + body_name_star_hint[i]
-            for body_id in self.m.bodies:
-                body = self.m.bodies[body_id]
-                if not body.is_star:
-                    continue
-                if body.body_name == star_name:
-                    parent_stars.append({str("Star"): int(body_id.split("_")[-1])})
+            star_id = self.m.topology.star_id_by_name(system_name + " " + body_name_star_hint[i])
+            if star_id is not None:
+                parent_stars.append({str("Star"): star_id})
 
         return parent_stars
 
@@ -197,7 +180,7 @@ class JournalController(PausableThread, threading.Thread):
         if etype == "FSSAllBodiesFound":
             self.m.total_bodies = evt.get("Count")
             total_bodies = self.m.total_bodies
-        # initialize all parameters for update_body
+        # initialize all parameters for the body patch - only the ones an event sets end up in it
         body_id                 = None
         body_name               = None
         body_type               = None
@@ -277,7 +260,7 @@ class JournalController(PausableThread, threading.Thread):
 
                 ring_id_is_name = False
                 rings_found_dict = {}
-                rings_found = self.m.bodies[body_id].rings
+                rings_found = dict(self.m.bodies[body_id].rings)
                 if body_id in self.m.bodies:
                     # do we have a proper ring ID?
                     if ring_id in self.m.bodies[body_id].rings:
@@ -311,7 +294,7 @@ class JournalController(PausableThread, threading.Thread):
                 parent_distance = evt.get("SemiMajorAxis")
                 distance = evt.get("DistanceFromArrivalLS")
                 landable = evt.get("Landable")
-                body_type = evt.get("PlanetClass") or evt.get("StarType")
+                body_type = intern_str(evt.get("PlanetClass") or evt.get("StarType"))
                 is_star = evt.get("StarType") is not None
                 radius = evt.get("Radius")
 
@@ -331,7 +314,7 @@ class JournalController(PausableThread, threading.Thread):
                         # add all new found rings
                         for journal_ring in evt.get("Rings"):
                             journal_ring_name = journal_ring.get("Name")
-                            journal_ring_class = journal_ring.get("RingClass")
+                            journal_ring_class = intern_str(journal_ring.get("RingClass"))
                             ring = Ring(body_id=journal_ring_name, body_name=journal_ring_name, ring_class=journal_ring_class, signals={})
                             rings_found[journal_ring_name] = ring
                     else:
@@ -352,17 +335,17 @@ class JournalController(PausableThread, threading.Thread):
                     pressure = evt.get("SurfacePressure")
 
                 if evt.get("Luminosity"):
-                    raw_luminosity = evt.get("Luminosity")
-                    luminosity = dh.get_clean_luminosity(raw_luminosity)
+                    raw_luminosity = intern_str(evt.get("Luminosity"))
+                    luminosity = intern_str(dh.get_clean_luminosity(raw_luminosity))
 
                 if evt.get("Volcanism"):
-                    volcanism = evt.get("Volcanism")
+                    volcanism = intern_str(evt.get("Volcanism"))
 
                 if evt.get("SurfaceTemperature"):
                     mean_temp = evt.get("SurfaceTemperature")
 
                 if body_type and " with " in body_type:
-                    present_life = body_type.split(" with ")[1]
+                    present_life = intern_str(body_type.split(" with ")[1])
 
                 g_force = None
                 if not g_force and radius is not None:
@@ -379,7 +362,7 @@ class JournalController(PausableThread, threading.Thread):
                     body_type = "Belt Cluster"
                 if len(body_type) == 1 or body_type[1] == "_":
                     scoopable = body_type[0] in ["K", "G", "B", "F", "O", "A", "M"]
-                materials = {m["Name"]: m["Percent"] for m in evt.get("Materials", [])}
+                materials = {intern_str(m["Name"]): m["Percent"] for m in evt.get("Materials", [])}
                 parents = evt.get("Parents", [])
                 parents = self.get_parent_star_ids(body_name, parents)
 
@@ -411,8 +394,8 @@ class JournalController(PausableThread, threading.Thread):
                             first_footfalled = 1
 
                     if evt.get("AtmosphereType") or evt.get("AtmosphereComposition") or evt.get("Atmosphere"):
-                        atmos_composition = {a["Name"]: a["Percent"] for a in evt.get("AtmosphereComposition", [])}
-                        atmosphere = Atmosphere(type=evt.get("AtmosphereType"), composition=atmos_composition, raw=evt.get("Atmosphere"))
+                        atmos_composition = {intern_str(a["Name"]): a["Percent"] for a in evt.get("AtmosphereComposition", [])}
+                        atmosphere = Atmosphere(type=intern_str(evt.get("AtmosphereType")), composition=atmos_composition, raw=intern_str(evt.get("Atmosphere")))
 
 
         if etype == "Disembark":
@@ -444,7 +427,7 @@ class JournalController(PausableThread, threading.Thread):
 
                 ring_id_is_name = False
                 rings_found_dict = {}
-                rings_found = self.m.bodies[body_id].rings
+                rings_found = dict(self.m.bodies[body_id].rings)
                 if body_id in self.m.bodies:
                     # do we have a proper ring ID?
                     if ring_id in self.m.bodies[body_id].rings:
@@ -513,7 +496,7 @@ class JournalController(PausableThread, threading.Thread):
 
                 body_name = None
                 scandata = None
-                rings_found = self.m.bodies[body_id].rings
+                rings_found = dict(self.m.bodies[body_id].rings)
                 journal_signals = evt.get("Signals")
                 ring_id_is_name = False
                 rings_found_dict = {}
@@ -552,11 +535,11 @@ class JournalController(PausableThread, threading.Thread):
                     if signal.get("Type") == "$SAA_SignalType_Biological;":
                         biosignals = signal.get("Count")
                         bio_dict = self.m.bodies[body_id].bio_found if body_id in self.m.bodies else {}
-                        bio_found = {k: Genus(**v) if isinstance(v, dict) else v for k, v in bio_dict.items()}
+                        bio_found = {k: Genus.from_dict(v) if isinstance(v, dict) else v for k, v in bio_dict.items()}
 
                         for genus in evt.get("Genuses", []):
-                            genus_id = genus.get("Genus")
-                            genus_localised = genus.get("Genus_Localised")
+                            genus_id = intern_str(genus.get("Genus"))
+                            genus_localised = intern_str(genus.get("Genus_Localised"))
                             genus_found_dict = {}
                             if body_id in self.m.bodies and genus_id in self.m.bodies[body_id].bio_found:
                                 genus_found_dict = self.m.bodies[body_id].bio_found[genus_id]
@@ -583,11 +566,11 @@ class JournalController(PausableThread, threading.Thread):
             subcategory = evt.get("SubCategory")
             if subcategory == "$Codex_SubCategory_Geology_and_Anomalies;":
                 if evt.get("NearestDestination") != "$Fixed_Event_Life_Cloud;":
-                    geo_id = evt.get("Name")
-                    geo_localised = evt.get("Name_Localised")
+                    geo_id = intern_str(evt.get("Name"))
+                    geo_localised = intern_str(evt.get("Name_Localised"))
                     geo_is_new = evt.get("IsNewEntry") or evt.get("IsNewEntry") == "true"
                     geo_dict = self.m.bodies[body_id].geo_found if body_id in self.m.bodies else {}
-                    geo_found = {k: CodexEntry(**v) if isinstance(v, dict) else v for k, v in geo_dict.items()}
+                    geo_found = {k: CodexEntry.from_dict(v) if isinstance(v, dict) else v for k, v in geo_dict.items()}
                     geo_codex_dict = {}
 
                     geosignals_total = self.m.bodies[body_id].geosignals if body_id in self.m.bodies else 0
@@ -620,11 +603,11 @@ class JournalController(PausableThread, threading.Thread):
             if subcategory == "$Codex_SubCategory_Organic_Structures;":
                 genus_id = evt.get("Name")
                 # generalize genus ID
-                genus_id = self.normalize_genus(genus_id) # re.sub(r'_\d+_[^_]+(?=_Name;)', '_Genus', genus_id)
-                genus_localised = evt.get("Genus_Localised")
-                variant_localised = evt.get("Name_Localised")
+                genus_id = intern_str(self.normalize_genus(genus_id)) # re.sub(r'_\d+_[^_]+(?=_Name;)', '_Genus', genus_id)
+                genus_localised = intern_str(evt.get("Genus_Localised"))
+                variant_localised = intern_str(evt.get("Name_Localised"))
                 bio_dict = self.m.bodies[body_id].bio_found if body_id in self.m.bodies else {}
-                bio_found = {k: Genus(**v) if isinstance(v, dict) else v for k, v in bio_dict.items()}
+                bio_found = {k: Genus.from_dict(v) if isinstance(v, dict) else v for k, v in bio_dict.items()}
 
                 genus_found_dict = {}
                 if body_id in self.m.bodies and genus_id in self.m.bodies[body_id].bio_found:
@@ -652,10 +635,10 @@ class JournalController(PausableThread, threading.Thread):
             species_id = evt.get("Species")
 
             # generalize genus ID
-            genus_id = self.normalize_genus(genus_id) # re.sub(r'_\d+_[^_]+(?=_Name;)', '_Genus', genus_id)
-            genus_localised = evt.get("Genus_Localised")
-            species_localised = evt.get("Species_Localised")
-            variant_localised = evt.get("Variant_Localised")
+            genus_id = intern_str(self.normalize_genus(genus_id)) # re.sub(r'_\d+_[^_]+(?=_Name;)', '_Genus', genus_id)
+            genus_localised = intern_str(evt.get("Genus_Localised"))
+            species_localised = intern_str(evt.get("Species_Localised"))
+            variant_localised = intern_str(evt.get("Variant_Localised"))
             bio_dict = self.m.bodies[body_id].bio_found if body_id in self.m.bodies else {}
             bio_found = {k: Genus.from_dict(v) if isinstance(v, dict) else v for k, v in bio_dict.items()}
             bio_scanned = self.m.bodies[body_id].bio_scanned if body_id in self.m.bodies else 0
@@ -736,9 +719,10 @@ class JournalController(PausableThread, threading.Thread):
             body_type = "🚫 no data 🚫"
 
         if body_id is not None and (body_name is None or not body_name.endswith("Ring")):
-            self.m.update_body(
-                systemaddress=systemaddress,
+            patch = BodyPatch(
                 body_id=body_id,
+                materials=materials,
+                scandata=scandata,
                 body_name=body_name,
                 body_type=body_type,
                 is_star=is_star,
@@ -748,17 +732,14 @@ class JournalController(PausableThread, threading.Thread):
                 g_force=g_force,
                 biosignals=biosignals,
                 geosignals=geosignals,
-                materials=materials,
-                scandata=scandata,
                 bio_found=bio_found,
                 geo_found=geo_found,
                 has_rings=has_rings,
                 rings=rings_found,
-                total_bodies=total_bodies,
                 radius=radius,
                 mapped=mapped,
                 geo_complete=geo_complete,
-                geo_scanned=geo_scanned or 0,
+                geo_scanned=geo_scanned,
                 bio_complete=bio_complete,
                 bio_scanned=bio_scanned,
                 first_discovered=first_discovered,
@@ -774,6 +755,7 @@ class JournalController(PausableThread, threading.Thread):
                 parent_distance=parent_distance,
                 pressure=pressure
             )
+            self.m.apply_patch(systemaddress=systemaddress, patch=patch, total_bodies=total_bodies)
 
         # nothing to safe here, just update the target
         if etype == "Location":
@@ -10,13 +10,17 @@ model.py – core logic for ED Mineral Viewer
 
 from __future__ import annotations
 
+import copy
 import threading
-from dataclasses import dataclass, asdict, field
-from typing import Optional, List
+from dataclasses import dataclass, field, fields, MISSING
+from typing import NamedTuple, Optional, List
 
 import EDXD.data_handler.helper.data_helper as dh
 
-from EDXD.data_handler.helper.body_appraiser import appraise_body
+from EDXD.data_handler.helper.body_appraiser import appraise_values, appraisal_inputs
+from EDXD.data_handler.helper.string_pool import intern_cached_body
+from EDXD.data_handler.helper.system_topology import SystemTopology
+from EDXD.data_handler.helper.system_valuation import SystemValuation, SystemValue
 from EDXD.data_handler.planetary_surface_positioning_system import PSPSCoordinates
 from EDXD.data_handler.vessel_status import *
 from EDXD.globals import BODY_ID_PREFIX
@@ -27,26 +31,10 @@ bip = BODY_ID_PREFIX
 # paths (shared with other modules)
 # ---------------------------------------------------------------------------
 from EDXD.globals import CACHE_DIR
-from EDXD.globals import logging, LOG_LEVEL
-import inspect, functools
+from EDXD.globals import LOG_LEVEL, log_call
 
-def log_call(level=LOG_LEVEL):
-    """Decorator that logs function name and bound arguments."""
-    def decorator(fn):
-        logger = logging.getLogger(fn.__module__)   # one logger per module
-        sig = inspect.signature(fn)                 # capture once, not on every call
 
-        @functools.wraps(fn)
-        def wrapper(*args, **kwargs):
-            bound = sig.bind_partial(*args, **kwargs)
-            arg_str = ", ".join(f"{k}={v!r}" for k, v in bound.arguments.items())
-            logger.log(level, "%s(%s)", fn.__name__, arg_str)
-            return fn(*args, **kwargs)
-
-        return wrapper
-    return decorator
-
-@dataclass
+@dataclass(slots=True)
 class Body:
     body_id                 : str
     body_name               : str = ""
@@ -61,6 +49,7 @@ class Body:
     biosignals              : int = 0
     geosignals              : int = 0
     estimated_value         : int = 0
+    scan_value              : int = 0
     has_rings               : bool = False
     rings                   : Dict[str, Ring] = field(default_factory=dict)
     radius                  : float = 0.0
@@ -82,6 +71,7 @@ class Body:
     parents                 : List[Dict[str, int]] = field(default_factory=list)
     parent_distance         : float = 0.0
     pressure                : float = 0.0
+    appraisal               : Dict[str, object] = field(default_factory=dict)
 
     def __post_init__(self):
         # Ensure mutable defaults are initialized as empty dicts if None is passed
@@ -95,9 +85,103 @@ class Body:
             self.rings = {}
         if self.parents is None:
             self.parents = []
+        if self.appraisal is None:
+            self.appraisal = {}
+
+    def __copy__(self) -> Body:
+        # shallow: nested containers are shared, patches replace them rather than editing them
+        clone = Body.__new__(Body)
+        for name in _BODY_FIELDS:
+            setattr(clone, name, getattr(self, name))
+        return clone
+
+    def to_dict(self) -> dict:
+        """Cache representation – body_id is the key of the surrounding mapping."""
+        return {
+            "body_name"             : self.body_name,
+            "body_type"             : self.body_type,
+            "is_star"               : self.is_star,
+            "scoopable"             : self.scoopable,
+            "landable"              : self.landable,
+            "g_force"               : self.g_force,
+            "radius"                : self.radius,
+            "mapped"                : self.mapped,
+            "distance"              : self.distance,
+            "biosignals"            : self.biosignals,
+            "bio_scanned"           : self.bio_scanned,
+            "bio_complete"          : self.bio_complete,
+            "geosignals"            : self.geosignals,
+            "geo_scanned"           : self.geo_scanned,
+            "geo_complete"          : self.geo_complete,
+            "materials"             : self.materials,
+            "first_discovered"      : self.first_discovered,
+            "first_mapped"          : self.first_mapped,
+            "first_footfalled"      : self.first_footfalled,
+            "bio_found"             : self._nested_to_dict("bio_found"),
+            "geo_found"             : self._nested_to_dict("geo_found"),
+            "estimated_value"       : self.estimated_value,
+            "scan_value"            : self.scan_value,
+            "has_rings"             : self.has_rings,
+            "rings"                 : self._nested_to_dict("rings"),
+            "atmosphere"            : self._nested_to_dict("atmosphere"),
+            "mean_temp"             : self.mean_temp,
+            "luminosity"            : self.luminosity,
+            "raw_luminosity"        : self.raw_luminosity,
+            "volcanism"             : self.volcanism,
+            "present_life"          : self.present_life,
+            "parents"               : self.parents,
+            "parent_distance"       : self.parent_distance,
+            "pressure"              : self.pressure,
+            "appraisal"             : self.appraisal,
+        }
 
+    def _nested_to_dict(self, name: str):
+        return _NESTED_CODECS[name][1](getattr(self, name))
 
-@dataclass
+    @classmethod
+    def from_dict(cls, body_id: str, data: dict) -> Body:
+        get = data.get
+        return cls(
+            body_id             = body_id,
+            body_name           = get("body_name", ""),
+            body_type           = get("body_type", ""),
+            is_star             = get("is_star", False),
+            scoopable           = get("scoopable", False),
+            landable            = get("landable", False),
+            distance            = get("distance", 0),
+            materials           = get("materials", {}),
+            bio_found           = _decode_bio_found(get("bio_found")),
+            geo_found           = _decode_geo_found(get("geo_found")),
+            biosignals          = get("biosignals", 0),
+            geosignals          = get("geosignals", 0),
+            estimated_value     = get("estimated_value", 0),
+            scan_value          = get("scan_value", 0),
+            has_rings           = get("has_rings", False),
+            rings               = _decode_rings(get("rings")),
+            radius              = get("radius", 0.0),
+            mapped              = get("mapped", False),
+            geo_complete        = get("geo_complete", False),
+            geo_scanned         = get("geo_scanned", 0),
+            bio_complete        = get("bio_complete", False),
+            bio_scanned         = get("bio_scanned", 0),
+            first_discovered    = get("first_discovered", 0),
+            first_mapped        = get("first_mapped", 0),
+            first_footfalled    = get("first_footfalled", 0),
+            g_force             = get("g_force", 0.0),
+            atmosphere          = _decode_atmosphere(get("atmosphere")),
+            mean_temp           = get("mean_temp", 0.0),
+            luminosity          = get("luminosity", ""),
+            raw_luminosity      = get("raw_luminosity", ""),
+            volcanism           = get("volcanism", ""),
+            present_life        = get("present_life", ""),
+            parents             = get("parents", []),
+            parent_distance     = get("parent_distance", 0.0),
+            pressure            = get("pressure", 0.0),
+            appraisal           = get("appraisal", {}),
+        )
+
+
+@dataclass(slots=True)
 class Ring:
     body_id     : str
     body_name   : str = ""
@@ -109,10 +193,20 @@ class Ring:
         if self.signals is None:
             self.signals = {}
 
-    def to_dict(self):
-        return asdict(self)
+    def to_dict(self) -> dict:
+        return {
+            "body_id"   : self.body_id,
+            "body_name" : self.body_name,
+            "ring_class": self.ring_class,
+            "signals"   : self.signals,
+        }
 
-@dataclass
+    @classmethod
+    def from_dict(cls, data: dict) -> Ring:
+        get = data.get
+        return cls(get("body_id"), get("body_name", ""), get("ring_class", ""), get("signals"))
+
+@dataclass(slots=True)
 class Genus:
     genusid            : Optional[str] = None
     localised          : Optional[str] = None
@@ -123,42 +217,60 @@ class Genus:
     pos_first          : Optional[PSPSCoordinates] = None
     pos_second         : Optional[PSPSCoordinates] = None
 
-    def to_dict(self):
-        data = asdict(self)
-        if self.pos_first and hasattr(self.pos_first, "to_dict"):
-            data["pos_first"] = self.pos_first.to_dict()
-
-        if self.pos_second and hasattr(self.pos_second, "to_dict"):
-            data["pos_second"] = self.pos_second.to_dict()
-
-        return data
+    def to_dict(self) -> dict:
+        pos_first = self.pos_first
+        pos_second = self.pos_second
+        return {
+            "genusid"           : self.genusid,
+            "localised"         : self.localised,
+            "species_localised" : self.species_localised,
+            "variant_localised" : self.variant_localised,
+            "scanned_count"     : self.scanned_count,
+            "min_distance"      : self.min_distance,
+            "pos_first"         : pos_first.to_dict() if isinstance(pos_first, PSPSCoordinates) else pos_first,
+            "pos_second"        : pos_second.to_dict() if isinstance(pos_second, PSPSCoordinates) else pos_second,
+        }
 
     @classmethod
-    def from_dict(cls, data: dict):
+    def from_dict(cls, data: dict) -> Optional[Genus]:
         if not data:
             return None
 
-        # make a shallow copy to avoid mutating the caller's dict
-        d = dict(data)
-
-        if "pos_first" in d and isinstance(d["pos_first"], dict):
-            d["pos_first"] = PSPSCoordinates.from_dict(d["pos_first"])
-        if "pos_second" in d and isinstance(d["pos_second"], dict):
-            d["pos_second"] = PSPSCoordinates.from_dict(d["pos_second"])
-
-        return cls(**d)
-
-@dataclass
+        get = data.get
+        pos_first = get("pos_first")
+        pos_second = get("pos_second")
+        return cls(
+            get("genusid"),
+            get("localised"),
+            get("species_localised"),
+            get("variant_localised"),
+            get("scanned_count"),
+            get("min_distance"),
+            PSPSCoordinates.from_dict(pos_first) if isinstance(pos_first, dict) else pos_first,
+            PSPSCoordinates.from_dict(pos_second) if isinstance(pos_second, dict) else pos_second,
+        )
+
+@dataclass(slots=True)
 class CodexEntry:
     codexid     : str = None
     localised   : str = None
     is_new      : bool = None
     body_id     : str = None
 
-    def to_dict(self):
-        return asdict(self)
+    def to_dict(self) -> dict:
+        return {
+            "codexid"   : self.codexid,
+            "localised" : self.localised,
+            "is_new"    : self.is_new,
+            "body_id"   : self.body_id,
+        }
 
-@dataclass
+    @classmethod
+    def from_dict(cls, data: dict) -> CodexEntry:
+        get = data.get
+        return cls(get("codexid"), get("localised"), get("is_new"), get("body_id"))
+
+@dataclass(slots=True)
 class Atmosphere:
     type        : str = None
     raw         : str = None
@@ -169,8 +281,150 @@ class Atmosphere:
         if self.composition is None:
             self.composition = {}
 
-    def to_dict(self):
-        return asdict(self)
+    def to_dict(self) -> dict:
+        return {
+            "type"          : self.type,
+            "raw"           : self.raw,
+            "composition"   : self.composition,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Atmosphere:
+        get = data.get
+        return cls(get("type"), get("raw"), get("composition"))
+
+# ---------------------------------------------------------------------------
+# lazy decoding of cached bodies
+# ---------------------------------------------------------------------------
+def _decode_bio_found(raw) -> Dict[str, Genus]:
+    return {k: Genus.from_dict(v) if isinstance(v, dict) else v for k, v in (raw or {}).items()}
+
+def _decode_geo_found(raw) -> Dict[str, CodexEntry]:
+    return {k: CodexEntry.from_dict(v) if isinstance(v, dict) else v for k, v in (raw or {}).items()}
+
+def _decode_rings(raw) -> Dict[str, Ring]:
+    return {k: Ring.from_dict(v) if isinstance(v, dict) else v for k, v in (raw or {}).items()}
+
+def _decode_atmosphere(raw):
+    return Atmosphere.from_dict(raw) if isinstance(raw, dict) else raw
+
+def _encode_mapping(value) -> dict:
+    return {k: v.to_dict() if hasattr(v, "to_dict") else v for k, v in value.items()}
+
+def _encode_atmosphere(value):
+    return value.to_dict() if isinstance(value, Atmosphere) else value
+
+# field name -> (decode raw cache value, encode decoded value)
+_NESTED_CODECS = {
+    "bio_found"     : (_decode_bio_found,   _encode_mapping),
+    "geo_found"     : (_decode_geo_found,   _encode_mapping),
+    "rings"         : (_decode_rings,       _encode_mapping),
+    "atmosphere"    : (_decode_atmosphere,  _encode_atmosphere),
+}
+
+_LAZY_BITS = {name: 1 << i for i, name in enumerate(_NESTED_CODECS)}
+
+def _lazy_field(name: str) -> property:
+    slot = Body.__dict__[name]      # the member descriptor created by __slots__
+    decode = _NESTED_CODECS[name][0]
+    bit = _LAZY_BITS[name]
+
+    def fget(self):
+        if not self._decoded & bit:
+            slot.__set__(self, decode(self._raw.get(name)))
+            self._decoded |= bit
+        return slot.__get__(self, LazyBody)
+
+    def fset(self, value):
+        slot.__set__(self, value)
+        self._decoded |= bit
+
+    return property(fget, fset)
+
+
+class LazyBody(Body):
+    """
+    Body backed by its raw cache mapping. Scalars are copied straight over, bio_found, geo_found,
+    rings and atmosphere are only turned into objects once something actually reads them.
+    """
+    __slots__ = ("_raw", "_decoded")
+
+    bio_found   = _lazy_field("bio_found")
+    geo_found   = _lazy_field("geo_found")
+    rings       = _lazy_field("rings")
+    atmosphere  = _lazy_field("atmosphere")
+
+    def __init__(self, body_id: str, data: dict):
+        self._raw = data
+        self._decoded = 0
+        self.body_id = body_id
+        get = data.get
+        for name, default, factory in _SCALAR_FIELDS:
+            if factory is None:
+                setattr(self, name, get(name, default))
+            else:
+                setattr(self, name, get(name) or factory())
+
+    def is_decoded(self, name: str) -> bool:
+        return bool(self._decoded & _LAZY_BITS[name])
+
+    def __copy__(self) -> LazyBody:
+        # copy the slots directly - going through the properties would decode every nested field
+        clone = LazyBody.__new__(LazyBody)
+        clone._raw = self._raw
+        clone._decoded = self._decoded
+        for name in _BODY_FIELDS:
+            slot = Body.__dict__[name]
+            try:
+                slot.__set__(clone, slot.__get__(self, LazyBody))
+            except AttributeError:
+                pass    # nested field not decoded yet, the clone decodes it from the shared raw mapping
+        return clone
+
+    def _nested_to_dict(self, name: str):
+        # untouched sub-objects go back to the cache exactly as they came
+        if not self.is_decoded(name):
+            value = self._raw.get(name)
+            return value if value is not None or name == "atmosphere" else {}
+        return Body._nested_to_dict(self, name)
+
+
+_SCALAR_FIELDS = tuple(
+    (f.name, f.default, None if f.default_factory is MISSING else f.default_factory)
+    for f in fields(Body) if f.name != "body_id" and f.name not in _NESTED_CODECS
+)
+
+# ---------------------------------------------------------------------------
+# sparse body updates
+# ---------------------------------------------------------------------------
+_BODY_FIELDS = frozenset(f.name for f in fields(Body))
+
+class BodyPatch:
+    """Carries only the Body fields an event actually set."""
+    __slots__ = ("body_id", "values", "materials", "scandata")
+
+    def __init__(self, body_id: str, materials: Dict[str, float] = None, scandata = None, **values):
+        unknown = values.keys() - _BODY_FIELDS
+        if unknown:
+            raise TypeError(f"BodyPatch got unknown Body field(s): {', '.join(sorted(unknown))}")
+
+        self.body_id    = body_id
+        self.materials  = materials or None
+        self.scandata   = scandata
+        # falsy values never won the `new or old or default` merge, so they are not carried at all
+        self.values     = {name: value for name, value in values.items() if value}
+
+    def apply_to(self, body: Body) -> Body:
+        for name, value in self.values.items():
+            setattr(body, name, value)
+
+        if self.materials:
+            body.materials = {**body.materials, **self.materials}
+        scandata = self.scandata
+        if scandata is not None and scandata.get("event") == "Scan" and scandata.get("ScanType") in {"AutoScan", "Detailed"}:
+            body.appraisal = appraisal_inputs(scandata)
+            body.scan_value, body.estimated_value = appraise_values(body.appraisal)
+        return body
 
 # ---------------------------------------------------------------------------
 # helper data classes for table views
@@ -231,6 +485,14 @@ class FlatRowDataMainWindow:
                 self.atmosphere = ""
 
 
+class PredictionRequest(NamedTuple):
+    """The bodies of the current system as they were at one model revision."""
+    system_addr : Optional[int]
+    revision    : int
+    bodies      : Dict[str, Body]   # shallow copies, safe to read while the journal thread patches the model
+    topology    : SystemTopology    # copy of Model.topology at the same revision
+
+
 # ---------------------------------------------------------------------------
 # thread-safe data model
 # ---------------------------------------------------------------------------
@@ -252,6 +514,12 @@ class Model:
         self.current_vessel     : Optional[str]             = None
         self.flags              : Optional[int]             = None
         self.flags2             : Optional[int]             = None
+        self.gui_focus          : Optional[int]             = None # Status.json GuiFocus - 9 is the FSS
+        self.topology           : SystemTopology            = SystemTopology()
+        self.valuation          : SystemValuation           = SystemValuation()
+        self.biosign_predictions: Dict[str, List[dict]]     = {} # latest result of the BiosignPredictor
+        self.revision           : int                       = 0  # bumped whenever the bodies change
+        self.body_revisions     : Dict[str, int]            = {} # body_id -> revision of its last change
 
     # ----- listeners ---------------------------------------------------------
     def register_target_listener(self, cb):
@@ -265,14 +533,22 @@ class Model:
             cb(body_id)
 
     # ----- mutators ----------------------------------------------------------
-    #@log_call()
+    #@log_call(LOG_LEVEL)
     def reset_system(self, system_name: str, address: Optional[int]):
         tmp_selected_body_id = self.selected_body_id
         """Clear all bodies and load cached system if available."""
         with self.lock:
+            # every journal event with a SystemAddress lands here - only another system starts over,
+            # the current one keeps its bodies, their revisions and everything derived from them
+            if address != self.system_addr:
+                self.bodies.clear()
+                self.topology.clear()
+                self.valuation.clear()
+                self.biosign_predictions = {}
+                self.body_revisions.clear()
+                self.revision += 1
             self.system_name = system_name
             self.system_addr = address
-            self.bodies.clear()
             self.target_body_id = None
             self.selected_body_id = None
 
@@ -289,80 +565,12 @@ class Model:
                 self.total_bodies = cached.get("total_bodies", None)
             body_map = cached.get("bodies", {})
             for body_id, body_properties in body_map.items():
-                body_name               = body_properties.get("body_name", "")
-                body_type               = body_properties.get("body_type", "")
-                is_star                 = body_properties.get("is_star", False)
-                scoopable               = body_properties.get("scoopable", False)
-                distance                = body_properties.get("distance", 0)
-                landable                = body_properties.get("landable", False)
-                g_force                 = body_properties.get("g_force", 0.0)
-                bio_count               = body_properties.get("biosignals", 0)
-                geo_count               = body_properties.get("geosignals", 0)
-                mats                    = body_properties.get("materials", {})
-                bio_dict                = body_properties.get("bio_found", {})
-                geo_dict                = body_properties.get("geo_found", {})
-                estimated_value         = body_properties.get("estimated_value", 0)
-                has_rings               = body_properties.get("has_rings", False)
-                rings_dict              = body_properties.get("rings", {})
-                radius                  = body_properties.get("radius", 0.0)
-                mapped                  = body_properties.get("mapped", False)
-                geo_complete            = body_properties.get("geo_complete", False)
-                geo_scanned             = body_properties.get("geo_scanned", 0)
-                bio_complete            = body_properties.get("bio_complete", False)
-                bio_scanned             = body_properties.get("bio_scanned", 0)
-                first_discovered        = body_properties.get("first_discovered", 0)
-                first_mapped            = body_properties.get("first_mapped", 0)
-                first_footfalled        = body_properties.get("first_footfalled", 0)
-                atmosphere              = body_properties.get("atmosphere", None)
-                mean_temp               = body_properties.get("mean_temp", 0.0)
-                luminosity              = body_properties.get("luminosity", "")
-                raw_luminosity          = body_properties.get("raw_luminosity", "")
-                volcanism               = body_properties.get("volcanism", "")
-                present_life            = body_properties.get("present_life", "")
-                parents                 = body_properties.get("parents", [])
-                parent_distance         = body_properties.get("parent_distance", 0.0)
-                pressure                = body_properties.get("pressure", 0.0)
-
-                bio_found = {k: Genus.from_dict(v) if isinstance(v, dict) else v for k, v in bio_dict.items()}
-                geo_found = {k: CodexEntry(**v) if isinstance(v, dict) else v for k, v in geo_dict.items()}
-                rings_found = {k: Ring(**v) if isinstance(v, dict) else v for k, v in rings_dict.items()}
-
-                self.bodies[body_id] = Body(
-                    body_id=body_id,
-                    body_name=body_name,
-                    body_type=body_type,
-                    is_star=is_star,
-                    scoopable=scoopable,
-                    distance=distance,
-                    landable=landable,
-                    g_force=g_force,
-                    materials=mats,
-                    biosignals=bio_count,
-                    geosignals=geo_count,
-                    bio_found=bio_found,
-                    geo_found=geo_found,
-                    estimated_value=estimated_value,
-                    has_rings=has_rings,
-                    rings=rings_found,
-                    radius=radius,
-                    mapped=mapped,
-                    geo_complete=geo_complete,
-                    geo_scanned=geo_scanned,
-                    bio_complete=bio_complete,
-                    bio_scanned=bio_scanned,
-                    first_discovered=first_discovered,
-                    first_mapped=first_mapped,
-                    first_footfalled=first_footfalled,
-                    atmosphere=atmosphere,
-                    mean_temp=mean_temp,
-                    luminosity=luminosity,
-                    raw_luminosity=raw_luminosity,
-                    volcanism=volcanism,
-                    present_life=present_life,
-                    parents=parents,
-                    parent_distance=parent_distance,
-                    pressure=pressure
-                )
+                body = LazyBody(body_id, intern_cached_body(body_properties))
+                self.bodies[body_id] = body
+                # the cache holds what the model had - a body read again keeps its revision
+                self.body_revisions.setdefault(body_id, self.revision)
+                self.topology.update_body(body)
+                self.valuation.update_body(body)
 
     def update_body(self, systemaddress: int, body_id: str, body_name: str = None, body_type: str = None, is_star: bool = None, scoopable: bool = None, distance: int = None, landable: bool = None,
                     biosignals: int = None, geosignals: int = None, materials: Dict[str, float] = None, scandata = None,
@@ -371,52 +579,37 @@ class Model:
                     first_discovered: int = 0, first_mapped: int = 0, first_footfalled: int = 0, g_force: float = 0.0, atmosphere: Atmosphere = None,
                     mean_temp: float = 0.0, luminosity: str = "", raw_luminosity: str = "", volcanism: str = "", present_life: str = "", parents: List[Dict[str, int]] = None, parent_distance: float = 0.0, pressure: float = 0.0
                     ):
+        patch = None
+        if body_id is not None:
+            patch = BodyPatch(
+                body_id=body_id, materials=materials, scandata=scandata,
+                body_name=body_name, body_type=body_type, is_star=is_star, scoopable=scoopable, distance=distance, landable=landable,
+                g_force=g_force, biosignals=biosignals, geosignals=geosignals, bio_found=bio_found, geo_found=geo_found,
+                has_rings=has_rings, rings=rings, radius=radius, mapped=mapped, geo_complete=geo_complete, geo_scanned=geo_scanned,
+                bio_complete=bio_complete, bio_scanned=bio_scanned, first_discovered=first_discovered, first_mapped=first_mapped,
+                first_footfalled=first_footfalled, atmosphere=atmosphere, mean_temp=mean_temp, luminosity=luminosity,
+                raw_luminosity=raw_luminosity, volcanism=volcanism, present_life=present_life, parents=parents,
+                parent_distance=parent_distance, pressure=pressure
+            )
+        self.apply_patch(systemaddress=systemaddress, patch=patch, total_bodies=total_bodies)
+
+    def apply_patch(self, systemaddress: int, patch: Optional[BodyPatch], total_bodies: int = None):
+        """Merge a sparse BodyPatch into the body it addresses and persist the system."""
         with self.lock:
             self.system_addr = systemaddress
             tmp_total_bodies = total_bodies or self.total_bodies
 
             if self.total_bodies is None:
                 self.total_bodies = tmp_total_bodies
-            if body_id is not None:
-                body = self.bodies.get(body_id, Body(body_id=body_id))
-                body.body_name              = body_name             or body.body_name               or ""
-                body.body_type              = body_type             or body.body_type               or ""
-                body.is_star                = is_star               or body.is_star                 or False
-                body.scoopable              = scoopable             or body.scoopable               or False
-                body.distance               = distance              or body.distance                or 0
-                body.landable               = landable              or body.landable                or False
-                body.g_force                = g_force               or body.g_force                 or 0
-                body.biosignals             = biosignals            or body.biosignals              or 0
-                body.geosignals             = geosignals            or body.geosignals              or 0
-                body.bio_found              = bio_found             or body.bio_found               or {}
-                body.geo_found              = geo_found             or body.geo_found               or {}
-                body.has_rings              = has_rings             or body.has_rings               or False
-                body.rings                  = rings                 or body.rings                   or {}
-                body.radius                 = radius                or body.radius                  or 0
-                body.mapped                 = mapped                or body.mapped                  or False
-                body.geo_complete           = geo_complete          or body.geo_complete            or False
-                body.geo_scanned            = geo_scanned           or body.geo_scanned             or 0
-                body.bio_complete           = bio_complete          or body.bio_complete            or False
-                body.bio_scanned            = bio_scanned           or body.bio_scanned             or 0
-                body.first_discovered       = first_discovered      or body.first_discovered        or 0
-                body.first_mapped           = first_mapped          or body.first_mapped            or 0
-                body.first_footfalled       = first_footfalled      or body.first_footfalled        or 0
-                body.atmosphere             = atmosphere            or body.atmosphere              or None
-                body.mean_temp              = mean_temp             or body.mean_temp               or 0
-                body.luminosity             = luminosity            or body.luminosity              or ""
-                body.raw_luminosity         = raw_luminosity        or body.raw_luminosity          or ""
-                body.volcanism              = volcanism             or body.volcanism               or ""
-                body.present_life           = present_life          or body.present_life            or ""
-                body.parents                = parents               or body.parents                 or []
-                body.parent_distance        = parent_distance       or body.parent_distance         or 0.0
-                body.pressure               = pressure              or body.pressure                or 0.0
-
-                if materials is not None:
-                    body.materials.update(materials)
-                if scandata is not None and scandata.get("event") == "Scan" and scandata.get("ScanType") in {"AutoScan", "Detailed"}:
-                    body.estimated_value = appraise_body(body_info=scandata, just_scanned_value=False)
-
-                self.bodies[body_id] = body
+            if patch is not None and patch.body_id is not None:
+                body = self.bodies.get(patch.body_id)
+                if body is None:
+                    body = Body(body_id=patch.body_id)
+                self.bodies[patch.body_id] = body = patch.apply_to(body)
+                self.topology.update_body(body)
+                self.valuation.update_body(body)
+                self.revision += 1
+                self.body_revisions[patch.body_id] = self.revision
             self._save_cache()
 
     def update_body_count(self, systemaddress: int, total_bodies: int = None):
@@ -451,53 +644,7 @@ class Model:
             "system_name"   : self.system_name,
             "total_bodies"  : self.total_bodies,
             "bodies"        : {
-                body_id: {
-                    "body_name"             : body.body_name,
-                    "body_type"             : body.body_type,
-                    "is_star"               : body.is_star,
-                    "scoopable"             : body.scoopable,
-                    "landable"              : body.landable,
-                    "g_force"               : body.g_force,
-                    "radius"                : body.radius,
-                    "mapped"                : body.mapped,
-                    "distance"              : body.distance,
-                    "biosignals"            : body.biosignals,
-                    "bio_scanned"           : body.bio_scanned,
-                    "bio_complete"          : body.bio_complete,
-                    "geosignals"            : body.geosignals,
-                    "geo_scanned"           : body.geo_scanned,
-                    "geo_complete"          : body.geo_complete,
-                    "materials"             : body.materials,
-                    "first_discovered"      : body.first_discovered,
-                    "first_mapped"          : body.first_mapped,
-                    "first_footfalled"      : body.first_footfalled,
-                    "bio_found"             : {
-                        genusid:
-                            genus.to_dict()
-                        for genusid, genus in body.bio_found.items()
-                    },
-                    "geo_found"             : {
-                        geoid:
-                            geo.to_dict()
-                        for geoid, geo in body.geo_found.items()
-                    },
-                    "estimated_value"       : body.estimated_value,
-                    "has_rings"             : body.has_rings,
-                    "rings"                 : {
-                        ringid:
-                            ring.to_dict()
-                        for ringid, ring in body.rings.items()
-                    },
-                    "atmosphere"            : body.atmosphere.to_dict() if hasattr(body.atmosphere, 'to_dict') else body.atmosphere,
-                    "mean_temp"             : body.mean_temp,
-                    "luminosity"            : body.luminosity,
-                    "raw_luminosity"        : body.raw_luminosity,
-                    "volcanism"             : body.volcanism,
-                    "present_life"          : body.present_life,
-                    "parents"               : body.parents,
-                    "parent_distance"       : body.parent_distance,
-                    "pressure"              : body.pressure,
-                }
+                body_id: body.to_dict()
                 for body_id, body in self.bodies.items()
             },
         }
@@ -515,6 +662,16 @@ class Model:
         with self.lock:
             return dict(self.bodies)
 
+    def snapshot_body_revisions(self) -> Dict[str, int]:
+        """body_id -> model revision of its last change; a body whose revision is unchanged is unchanged."""
+        with self.lock:
+            return dict(self.body_revisions)
+
+    def get_body_revision(self, body_id: Optional[str]) -> Optional[int]:
+        """Revision of the last change of body_id - take it before snapshotting the body itself."""
+        with self.lock:
+            return self.body_revisions.get(body_id)
+
     def snapshot_target(self) -> Optional[Body]:
         with self.lock:
             return self.bodies.get(self.target_body_id)
@@ -527,14 +684,25 @@ class Model:
         with self.lock:
             return self.total_bodies
 
-    def get_system_biosign_predictions(self) -> dict:
-        """
-        Analyzes current system bodies and returns potential biosigns.
-        Returns dict: { body_id: [ {name, base_value, scan_range}, ... ] }
-        """
+    def snapshot_valuation(self) -> SystemValue:
+        with self.lock:
+            return self.valuation.totals
+
+    def snapshot_prediction_request(self) -> PredictionRequest:
+        with self.lock:
+            return PredictionRequest(self.system_addr, self.revision,
+                                     {body_id: copy.copy(body) for body_id, body in self.bodies.items()},
+                                     self.topology.copy())
+
+    def snapshot_biosign_predictions(self) -> Dict[str, List[dict]]:
+        with self.lock:
+            return self.biosign_predictions
+
+    def store_biosign_predictions(self, request: PredictionRequest, predictions: Dict[str, List[dict]]) -> bool:
+        """Take over the predictions made for request; False if the system changed meanwhile."""
         with self.lock:
-            if not self.bodies:
-                return {}
-            # Pass a snapshot to the helper
-            from EDXD.data_handler.helper.biosign_estimator import estimate_system_biosigns
-            return estimate_system_biosigns(self.bodies)
\ No newline at end of file
+            if request.system_addr != self.system_addr:
+                return False
+            self.biosign_predictions = predictions
+            self.valuation.update_bio(predictions)
+            return True
\ No newline at end of file
@@ -23,6 +23,7 @@ class StatusWatcher(PausableThread, threading.Thread):
         self.poll   = poll
         self.last_body   = None           # last Destination.Name we saw
         self.last_timestamp = None        # last timestamp, so we can log only new lines
+        self.last_change = None           # time.monotonic() when the Status.json timestamp last changed
 
     def _process_data(self):
         raw_data = None
@@ -30,9 +31,11 @@ class StatusWatcher(PausableThread, threading.Thread):
             raw_data = self.path.read_text()
             data = json.loads(raw_data)
             timestamp = data.get("timestamp")
-            if DEBUG_STATUS_JSON and timestamp and timestamp != self.last_timestamp:
+            if timestamp and timestamp != self.last_timestamp:
                 self.last_timestamp = timestamp
-                self._write_debug_log(data)
+                self.last_change = time.monotonic()
+                if DEBUG_STATUS_JSON:
+                    self._write_debug_log(data)
 
             dest = data.get("Destination", {})
             body_id = bip + str(dest.get("Body"))
@@ -78,6 +81,7 @@ class StatusWatcher(PausableThread, threading.Thread):
 
             self.model.flags = int(data.get("Flags")) if data.get("Flags") else 0
             self.model.flags2 = int(data.get("Flags2")) if data.get("Flags2") else 0
+            self.model.gui_focus = int(data.get("GuiFocus")) if data.get("GuiFocus") else 0
 
         except FileNotFoundError:
             pass
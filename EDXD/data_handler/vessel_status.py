@@ -1,31 +1,7 @@
 from __future__ import annotations
 
-import functools
-import inspect
 from typing import Dict
 
-# ---------------------------------------------------------------------------
-# paths (shared with other modules)
-# ---------------------------------------------------------------------------
-from EDXD.globals import logging, LOG_LEVEL
-
-
-def log_call(level=LOG_LEVEL):
-    """Decorator that logs function name and bound arguments."""
-    def decorator(fn):
-        logger = logging.getLogger(fn.__module__)   # one logger per module
-        sig = inspect.signature(fn)                 # capture once, not on every call
-
-        @functools.wraps(fn)
-        def wrapper(*args, **kwargs):
-            bound = sig.bind_partial(*args, **kwargs)
-            arg_str = ", ".join(f"{k}={v!r}" for k, v in bound.arguments.items())
-            logger.log(level, "%s(%s)", fn.__name__, arg_str)
-            return fn(*args, **kwargs)
-
-        return wrapper
-    return decorator
-
 
 class ShipStatus:
     __slots__ = ("ship_type", "ship_id", "ship_name", "ship_ident", "fuel_capacity", "jet_cone_boost_factor", "fsd_injection_factor")
@@ -1,5 +1,3 @@
-import functools
-import inspect
 import sys
 import os
 import json
@@ -52,33 +50,7 @@ logging.basicConfig(
     datefmt="%Y-%m-%d %H:%M:%S",  # No .%f here!
 )
 
-def log_call(level=logging.INFO):
-    """Logs qualified name plus bound arguments, even for inner functions."""
-    def deco(fn):
-        logger = logging.getLogger(fn.__module__)
-        sig = inspect.signature(fn)
-
-        @functools.wraps(fn)
-        def wrapper(*args, **kwargs):
-            bound = sig.bind_partial(*args, **kwargs)
-            arglist = ", ".join(f"{k}={v!r}" for k, v in bound.arguments.items())
-            qualname = fn.__qualname__  # includes outer.<locals>.inner
-            logger.log(level, "%s(%s)", qualname, arglist)
-            return fn(*args, **kwargs)
-
-        return wrapper
-
-    return deco
-
-def log_context(frame, e, level=logging.DEBUG):
-    class_name = inspect.getmodule(frame).__name__
-    func_name = frame.f_code.co_name
-    arg_info = inspect.getargvalues(frame)
-    logging.log(level, f"{'_' * 10}")
-    logging.log(level, f"Exception in {class_name}.{func_name} with arguments {arg_info.locals}")
-    logging.log(level, f"Exception type: {type(e).__name__}")
-    logging.log(level, f"Exception args: {e.args}")
-    logging.log(level, f"Exception str: {str(e)}")
+from EDXD.utils.instrumentation import log_call, log_context
 
 # -----------------------------------------------------------------------
 try:
@@ -90,6 +62,8 @@ ap = argparse.ArgumentParser()
 ap.add_argument("--journals", type=Path, help="Path to Saved Games/Frontier Developments/Elite Dangerous")
 ap.add_argument("--version", action="version", version=__version__)
 ap.add_argument("--portable", help="Portable mode. All configs and data will be stored in the directory where the binary resides", action="store_true")
+ap.add_argument("--build-priors", help="Count the species found in the system cache into the biosign priors and exit", action="store_true")
+ap.add_argument("--revalue-cache", help="Recompute the scan and mapped values of all cached bodies and exit", action="store_true")
 args = ap.parse_args()
 
 if "--portable" in sys.argv:
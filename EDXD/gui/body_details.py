@@ -9,7 +9,9 @@ from EDXD.data_handler.model import Body, Atmosphere
 from EDXD.data_handler.planetary_surface_positioning_system import PSPSCoordinates, PSPS
 from EDXD.globals import DEFAULT_HEIGHT, DEFAULT_WIDTH, DEFAULT_POS_Y, DEFAULT_POS_X, RESIZE_MARGIN, ICONS, DEFAULT_WORTHWHILE_THRESHOLD
 from EDXD.gui.helper.dynamic_dialog import DynamicDialog
+from EDXD.gui.helper.frame_scheduler import get_frame_scheduler
 from EDXD.gui.helper.gui_handler import init_widget
+from EDXD.gui.helper.render_gate import skip_when_hidden
 from EDXD.gui.helper.theme_handler import get_theme
 from EDXD.gui.helper.window_properties import WindowProperties
 from EDXD.utils.clipboard import copy_text_to_clipboard
@@ -32,6 +34,8 @@ class BodyDetails(DynamicDialog):
 
         self.parent = parent
         self.body = None
+        self._rendered_body     : Optional[tuple]   = None  # body key of the last full render
+        self._rendered_position : Optional[tuple]   = None  # position key of the last render
 
         self.theme = get_theme()
 
@@ -80,15 +84,35 @@ class BodyDetails(DynamicDialog):
         self.rings_panel.Hide()
 
         self.finalize_layout()
-        # noinspection PyTypeChecker
-        wx.CallLater(millis=3000, callableObj=self._loading_finished)
+        get_frame_scheduler().call_later("loading_finished", 3000, self._loading_finished, window=self)
 
     def _loading_finished(self):
         self._loading = False
 
     # ------------------------------------------------------------------
-    def render(self, body: Optional[Body], filters: Dict[str, bool], current_position: PSPSCoordinates, current_heading: float):
-        self.lbl_body.SetLabelText(text=body.body_name if body else "")
+    @skip_when_hidden
+    def render(self, body: Optional[Body], filters: Dict[str, bool], current_position: PSPSCoordinates, current_heading: float,
+               body_revision: Optional[int] = None):
+        """
+        body_revision is Model.get_body_revision(), taken before the body was snapshotted. With it,
+        a body that did not change since the last render is not rendered again; a new position
+        only updates the ranges and bearings of a bio scan in progress.
+        """
+        body_key = self._body_key(body, filters, body_revision)
+        position_key = self._position_key(current_position, current_heading)
+        if body_key is not None and body_key == self._rendered_body:
+            self.body = body
+            if position_key != self._rendered_position and self._bio_scan_in_progress():
+                self.bio_panel.reset_table()
+                self._update_bio_signals(psps=PSPS(current_position, self.body.radius), current_heading=current_heading, current_position=current_position)
+            self._rendered_position = position_key
+            return
+        self._rendered_body = body_key
+        self._rendered_position = position_key
+
+        label = body.body_name if body else ""
+        if self.lbl_body.GetLabelText() != label:
+            self.lbl_body.SetLabelText(text=label)
         # reset
         self.general_panel.reset_table()
         self.atmosphere_panel.reset_table()
@@ -114,8 +138,27 @@ class BodyDetails(DynamicDialog):
             self._update_geo_signals()
             self._update_rings()
 
-        if not self.IsShown():
-            self.Show()
+    def _body_key(self, body: Optional[Body], filters: Dict[str, bool], body_revision: Optional[int]) -> Optional[tuple]:
+        """Everything but the position a render depends on; None if unknown."""
+        if body is None:
+            return ()
+        if body_revision is None:
+            return None
+        return (body.body_id, body_revision, tuple(sorted(filters.items())),
+                self.parent.prefs.get("worthwhile_threshold", DEFAULT_WORTHWHILE_THRESHOLD))
+
+    @staticmethod
+    def _position_key(current_position: Optional[PSPSCoordinates], current_heading: Optional[float]) -> Optional[tuple]:
+        if current_position is None or current_position.latitude is None or current_position.longitude is None:
+            return None
+        # 5 decimals are about a metre on an earth-sized body - below the shown precision
+        return round(current_position.latitude, 5), round(current_position.longitude, 5), current_heading
+
+    def _bio_scan_in_progress(self) -> bool:
+        """True if a genus shows ranges and bearings to its scans."""
+        if self.body is None or not self.body.biosignals:
+            return False
+        return any(int(genus.scanned_count or 0) in (1, 2) for genus in self.body.bio_found.values())
 
     # --------------------------------------------------------------
     def _on_show(self, event):
@@ -173,11 +216,11 @@ class BodyDetails(DynamicDialog):
         self.general_panel.add_table_item(f"  {self.body.distance:,.0f} Ls")
         if self.body.g_force is not None and self.body.g_force > 0:
             self.general_panel.add_table_item("Gravity")
-            self._set_g_force_colour(self.general_panel.add_table_item(f"  {dh.format_gravity(self.body.g_force)}"), self.body.g_force)
+            self.general_panel.add_table_item(f"  {dh.format_gravity(self.body.g_force)}", colour=dh.get_colour_gradient_from_gravity(self.body.g_force))
 
         if self.body.mean_temp is not None:
             self.general_panel.add_table_item("Surface Temperature")
-            self._set_temperature_colour(self.general_panel.add_table_item(f"  {dh.format_temperature(self.body.mean_temp, self.body.landable)}"), self.body.mean_temp)
+            self.general_panel.add_table_item(f"  {dh.format_temperature(self.body.mean_temp, self.body.landable)}", colour=dh.get_colour_gradient_from_temperature(self.body.mean_temp))
 
         if self.body.volcanism is not None and self.body.volcanism != "":
             self.general_panel.add_table_item("Volcanism")
@@ -246,8 +289,8 @@ class BodyDetails(DynamicDialog):
 
         if not self.atmosphere_panel.IsShown():
             self.atmosphere_panel.Show()
-            # Force a layout update
-            self.atmosphere_panel.force_render()
+        # Force a layout update
+        self.atmosphere_panel.force_render()
 
     def _update_materials(self, filters: Dict[str, bool]):
         show_mats = False
@@ -351,14 +394,14 @@ class BodyDetails(DynamicDialog):
 
             # line per genus
             if bio_name == "Radicoida Unica":
-                self.bio_panel.add_table_item(f"{ICONS['radicoida']}")
+                self.bio_panel.add_icon_item(ICONS['radicoida'])
             else:
                 if done >= 3:
-                    self.bio_panel.add_table_item(f"{ICONS['checked']}")
+                    self.bio_panel.add_icon_item(ICONS['checked'])
                 elif 0 < done < 3:
-                    self.bio_panel.add_table_item(f"{ICONS['in_progress']}")
+                    self.bio_panel.add_icon_item(ICONS['in_progress'])
                 else:
-                    self.bio_panel.add_table_item(f"{ICONS['unknown']}")
+                    self.bio_panel.add_icon_item(ICONS['unknown'])
 
             self.bio_panel.add_table_item(f"{bio_name}")
             if bio_name == "Radicoida Unica":
@@ -382,16 +425,14 @@ class BodyDetails(DynamicDialog):
                     self.bio_panel.add_table_item("")
                     self.bio_panel.add_table_item(f"min. {bio_range}m")
                     self.bio_panel.add_table_item(f"{bearing_one}")
-                    lbl_range_1 = self.bio_panel.add_table_item(f"{range_one}")
-                    self._set_distance_color(label=lbl_range_1, range_min=bio_range, range_current=range_raw_one)
+                    self.bio_panel.add_table_item(f"{range_one}", colour=self._distance_colour(range_min=bio_range, range_current=range_raw_one))
                     self.bio_panel.add_table_item("")
 
                 if done == 2:
                     self.bio_panel.add_table_item("")
                     self.bio_panel.add_table_item("")
                     self.bio_panel.add_table_item(f"{bearing_two}")
-                    lbl_range_2 = self.bio_panel.add_table_item(f"{range_two}")
-                    self._set_distance_color(label=lbl_range_2, range_min=bio_range, range_current=range_raw_two)
+                    self.bio_panel.add_table_item(f"{range_two}", colour=self._distance_colour(range_min=bio_range, range_current=range_raw_two))
                     self.bio_panel.add_table_item("")
 
         if self.bio_panel.IsShown():
@@ -431,23 +472,7 @@ class BodyDetails(DynamicDialog):
             self.rings_panel.force_render()
 
     @staticmethod
-    def _set_g_force_colour(label: wx.StaticText = None, g_force: float = 0.0):
-        if label is None:
-            return
-        label.SetForegroundColour(dh.get_colour_gradient_from_gravity(g_force))
-
-    @staticmethod
-    def _set_temperature_colour(label: wx.StaticText = None, temperature: float = 0.0):
-        if label is None:
-            return
-        label.SetForegroundColour(dh.get_colour_gradient_from_temperature(temperature))
-
-    @staticmethod
-    def _set_distance_color(label: wx.StaticText = None, range_min: float = 0.0, range_current: float = 0.0):
-        if label is None:
-            return
-
+    def _distance_colour(range_min: float = 0.0, range_current: float = 0.0) -> wx.Colour:
         if range_current * 1000 > range_min:
-            label.SetForegroundColour(wx.GREEN)
-        else:
-            label.SetForegroundColour(wx.RED)
+            return wx.GREEN
+        return wx.RED
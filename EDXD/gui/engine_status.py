@@ -10,6 +10,7 @@ from EDXD.gui.helper.dynamic_dialog import DynamicDialog
 from EDXD.gui.helper.fuel_gauge import FuelGauge
 from EDXD.gui.helper.fsd_indicator import FSDIndicator
 from EDXD.gui.helper.gui_handler import init_widget
+from EDXD.gui.helper.render_gate import skip_when_hidden
 from EDXD.gui.helper.theme_handler import get_theme
 from EDXD.gui.helper.window_properties import WindowProperties
 
@@ -84,6 +85,7 @@ class EngineStatus(DynamicDialog):
 
         self.render()
 
+    @skip_when_hidden
     def render(self, fuel_current_main: float = 0, fuel_current_reservoir: float = 0, fuel_capacity_main: float = 0, fuel_capacity_reservoir: float = 0, vehicle: str = "ship"):
         fuel_capacity_total = 0
         reservoir_fuel_level = 0
@@ -110,8 +112,6 @@ class EngineStatus(DynamicDialog):
         self.pnl_fuel_gauge.SetReservoirLevel(reservoir_fuel_level)
 
         self.set_values()
-        if not self.IsShown():
-            self.Show()
 
         self.Fit()
         if vehicle == VESSEL_SHIP:
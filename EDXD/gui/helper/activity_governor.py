@@ -0,0 +1,166 @@
+"""
+activity_governor.py – refresh and poll rates that follow the game
+
+Reads the status flags, the GUI focus, the vessel and how recently Status.json and the
+journal changed, and picks an activity mode. Each mode sets the cadence of the dashboard
+refresh (a FrameScheduler consumer) and the poll interval of the StatusWatcher: fast while
+sampling bio or in the FSS, slow while docked, very slow while nothing happens or the game
+is not running.
+
+A faster mode is taken at once; a slower one only after the state held for `linger_s`, so a
+flag that flickers does not make the rates flap. Everything is configurable through the
+"activity_governor" preference, which is laid over DEFAULT_GOVERNOR:
+
+    "activity_governor": {"idle_after_s": 300, "modes": {"bio": {"refresh_ms": 150}}}
+"""
+import copy
+import time
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from EDXD.data_handler.model import Model
+from EDXD.data_handler.status_json_watcher import StatusWatcher
+from EDXD.globals import logging, VESSEL_EV, VESSEL_SRV
+from EDXD.gui.helper.frame_scheduler import Consumer, FrameScheduler
+
+# Status.json flags, see StatusFlags for the full list
+FLAG_DOCKED         = 1 << 0
+FLAG_LANDED         = 1 << 1
+FLAG_SUPERCRUISE    = 1 << 4
+FLAG_HAS_LAT_LONG   = 1 << 21
+FLAG2_IN_STATION    = 1 << 3
+FLAG2_IN_HANGAR     = 1 << 13
+FLAG2_SOCIAL_SPACE  = 1 << 14
+
+# Status.json GuiFocus
+GUI_FOCUS_FSS       = 9
+GUI_FOCUS_SAA       = 10
+
+# checked in this order by ActivityGovernor.classify
+DEFAULT_GOVERNOR = {
+    "evaluate_ms"   : 500,      # how often the mode is re-evaluated
+    "idle_after_s"  : 120,      # no Status.json or journal change for this long: idle
+    "linger_s"      : 5,        # a slower mode must hold this long before it is taken
+    "modes": {
+        "bio"           : {"refresh_ms":  200, "poll_s": 0.2},  # on the surface, a genus scan in progress
+        "fss"           : {"refresh_ms":  250, "poll_s": 0.25}, # FSS or surface scanner open
+        "approach"      : {"refresh_ms":  250, "poll_s": 0.25}, # lat/long known: orbital cruise, glide, surface
+        "normal"        : {"refresh_ms":  500, "poll_s": 0.5},
+        "docked"        : {"refresh_ms": 1000, "poll_s": 1.0},
+        "idle"          : {"refresh_ms": 3000, "poll_s": 2.0},  # game closed or nothing happens
+    },
+}
+
+
+class ActivityMode(NamedTuple):
+    name        : str
+    refresh_ms  : int
+    poll_s      : float
+    reason      : str
+
+
+def governor_settings(prefs: Optional[Dict]) -> Dict:
+    """DEFAULT_GOVERNOR with the user's "activity_governor" preference laid over it."""
+    settings = copy.deepcopy(DEFAULT_GOVERNOR)
+    user = (prefs or {}).get("activity_governor") or {}
+    for key, value in user.items():
+        if key == "modes" and isinstance(value, dict):
+            for mode, rates in value.items():
+                if mode in settings["modes"] and isinstance(rates, dict):
+                    settings["modes"][mode].update(rates)
+        elif key in settings:
+            settings[key] = value
+    return settings
+
+
+class ActivityGovernor:
+    def __init__(self, model: Model, status_watcher: StatusWatcher, scheduler: FrameScheduler,
+                 refresh: Consumer, prefs: Optional[Dict] = None):
+        self.model          = model
+        self.status_watcher = status_watcher
+        self.scheduler      = scheduler
+        self.refresh        = refresh
+        self.settings       : Dict                          = governor_settings(prefs)
+        self.mode           : Optional[ActivityMode]        = None
+        self.switches       : int                           = 0
+        self._last_revision : Optional[int]                 = None
+        self._last_activity : float                         = time.monotonic()
+        self._pending       : Optional[str]                 = None  # slower mode waiting for linger_s
+        self._pending_since : float                         = 0.0
+        self._consumer      : Consumer = scheduler.register("activity_governor", self.evaluate,
+                                                            interval_ms=self.settings["evaluate_ms"])
+
+    def update_prefs(self, prefs: Optional[Dict]):
+        self.settings = governor_settings(prefs)
+        self.scheduler.set_interval(self._consumer, self.settings["evaluate_ms"])
+        self.mode = None                                    # re-apply the rates of the current mode
+
+    def stop(self):
+        self.scheduler.unregister(self._consumer)
+
+    # ----- evaluation --------------------------------------------------------
+    def classify(self, now: float) -> Tuple[str, str]:
+        """(mode name, reason) for the current game state."""
+        if self.model.revision != self._last_revision:
+            self._last_revision = self.model.revision
+            self._last_activity = now
+        last_status = self.status_watcher.last_change
+        if last_status is not None:
+            self._last_activity = max(self._last_activity, last_status)
+        idle_for = now - self._last_activity
+        if idle_for >= self.settings["idle_after_s"]:
+            return "idle", "no Status.json or journal change"
+
+        flags = self.model.flags or 0
+        flags2 = self.model.flags2 or 0
+        gui_focus = self.model.gui_focus or 0
+        near_surface = flags & (FLAG_HAS_LAT_LONG | FLAG_LANDED) or self.model.current_vessel in (VESSEL_EV, VESSEL_SRV)
+        if near_surface and self._bio_scan_in_progress():
+            return "bio", "genus scan in progress"
+        if gui_focus in (GUI_FOCUS_FSS, GUI_FOCUS_SAA):
+            return "fss", "FSS open" if gui_focus == GUI_FOCUS_FSS else "surface scanner open"
+        if flags & FLAG_HAS_LAT_LONG:
+            return "approach", "near a body"
+        if flags & FLAG_DOCKED or flags2 & (FLAG2_IN_STATION | FLAG2_IN_HANGAR | FLAG2_SOCIAL_SPACE):
+            return "docked", "docked"
+        if flags & FLAG_SUPERCRUISE:
+            return "normal", "supercruise"
+        return "normal", "in flight"
+
+    def _bio_scan_in_progress(self) -> bool:
+        body = self.model.snapshot_target()
+        if body is None or not body.biosignals:
+            return False
+        return any(int(genus.scanned_count or 0) in (1, 2) for genus in body.bio_found.values())
+
+    def evaluate(self) -> ActivityMode:
+        now = time.monotonic()
+        name, reason = self.classify(now)
+        current = self.mode
+        if current is not None and name != current.name and self._slower(name, current.name):
+            if self._pending != name:
+                self._pending, self._pending_since = name, now
+            if now - self._pending_since < self.settings["linger_s"]:
+                return current
+        self._pending = None
+        if current is not None and name == current.name:
+            if reason == current.reason:
+                return current
+            self.mode = current._replace(reason=reason)
+        else:
+            rates = self.settings["modes"][name]
+            self.mode = ActivityMode(name=name, refresh_ms=int(rates["refresh_ms"]), poll_s=float(rates["poll_s"]), reason=reason)
+            self.switches += 1
+            self.scheduler.set_interval(self.refresh, self.mode.refresh_ms)
+            self.status_watcher.poll = self.mode.poll_s
+            logging.debug("Activity mode %s (%s): refresh %d ms, poll %.2f s", name, reason, self.mode.refresh_ms, self.mode.poll_s)
+        return self.mode
+
+    def _slower(self, name: str, than: str) -> bool:
+        modes = self.settings["modes"]
+        return modes[name]["refresh_ms"] > modes[than]["refresh_ms"] or modes[name]["poll_s"] > modes[than]["poll_s"]
+
+    def describe(self) -> str:
+        """One line for the debug readout."""
+        if self.mode is None:
+            return "Activity: -"
+        return f"Activity: {self.mode.name} ({self.mode.reason}) - refresh {self.mode.refresh_ms} ms, poll {self.mode.poll_s:g} s"
@@ -1,6 +1,11 @@
+from typing import List, Optional
+
 import wx
+from EDXD.gui.helper.frame_scheduler import Consumer, get_frame_scheduler
 from EDXD.gui.helper.gui_handler import init_widget
 from EDXD.gui.helper.gui_dynamic_toggle_button import DynamicToggleButton
+from EDXD.gui.helper.icon_renderer import IconBitmap
+from EDXD.gui.helper.theme_handler import get_theme
 
 class CollapsiblePanel(wx.Panel):
     def __init__(self, parent, label="Panel Title", collapsed=False, columns: int = 1):
@@ -11,6 +16,8 @@ class CollapsiblePanel(wx.Panel):
         self.columns = columns
         self.animation_duration = 200  # ms
         self.content_height = 0
+        self._scheduler = get_frame_scheduler()
+        self._animation: Optional[Consumer] = None
 
         # Main sizer
         self.main_sizer = wx.BoxSizer(wx.VERTICAL)
@@ -44,8 +51,14 @@ class CollapsiblePanel(wx.Panel):
         self.content.SetSizer(self.content_sizer)
         self.content.Hide() if collapsed else self.content.Show()
 
-        # Setup table
+        # Setup table - cells are pooled: reset_table() rewinds, add_*_item() reuses the next cell
         self.table_sizer = None
+        self._items         : List[wx.Window]   = []
+        self._used          : int               = 0     # cells handed out since reset_table()
+        self._relayout      : bool              = True
+        self._laid_out_shown: bool              = False
+        self._content_stale : bool              = False # cells changed while collapsed, laid out on expand
+        self._foreground    : wx.Colour         = get_theme()["foreground"]
         self.setup_table()
 
         # Layout
@@ -66,18 +79,73 @@ class CollapsiblePanel(wx.Panel):
         self.main_sizer.Layout()
 
     def reset_table(self):
-        """Reset the table-like layout to its initial state."""
-        """Clear all rows from the table."""
-        for child in self.table_sizer.GetChildren():
-            if child.GetWindow():
-                child.GetWindow().Destroy()
-        self.table_sizer.Clear()
-
-    def add_table_item(self, label_text, align=wx.ALIGN_LEFT) -> wx.StaticText:
-        """Add a row to the table."""
+        """Start filling the table again; the cells stay alive and are reused by the next add_*_item() calls."""
+        self._used = 0
+
+    def keep_items(self, count: int):
+        """Leave the next count cells as the last render left them."""
+        self._used = min(self._used + count, len(self._items))
+
+    def finish_table(self):
+        """Hide the cells not used since reset_table()."""
+        for item in self._items[self._used:]:
+            if item.IsShown():
+                item.Hide()
+                self._relayout = True
+
+    def add_table_item(self, label_text, align=wx.ALIGN_LEFT, colour: Optional[wx.Colour] = None) -> wx.StaticText:
+        """Add a cell to the table; colour defaults to the theme foreground."""
+        label = self._take_item(wx.StaticText, align | wx.EXPAND)
+        if label.GetLabelText() != label_text:
+            best_size = label.GetBestSize()
+            label.SetLabelText(label_text)
+            if label.GetBestSize() != best_size:
+                self._relayout = True
+        colour = colour if colour is not None else self._foreground
+        if label.GetForegroundColour() != colour:
+            label.SetForegroundColour(colour)
+            label.Refresh()
+        return label
+
+    def add_icon_item(self, icon_text, align=wx.ALIGN_LEFT) -> IconBitmap:
+        """Add a cell showing only ICONS, drawn from the shared bitmap cache."""
+        icon = self._take_item(IconBitmap, align | wx.ALIGN_CENTER_VERTICAL)
+        icon.set_text(icon_text)
+        return icon
+
+    def _take_item(self, kind: type, flags: int) -> wx.Window:
+        index = self._used
+        self._used += 1
+        if index < len(self._items) and type(self._items[index]) is kind:
+            item = self._items[index]
+            sizer_item = self.table_sizer.GetItem(index)
+            if sizer_item.GetFlag() != flags:
+                sizer_item.SetFlag(flags)
+                self._relayout = True
+            if not item.IsShown():
+                item.Show()
+                self._relayout = True
+            return item
+
+        item = self._create_item(kind)
+        if index < len(self._items):
+            # a text cell became an icon or the other way round
+            old = self._items[index]
+            self.table_sizer.Replace(old, item)
+            self.table_sizer.GetItem(index).SetFlag(flags)
+            old.Destroy()
+            self._items[index] = item
+        else:
+            self.table_sizer.Add(item, 0, flags, 5)
+            self._items.append(item)
+        self._relayout = True
+        return item
+
+    def _create_item(self, kind: type) -> wx.Window:
+        if kind is IconBitmap:
+            return IconBitmap(self.content)
         label = wx.StaticText(self.content)
-        init_widget(widget=label, title=label_text)
-        self.table_sizer.Add(label, 0, align | wx.EXPAND, 5)
+        init_widget(widget=label, title="")
         return label
 
     def on_toggle(self, event):
@@ -88,6 +156,13 @@ class CollapsiblePanel(wx.Panel):
         # Update button label
         self.toggle_button.SetLabel("+" if self.collapsed else "–")
 
+        if not self.collapsed and self._content_stale:
+            self._content_stale = False
+            self.content.SetMinSize((-1, -1))
+            self.content.Layout()
+            self.content_height = self.content.GetBestSize().height
+            target_height = self.content_height
+
         # Animate
         self.animate_height(target_height)
 
@@ -97,11 +172,20 @@ class CollapsiblePanel(wx.Panel):
         steps = 10
         step_duration = self.animation_duration // steps
         delta = (target_height - start_height) / steps
+        heights = iter([start_height + delta * i for i in range(1, steps)])
 
-        for i in range(steps):
-            wx.CallLater(i * step_duration, self._set_content_height, start_height + delta * i)
+        def step():
+            height = next(heights, None)
+            if height is not None:
+                self._set_content_height(height)
+                return
+            self._scheduler.unregister(self._animation)
+            self._animation = None
+            self._finalize_animation(target_height)
 
-        wx.CallLater(steps * step_duration, self._finalize_animation, target_height)
+        self._scheduler.unregister(self._animation)     # toggled again while animating
+        self._set_content_height(start_height)
+        self._animation = self._scheduler.register("collapsible_panel.animate", step, interval_ms=step_duration, window=self)
 
     def _set_content_height(self, height):
         """Set content height during animation."""
@@ -127,11 +211,26 @@ class CollapsiblePanel(wx.Panel):
             self.content_height = self.content.GetBestSize().height
         event.Skip()
 
-    def force_render(self):
+    def force_render(self, layout_parent: bool = True) -> bool:
+        """
+        Finish the table and lay it out - only if cells were added, hidden or resized, or the panel
+        was shown. True if it was laid out; the parent is laid out too unless layout_parent is False.
+        """
+        self.finish_table()
+        if self.collapsed and self._relayout:
+            # nobody sees the cells - lay them out once the panel is expanded (on_toggle)
+            self._content_stale = True
+            self._relayout = False
+        shown = self.IsShown()
+        if not self._relayout and shown == self._laid_out_shown:
+            return False
+        self._relayout = False
+        self._laid_out_shown = shown
         self.content.SetMinSize((-1, -1))
         self.content.Layout()
         self.content_sizer.Layout()
         self.main_sizer.Layout()
         self.Layout()
-        if self.GetParent():
+        if layout_parent and self.GetParent():
             self.GetParent().Layout()
+        return True
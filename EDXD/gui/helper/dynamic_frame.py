@@ -1,31 +1,13 @@
-import functools
-import inspect
-
 import wx
 
-from EDXD.globals import logging
+from EDXD.globals import log_call
 from EDXD.gui.helper.custom_title_bar import CustomTitleBar
 from EDXD.gui.helper.icon_loader import make_icon_bundle
+from EDXD.gui.helper.render_gate import RenderGate
 from EDXD.gui.helper.window_properties import WindowProperties
 
 
-def log_call(level=logging.INFO):
-    """Decorator that logs function name and bound arguments."""
-    def decorator(fn):
-        logger = logging.getLogger(fn.__module__)   # one logger per module
-        sig = inspect.signature(fn)                 # capture once, not on every call
-
-        @functools.wraps(fn)
-        def wrapper(*args, **kwargs):
-            bound = sig.bind_partial(*args, **kwargs)
-            arg_str = ", ".join(f"{k}={v!r}" for k, v in bound.arguments.items())
-            logger.log(level, "%s(%s)", fn.__name__, arg_str)
-            return fn(*args, **kwargs)
-
-        return wrapper
-    return decorator
-
-class DynamicFrame(wx.Frame):
+class DynamicFrame(RenderGate, wx.Frame):
     from EDXD.globals import RESIZE_MARGIN  # px area at edge/corner for resizing
     def __init__(self, parent, style, title, win_id, show_minimize: bool = False, show_maximize: bool = False, show_close: bool = False):
         super().__init__(parent=parent, title=title, style=style)
@@ -54,6 +36,7 @@ class DynamicFrame(wx.Frame):
         self.Bind(wx.EVT_MOTION, self.on_mouse_move)
 
         self.Bind(wx.EVT_CLOSE, self.on_close)
+        self._init_render_gate()
 
     # @log_call()
     def hit_test(self, pos):
@@ -134,6 +117,4 @@ class DynamicFrame(wx.Frame):
         w, h = self.GetSize()
         is_hidden = WindowProperties.load(window_id=self.win_id, default_height=h, default_width=w, default_posx=x, default_posy=y, default_is_hidden=False).is_hidden
         props = WindowProperties(window_id=self.win_id, height=h, width=w, posx=x, posy=y, is_hidden=is_hidden)
-        props.save()
-        if hasattr(self, '_refresh_timer') and getattr(self, '_refresh_timer') is not None:
-            getattr(self, '_refresh_timer').Stop()
\ No newline at end of file
+        props.save()
\ No newline at end of file
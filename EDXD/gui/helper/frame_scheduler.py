@@ -0,0 +1,258 @@
+"""
+frame_scheduler.py – one timer for every periodic UI job
+
+Windows and widgets register consumers instead of arming their own wx.Timer/wx.CallLater:
+a callback with the cadence it wants, optionally a dirty predicate and a window. A single
+one-shot timer wakes up when the next consumer is due - the tick rate follows the fastest
+active consumer and drops to nothing while only slow ones are registered. Consumers that are
+due together run in the same tick; the windows of those registered with freeze=True - and
+the further windows their freeze_also returns - are frozen once around all of them.
+
+Every consumer keeps timing statistics (FrameScheduler.stats / format_stats).
+"""
+import inspect
+import time
+from typing import Callable, Iterable, List, NamedTuple, Optional
+
+import wx
+
+from EDXD.globals import logging, log_context
+
+MIN_TICK_MS = 15    # never tick faster than this
+COALESCE_MS = 10    # consumers due within this window of a tick run in it
+
+
+class ConsumerStats(NamedTuple):
+    name        : str
+    interval_ms : int
+    active      : bool
+    runs        : int
+    skipped     : int   # due, but the dirty predicate said no
+    errors      : int
+    avg_ms      : float
+    max_ms      : float
+    last_ms     : float
+
+
+class Consumer:
+    """Handle of a registered job - keep it to change the cadence or to unregister."""
+    __slots__ = ("name", "callback", "interval", "is_dirty", "window", "freeze", "freeze_also", "visible_only", "once", "active",
+                 "due", "runs", "skipped", "errors", "total", "max", "last")
+
+    def __init__(self, name: str, callback: Callable[[], None], interval_ms: int,
+                 is_dirty: Optional[Callable[[], bool]], window: Optional[wx.Window], freeze: bool, once: bool):
+        self.name       : str                               = name
+        self.callback   : Callable[[], None]                = callback
+        self.interval   : float                             = interval_ms / 1000.0
+        self.is_dirty   : Optional[Callable[[], bool]]      = is_dirty
+        self.window     : Optional[wx.Window]               = window
+        self.freeze     : bool                              = freeze
+        self.freeze_also: Optional[Callable[[], Iterable[wx.Window]]] = None
+        self.visible_only: bool                             = False
+        self.once       : bool                              = once
+        self.active     : bool                              = True
+        self.due        : float                             = time.monotonic() + self.interval
+        self.runs       : int                               = 0
+        self.skipped    : int                               = 0
+        self.errors     : int                               = 0
+        self.total      : float                             = 0.0
+        self.max        : float                             = 0.0
+        self.last       : float                             = 0.0
+
+    @property
+    def interval_ms(self) -> int:
+        return int(round(self.interval * 1000))
+
+    def stats(self) -> ConsumerStats:
+        return ConsumerStats(
+            name=self.name, interval_ms=self.interval_ms, active=self.active,
+            runs=self.runs, skipped=self.skipped, errors=self.errors,
+            avg_ms=self.total / self.runs * 1000 if self.runs else 0.0,
+            max_ms=self.max * 1000, last_ms=self.last * 1000,
+        )
+
+
+class _Ticker(wx.Timer):
+    def __init__(self, scheduler: "FrameScheduler"):
+        super().__init__()
+        self.scheduler = scheduler
+
+    def Notify(self):
+        self.scheduler.tick()
+
+
+class FrameScheduler:
+    def __init__(self):
+        self._consumers : List[Consumer]    = []
+        self._timer     : Optional[_Ticker] = None
+        self._ticking   : bool              = False
+        self.ticks      : int               = 0
+
+    # ----- registration ------------------------------------------------------
+    def register(self, name: str, callback: Callable[[], None], interval_ms: int,
+                 is_dirty: Optional[Callable[[], bool]] = None, window: Optional[wx.Window] = None,
+                 freeze: bool = False, active: bool = True, visible_only: bool = False,
+                 freeze_also: Optional[Callable[[], Iterable[wx.Window]]] = None) -> Consumer:
+        """
+        Run callback every interval_ms while active - skipped if is_dirty() returns False, or with
+        visible_only while window is not shown on screen. The consumer is dropped once window is
+        destroyed; freeze=True freezes window for the tick, together with the windows freeze_also()
+        returns - other top-level windows the callback draws into.
+        """
+        consumer = Consumer(name, callback, interval_ms, is_dirty, window, freeze, once=False)
+        consumer.freeze_also = freeze_also
+        consumer.active = active
+        consumer.visible_only = visible_only
+        self._consumers.append(consumer)
+        self._reschedule()
+        return consumer
+
+    def call_later(self, name: str, delay_ms: int, callback: Callable[[], None], window: Optional[wx.Window] = None) -> Consumer:
+        """Run callback once after delay_ms."""
+        consumer = Consumer(name, callback, delay_ms, None, window, freeze=False, once=True)
+        self._consumers.append(consumer)
+        self._reschedule()
+        return consumer
+
+    def unregister(self, consumer: Optional[Consumer]):
+        if consumer is not None and consumer in self._consumers:
+            self._consumers.remove(consumer)
+            self._reschedule()
+
+    def set_active(self, consumer: Consumer, active: bool):
+        """Pause or resume a consumer; a resumed consumer is due one interval later."""
+        if consumer.active == active:
+            return
+        consumer.active = active
+        if active:
+            consumer.due = time.monotonic() + consumer.interval
+        self._reschedule()
+
+    def set_interval(self, consumer: Consumer, interval_ms: int):
+        """Change the cadence; a shorter one takes effect right away."""
+        interval = interval_ms / 1000.0
+        if interval == consumer.interval:
+            return
+        consumer.due = min(consumer.due, time.monotonic() + interval)
+        consumer.interval = interval
+        self._reschedule()
+
+    # ----- ticking -----------------------------------------------------------
+    def tick(self):
+        self._ticking = True
+        try:
+            self._run_due()
+        finally:
+            self._ticking = False
+            self._reschedule()
+
+    def _run_due(self):
+        now = time.monotonic()
+        self.ticks += 1
+        due = []
+        for consumer in list(self._consumers):
+            if consumer.window is not None and not consumer.window:
+                self._consumers.remove(consumer)        # window destroyed
+                continue
+            if not consumer.active or consumer.due > now + COALESCE_MS / 1000.0:
+                continue
+            consumer.due = now + consumer.interval
+            if consumer.once:
+                self._consumers.remove(consumer)
+            if self._is_dirty(consumer):
+                due.append(consumer)
+        if not due:
+            return
+
+        frozen = []
+        for consumer in due:
+            if not consumer.freeze:
+                continue
+            windows = [consumer.window]
+            if consumer.freeze_also is not None:
+                windows.extend(consumer.freeze_also())
+            for window in windows:
+                if window and window.IsShown() and window not in frozen:
+                    window.Freeze()
+                    frozen.append(window)
+        try:
+            for consumer in due:
+                if consumer.active and (consumer.once or consumer in self._consumers):    # an earlier one may have removed it
+                    self._run(consumer)
+        finally:
+            for window in reversed(frozen):
+                if window:
+                    window.Thaw()
+
+    @staticmethod
+    def _is_dirty(consumer: Consumer) -> bool:
+        if consumer.visible_only and not consumer.window.IsShownOnScreen():
+            consumer.skipped += 1
+            return False
+        if consumer.is_dirty is None:
+            return True
+        try:
+            if consumer.is_dirty():
+                return True
+        except Exception as e:
+            consumer.errors += 1
+            log_context(level=logging.ERROR, frame=inspect.currentframe(), e=e)
+            return False
+        consumer.skipped += 1
+        return False
+
+    @staticmethod
+    def _run(consumer: Consumer):
+        t0 = time.perf_counter()
+        try:
+            consumer.callback()
+        except Exception as e:
+            consumer.errors += 1
+            log_context(level=logging.ERROR, frame=inspect.currentframe(), e=e)
+            return
+        elapsed = time.perf_counter() - t0
+        consumer.runs += 1
+        consumer.total += elapsed
+        consumer.last = elapsed
+        consumer.max = max(consumer.max, elapsed)
+
+    def _reschedule(self):
+        if self._ticking:
+            return                                      # tick() reschedules when it is done
+        active = [consumer.due for consumer in self._consumers if consumer.active]
+        if self._timer is None:
+            if not active:
+                return
+            self._timer = _Ticker(self)
+        if not active:
+            self._timer.Stop()
+            return
+        delay = (min(active) - time.monotonic()) * 1000
+        self._timer.StartOnce(max(MIN_TICK_MS, int(delay)))
+
+    # ----- statistics --------------------------------------------------------
+    def stats(self) -> List[ConsumerStats]:
+        return [consumer.stats() for consumer in self._consumers]
+
+    def format_stats(self) -> str:
+        lines = [f"{self.ticks} ticks, {len(self._consumers)} consumers"]
+        for s in sorted(self.stats(), key=lambda s: s.max_ms, reverse=True):
+            lines.append(f"  {s.name:<28} {s.interval_ms:>6} ms {'on ' if s.active else 'off'}  runs {s.runs:>7}  "
+                         f"skipped {s.skipped:>7}  errors {s.errors:>3}  avg {s.avg_ms:7.2f} ms  max {s.max_ms:7.2f} ms")
+        return "\n".join(lines)
+
+    def stop(self):
+        if self._timer is not None:
+            self._timer.Stop()
+        self._consumers.clear()
+
+
+_SCHEDULER: Optional[FrameScheduler] = None
+
+
+def get_frame_scheduler() -> FrameScheduler:
+    """The app-wide scheduler, created on first use (after wx.App)."""
+    global _SCHEDULER
+    if _SCHEDULER is None:
+        _SCHEDULER = FrameScheduler()
+    return _SCHEDULER
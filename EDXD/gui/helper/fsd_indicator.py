@@ -1,5 +1,6 @@
 import math
 import wx
+from EDXD.gui.helper.frame_scheduler import get_frame_scheduler
 from EDXD.gui.helper.theme_handler import get_theme, apply_theme
 # FSDIndicator - revised to draw a hollow triangular band (like the reference image)
 # - Each side is drawn as a polygon band filled with a linear gradient.
@@ -37,8 +38,8 @@ class FSDIndicator(wx.Panel):
         self.text = ""
         self.state = self.STATE_OFF
         self._phase = 0.0
-        self._timer = wx.Timer(self)
-        self.Bind(wx.EVT_TIMER, self._on_timer, self._timer)
+        self._scheduler = get_frame_scheduler()
+        self._pulse = self._scheduler.register("fsd_indicator.pulse", self._on_timer, interval_ms=self.TIMER_MS, window=self, active=False, visible_only=True)
         self.Bind(wx.EVT_PAINT, self._on_paint)
         self.Bind(wx.EVT_SIZE, lambda evt: self.Refresh())
 
@@ -72,12 +73,10 @@ class FSDIndicator(wx.Panel):
 
         self.state = state
         if state == self.STATE_OFF:
-            if self._timer.IsRunning():
-                self._timer.Stop()
+            self._scheduler.set_active(self._pulse, False)
             self._running = False
         else:
-            if not self._timer.IsRunning():
-                self._timer.Start(self.TIMER_MS)
+            self._scheduler.set_active(self._pulse, True)
             self._running = True
 
         # tweak pulse speed depending on state
@@ -99,7 +98,7 @@ class FSDIndicator(wx.Panel):
             int(c1.Alpha() + (c2.Alpha() - c1.Alpha()) * t),
         )
 
-    def _on_timer(self, evt):
+    def _on_timer(self, evt=None):
         self._phase += self._pulse_speed
         # keep phase in reasonable range
         if self._phase > math.pi * 10000:
@@ -3,6 +3,7 @@ import math
 
 import wx
 
+from EDXD.gui.helper.frame_scheduler import get_frame_scheduler
 from EDXD.gui.helper.theme_handler import get_theme, apply_theme
 
 
@@ -26,8 +27,8 @@ class FuelGauge(wx.Panel):
         self._show_scale = show_scale
 
         self._pulse_phase = 0.0
-        self._timer = wx.Timer(self)
-        self.Bind(wx.EVT_TIMER, self.OnTimer, self._timer)
+        self._scheduler = get_frame_scheduler()
+        self._pulse = self._scheduler.register("fuel_gauge.pulse", self.OnTimer, interval_ms=50, window=self, active=False, visible_only=True)  # ~20 FPS
 
         self.SetBackgroundStyle(wx.BG_STYLE_PAINT)  # for flicker-free drawing
         self.Bind(wx.EVT_PAINT, self.OnPaint)
@@ -94,7 +95,7 @@ class FuelGauge(wx.Panel):
         self.Refresh(False)
         event.Skip()
 
-    def OnTimer(self, event):
+    def OnTimer(self, event=None):
         # advance pulse phase for smooth flashing
         self._pulse_phase = (self._pulse_phase + 0.06) % 1.0
         self.Refresh(False)
@@ -102,12 +103,12 @@ class FuelGauge(wx.Panel):
     def UpdateTimer(self):
         frac = self._level / float(self._range)
         if frac * 100.0 <= self._warning_threshold:
-            if not self._timer.IsRunning():
+            if not self._pulse.active:
                 self._pulse_phase = 0.0
-                self._timer.Start(50)  # ~20 FPS
+                self._scheduler.set_active(self._pulse, True)
         else:
-            if self._timer.IsRunning():
-                self._timer.Stop()
+            if self._pulse.active:
+                self._scheduler.set_active(self._pulse, False)
                 self._pulse_phase = 0.0
 
     def _get_bar_rect(self, rect):
@@ -0,0 +1,136 @@
+"""
+icon_renderer.py – emoji icons drawn from cached bitmaps
+
+Laying out emoji text is slow in wx: every paint shapes the string again and falls back to the
+colour emoji font glyph by glyph. IconBitmapCache rasterises every distinct text once per font
+and colours and keeps the bitmap; painting it again is a blit.
+
+IconCellRenderer draws grid cells from the cache (BodiesTable's icon columns, with
+icon_bitmaps=True), IconBitmap is a static bitmap for CollapsiblePanel rows that only hold icons.
+"""
+from typing import Dict, Optional, Tuple
+
+import wx
+import wx.grid as gridlib
+
+from EDXD.gui.helper.theme_handler import get_theme
+
+MAX_BITMAPS = 512       # distinct (text, font, colours) kept; cleared when exceeded
+CELL_PADDING = 2        # px between the bitmap and a left/right aligned cell border
+
+
+class IconBitmapCache:
+    """Bitmaps of rendered texts, keyed by (text, font, foreground, background)."""
+    __slots__ = ("_bitmaps", "hits", "misses")
+
+    def __init__(self):
+        self._bitmaps   : Dict[tuple, wx.Bitmap]    = {}
+        self.hits       : int                       = 0
+        self.misses     : int                       = 0
+
+    def get(self, text: str, font: wx.Font, foreground: wx.Colour, background: wx.Colour) -> wx.Bitmap:
+        key = (text, font.GetNativeFontInfoDesc(), foreground.Get(), background.Get())
+        bitmap = self._bitmaps.get(key)
+        if bitmap is not None:
+            self.hits += 1
+            return bitmap
+
+        self.misses += 1
+        if len(self._bitmaps) >= MAX_BITMAPS:
+            self._bitmaps.clear()
+        bitmap = self._bitmaps[key] = self._rasterise(text, font, foreground, background)
+        return bitmap
+
+    @staticmethod
+    def _rasterise(text: str, font: wx.Font, foreground: wx.Colour, background: wx.Colour) -> wx.Bitmap:
+        dc = wx.MemoryDC(wx.Bitmap(1, 1))
+        dc.SetFont(font)
+        width, height = dc.GetTextExtent(text)
+        bitmap = wx.Bitmap(max(width, 1), max(height, 1))
+        dc.SelectObject(bitmap)
+        dc.SetBackground(wx.Brush(background))
+        dc.Clear()
+        dc.SetTextForeground(foreground)
+        dc.DrawText(text, 0, 0)
+        dc.SelectObject(wx.NullBitmap)
+        return bitmap
+
+    def clear(self):
+        self._bitmaps.clear()
+
+    def __len__(self):
+        return len(self._bitmaps)
+
+
+# one cache for the whole app - the same icons show up in every window
+ICON_BITMAPS = IconBitmapCache()
+
+
+class IconCellRenderer(gridlib.GridCellRenderer):
+    """Grid cell renderer blitting the cell text from an IconBitmapCache."""
+    def __init__(self, cache: Optional[IconBitmapCache] = None):
+        super().__init__()
+        self.cache = cache if cache is not None else ICON_BITMAPS
+
+    def _colours(self, grid: gridlib.Grid, attr: gridlib.GridCellAttr, is_selected: bool) -> Tuple[wx.Colour, wx.Colour]:
+        if is_selected:
+            return grid.GetSelectionForeground(), grid.GetSelectionBackground()
+        return attr.GetTextColour(), attr.GetBackgroundColour()
+
+    def Draw(self, grid, attr, dc, rect, row, col, isSelected):
+        foreground, background = self._colours(grid, attr, isSelected)
+        dc.SetBrush(wx.Brush(background, wx.BRUSHSTYLE_SOLID))
+        dc.SetPen(wx.TRANSPARENT_PEN)
+        dc.DrawRectangle(rect)
+
+        text = grid.GetTable().GetValue(row, col)
+        if not text:
+            return
+        bitmap = self.cache.get(text, attr.GetFont(), foreground, background)
+        width, height = bitmap.GetWidth(), bitmap.GetHeight()
+        h_align, _ = attr.GetAlignment()
+        if h_align == wx.ALIGN_CENTER:
+            x = rect.x + (rect.width - width) // 2
+        elif h_align == wx.ALIGN_RIGHT:
+            x = rect.x + rect.width - width - CELL_PADDING
+        else:
+            x = rect.x + CELL_PADDING
+        y = rect.y + (rect.height - height) // 2
+
+        dc.SetClippingRegion(rect)
+        dc.DrawBitmap(bitmap, x, y)
+        dc.DestroyClippingRegion()
+
+    def GetBestSize(self, grid, attr, dc, row, col):
+        text = grid.GetTable().GetValue(row, col)
+        if not text:
+            return wx.Size(0, 0)
+        foreground, background = self._colours(grid, attr, False)
+        bitmap = self.cache.get(text, attr.GetFont(), foreground, background)
+        return wx.Size(bitmap.GetWidth() + 2 * CELL_PADDING, bitmap.GetHeight())
+
+    def Clone(self):
+        return IconCellRenderer(self.cache)
+
+
+class IconBitmap(wx.StaticBitmap):
+    """Static icon text as a cached bitmap, themed like a static text."""
+    def __init__(self, parent: wx.Window, text: str = "", cache: Optional[IconBitmapCache] = None):
+        super().__init__(parent)
+        theme = get_theme()
+        self.SetBackgroundColour(theme["background"])
+        self._font          : wx.Font   = theme["font"]
+        self._foreground    : wx.Colour = theme["foreground"]
+        self._background    : wx.Colour = theme["background"]
+        self.cache = cache if cache is not None else ICON_BITMAPS
+        self._text = None
+        self.set_text(text)
+
+    def set_text(self, text: str):
+        if text == self._text:
+            return
+        self._text = text
+        self.SetBitmap(self.cache.get(text, self._font, self._foreground, self._background))
+
+    def GetLabel(self):
+        return self._text
@@ -0,0 +1,59 @@
+"""
+render_gate.py – no rendering into windows nobody can see
+
+DynamicFrame and DynamicDialog mix in RenderGate. A render method decorated with
+@skip_when_hidden returns at once while its window is hidden, iconised or its owner is
+iconised, and only remembers the arguments of the latest call. When the window can be seen
+again, that call is made once - one catch-up render from the latest snapshot instead of
+every render that was missed.
+"""
+import functools
+from typing import Callable, Optional
+
+import wx
+
+
+def skip_when_hidden(render: Callable) -> Callable:
+    @functools.wraps(render)
+    def wrapper(self, *args, **kwargs):
+        if self.is_render_visible():
+            self._render_pending = None
+            return render(self, *args, **kwargs)
+        self._render_pending = (render, args, kwargs)
+        self.renders_skipped += 1
+        return None
+    return wrapper
+
+
+class RenderGate:
+    """Mixin for top level windows; call _init_render_gate() in __init__."""
+    _render_pending : Optional[tuple]   = None      # (render, args, kwargs) skipped while not visible
+    renders_skipped : int               = 0
+
+    def _init_render_gate(self):
+        self._render_pending = None
+        self.renders_skipped = 0
+        self.Bind(wx.EVT_SHOW, self._on_render_visibility)
+        self.Bind(wx.EVT_ICONIZE, self._on_render_visibility)
+
+    def is_render_visible(self) -> bool:
+        if not self.IsShown() or self.IsIconized():
+            return False
+        owner = self.GetParent()
+        return not (isinstance(owner, wx.TopLevelWindow) and owner.IsIconized())
+
+    def _on_render_visibility(self, event: wx.Event):
+        # the window state is settled once the event was handled
+        wx.CallAfter(self.catch_up_render)
+        for child in self.GetChildren():
+            if isinstance(child, RenderGate):
+                wx.CallAfter(child.catch_up_render)     # owned windows follow an iconised owner
+        event.Skip()
+
+    def catch_up_render(self):
+        """Make the latest skipped render call, if the window can be seen now."""
+        if not self or self._render_pending is None or not self.is_render_visible():
+            return
+        render, args, kwargs = self._render_pending
+        self._render_pending = None
+        render(self, *args, **kwargs)
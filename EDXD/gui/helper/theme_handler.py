@@ -1,30 +1,9 @@
-import functools
-import inspect
-
 import wx
 import wx.grid as gridlib
 import wx.lib.buttons as buttons
 
-from EDXD.globals import logging
-
-
 # from EDXD.globals import ICON_PATH
 
-def log_call(level=logging.INFO):
-    """Decorator that logs function name and bound arguments."""
-    def decorator(fn):
-        logger = logging.getLogger(fn.__module__)   # one logger per module
-        sig = inspect.signature(fn)                 # capture once, not on every call
-
-        @functools.wraps(fn)
-        def wrapper(*args, **kwargs):
-            bound = sig.bind_partial(*args, **kwargs)
-            arg_str = ", ".join(f"{k}={v!r}" for k, v in bound.arguments.items())
-            logger.log(level, "%s(%s)", fn.__name__, arg_str)
-            return fn(*args, **kwargs)
-
-        return wrapper
-    return decorator
 
 def get_theme(theme: str = "dark"):
     # Data for theme_handler
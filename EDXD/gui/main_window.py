@@ -1,25 +1,26 @@
 from __future__ import annotations
 
-import functools
-import inspect
 from typing import Dict
 
 import wx, json
 
+from EDXD.data_handler.biosign_predictor import BiosignPredictor
 from EDXD.data_handler.journal_controller import JournalController
 from EDXD.data_handler.journal_reader import JournalReader
 from EDXD.data_handler.model import Model, Body
 from EDXD.data_handler.status_json_watcher import StatusWatcher
-from EDXD.data_handler.helper.biosign_estimator import estimate_system_biosigns
 
 from EDXD.globals import DEFAULT_HEIGHT_MAIN, DEFAULT_WIDTH_MAIN, DEFAULT_POS_Y, DEFAULT_POS_X, RESIZE_MARGIN
-from EDXD.globals import logging, CFG_FILE
+from EDXD.globals import logging, CFG_FILE, log_call
 
 from EDXD.gui.detail_selected import DetailSelected
 from EDXD.gui.detail_target import DetailTargeted
 from EDXD.gui.engine_status import EngineStatus
+from EDXD.gui.helper.activity_governor import ActivityGovernor
 from EDXD.gui.helper.dynamic_frame import DynamicFrame
+from EDXD.gui.helper.frame_scheduler import get_frame_scheduler
 from EDXD.gui.helper.gui_handler import init_widget
+from EDXD.gui.helper.render_gate import skip_when_hidden
 from EDXD.gui.helper.window_properties import WindowProperties
 from EDXD.gui.main_window_options import MainWindowOptions
 from EDXD.gui.psps_gui import PositionTracker
@@ -30,27 +31,11 @@ from EDXD.gui.signal_prediction import SignalPrediction
 from EDXD.utils.clipboard import copy_text_to_clipboard
 
 
-def log_call(level=logging.INFO):
-    """Decorator that logs function name and bound arguments."""
-    def decorator(fn):
-        logger = logging.getLogger(fn.__module__)   # one logger per module
-        sig = inspect.signature(fn)                 # capture once, not on every call
-
-        @functools.wraps(fn)
-        def wrapper(*args, **kwargs):
-            bound = sig.bind_partial(*args, **kwargs)
-            arg_str = ", ".join(f"{k}={v!r}" for k, v in bound.arguments.items())
-            logger.log(level, "%s(%s)", fn.__name__, arg_str)
-            return fn(*args, **kwargs)
-
-        return wrapper
-    return decorator
-
 TITLE = "ED eXploration Dashboard"
 WINID = "EDXD_MAIN_WINDOW"
 
 class MainFrame(DynamicFrame):
-    def __init__(self, model: Model, prefs: Dict, journal_reader: JournalReader, journal_controller: JournalController, status_watcher: StatusWatcher):
+    def __init__(self, model: Model, prefs: Dict, journal_reader: JournalReader, journal_controller: JournalController, status_watcher: StatusWatcher, biosign_predictor: BiosignPredictor):
         # 1. Load saved properties (or use defaults)
         props = WindowProperties.load(WINID, default_height=DEFAULT_HEIGHT_MAIN, default_width=DEFAULT_WIDTH_MAIN,
                                       default_posx=DEFAULT_POS_X, default_posy=DEFAULT_POS_Y)
@@ -59,6 +44,7 @@ class MainFrame(DynamicFrame):
         self.journal_reader = journal_reader
         self.journal_controller = journal_controller
         self.status_watcher = status_watcher
+        self.biosign_predictor = biosign_predictor
 
         # Define the handler as a method
         def on_body_selected(body_name: str) -> None:
@@ -66,7 +52,8 @@ class MainFrame(DynamicFrame):
 
         self.model = model
         self.prefs = prefs
-        self._refresh_timer = None
+        self.scheduler = get_frame_scheduler()
+        self._refresh_consumer = None
 
         # prepare panels
         self.win_sel = None
@@ -95,14 +82,15 @@ class MainFrame(DynamicFrame):
         self.window_box.Add(self.table_view, 1, wx.EXPAND | wx.EAST | wx.WEST | wx.SOUTH, RESIZE_MARGIN)
         self.SetSizer(self.window_box)
 
-        # noinspection PyTypeChecker
-        self._refresh_timer = wx.CallLater(millis=500, callableObj=self._refresh)
+        self._refresh_consumer = self.scheduler.register("main.refresh", self._refresh, interval_ms=500, window=self, freeze=True,
+                                                         freeze_also=self._refreshed_windows)
+        # refresh and Status.json poll rates follow what happens in the game
+        self.governor = ActivityGovernor(model=self.model, status_watcher=self.status_watcher, scheduler=self.scheduler,
+                                         refresh=self._refresh_consumer, prefs=self.prefs)
         self.options.chk_landable.SetToggle(self.prefs["land"])
         self.options.chk_landable.Bind(wx.EVT_BUTTON, self._toggle_land)
         self._selected = None  # currently clicked body name
 
-        # noinspection PyTypeChecker
-        self._refresh_timer = wx.CallLater(millis=500, callableObj=self._refresh)
         self.options.chk_ringed.SetToggle(self.prefs["ringed"])
         self.options.chk_ringed.Bind(wx.EVT_BUTTON, self._toggle_ringed)
         self._selected = None  # currently clicked body name
@@ -112,12 +100,15 @@ class MainFrame(DynamicFrame):
 
         # listen for target changes
         self.model.register_target_listener(lambda name: wx.CallAfter(self._update_target, name))
+        # predictions are made on the predictor thread
+        self.biosign_predictor.register_listener(lambda prediction: wx.CallAfter(self._show_biosign_prediction, prediction))
 
         # 2. Apply geometry
         init_widget(self, width=props.width, height=props.height, posx=props.posx, posy=props.posy, title=TITLE)
 
     def update_panels(self):
         self.prefs = json.loads(CFG_FILE.read_text()) if CFG_FILE.exists() else {}
+        self.governor.update_prefs(self.prefs)
         self._init_panels()
 
     def _init_panels(self):
@@ -136,6 +127,8 @@ class MainFrame(DynamicFrame):
             if self.win_sel is None:
                 self.win_sel = DetailSelected(self)
                 self.win_sel.Show(True)
+            elif not self.win_sel.IsShown():
+                self.win_sel.Show(True)     # closed by the user; renders skip it until shown again
 
         # target body --------------------------------------------------------------------------------------------------
         from EDXD.gui.detail_target import WINID as winIdSelected
@@ -151,6 +144,8 @@ class MainFrame(DynamicFrame):
             if self.win_tar is None:
                 self.win_tar = DetailTargeted(self)
                 self.win_tar.Show(True)
+            elif not self.win_tar.IsShown():
+                self.win_tar.Show(True)
 
         # Planetary Surface Positioning System -------------------------------------------------------------------------
         from EDXD.gui.psps_gui import WINID as winIdSelected
@@ -166,6 +161,8 @@ class MainFrame(DynamicFrame):
             if self.win_psps is None:
                 self.win_psps = PositionTracker(self)
                 self.win_psps.Show(True)
+            elif not self.win_psps.IsShown():
+                self.win_psps.Show(True)
 
         # engine status ------------------------------------------------------------------------------------------------
         from EDXD.gui.engine_status  import WINID as winIdSelected
@@ -181,6 +178,8 @@ class MainFrame(DynamicFrame):
             if self.win_engine_status is None:
                 self.win_engine_status = EngineStatus(self)
                 self.win_engine_status.Show(True)
+            elif not self.win_engine_status.IsShown():
+                self.win_engine_status.Show(True)
 
         # status flags -------------------------------------------------------------------------------------------------
         from EDXD.gui.status_flags import WINID as winIdSelected
@@ -196,6 +195,8 @@ class MainFrame(DynamicFrame):
             if self.win_status_flags is None:
                 self.win_status_flags = StatusFlags(self)
                 self.win_status_flags.Show(True)
+            elif not self.win_status_flags.IsShown():
+                self.win_status_flags.Show(True)
 
         # Signal prediction -------------------------------------------------------------------------
         from EDXD.gui.signal_prediction import WINID as winIdSelected
@@ -211,6 +212,9 @@ class MainFrame(DynamicFrame):
             if self.win_sig_pred is None:
                 self.win_sig_pred = SignalPrediction(self)
                 self.win_sig_pred.Show(True)
+            elif not self.win_sig_pred.IsShown():
+                self.win_sig_pred.Show(True)
+                self._show_biosign_prediction(self.model.snapshot_biosign_predictions())
 
     def _update_system(self, title: str = ""):
         init_widget(widget=self.lbl_sys, title=title)
@@ -229,9 +233,14 @@ class MainFrame(DynamicFrame):
                 vehicle=self.model.current_vessel
             )
 
-    def _update_biosign_prediction(self, body_data):
-        prediction_data = estimate_system_biosigns(body_data)
-        self.win_sig_pred.render(prediction=prediction_data)
+    def _update_biosign_prediction(self):
+        # estimated on the predictor thread, shown by _show_biosign_prediction once done
+        self.biosign_predictor.submit()
+
+    def _show_biosign_prediction(self, prediction: Dict):
+        if self.win_sig_pred is None:
+            return
+        self.win_sig_pred.render(prediction=prediction)
 
     # ------------------------------------------------------------------
     # event handlers
@@ -261,15 +270,17 @@ class MainFrame(DynamicFrame):
     def _row_clicked(self, body_id: str):
         self._selected = body_id
         self.model.selected_body_id = body_id
+        body_revision = self.model.get_body_revision(body_id)
         body = self.model.snapshot_bodies().get(body_id)
 
         if body:
             current_position = self.model.snapshot_position()
             current_heading = self.model.current_heading
-            if self.win_sel: self.win_sel.render(body, self.prefs["mat_sel"], current_position=current_position, current_heading=current_heading)
+            if self.win_sel: self.win_sel.render(body, self.prefs["mat_sel"], current_position=current_position, current_heading=current_heading, body_revision=body_revision)
 
     def _update_target(self, body_id: str):
         """Called by Model when the cockpit target changes."""
+        body_revision = self.model.get_body_revision(body_id)
         bodies = self.model.snapshot_bodies()
         body = bodies.get(body_id)
         current_position = self.model.snapshot_position()
@@ -280,9 +291,9 @@ class MainFrame(DynamicFrame):
             # from model import Body          # avoid circular import at top
             body = Body(body_id=body_id)
 
-        if self.win_tar: self.win_tar.render(body=body, filters=self.prefs["mat_sel"], current_position=current_position, current_heading=current_heading)
+        if self.win_tar: self.win_tar.render(body=body, filters=self.prefs["mat_sel"], current_position=current_position, current_heading=current_heading, body_revision=body_revision)
         if self.win_sel and self.win_sel.lbl_body.GetLabelText() == self.win_tar.lbl_body.GetLabelText():
-            self.win_sel.render(body=body, filters=self.prefs["mat_sel"], current_position=current_position, current_heading=current_heading)
+            self.win_sel.render(body=body, filters=self.prefs["mat_sel"], current_position=current_position, current_heading=current_heading, body_revision=body_revision)
         if self.win_psps: self.win_psps.render(body=body, current_position=current_position, current_heading=current_heading)
 
         # trigger a table refresh so the status icon updates immediately
@@ -321,30 +332,30 @@ class MainFrame(DynamicFrame):
     # ------------------------------------------------------------------
     # periodic refresh
     # ------------------------------------------------------------------
+    def _refreshed_windows(self):
+        """The satellite windows _refresh renders - frozen with the main window for the tick."""
+        return self.win_sel, self.win_tar, self.win_psps, self.win_engine_status
+
     #@log_call()
     def _refresh(self):
-        self.table_view.refresh(
-            bodies=self.model.snapshot_bodies(),
-            filters=self.prefs["mat_sel"],
-            landable_only=self.prefs["land"],
-            ringed_only=self.prefs["ringed"],
-            selected_body_id=self._selected,
-            target_body_id=self.model.target_body_id
-        )
+        # revisions first: a body changing in between only makes its row rebuild once more
+        body_revisions = self.model.snapshot_body_revisions()
+        bodies = self.model.snapshot_bodies()
+        self._render_main(bodies=bodies, body_revisions=body_revisions)
+
         # keep the auto-window live even if nothing else changes
         current_position = self.model.snapshot_position()
         current_heading = self.model.current_heading
+        tgt_revision = self.model.get_body_revision(self.model.target_body_id)
         tgt = self.model.snapshot_target()
 
         if current_position and self.win_psps:
             self.win_psps.render(body=tgt, current_position=current_position, current_heading=current_heading)
 
         if tgt and self.win_tar:
-            self.win_tar.render(body=tgt, filters=self.prefs["mat_sel"],  current_position=current_position, current_heading=current_heading)
-
-        bodies = self.model.snapshot_bodies()
+            self.win_tar.render(body=tgt, filters=self.prefs["mat_sel"],  current_position=current_position, current_heading=current_heading, body_revision=tgt_revision)
 
-        self._update_biosign_prediction(bodies)
+        self._update_biosign_prediction()
 
         if self.model.selected_body_id is None:
             self._selected = ""
@@ -354,24 +365,36 @@ class MainFrame(DynamicFrame):
             if self._selected != "":
                 sel_body = bodies[self._selected]
 
-            if self.win_sel: self.win_sel.render(body=sel_body, filters=self.prefs["mat_sel"], current_position=current_position, current_heading=current_heading)
+            if self.win_sel: self.win_sel.render(body=sel_body, filters=self.prefs["mat_sel"], current_position=current_position, current_heading=current_heading,
+                                                 body_revision=body_revisions.get(self._selected))
         except KeyError:
             pass
 
-        scanned = sum(1 for b in bodies.values()
-                      if "Belt Cluster" not in b.body_name)
+        self._update_fuel_status()
 
-        total = self.model.snapshot_total() or "?"  # raw DSS BodyCount
+    @skip_when_hidden
+    def _render_main(self, bodies: Dict[str, Body], body_revisions: Dict[str, int]):
+        """Body table and system title - the satellite windows gate their own renders."""
+        self.table_view.refresh(
+            bodies=bodies,
+            filters=self.prefs["mat_sel"],
+            landable_only=self.prefs["land"],
+            ringed_only=self.prefs["ringed"],
+            selected_body_id=self._selected,
+            target_body_id=self.model.target_body_id,
+            body_revisions=body_revisions
+        )
 
-        name = self.model.system_name or "No system"
-        self._update_system(title=f"{name}   ({scanned}/{total})")
+        valuation = self.model.snapshot_valuation()
+        scanned = valuation.bodies_scanned
 
-        self._update_fuel_status()
+        total = self.model.snapshot_total() or "?"  # raw DSS BodyCount
 
-        # noinspection PyTypeChecker
-        if self._refresh_timer:
-            self._refresh_timer.Stop()
-        self._refresh_timer = wx.CallLater(millis=500, callableObj=self._refresh)  # schedule next update
+        name = self.model.system_name or "No system"
+        title = f"{name}   ({scanned}/{total})"
+        if valuation.current_value or valuation.potential_value:
+            title += f"   {valuation.current_value:,} Cr (+{valuation.potential_value:,} Cr)"
+        self._update_system(title=title)
 
     def on_close(self, event):
         if self.win_sel             : self.win_sel.Close(True)
@@ -380,5 +403,8 @@ class MainFrame(DynamicFrame):
         if self.win_engine_status   : self.win_engine_status.Close(True)
         if self.win_status_flags    : self.win_status_flags.Close(True)
         if self.win_sig_pred        : self.win_sig_pred.Close(True)
+        self.scheduler.unregister(self._refresh_consumer)
+        self.governor.stop()
+        logging.debug("UI frame scheduler\n%s", self.scheduler.format_stats())
         self.save_geometry()
         event.Skip()
\ No newline at end of file
@@ -1,6 +1,3 @@
-import functools
-import inspect
-
 import wx
 
 from EDXD.globals import *
@@ -13,22 +10,6 @@ from EDXD.gui.set_mineral_filter import MineralsFilter
 from EDXD.gui.config import EDXDConfig
 
 
-def log_call(level=logging.INFO):
-    """Decorator that logs function name and bound arguments."""
-    def decorator(fn):
-        logger = logging.getLogger(fn.__module__)   # one logger per module
-        sig = inspect.signature(fn)                 # capture once, not on every call
-
-        @functools.wraps(fn)
-        def wrapper(*args, **kwargs):
-            bound = sig.bind_partial(*args, **kwargs)
-            arg_str = ", ".join(f"{k}={v!r}" for k, v in bound.arguments.items())
-            logger.log(level, "%s(%s)", fn.__name__, arg_str)
-            return fn(*args, **kwargs)
-
-        return wrapper
-    return decorator
-
 # current version
 try:
     from EDXD._version import VERSION as __version__
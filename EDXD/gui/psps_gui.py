@@ -9,7 +9,9 @@ from EDXD.data_handler.model import Body
 from EDXD.data_handler.planetary_surface_positioning_system import PSPS, PSPSCoordinates
 from EDXD.globals import DEFAULT_WIDTH_PSPS, DEFAULT_HEIGHT_PSPS, DEFAULT_POS_Y, DEFAULT_POS_X, RESIZE_MARGIN, ICONS
 from EDXD.gui.helper.dynamic_dialog import DynamicDialog
+from EDXD.gui.helper.frame_scheduler import get_frame_scheduler
 from EDXD.gui.helper.gui_handler import init_widget
+from EDXD.gui.helper.render_gate import skip_when_hidden
 from EDXD.gui.helper.theme_handler import get_theme
 from EDXD.gui.helper.window_properties import WindowProperties
 from EDXD.gui.psps_gui_buttons import PSPSButtons
@@ -29,6 +31,7 @@ class PositionTracker(DynamicDialog):
         self.psps = None
         self.pinned_position = None
         self.current_position = None
+        self._rendered: Optional[tuple] = None    # (label, current, pinned, distance) last shown
 
         self.theme = get_theme()
 
@@ -65,18 +68,16 @@ class PositionTracker(DynamicDialog):
 
         self.finalize_layout()
 
-        # noinspection PyTypeChecker
-        wx.CallLater(millis=3000, callableObj=self._loading_finished)
+        get_frame_scheduler().call_later("loading_finished", 3000, self._loading_finished, window=self)
 
     def _loading_finished(self):
         self._loading = False
 
     # ------------------------------------------------------------------
+    @skip_when_hidden
     def render(self, body: Optional[Body], current_position: Optional[PSPSCoordinates], current_heading: Optional[int]) -> None:
-        self.lbl_body.SetLabelText(text=body.body_name if body else "")
-        self.txt_pinned_position.Clear()
-        self.txt_current_position.Clear()
-        self.txt_distance_to_target.Clear()
+        label = body.body_name if body else ""
+        current_text = pinned_text = distance_text = ""
 
         if current_position:
             self.current_position = current_position
@@ -85,34 +86,41 @@ class PositionTracker(DynamicDialog):
             current_ok: bool = False
             pinned_ok: bool = False
             if self.current_position.latitude and self.current_position.longitude:
-                self.txt_current_position.SetValue(f"{ICONS['status_target']} Lat: {self.current_position.latitude:.5f}° :: Long: {self.current_position.longitude:.5f}°")
+                current_text = f"{ICONS['status_target']} Lat: {self.current_position.latitude:.5f}° :: Long: {self.current_position.longitude:.5f}°"
                 current_ok = True
             else:
                 self.current_position = None
                 self.pinned_position = None
-                self.txt_current_position.Clear()
-                self.txt_pinned_position.Clear()
-                self.txt_distance_to_target.Clear()
 
             if current_ok and self.pinned_position and self.pinned_position.latitude is not None and self.pinned_position.longitude is not None:
-                self.txt_pinned_position.SetValue(f"{ICONS['pinned']} Lat: {self.pinned_position.latitude:.5f}° :: Long: {self.pinned_position.longitude:.5f}°")
+                pinned_text = f"{ICONS['pinned']} Lat: {self.pinned_position.latitude:.5f}° :: Long: {self.pinned_position.longitude:.5f}°"
                 pinned_ok = True
             if current_ok and pinned_ok:
                 formatted_distance = self.psps.get_distance(current_coordinates=self.current_position, target_coordinates=self.pinned_position)
                 bearing_indicator = self.psps.get_relative_bearing(self.current_position, current_heading=current_heading)
-                self.txt_distance_to_target.SetValue(f"Distance: {bearing_indicator} {formatted_distance}")
+                distance_text = f"Distance: {bearing_indicator} {formatted_distance}"
         else:
-            self.txt_pinned_position.Clear()
-            self.txt_current_position.Clear()
-            self.txt_distance_to_target.Clear()
             self.current_position = None
             self.pinned_position = None
             self.psps = None
 
-        if not self.IsShown():
-            self.Show()
+        # the texts are shown at display precision - equal texts mean nothing visible changed
+        rendered = self._rendered
+        self._rendered = (label, current_text, pinned_text, distance_text)
+        if rendered is None or rendered[0] != label:
+            self.lbl_body.SetLabelText(text=label)
+        for ctrl, old, text in ((self.txt_current_position, rendered and rendered[1], current_text),
+                                (self.txt_pinned_position, rendered and rendered[2], pinned_text),
+                                (self.txt_distance_to_target, rendered and rendered[3], distance_text)):
+            if rendered is not None and old == text:
+                continue
+            if text:
+                ctrl.SetValue(text)
+            else:
+                ctrl.Clear()
 
-        self.Fit()
+        if rendered is None or rendered[0] != label:
+            self.Fit()
 
     # --------------------------------------------------------------
     def _on_show(self, event):
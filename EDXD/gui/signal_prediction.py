@@ -1,13 +1,15 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Set
+from typing import Dict, List, NamedTuple, Tuple
 
 import wx
 
 from EDXD.globals import DEFAULT_HEIGHT, DEFAULT_WIDTH, DEFAULT_POS_Y, DEFAULT_POS_X, RESIZE_MARGIN
 from EDXD.gui.helper.dynamic_dialog import DynamicDialog
+from EDXD.gui.helper.frame_scheduler import get_frame_scheduler
 from EDXD.gui.helper.gui_handler import init_widget
+from EDXD.gui.helper.render_gate import skip_when_hidden
 from EDXD.gui.helper.theme_handler import get_theme
 from EDXD.gui.helper.window_properties import WindowProperties
 from EDXD.gui.helper.collapsible_panel import CollapsiblePanel
@@ -16,6 +18,16 @@ import EDXD.data_handler.helper.data_helper as dh
 
 TITLE = "Biosignal prediction"
 WINID = "BIOSIGNAL_PREDICTION"
+CELLS_PER_ROW = 5
+
+
+class PredictionRow(NamedTuple):
+    """What one rendered row of a prediction panel shows."""
+    name        : str
+    variant     : str
+    probability : float
+    base_value  : int
+
 
 class SignalPrediction(DynamicDialog):
     def __init__(self, parent, title=TITLE, win_id=WINID, is_hidden: bool = True):
@@ -34,50 +46,64 @@ class SignalPrediction(DynamicDialog):
 
         # collapsible panels with details
         self.prediction_panels: Dict[str, CollapsiblePanel] = {}
+        # body_id -> rows its panel shows; render() only patches what differs
+        self._rendered: Dict[str, Tuple[PredictionRow, ...]] = {}
 
         self.finalize_layout()
-        # noinspection PyTypeChecker
-        wx.CallLater(millis=3000, callableObj=self._loading_finished)
+        get_frame_scheduler().call_later("loading_finished", 3000, self._loading_finished, window=self)
 
     def _loading_finished(self):
         self._loading = False
 
     # ------------------------------------------------------------------
+    @skip_when_hidden
     def render(self, prediction: Dict[str, List[Dict]] = None):
-        panels_to_remove: Set[str] = set()
+        prediction = prediction or {}
+        removed = [body_id for body_id in self.prediction_panels if body_id not in prediction]
+        added = [body_id for body_id in prediction if body_id not in self.prediction_panels]
+        changed: Dict[str, Tuple[PredictionRow, ...]] = {}
+        for body_id, body_data in prediction.items():
+            rows = self._prediction_rows(body_data)
+            if rows != self._rendered.get(body_id):
+                changed[body_id] = rows
+
+        if removed or added or changed:
+            self.Freeze()
+            try:
+                relayout = self._patch(prediction, removed, added, changed)
+                if relayout:
+                    # one pass for the whole window, the panels skipped laying out their parent
+                    self.window_box.Layout()
+            finally:
+                self.Thaw()
+
+    def _patch(self, prediction: Dict[str, List[Dict]], removed: List[str], added: List[str],
+               changed: Dict[str, Tuple[PredictionRow, ...]]) -> bool:
+        """Apply the differences to the last render; True if the window needs a layout pass."""
         # remove unnecessary panels
-        for panel_key in self.prediction_panels:
-            if panel_key not in prediction.keys():
-                panels_to_remove.add(panel_key)
-
-        for panel_key in panels_to_remove:
-            panel: CollapsiblePanel = self.prediction_panels.pop(panel_key)
+        for body_id in removed:
+            panel: CollapsiblePanel = self.prediction_panels.pop(body_id)
+            self._rendered.pop(body_id, None)
             self.window_box.Detach(panel)
             panel.Destroy()
 
         # add more panels
-        for prediction_key in prediction.keys():
-            if prediction_key not in self.prediction_panels.keys():
-                signal_count = prediction[prediction_key][0]["present_signal_count"]
-                signal_suffix = "signal"
-                if signal_count > 1:
-                    signal_suffix = "signals"
-                body_name = prediction[prediction_key][0]["body_name"] + "   (" + str(signal_count) + " " + signal_suffix + ")"
-
-                new_panel = CollapsiblePanel(parent=self.scroll_container, columns=5, label=body_name)
-                self.prediction_panels[prediction_key] = new_panel
-                self.window_box.Add(self.prediction_panels[prediction_key], 0, wx.EXPAND, RESIZE_MARGIN)
-
-        for panel_key in self.prediction_panels:
-            self.prediction_panels[panel_key].reset_table()
-
-        for body_id, body_data in prediction.items():
-            self._update_general(self.prediction_panels[body_id], body_data)
-
-        self.window_box.Layout()
-
-        if not self.IsShown():
-            self.Show()
+        for body_id in added:
+            signal_count = prediction[body_id][0]["present_signal_count"]
+            signal_suffix = "signal"
+            if signal_count > 1:
+                signal_suffix = "signals"
+            body_name = prediction[body_id][0]["body_name"] + "   (" + str(signal_count) + " " + signal_suffix + ")"
+
+            new_panel = CollapsiblePanel(parent=self.scroll_container, columns=5, label=body_name)
+            self.prediction_panels[body_id] = new_panel
+            self.window_box.Add(new_panel, 0, wx.EXPAND, RESIZE_MARGIN)
+
+        relayout = bool(removed or added)
+        for body_id, rows in changed.items():
+            relayout |= self._update_general(self.prediction_panels[body_id], rows, self._rendered.get(body_id, ()))
+            self._rendered[body_id] = rows
+        return relayout
 
     # --------------------------------------------------------------
     def _on_show(self, event):
@@ -85,24 +111,30 @@ class SignalPrediction(DynamicDialog):
         self._ready = True
         event.Skip()
 
-    def _update_general(self, prediction_panel: CollapsiblePanel, body_data: List[Dict] = None):
-        if prediction_panel is None or body_data is None or len(body_data) == 0:
-            return
-
+    @staticmethod
+    def _prediction_rows(body_data: List[Dict]) -> Tuple[PredictionRow, ...]:
+        return tuple(
+            PredictionRow(item["name"], item["variant_color"] or "", item["probability"], item["base_value"])
+            for item in body_data or ()
+            if item["name"] != "Radicoida Unica"
+        )
+
+    def _update_general(self, prediction_panel: CollapsiblePanel, rows: Tuple[PredictionRow, ...],
+                        rendered: Tuple[PredictionRow, ...] = ()) -> bool:
+        """Patch the rows that differ from the rendered ones; True if the panel was laid out."""
         if not prediction_panel.IsShown():
             prediction_panel.Show()
 
-        for item in body_data:
-            genus_name: str = item["name"]
-            if genus_name == "Radicoida Unica":
+        prediction_panel.reset_table()
+        for index, row in enumerate(rows):
+            if index < len(rendered) and rendered[index] == row:
+                prediction_panel.keep_items(CELLS_PER_ROW)
                 continue
-            genus_variant: str = item["variant_color"] or ""
+
+            genus_name, genus_variant, genus_probability, genus_value = row
             if genus_variant == "Unknown": genus_variant = ""
-            genus_probability: float = item["probability"]
-            genus_value: int = item["base_value"]
 
-            genus_value_string = ""
-            if genus_name != "Radicoida Unica" and genus_value == 0:
+            if genus_value == 0:
                 min_max: tuple[int, int] = get_genus_value_range(genus_name)
                 genus_value_string = f"  {min_max[0]:,} Cr ~ {min_max[1]:,} Cr"
             else:
@@ -110,18 +142,9 @@ class SignalPrediction(DynamicDialog):
 
             prediction_panel.add_table_item(f"  {genus_name}")
             prediction_panel.add_table_item(f" {genus_variant}")
-            self._set_probability_colour(prediction_panel.add_table_item(f"  {dh.format_probability(genus_probability)}", align=wx.ALIGN_RIGHT), genus_probability)
+            prediction_panel.add_table_item(f"  {dh.format_probability(genus_probability)}", align=wx.ALIGN_RIGHT,
+                                            colour=dh.get_colour_gradient_from_probability(genus_probability))
             prediction_panel.add_table_item(f"  {genus_value_string}", align=wx.ALIGN_RIGHT)
             prediction_panel.add_table_item("")
 
-
-        if prediction_panel.IsShown():
-            # Force a layout update
-            prediction_panel.force_render()
-
-    @staticmethod
-    def _set_probability_colour(label: wx.StaticText = None, probability: float = 0.0):
-        if label is None:
-            return
-        label.SetForegroundColour(dh.get_colour_gradient_from_probability(probability))
-
+        return prediction_panel.force_render(layout_parent=False)
@@ -11,8 +11,10 @@ from __future__ import annotations
 import wx
 
 from EDXD.gui.helper.dynamic_dialog import DynamicDialog
+from EDXD.gui.helper.frame_scheduler import get_frame_scheduler
 from EDXD.gui.helper.gui_dynamic_toggle_button import DynamicToggleButton
 from EDXD.gui.helper.gui_handler import init_widget
+from EDXD.gui.helper.render_gate import skip_when_hidden
 from EDXD.gui.helper.theme_handler import get_theme
 from EDXD.gui.helper.window_properties import WindowProperties
 
@@ -175,11 +177,32 @@ class StatusFlags(DynamicDialog):
             grid2.Add(btn, 0, wx.ALIGN_LEFT | wx.LEFT | wx.RIGHT | wx.BOTTOM, -4)
         self.window_box.Add(grid2, flag=wx.ALL, border=10)
 
+        # debug readout of the refresh governor
+        self.lbl_activity = None
+        if self.debug_mode:
+            self.lbl_activity = wx.StaticText(parent=self.scroll_container)
+            init_widget(self.lbl_activity)
+            self.window_box.Add(self.lbl_activity, flag=wx.ALL | wx.EXPAND, border=10)
+
         self.finalize_layout()
-        self._refresh_timer = wx.CallLater(millis=500, callableObj=self.render)
+        self._rendered_flags = None
+        self._refresh_consumer = get_frame_scheduler().register("status_flags.render", self.render, interval_ms=500,
+                                                                is_dirty=self._flags_changed, window=self, freeze=True)
         self.Fit()
 
+    def _shown_state(self) -> tuple:
+        governor = getattr(self.parent, "governor", None)
+        mode = governor.mode if governor is not None and self.lbl_activity is not None else None
+        return self.parent.model.flags, self.parent.model.flags2, mode
+
+    def _flags_changed(self) -> bool:
+        return self._shown_state() != self._rendered_flags
+
+    @skip_when_hidden
     def render(self):
+        self._rendered_flags = self._shown_state()
+        if self.lbl_activity is not None and getattr(self.parent, "governor", None) is not None:
+            self.lbl_activity.SetLabel(self.parent.governor.describe())
         if self.parent.model.flags is not None:
             for i in range(len(self.flag_buttons)):
                 new_val = (self.parent.model.flags & pow(2, i)) != 0
@@ -193,5 +216,3 @@ class StatusFlags(DynamicDialog):
                 self.flag2_buttons[i].SetValue(new_val)
                 self.flag2_buttons[i]._is_toggled = new_val
                 self.flag2_buttons[i].Refresh()
-
-        self._refresh_timer = wx.CallLater(millis=500, callableObj=self.render)
@@ -1,6 +1,9 @@
 import inspect
 import re
-from typing import Dict, Callable, Optional
+from bisect import bisect_left, insort
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, Callable, List, Optional, Tuple
 
 import wx
 import wx.grid as gridlib
@@ -9,14 +12,155 @@ import EDXD.data_handler.helper.data_helper as dh
 from EDXD.data_handler.model import Body, FlatRowDataMainWindow
 from EDXD.globals import SYMBOL, logging, RAW_MATS, ICONS, log_call, DEBUG_MODE, log_context, \
     DEFAULT_WORTHWHILE_THRESHOLD
+from EDXD.gui.helper.icon_renderer import IconCellRenderer
 from EDXD.utils.clipboard import copy_text_to_clipboard
 import EDXD.data_handler.helper.technical2humanreadable as t2h
 
 
+CENTERED_COLS = frozenset(("body", "body_type", "land", "bio", "geo", "status", "scoopable", "has_rings", "ring_hotspots",
+                           "worthwhile", "mapped", "first_discovered", "first_mapped", "first_footfalled"))
+# columns showing ICONS - drawn from cached bitmaps instead of laying out emoji text on every paint
+ICON_COLS = frozenset(("status", "scoopable", "has_rings", "ring_hotspots", "land", "atmosphere", "bio", "geo",
+                       "worthwhile", "mapped", "first_discovered", "first_mapped", "first_footfalled"))
+_DIGITS = re.compile(r'(\d+)')
+_ORDER = itemgetter(0, 1)  # (sort key, tie) of an entry of BodiesTable._sorted
+
+
+@lru_cache(maxsize=4096)
+def natural_sort_key(text: str) -> tuple:
+    """Digit runs compare as numbers, the rest case-insensitive: "Sys A 2" < "Sys A 10"."""
+    return tuple(int(part) if part.isdigit() else part.lower() for part in _DIGITS.split(text))
+
+
+def typed_sort_key(colname: str, raw) -> tuple:
+    """Sort key of a raw cell value: missing values first, then numbers by value, then text naturally."""
+    if raw is None:
+        return (1, -1.0) if colname in RAW_MATS else (0,)
+    if isinstance(raw, (int, float)):
+        return 1, raw
+    return 2, natural_sort_key(str(raw))
+
+
+class BodyRow:
+    """One row of BodiesTable: cells by column name and their display strings in column order."""
+    __slots__ = ("body_id", "cells", "values", "gravity_colour", "_sort_keys")
+
+    def __init__(self, body_id: str, cells: Dict[str, tuple], cols: List[str]):
+        self.body_id    : str                   = body_id
+        self.cells      : Dict[str, tuple]      = cells     # column name -> (display, raw)
+        self.values     : Tuple[str, ...]       = tuple(cells.get(colname, ("", ""))[0] for colname in cols)
+        g_force = cells.get("g_force", ("", None))[1]
+        # coloured by the value as displayed (two decimals), like the cells always were
+        self.gravity_colour = dh.get_colour_gradient_from_gravity(round(g_force, 2)) if g_force is not None else None
+        self._sort_keys : Dict[str, tuple]      = {}
+
+    def sort_key(self, colname: str) -> tuple:
+        """Typed sort key of a column, computed once per row."""
+        key = self._sort_keys.get(colname)
+        if key is None:
+            key = self._sort_keys[colname] = typed_sort_key(colname, self.cells.get(colname, ("", None))[1])
+        return key
+
+
+class BodiesGridTable(gridlib.GridTableBase):
+    """
+    Virtual data of BodiesTable: the grid asks for the cells it paints, the values come from the
+    row model handed over by set_data(). Column attributes are created once, the gravity colours
+    once per colour. With icon_bitmaps the icon columns get an IconCellRenderer - off until
+    debug/bench_icon_paint.py has shown it paints faster than the default text renderer.
+    """
+    def __init__(self, headers: Dict[str, str], icon_bitmaps: bool = False):
+        super().__init__()
+        self.headers    : Dict[str, str]            = headers
+        self.cols       : List[str]                 = []
+        self.rows       : List[BodyRow]             = []    # in display order
+        self._attr_center = gridlib.GridCellAttr()
+        self._attr_center.SetAlignment(wx.ALIGN_CENTER, wx.ALIGN_CENTER)
+        self._attr_right = gridlib.GridCellAttr()
+        self._attr_right.SetAlignment(wx.ALIGN_RIGHT, wx.ALIGN_CENTER)
+        self._attr_icon_center = self._attr_center
+        self._attr_icon_right = self._attr_right
+        if icon_bitmaps:
+            self._attr_icon_center = self._attr_center.Clone()
+            self._attr_icon_center.SetRenderer(IconCellRenderer())
+            self._attr_icon_right = self._attr_right.Clone()
+            self._attr_icon_right.SetRenderer(IconCellRenderer())
+        self._col_attrs : List[gridlib.GridCellAttr]        = []
+        self._attr_gravity: Dict[tuple, gridlib.GridCellAttr] = {}
+        self._col_gravity: int = -1
+
+    def set_data(self, cols: List[str], rows: List[BodyRow]) -> bool:
+        """Take over columns and rows (in display order); False if nothing visible changed."""
+        if cols == self.cols:
+            # unchanged rows are the very same objects - compare the strings only for the others
+            unchanged = len(rows) == len(self.rows) and all(
+                new is old or new.values == old.values and new.gravity_colour == old.gravity_colour
+                for new, old in zip(rows, self.rows))
+            self.rows = rows
+            if unchanged:
+                return False
+        else:
+            self.cols = list(cols)
+            self._col_attrs = [self._col_attr(colname) for colname in cols]
+            self._col_gravity = cols.index("g_force") if "g_force" in cols else -1
+            self.rows = rows
+        return True
+
+    def _col_attr(self, colname: str) -> gridlib.GridCellAttr:
+        if colname in ICON_COLS:
+            return self._attr_icon_center if colname in CENTERED_COLS else self._attr_icon_right
+        return self._attr_center if colname in CENTERED_COLS else self._attr_right
+
+    def _gravity_attr(self, colour) -> gridlib.GridCellAttr:
+        key = colour.Get()
+        attr = self._attr_gravity.get(key)
+        if attr is None:
+            attr = self._attr_right.Clone()
+            attr.SetTextColour(colour)
+            self._attr_gravity[key] = attr
+        return attr
+
+    def row(self, index: int) -> Optional[BodyRow]:
+        return self.rows[index] if index is not None and 0 <= index < len(self.rows) else None
+
+    # ----- GridTableBase -----------------------------------------------------
+    def GetNumberRows(self):
+        return len(self.rows)
+
+    def GetNumberCols(self):
+        return len(self.cols)
+
+    def GetValue(self, row, col):
+        try:
+            return self.rows[row].values[col]
+        except IndexError:
+            return ""
+
+    def SetValue(self, row, col, value):
+        pass    # read only
+
+    def IsEmptyCell(self, row, col):
+        return not self.GetValue(row, col)
+
+    def GetColLabelValue(self, col):
+        colname = self.cols[col] if 0 <= col < len(self.cols) else ""
+        return self.headers.get(colname, SYMBOL.get(colname, colname[:2].title()))
+
+    def GetAttr(self, row, col, kind):
+        attr = None
+        if col == self._col_gravity and 0 <= row < len(self.rows) and self.rows[row].gravity_colour is not None:
+            attr = self._gravity_attr(self.rows[row].gravity_colour)
+        elif 0 <= col < len(self._col_attrs):
+            attr = self._col_attrs[col]
+        if attr is not None:
+            attr.IncRef()
+        return attr
+
+
 class BodiesTable(gridlib.Grid):
     """Table with Status | Body | 🛬 | 🌿 | 🌋 | one column per mineral."""
     #@log_call()
-    def __init__(self, parent, on_select: Callable[[str], None]):
+    def __init__(self, parent, on_select: Callable[[str], None], icon_bitmaps: bool = False):
         super().__init__(parent)
 
         self.parent = parent
@@ -45,10 +189,14 @@ class BodiesTable(gridlib.Grid):
             "first_mapped"      : ICONS["col_first_mapped"]
         }
 
-        self._display_cols = None
-        self._rows_data = None
+        self._display_cols = list(self._all_cols)
+        self._rows_data: List[BodyRow] = []
+        # body_id -> (key, row); key = (body revision, status, visible minerals, worthwhile threshold)
+        self._row_cache: Dict[str, Tuple[tuple, BodyRow]] = {}
 
-        self.CreateGrid(0, len(self._all_cols))
+        self._table = BodiesGridTable(self._headers, icon_bitmaps=icon_bitmaps)
+        self._table.set_data(self._display_cols, [])
+        self.SetTable(self._table, True)
         self.SetRowLabelSize(0)
         self.SetSelectionMode(gridlib.Grid.SelectRows)
         self.DisableDragGridSize()  # Prevents grid line drag-resizing
@@ -84,6 +232,10 @@ class BodiesTable(gridlib.Grid):
         # Sorting
         self.sort_col: Optional[str] = "body"
         self.sort_reverse: bool = False
+        # ascending (sort key, tie, row); tie is the position in _rows_data, negated when sorting in reverse
+        self._sorted: List[tuple] = []
+        self._sorted_entries: Dict[str, tuple] = {}     # body_id -> its entry in _sorted
+        self._sorted_by: Optional[Tuple[str, bool]] = None
         self.Bind(gridlib.EVT_GRID_LABEL_LEFT_CLICK, self._on_label_click)
         # Selection
         self.Bind(gridlib.EVT_GRID_SELECT_CELL, self._on_select)
@@ -131,7 +283,7 @@ class BodiesTable(gridlib.Grid):
         # Always clear any multi-selection, then select only this row
         self.SelectRow(row)
         if 0 <= row < self.GetNumberRows():
-            body_id = self.GetCellValue(row, self._all_cols.index("body_id"))
+            body_id = self.GetCellValue(row, self._display_cols.index("body_id"))
             if self._on_select_cb:
                 self.loading = False
                 self._on_select_cb(body_id)
@@ -163,43 +315,25 @@ class BodiesTable(gridlib.Grid):
             landable_only: bool,
             ringed_only: bool,
             selected_body_id: str,
-            target_body_id: str
+            target_body_id: str,
+            body_revisions: Optional[Dict[str, int]] = None
     ):
+        """
+        With body_revisions (see Model.snapshot_body_revisions) the rows of unchanged bodies are
+        reused; without them every row is built again.
+        """
         visible_mats = [m for m, on in filters.items() if on]
         display_cols = ["body_id", "status", "body_type", "scoopable", "body", "distance", "has_rings", "ring_hotspots", "land", "atmosphere", "g_force", "first_footfalled",
                         "bio", "geo", "value", "worthwhile", "first_discovered", "mapped",
                         "first_mapped"] + visible_mats
 
-        needed_cols = len(display_cols)
-        current_cols = self.GetNumberCols()
-        if current_cols < needed_cols:
-            self.AppendCols(needed_cols - current_cols)
-        elif current_cols > needed_cols:
-            self.DeleteCols(0, current_cols - needed_cols)
-        self._prepare_columns(display_cols=display_cols)
-
-        freeze_col = 0
-        # Align value and distance columns to right
-        for i, colname in enumerate(display_cols):
-            if colname in ["body", "body_type"]:
-                attr_left = gridlib.GridCellAttr()
-                attr_left.SetAlignment(wx.ALIGN_CENTER, wx.ALIGN_CENTER)
-                self.SetColAttr(i, attr_left)
-            elif colname in ("land", "bio", "geo", "status", "scoopable", "has_rings", "ring_hotspots", "worthwhile", "mapped", "first_discovered",
-                             "first_mapped", "first_footfalled"):
-                attr_center = gridlib.GridCellAttr()
-                attr_center.SetAlignment(wx.ALIGN_CENTER, wx.ALIGN_CENTER)
-                self.SetColAttr(i, attr_center)
-            else:
-                attr_right = gridlib.GridCellAttr()
-                attr_right.SetAlignment(wx.ALIGN_RIGHT, wx.ALIGN_CENTER)
-                self.SetColAttr(i, attr_right)
-
-            if colname == "body":
-                freeze_col = i + 1
+        worthwhile_threshold = self.parent.prefs.get("worthwhile_threshold", DEFAULT_WORTHWHILE_THRESHOLD)
+        mats_key = tuple(visible_mats)
+        if self._display_cols != display_cols:
+            self._row_cache.clear()
 
-        # 1. PREPARE ROW DATA AS LIST OF DICTS (column name -> (disp, raw) tuple)
-        rows_data = []
+        # 1. PREPARE ROWS - unchanged bodies keep their BodyRow (column name -> (disp, raw) tuple)
+        rows_data: List[BodyRow] = []
         for body_id, body in bodies.items():
             if landable_only and not getattr(body, "landable", False):
                 continue
@@ -207,155 +341,162 @@ class BodiesTable(gridlib.Grid):
                 continue
             if body.body_type == "BARY_CENTRE":
                 continue
+            status = (
+                ICONS["status_header"]      if body_id == target_body_id == selected_body_id else
+                ICONS["status_target"]      if body_id == target_body_id else
+                ICONS["status_selected"]    if body_id == selected_body_id else
+                "")
+            key = (body_revisions.get(body_id), status, mats_key, worthwhile_threshold) if body_revisions is not None else None
+            cached = self._row_cache.get(body_id)
+            if key is not None and key[0] is not None and cached is not None and cached[0] == key:
+                rows_data.append(cached[1])
+                continue
             try:
-                flat_body_data = FlatRowDataMainWindow(body_to_parse=body)
-
-                row = {
-                    "body_id"           : (body_id, body_id if body_id is not None else ""),
-                    "status"            : (
-                            ICONS["status_header"]      if flat_body_data.body_id == target_body_id == selected_body_id else
-                            ICONS["status_target"]      if flat_body_data.body_id == target_body_id else
-                            ICONS["status_selected"]    if flat_body_data.body_id == selected_body_id else
-                            "", 0),
-                    "body_type"         : (f"{t2h.get_clean_body_type(flat_body_data.body_type)}", flat_body_data.body_type.lower()),
-                    "scoopable"       : (
-                                ICONS['scoopable'] if flat_body_data.scoopable else
-                                "",
-                                (
-                                    0 if flat_body_data.scoopable else
-                                    1)
-                            ),"body"              : (body.body_name, body.body_name.lower()),
-                    "distance"          : (f"{flat_body_data.distance:,.0f} Ls" if flat_body_data.distance is not None else "", flat_body_data.distance),
-                    "has_rings"       : (
-                                ICONS['has_rings'] if flat_body_data.has_rings else
-                                "",
-                                (
-                                    0 if flat_body_data.has_rings else
-                                    1)
-                            ),
-                    "ring_hotspots"       : (
-                                ICONS['ring_hotspots'] if dh.rings_have_hotspots(body) else
-                                "",
-                                (
-                                    0 if flat_body_data.has_rings else
-                                    1)
-                            ),
-                    "land"              : (f"{ICONS['landable']}" if flat_body_data.landable   else "", (0 if flat_body_data.landable  else 1)),
-                    "atmosphere"        : (f"{ICONS['atmosphere_present']}" if flat_body_data.atmosphere != "" else "", (0 if flat_body_data.atmosphere != "" else 1)),
-                    "g_force"           : (dh.format_gravity(flat_body_data.g_force) if flat_body_data.g_force is not None else "", flat_body_data.g_force),
-                    "bio"               : (
-                            f"{ICONS['biosigns']}{ICONS['checked']}"                                if flat_body_data.bio_complete else
-                            f"{ICONS['biosigns']} {flat_body_data.bio_scanned}/{flat_body_data.biosignals}"   if flat_body_data.biosignals > 0 else
-                            "", flat_body_data.biosignals),
-                    "geo"               : (
-                            f"{ICONS['geosigns']}{ICONS['checked']}"                               if flat_body_data.geo_complete else
-                            f"{ICONS['geosigns']} {flat_body_data.geo_scanned}/{flat_body_data.geosignals}"  if flat_body_data.geosignals > 0 else
-                            "", flat_body_data.geosignals),
-                    "value"             : (f"{flat_body_data.estimated_value:,} Cr"  if flat_body_data.estimated_value else "", flat_body_data.estimated_value),
-                    "worthwhile"        : (f"{ICONS["worthwhile"]}"             if flat_body_data.estimated_value >= self.parent.prefs.get("worthwhile_threshold", DEFAULT_WORTHWHILE_THRESHOLD) else "",
-                            flat_body_data.estimated_value),
-                    "mapped"            : (f"{ICONS['mapped']}"                 if flat_body_data.mapped else "",
-                            (1 if flat_body_data.mapped else 0)),
-                    "first_discovered"  : (
-                            f"{ICONS["first_discovered"]}"      if flat_body_data.first_discovered == 2 else (
-                            f"{ICONS["previous_discovered"]}"   if flat_body_data.first_discovered == 1 else ""),
-                        flat_body_data.first_discovered),
-                    "first_mapped"      : (
-                            f"{ICONS["first_mapped"]}"          if flat_body_data.first_mapped == 2 else (
-                            f"{ICONS["previous_mapped"]}"       if flat_body_data.first_mapped == 1 else ""),
-                        flat_body_data.first_mapped),
-                    "first_footfalled"  : (
-                            f"{ICONS["first_footfalled"]}"      if flat_body_data.first_footfalled == 2 else (
-                            f"{ICONS["previous_footfalled"]}"   if flat_body_data.first_footfalled == 1 else ""),
-                        flat_body_data.first_discovered),
-                }
-                for m in visible_mats:
-                    matval = body.materials.get(m, None)
-                    row[m] = (f"{matval:.1f} %" if matval is not None else "", matval if matval is not None else -1.0)
-
-                rows_data.append(row)
-
+                row = BodyRow(body_id, self._build_row(body_id, body, status, visible_mats, worthwhile_threshold), display_cols)
             except Exception as e:
                 log_context(level=logging.ERROR, frame=inspect.currentframe(), e=e)
-                
+                continue
+            self._row_cache[body_id] = (key, row)
+            rows_data.append(row)
 
-        needed_rows = len(rows_data)
-        current_rows = self.GetNumberRows()
-        if current_rows < needed_rows:
-            self.AppendRows(needed_rows - current_rows)
-        elif current_rows > needed_rows:
-            self.DeleteRows(0, current_rows - needed_rows)
+        # bodies that left the system (or the table) do not keep their rows
+        if len(self._row_cache) > len(rows_data):
+            shown = {row.body_id for row in rows_data}
+            for body_id in [body_id for body_id in self._row_cache if body_id not in shown]:
+                del self._row_cache[body_id]
 
         # 2. STORE rows_data FOR SORTING
         self._display_cols = display_cols
         self._rows_data = rows_data
 
-        # 3. FILL VISIBLE DATA
-        for r, row in enumerate(rows_data):
-            for c, colname in enumerate(display_cols):
-                # todo: remove try... col handling needs to be fixed
-                try:
-                    self.SetCellValue(r, c, row.get(colname, ("", ""))[0])
-                except Exception as e:
-                    log_context(level=logging.ERROR, frame=inspect.currentframe(), e=e)
-                    logging.error(f"Failed to set value to {colname}(row[{r}]:col[{c}])")
-
-
-        for r in range(len(rows_data), self.GetNumberRows()):
-            for c in range(self.GetNumberCols()):
-                self.SetCellValue(r, c, "")
-
-        if hasattr(self, "_refresh_sort"):
-            self._refresh_sort()
+        # 3. HAND THE SORTED ROWS TO THE TABLE - the grid only asks for what it paints
+        self._refresh_sort()
         self.ClearSelection()
 
         # freeze columns for scrolling
         #ToDo: #248 - fix broken tooltips when using frozen columns
-        #self.FreezeTo(row=0, col=freeze_col)
+        #self.FreezeTo(row=0, col=display_cols.index("body") + 1)
 
-        # colorise G-force
-        self._set_g_force_color()
+    @staticmethod
+    def _build_row(body_id: str, body: Body, status: str, visible_mats: List[str], worthwhile_threshold: int) -> Dict[str, tuple]:
+        flat_body_data = FlatRowDataMainWindow(body_to_parse=body)
+
+        row = {
+            "body_id"           : (body_id, body_id if body_id is not None else ""),
+            "status"            : (status, 0),
+            "body_type"         : (f"{t2h.get_clean_body_type(flat_body_data.body_type)}", flat_body_data.body_type.lower()),
+            "scoopable"       : (
+                        ICONS['scoopable'] if flat_body_data.scoopable else
+                        "",
+                        (
+                            0 if flat_body_data.scoopable else
+                            1)
+                    ),"body"              : (body.body_name, body.body_name.lower()),
+            "distance"          : (f"{flat_body_data.distance:,.0f} Ls" if flat_body_data.distance is not None else "", flat_body_data.distance),
+            "has_rings"       : (
+                        ICONS['has_rings'] if flat_body_data.has_rings else
+                        "",
+                        (
+                            0 if flat_body_data.has_rings else
+                            1)
+                    ),
+            "ring_hotspots"       : (
+                        ICONS['ring_hotspots'] if dh.rings_have_hotspots(body) else
+                        "",
+                        (
+                            0 if flat_body_data.has_rings else
+                            1)
+                    ),
+            "land"              : (f"{ICONS['landable']}" if flat_body_data.landable   else "", (0 if flat_body_data.landable  else 1)),
+            "atmosphere"        : (f"{ICONS['atmosphere_present']}" if flat_body_data.atmosphere != "" else "", (0 if flat_body_data.atmosphere != "" else 1)),
+            "g_force"           : (dh.format_gravity(flat_body_data.g_force) if flat_body_data.g_force is not None else "", flat_body_data.g_force),
+            "bio"               : (
+                    f"{ICONS['biosigns']}{ICONS['checked']}"                                if flat_body_data.bio_complete else
+                    f"{ICONS['biosigns']} {flat_body_data.bio_scanned}/{flat_body_data.biosignals}"   if flat_body_data.biosignals > 0 else
+                    "", flat_body_data.biosignals),
+            "geo"               : (
+                    f"{ICONS['geosigns']}{ICONS['checked']}"                               if flat_body_data.geo_complete else
+                    f"{ICONS['geosigns']} {flat_body_data.geo_scanned}/{flat_body_data.geosignals}"  if flat_body_data.geosignals > 0 else
+                    "", flat_body_data.geosignals),
+            "value"             : (f"{flat_body_data.estimated_value:,} Cr"  if flat_body_data.estimated_value else "", flat_body_data.estimated_value),
+            "worthwhile"        : (f"{ICONS["worthwhile"]}"             if flat_body_data.estimated_value >= worthwhile_threshold else "",
+                    flat_body_data.estimated_value),
+            "mapped"            : (f"{ICONS['mapped']}"                 if flat_body_data.mapped else "",
+                    (1 if flat_body_data.mapped else 0)),
+            "first_discovered"  : (
+                    f"{ICONS["first_discovered"]}"      if flat_body_data.first_discovered == 2 else (
+                    f"{ICONS["previous_discovered"]}"   if flat_body_data.first_discovered == 1 else ""),
+                flat_body_data.first_discovered),
+            "first_mapped"      : (
+                    f"{ICONS["first_mapped"]}"          if flat_body_data.first_mapped == 2 else (
+                    f"{ICONS["previous_mapped"]}"       if flat_body_data.first_mapped == 1 else ""),
+                flat_body_data.first_mapped),
+            "first_footfalled"  : (
+                    f"{ICONS["first_footfalled"]}"      if flat_body_data.first_footfalled == 2 else (
+                    f"{ICONS["previous_footfalled"]}"   if flat_body_data.first_footfalled == 1 else ""),
+                flat_body_data.first_discovered),
+        }
+        for m in visible_mats:
+            matval = body.materials.get(m, None)
+            row[m] = (f"{matval:.1f} %" if matval is not None else "", matval if matval is not None else -1.0)
+        return row
 
     def _refresh_sort(self):
         if not self.sort_col:
+            self._show_rows(self._rows_data)
             return
 
-        # Helper function for natural sorting
-        def natural_sort_key(text):
-            if text is None:
-                return ""
-            # Split string into parts of digits and non-digits
-            # Convert digit parts to integers, keep text parts as lower-case strings
-            return [int(c) if c.isdigit() else c.lower() for c in re.split(r'(\d+)', str(text))]
-
-        def sort_key(sort_row):
-            val = sort_row.get(self.sort_col, ("", None))
-            raw = val[1]
-
-            if raw is None:
-                if self.sort_col in RAW_MATS:
-                    return -1.0
-                return ""
-
-            # Apply natural sorting logic
-            return natural_sort_key(raw)
+        # same order as sorted(rows, reverse=...) - equal keys keep their order in _rows_data
+        sort_col, sign = self.sort_col, -1 if self.sort_reverse else 1
+        entries = {row.body_id: (row.sort_key(sort_col), sign * seq, row) for seq, row in enumerate(self._rows_data)}
+        if self._sorted_by == (sort_col, self.sort_reverse):
+            stale = {body_id for body_id, entry in self._sorted_entries.items()
+                     if body_id not in entries or entries[body_id][2] is not entry[2] or entries[body_id][1] != entry[1]}
+            fresh = [entry for body_id, entry in entries.items()
+                     if body_id not in self._sorted_entries or body_id in stale]
+        else:
+            stale = fresh = None
 
-        sorted_rows = sorted(self._rows_data, key=sort_key, reverse=self.sort_reverse)
+        if fresh is None or len(stale) + len(fresh) > len(entries) // 4:
+            self._sorted = sorted(entries.values(), key=_ORDER)
+        else:
+            # reposition only the rows that changed
+            for body_id in stale:
+                entry = self._sorted_entries[body_id]
+                del self._sorted[bisect_left(self._sorted, _ORDER(entry), key=_ORDER)]
+            for entry in fresh:
+                insort(self._sorted, entry, key=_ORDER)
+        self._sorted_entries = entries
+        self._sorted_by = (sort_col, self.sort_reverse)
+
+        ordered = self._sorted if sign > 0 else reversed(self._sorted)
+        self._show_rows([entry[2] for entry in ordered])
+
+    def _show_rows(self, rows):
+        """Hand rows (in display order) to the table; the grid repaints only if something visible changed."""
+        old_rows = self._table.GetNumberRows()
+        old_cols = self._table.GetNumberCols()
+        cols_changed = self._table.cols != self._display_cols
+        if not self._table.set_data(self._display_cols, rows):
+            return
 
-        for r, row in enumerate(sorted_rows):
-            for c, colname in enumerate(self._display_cols):
-                try:
-                    self.SetCellValue(r, c, row.get(colname, ("", ""))[0])
-                except Exception as e:
-                    log_context(level=logging.ERROR, frame=inspect.currentframe(), e=e)
-                    logging.error(f"Failed to set value to {colname}(row[{r}]:col[{c}])")
+        self._notify_resized(old_rows, self._table.GetNumberRows(),
+                             gridlib.GRIDTABLE_NOTIFY_ROWS_APPENDED, gridlib.GRIDTABLE_NOTIFY_ROWS_DELETED)
+        self._notify_resized(old_cols, self._table.GetNumberCols(),
+                             gridlib.GRIDTABLE_NOTIFY_COLS_APPENDED, gridlib.GRIDTABLE_NOTIFY_COLS_DELETED)
+        if cols_changed:
+            self._prepare_columns(display_cols=self._display_cols)
+        self.ForceRefresh()
 
-        self._set_g_force_color()
+    def _notify_resized(self, old: int, new: int, appended: int, deleted: int):
+        if new > old:
+            self.ProcessTableMessage(gridlib.GridTableMessage(self._table, appended, new - old))
+        elif new < old:
+            self.ProcessTableMessage(gridlib.GridTableMessage(self._table, deleted, new, old - new))
 
     def _prepare_columns(self, display_cols):
+        # labels come from BodiesGridTable.GetColLabelValue
         for i, colname in enumerate(display_cols):
-            self.SetColLabelValue(i, self._headers.get(colname, SYMBOL.get(colname, colname[:2].title())))
-
             if colname == "status":
                 self.SetColSize(i, 44)
             elif colname == "body_type":
@@ -376,26 +517,6 @@ class BodiesTable(gridlib.Grid):
             else:
                 self.SetColSize(i, 60)
 
-    def _set_g_force_color(self):
-        col_g_force: int = -1
-
-        for i, colname in enumerate(self._display_cols):
-            if colname == "g_force":
-                col_g_force = i
-                break
-
-        # colorise G-force
-        if col_g_force > -1:
-            i: int = 0
-            while i < self.GetNumberRows():
-                g_force = float(self.GetCellValue(i, col_g_force).split(" ")[0].replace(",", ""))
-                attr = wx.grid.GridCellAttr()
-                attr.SetTextColour(dh.get_colour_gradient_from_gravity(g_force))
-                self.SetAttr(i, col_g_force, attr)
-                i += 1
-
-            #self.refresh()
-
     @staticmethod
     def _plain_name_from_label(raw: str) -> str:
         if not raw:
@@ -462,14 +583,14 @@ class BodiesTable(gridlib.Grid):
             except Exception:
                 pass
 
-        # Fallback: use stored rows_data (the internal data used for rendering) to get the body display
+        # Fallback: use the row model of the table (the internal data used for rendering) to get the body display
         if not name:
             try:
-                if hasattr(self, "_rows_data") and index is not None and 0 <= index < len(self._rows_data):
-                    row_data = self._rows_data[index]
+                row_data = self._table.row(index) if index is not None else None
+                if row_data is not None:
                     candidate = ""
-                    if isinstance(row_data, dict):
-                        candidate = row_data.get("body", ("", ""))[0] or row_data.get("body_id", ("", ""))[0]
+                    if isinstance(row_data, BodyRow):
+                        candidate = row_data.cells.get("body", ("", ""))[0] or row_data.body_id
                     if candidate:
                         name = self._plain_name_from_label(candidate)
             except Exception:
@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+import multiprocessing
 import queue
 # version handling
 import sys
@@ -6,9 +7,12 @@ from pathlib import Path
 
 import wx
 
+from EDXD.data_handler.biosign_predictor import BiosignPredictor
 from EDXD.data_handler.journal_controller import JournalController
 from EDXD.data_handler.journal_reader import JournalReader
 from EDXD.data_handler.model import Model
+from EDXD.data_handler.helper.biosign_priors import build_and_save, get_priors, priors_path
+from EDXD.data_handler.helper.system_valuation import appraise_bodies
 from EDXD.data_handler.status_json_watcher import StatusWatcher
 from EDXD.globals import CFG_FILE, RAW_MATS, DEFAULT_WORTHWHILE_THRESHOLD, DEFAULT_FUEL_LOW_THRESHOLD, args
 from EDXD.gui.main_window import MainFrame
@@ -43,11 +47,22 @@ from typing import Optional
 _instance: Optional[SingleInstance] = None
 
 def main():
+    if args.build_priors:
+        priors = build_and_save()
+        print(f"{priors.systems} systems, {priors.bodies} bodies with identified biosigns, {len(priors.bins)} bins -> {priors_path()}")
+        return
+
     # check if another instance of EDXD is already running (working from v0.6.0.0)
     global _instance
     _instance = SingleInstance()
     _instance.acquire_or_exit()
 
+    # rewrites the cache files - not while a running dashboard saves them
+    if args.revalue_cache:
+        systems, revalued, changed = appraise_bodies()
+        print(f"{systems} systems, {revalued} bodies revalued, {changed} changed")
+        return
+
     import json
     app = wx.App(False)
     app.SetAppName("EDXD")
@@ -75,10 +90,13 @@ def main():
 
     q = queue.Queue()
     model = Model()
+    get_priors()    # load the biosign priors before the BiosignPredictor thread estimates the first body
     journal_reader = JournalReader(journal_dir, q)
     journal_reader.start()
     journal_controller = JournalController(q, model)
     journal_controller.start()
+    biosign_predictor = BiosignPredictor(model)
+    biosign_predictor.start()
 
     cfg.setdefault("land", False)
     cfg.setdefault("ringed", False)
@@ -100,7 +118,7 @@ def main():
     status_watcher = StatusWatcher(journal_dir / "Status.json", model)
     status_watcher.start()
 
-    frame = MainFrame(model=model, prefs=cfg, journal_reader=journal_reader, journal_controller=journal_controller, status_watcher=status_watcher)
+    frame = MainFrame(model=model, prefs=cfg, journal_reader=journal_reader, journal_controller=journal_controller, status_watcher=status_watcher, biosign_predictor=biosign_predictor)
 
     # Try to apply the app font/theme using the font_utils helper (if available).
     # This is optional: if font_utils implements apply_app_fonts or set helpers, use them.
@@ -119,4 +137,5 @@ def main():
     app.MainLoop()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()    # --build-priors and --revalue-cache work on a process pool
     main()
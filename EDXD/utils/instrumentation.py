@@ -0,0 +1,45 @@
+"""
+instrumentation.py – call tracing and exception context logging
+
+Everything in here checks `isEnabledFor` before touching arguments, frames or f-strings, so at
+the default LOG_LEVEL (ERROR) a decorated function costs one level check per call and a
+log_context() from an exception handler costs nothing beyond that.
+"""
+import functools
+import inspect
+import logging
+
+
+def log_call(level=logging.INFO):
+    """Decorator that logs the qualified name and bound arguments of each call."""
+    def decorator(fn):
+        logger = logging.getLogger(fn.__module__)   # one logger per module
+        sig = inspect.signature(fn)                 # capture once, not on every call
+        qualname = fn.__qualname__                  # includes outer.<locals>.inner
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if logger.isEnabledFor(level):
+                bound = sig.bind_partial(*args, **kwargs)
+                arg_str = ", ".join(f"{k}={v!r}" for k, v in bound.arguments.items())
+                logger.log(level, "%s(%s)", qualname, arg_str)
+            return fn(*args, **kwargs)
+
+        return wrapper
+    return decorator
+
+
+def log_context(frame, e, level=logging.DEBUG):
+    """Log where an exception happened, including the locals of the failing frame."""
+    if not logging.root.isEnabledFor(level):
+        return
+
+    class_name = frame.f_globals.get("__name__")
+    func_name = frame.f_code.co_name
+    arg_info = inspect.getargvalues(frame)
+    logging.log(level, "%s", "_" * 10)
+    logging.log(level, "Exception in %s.%s with arguments %s", class_name, func_name, arg_info.locals)
+    logging.log(level, "Exception type: %s", type(e).__name__)
+    logging.log(level, "Exception args: %s", e.args)
+    logging.log(level, "Exception str: %s", e)
+
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+bench_biosign_memo.py
+
+Time estimate_system_biosigns on synthetic systems as the GUI refresh calls it:
+
+* without a memo - every landable body with biosignals is estimated on every call,
+* with a warm memo and nothing changed (the common refresh),
+* with a warm memo after one body got a new bio_found entry (a DSS / organic scan).
+
+Every memoised result is compared against the unmemoised one.
+
+  python debug/bench_biosign_memo.py --systems 200
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+
+# EDXD.globals parses sys.argv on import - keep the benchmark options away from it
+_ARGV, sys.argv = sys.argv[1:], sys.argv[:1]
+
+from EDXD.data_handler.helper.biosign_estimator import estimate_system_biosigns
+from EDXD.data_handler.model import Body, Genus, Atmosphere
+
+STARS = [("K", "Va"), ("M", "V"), ("F", "Vab"), ("D", "VII")]
+PLANET_TYPES = ["High metal content body", "Rocky body", "Icy body", "Rocky ice body"]
+ATMOSPHERES = ["thin carbon dioxide atmosphere", "thin ammonia atmosphere", "thin sulphur dioxide atmosphere",
+               "thin water atmosphere", "thin argon atmosphere", "thin methane atmosphere"]
+VOLCANISM = ["", "minor silicate vapour geysers volcanism", "major water geysers volcanism", "minor metallic magma volcanism"]
+
+
+def synthetic_bodies(rnd: random.Random) -> dict[str, Body]:
+    star_type, luminosity = rnd.choice(STARS)
+    bodies = {"b_0": Body(body_id="b_0", body_name="Synthetic A", body_type=star_type, luminosity=luminosity, is_star=True)}
+    for i in range(1, rnd.randint(8, 40)):
+        bodies[f"b_{i}"] = Body(
+            body_id=f"b_{i}", body_name=f"Synthetic A {i}", body_type=rnd.choice(PLANET_TYPES),
+            landable=rnd.random() < 0.6, biosignals=rnd.choice([0, 0, 1, 2, 3, 5]),
+            atmosphere=Atmosphere(type="", raw=rnd.choice(ATMOSPHERES)), mean_temp=rnd.uniform(40, 500),
+            g_force=rnd.uniform(0.03, 0.6), pressure=rnd.uniform(0, 50000), volcanism=rnd.choice(VOLCANISM),
+            parents=[{"Star": 0}], parent_distance=rnd.uniform(1e9, 1e12),
+        )
+    return bodies
+
+
+def timed(fn, systems) -> tuple[float, list]:
+    t0 = time.perf_counter()
+    out = [fn(i, bodies) for i, bodies in enumerate(systems)]
+    return (time.perf_counter() - t0) / len(systems) * 1e3, out
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--systems", type=int, default=200)
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args(_ARGV)
+
+    rnd = random.Random(args.seed)
+    systems = [synthetic_bodies(rnd) for _ in range(args.systems)]
+    memos = [{} for _ in systems]
+
+    plain_ms, plain = timed(lambda i, bodies: estimate_system_biosigns(bodies), systems)
+    cold_ms, cold = timed(lambda i, bodies: estimate_system_biosigns(bodies, memo=memos[i]), systems)
+    warm_ms, warm = timed(lambda i, bodies: estimate_system_biosigns(bodies, memo=memos[i]), systems)
+
+    # one organic scan per system invalidates exactly one memo entry
+    for bodies in systems:
+        candidates = [b for b in bodies.values() if b.landable and b.biosignals]
+        if candidates:
+            rnd.choice(candidates).bio_found["$Codex_Ent_Bacterial_Genus_Name;"] = Genus(
+                genusid="$Codex_Ent_Bacterial_Genus_Name;", localised="Bacterium", scanned_count=1)
+    changed_ms, changed = timed(lambda i, bodies: estimate_system_biosigns(bodies, memo=memos[i]), systems)
+    expected = [estimate_system_biosigns(bodies) for bodies in systems]
+
+    mismatches = sum(a != b for a, b in zip(plain, cold)) + sum(a != b for a, b in zip(plain, warm))
+    mismatches += sum(a != b for a, b in zip(expected, changed))
+    print(f"{len(systems)} systems, {mismatches} mismatches")
+    print(f"  no memo          : {plain_ms:8.3f} ms/system")
+    print(f"  cold memo        : {cold_ms:8.3f} ms/system")
+    print(f"  warm, unchanged  : {warm_ms:8.3f} ms/system  ({plain_ms / warm_ms:.1f}x)")
+    print(f"  warm, one change : {changed_ms:8.3f} ms/system  ({plain_ms / changed_ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
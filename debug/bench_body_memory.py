@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+bench_body_memory.py
+
+Compare the memory footprint of the slotted model classes (Body, Genus, Ring, CodexEntry,
+Atmosphere) with plain __dict__ based dataclasses carrying the same fields, and the footprint
+of a cache load with and without interning of the closed-vocabulary strings.
+
+Either point it at a real cache directory (one <SystemAddress>.json per system) or let it
+synthesise systems:
+
+  python debug/bench_body_memory.py                       # 10k synthetic systems
+  python debug/bench_body_memory.py --systems 2000
+  python debug/bench_body_memory.py --cache-dir ~/.config/EDXD/cache
+"""
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# EDXD.globals parses sys.argv on import - keep the benchmark options away from it
+_ARGV, sys.argv = sys.argv[1:], sys.argv[:1]
+
+from EDXD.data_handler.helper.string_pool import intern_cached_body
+from EDXD.data_handler.model import Body, Genus, Ring, CodexEntry, Atmosphere, BodyPatch, LazyBody
+from EDXD.data_handler.planetary_surface_positioning_system import PSPSCoordinates
+
+
+def _unslotted(cls):
+    """Same fields as cls, but a regular dataclass with a __dict__ per instance."""
+    spec = [
+        (f.name, f.type, dataclasses.field(default=f.default, default_factory=f.default_factory))
+        for f in dataclasses.fields(cls)
+    ]
+    return dataclasses.make_dataclass(f"Dict{cls.__name__}", spec)
+
+
+LEGACY = {cls: _unslotted(cls) for cls in (Body, Genus, Ring, CodexEntry, Atmosphere)}
+SLOTTED = {cls: cls for cls in (Body, Genus, Ring, CodexEntry, Atmosphere)}
+
+PLANET_TYPES = ["High metal content body", "Rocky body", "Icy body", "Rocky ice body", "Water world", "Sudarsky class I gas giant"]
+ATMOSPHERES = ["thin carbon dioxide atmosphere", "thin ammonia atmosphere", "thin sulphur dioxide atmosphere", ""]
+MATERIALS = ["iron", "nickel", "sulphur", "carbon", "phosphorus", "chromium", "zinc", "germanium"]
+GENERA = ["$Codex_Ent_Bacterial_Genus_Name;", "$Codex_Ent_Stratum_Genus_Name;", "$Codex_Ent_Tussocks_Genus_Name;"]
+
+
+def synthetic_system(rnd: random.Random, address: int) -> dict:
+    bodies = {}
+    for i in range(rnd.randint(5, 40)):
+        landable = rnd.random() < 0.4
+        body = {
+            "body_name": f"Synthetic {address} {i}",
+            "body_type": rnd.choice(PLANET_TYPES),
+            "landable": landable,
+            "distance": rnd.randint(0, 200000),
+            "radius": rnd.uniform(1e5, 7e7),
+            "g_force": rnd.uniform(0.01, 5.0),
+            "mean_temp": rnd.uniform(20, 2000),
+            "materials": {m: rnd.uniform(0.1, 20) for m in rnd.sample(MATERIALS, 5)} if landable else {},
+            "atmosphere": {"type": rnd.choice(ATMOSPHERES), "raw": "", "composition": {"CarbonDioxide": 99.0}},
+            "rings": {},
+            "bio_found": {},
+            "geo_found": {},
+        }
+        if landable and rnd.random() < 0.3:
+            body["bio_found"] = {
+                g: {"genusid": g, "localised": g.split("_")[2], "scanned_count": 0,
+                    "pos_first": {"latitude": 1.0, "longitude": 2.0}}
+                for g in rnd.sample(GENERA, 2)
+            }
+        if rnd.random() < 0.1:
+            body["rings"] = {f"{i} A Ring": {"body_id": f"{i} A Ring", "body_name": f"{i} A Ring", "ring_class": "eRingClass_Icy", "signals": {}}}
+        bodies[f"b_{i}"] = body
+    return {"bodies": bodies}
+
+
+def load_systems(args) -> list[dict]:
+    if args.cache_dir:
+        return [json.loads(p.read_text()) for p in sorted(Path(args.cache_dir).expanduser().glob("*.json"))]
+    rnd = random.Random(args.seed)
+    return [synthetic_system(rnd, address) for address in range(args.systems)]
+
+
+def build(systems: list[dict], classes: dict) -> list:
+    body_cls, genus_cls, ring_cls, atmos_cls = classes[Body], classes[Genus], classes[Ring], classes[Atmosphere]
+    out = []
+    for system in systems:
+        for body_id, props in system.get("bodies", {}).items():
+            bio_found = {}
+            for k, v in (props.get("bio_found") or {}).items():
+                v = dict(v)
+                for pos in ("pos_first", "pos_second"):
+                    if isinstance(v.get(pos), dict):
+                        v[pos] = PSPSCoordinates.from_dict(v[pos])
+                bio_found[k] = genus_cls(**v)
+            rings = {k: ring_cls(**v) for k, v in (props.get("rings") or {}).items()}
+            atmos = props.get("atmosphere")
+            out.append(body_cls(
+                body_id=body_id,
+                body_name=props.get("body_name", ""),
+                body_type=props.get("body_type", ""),
+                landable=props.get("landable", False),
+                distance=props.get("distance", 0),
+                radius=props.get("radius", 0.0),
+                g_force=props.get("g_force", 0.0),
+                mean_temp=props.get("mean_temp", 0.0),
+                materials=props.get("materials") or {},
+                bio_found=bio_found,
+                rings=rings,
+                atmosphere=atmos_cls(**atmos) if isinstance(atmos, dict) else atmos,
+            ))
+    return out
+
+
+def measure(systems: list[dict], classes: dict) -> tuple[int, float, int]:
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    bodies = build(systems, classes)
+    elapsed = time.perf_counter() - t0
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    count = len(bodies)
+    del bodies
+    return current, elapsed, count
+
+
+def measure_cache_load(texts: list[str], interned: bool) -> int:
+    """Decode one json document per system like Model.read_data_from_cache, keep everything alive."""
+    gc.collect()
+    tracemalloc.start()
+    kept = []
+    for text in texts:
+        for body_id, props in json.loads(text).get("bodies", {}).items():
+            kept.append(LazyBody(body_id, intern_cached_body(props) if interned else props))
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return current
+
+
+def bench_patch(n: int = 200_000) -> float:
+    body = Body(body_id="b_1", body_name="Synthetic 1", materials={})
+    t0 = time.perf_counter()
+    for i in range(n):
+        BodyPatch(body_id="b_1", biosignals=i % 7, geosignals=None, body_name=None).apply_to(body)
+    return (time.perf_counter() - t0) / n * 1e6
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--systems", type=int, default=10_000, help="number of synthetic systems")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--cache-dir", help="use real cache files instead of synthetic systems")
+    args = ap.parse_args(_ARGV)
+
+    systems = load_systems(args)
+    # note: the raw json payload is allocated before tracing starts, only the objects are counted
+    legacy_mem, legacy_t, count = measure(systems, LEGACY)
+    slotted_mem, slotted_t, _ = measure(systems, SLOTTED)
+
+    print(f"{len(systems)} systems, {count} bodies")
+    print(f"  __dict__ dataclasses : {legacy_mem / 2**20:8.1f} MiB  {legacy_t:6.2f} s")
+    print(f"  slotted dataclasses  : {slotted_mem / 2**20:8.1f} MiB  {slotted_t:6.2f} s")
+    print(f"  saved                : {(legacy_mem - slotted_mem) / 2**20:8.1f} MiB ({(1 - slotted_mem / legacy_mem) * 100:.0f}%)")
+    print(f"  sparse patch apply   : {bench_patch():8.2f} us/update")
+
+    # every cache file is its own json document, so equal strings are separate objects across systems
+    texts = [json.dumps(system) for system in systems]
+    plain_mem = measure_cache_load(texts, interned=False)
+    interned_mem = measure_cache_load(texts, interned=True)
+    print("cache load incl. raw mappings")
+    print(f"  plain strings        : {plain_mem / 2**20:8.1f} MiB")
+    print(f"  interned vocabulary  : {interned_mem / 2**20:8.1f} MiB")
+    print(f"  saved                : {(plain_mem - interned_mem) / 2**20:8.1f} MiB ({(1 - interned_mem / plain_mem) * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+bench_icon_paint.py
+
+Paint a BodiesTable with a synthetic system twice: icon columns drawn as emoji text by the
+default renderer, and from the cached bitmaps of IconCellRenderer. Every round repaints the
+visible grid synchronously (Refresh + Update); reports the time per full paint and the bitmap
+cache statistics.
+
+Needs a display. Apply the app fonts first with --emoji-font to measure with the colour emoji
+font the app uses.
+
+Not measured yet: IconCellRenderer went in without before/after numbers from this script, so
+BodiesTable keeps the text renderer by default (icon_bitmaps=False). Switch the default once a
+run on a desktop shows the bitmaps paint faster.
+
+  python debug/bench_icon_paint.py --rows 300 --rounds 50
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+
+# EDXD.globals parses sys.argv on import - keep the benchmark options away from it
+_ARGV, sys.argv = sys.argv[1:], sys.argv[:1]
+
+import wx
+
+from EDXD.data_handler.model import Atmosphere, Body
+from EDXD.gui.helper.icon_renderer import ICON_BITMAPS
+from EDXD.gui.table_view import BodiesTable
+
+PLANET_TYPES = ["Rocky body", "Icy body", "High metal content body", "Water world", "K", "M"]
+
+
+def synthetic_bodies(rnd: random.Random, rows: int) -> dict:
+    bodies = {}
+    for i in range(rows):
+        bodies[f"b_{i}"] = Body(
+            body_id=f"b_{i}", body_name=f"Synthetic {rnd.choice('ABC')} {i}", body_type=rnd.choice(PLANET_TYPES),
+            distance=rnd.uniform(0, 50_000), landable=rnd.random() < 0.5, g_force=rnd.uniform(0.02, 3),
+            biosignals=rnd.choice([0, 0, 1, 3]), geosignals=rnd.choice([0, 0, 2]),
+            estimated_value=rnd.randint(500, 3_000_000), mapped=rnd.random() < 0.3,
+            first_discovered=rnd.choice([0, 1, 2]), first_mapped=rnd.choice([0, 1, 2]),
+            atmosphere=Atmosphere(type=rnd.choice(["", "CarbonDioxide"]), raw=""), has_rings=rnd.random() < 0.2,
+            materials={"iron": rnd.uniform(1, 30)},
+        )
+    return bodies
+
+
+class BenchFrame(wx.Frame):
+    def __init__(self, icon_bitmaps: bool):
+        super().__init__(None, title="bench_icon_paint", size=wx.Size(1400, 1000))
+        self.prefs = {}
+        self.table = BodiesTable(self, on_select=lambda body_id: None, icon_bitmaps=icon_bitmaps)
+
+
+def time_paints(icon_bitmaps: bool, bodies: dict, rounds: int) -> float:
+    frame = BenchFrame(icon_bitmaps)
+    frame.Show()
+    frame.table.refresh(bodies=bodies, filters={"iron": True}, landable_only=False, ringed_only=False,
+                        selected_body_id="b_0", target_body_id="b_1")
+    window = frame.table.GetGridWindow()
+    window.Refresh()
+    window.Update()     # first paint: fonts and bitmaps are created here
+    wx.Yield()
+
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        window.Refresh()
+        window.Update()
+    elapsed = time.perf_counter() - t0
+    frame.Destroy()
+    wx.Yield()
+    return elapsed / rounds
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--rows", type=int, default=300)
+    ap.add_argument("--rounds", type=int, default=50)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--emoji-font", action="store_true", help="register the embedded fonts first")
+    args = ap.parse_args(_ARGV)
+
+    app = wx.App(False)
+    if args.emoji_font:
+        from EDXD.gui.helper.font_utils import register_embedded_fonts
+        register_embedded_fonts()
+    bodies = synthetic_bodies(random.Random(args.seed), args.rows)
+
+    t_text = time_paints(False, bodies, args.rounds)
+    t_bitmap = time_paints(True, bodies, args.rounds)
+    print(f"{args.rows} rows, {args.rounds} repaints of the visible grid")
+    print(f"  emoji text      : {t_text * 1e3:8.2f} ms per paint")
+    print(f"  cached bitmaps  : {t_bitmap * 1e3:8.2f} ms per paint")
+    print(f"  bitmap cache    : {len(ICON_BITMAPS)} bitmaps, {ICON_BITMAPS.hits} hits, {ICON_BITMAPS.misses} misses")
+    app.Destroy()
+
+
+if __name__ == "__main__":
+    main()
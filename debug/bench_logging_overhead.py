@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+bench_logging_overhead.py
+
+Time JournalController.process_event over a small synthetic event stream with
+
+* logging at the default LOG_LEVEL,
+* logging switched off completely (logging.disable) - the zero-overhead reference,
+* the former unguarded debug dump in data_helper.save, for comparison.
+
+Cache and ship status files are redirected to a temporary directory, the real ones are not touched.
+
+  python debug/bench_logging_overhead.py --rounds 200
+"""
+from __future__ import annotations
+
+import argparse
+import inspect
+import json
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# EDXD.globals parses sys.argv on import - keep the benchmark options away from it
+_ARGV, sys.argv = sys.argv[1:], sys.argv[:1]
+
+import EDXD.data_handler.helper.data_helper as dh
+import EDXD.data_handler.journal_controller as jc
+import EDXD.data_handler.model as model
+from EDXD.globals import log_context
+
+EVENTS = [
+    {"event": "FSDJump", "StarSystem": "Bench", "SystemAddress": 4242, "Body": "Bench A", "BodyID": 0},
+    {"event": "Scan", "ScanType": "Detailed", "StarSystem": "Bench", "SystemAddress": 4242, "BodyName": "Bench A", "BodyID": 0,
+     "StarType": "K", "DistanceFromArrivalLS": 0, "Radius": 5e8, "StellarMass": 0.8, "Luminosity": "Va", "SurfaceTemperature": 5000,
+     "WasDiscovered": True, "WasMapped": False},
+    *[
+        {"event": "Scan", "ScanType": "Detailed", "StarSystem": "Bench", "SystemAddress": 4242, "BodyName": f"Bench A {i}", "BodyID": i,
+         "PlanetClass": "Rocky body", "DistanceFromArrivalLS": 100 * i, "Radius": 1e6, "MassEM": 0.05, "Landable": True,
+         "SurfaceTemperature": 180, "SurfacePressure": 1000, "AtmosphereType": "CarbonDioxide", "Atmosphere": "thin carbon dioxide atmosphere",
+         "AtmosphereComposition": [{"Name": "CarbonDioxide", "Percent": 99}], "Materials": [{"Name": "iron", "Percent": 20}],
+         "Parents": [{"Star": 0}], "SemiMajorAxis": 1e11, "WasDiscovered": False, "WasMapped": False, "TerraformState": ""}
+        for i in range(1, 25)
+    ],
+    {"event": "FSSBodySignals", "SystemAddress": 4242, "BodyName": "Bench A 1", "BodyID": 1,
+     "Signals": [{"Type": "$SAA_SignalType_Biological;", "Count": 2}]},
+]
+
+
+def _legacy_save(path: Path, data):
+    """data_helper.save as it was: the debug dump is built whether DEBUG is enabled or not."""
+    try:
+        logging.debug(f"{data}\n{json.dumps(data, indent=4)}")
+        path.write_text(json.dumps(data, indent=2))
+    except Exception as e:
+        log_context(level=logging.ERROR, frame=inspect.currentframe(), e=e)
+
+
+def run(rounds: int) -> float:
+    controller = jc.JournalController(None, model.Model())
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        for evt in EVENTS:
+            controller.process_event(dict(evt, timestamp="2025-01-01T00:00:00Z"), update_gui=False, set_timestamp=False)
+    return (time.perf_counter() - t0) / (rounds * len(EVENTS)) * 1e6
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--rounds", type=int, default=50)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args(_ARGV)
+
+    tmp = Path(tempfile.mkdtemp(prefix="edxd_bench_"))
+    model.CACHE_DIR = tmp
+    jc.SHIP_STATUS_FILE = tmp / "ship_status.json"
+
+    run(5)  # warm up caches and files
+    default_us, disabled_us, legacy_us = [], [], []
+    for _ in range(args.repeat):
+        default_us.append(run(args.rounds))
+
+        logging.disable(logging.CRITICAL)
+        disabled_us.append(run(args.rounds))
+        logging.disable(logging.NOTSET)
+
+        guarded_save = dh.save
+        dh.save = _legacy_save
+        legacy_us.append(run(args.rounds))
+        dh.save = guarded_save
+    # the runs are dominated by file I/O, the minimum is the least noisy figure
+    default_us, disabled_us, legacy_us = min(default_us), min(disabled_us), min(legacy_us)
+
+    print(f"process_event, {len(EVENTS)} events x {args.rounds} rounds, root level {logging.getLevelName(logging.root.level)}")
+    print(f"  logging disabled     : {disabled_us:8.1f} us/event")
+    print(f"  default level        : {default_us:8.1f} us/event  ({(default_us / disabled_us - 1) * 100:+.1f}%)")
+    print(f"  unguarded debug dump : {legacy_us:8.1f} us/event  ({(legacy_us / disabled_us - 1) * 100:+.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
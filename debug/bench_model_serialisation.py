@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+bench_model_serialisation.py
+
+Round-trip check and micro-benchmark for the hand-written Body/Genus/Ring/CodexEntry/Atmosphere
+to_dict()/from_dict() pairs.
+
+* round trip: every body of every cache file must come back identical after
+  Body.from_dict(...).to_dict()
+* benchmark: the explicit to_dict() against the former dataclasses.asdict() based serialisation,
+  and the eager Body.from_dict() against the LazyBody used by Model.read_data_from_cache
+
+  python debug/bench_model_serialisation.py --cache-dir ~/.config/EDXD/cache
+  python debug/bench_model_serialisation.py                  # synthetic systems
+"""
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import random
+import sys
+import timeit
+from pathlib import Path
+
+# EDXD.globals parses sys.argv on import - keep the benchmark options away from it
+_ARGV, sys.argv = sys.argv[1:], sys.argv[:1]
+
+from EDXD.data_handler.model import Body, Genus, Atmosphere, LazyBody
+from EDXD.data_handler.planetary_surface_positioning_system import PSPSCoordinates
+
+from bench_body_memory import synthetic_system
+
+
+def _asdict_body(body: Body) -> dict:
+    """What _save_cache produced per body before the explicit to_dict() methods."""
+    def genus(g: Genus):
+        data = dataclasses.asdict(g)
+        if isinstance(g.pos_first, PSPSCoordinates):
+            data["pos_first"] = g.pos_first.to_dict()
+        if isinstance(g.pos_second, PSPSCoordinates):
+            data["pos_second"] = g.pos_second.to_dict()
+        return data
+
+    data = {f.name: getattr(body, f.name) for f in dataclasses.fields(body) if f.name != "body_id"}
+    data["bio_found"] = {k: genus(v) for k, v in body.bio_found.items()}
+    data["geo_found"] = {k: dataclasses.asdict(v) for k, v in body.geo_found.items()}
+    data["rings"] = {k: dataclasses.asdict(v) for k, v in body.rings.items()}
+    data["atmosphere"] = dataclasses.asdict(body.atmosphere) if isinstance(body.atmosphere, Atmosphere) else body.atmosphere
+    return data
+
+
+def load_systems(args) -> list[dict]:
+    if args.cache_dir:
+        return [json.loads(p.read_text()) for p in sorted(Path(args.cache_dir).expanduser().glob("*.json"))]
+    rnd = random.Random(args.seed)
+    return [synthetic_system(rnd, address) for address in range(args.systems)]
+
+
+def _contains(full, raw) -> bool:
+    """True if every key/value of raw survives in full - older caches may lack newer keys."""
+    if isinstance(raw, dict) and isinstance(full, dict):
+        return all(key in full and _contains(full[key], value) for key, value in raw.items())
+    return full == raw
+
+
+def round_trip(systems: list[dict]) -> int:
+    failures = 0
+    for system in systems:
+        for body_id, raw in system.get("bodies", {}).items():
+            first = Body.from_dict(body_id, raw).to_dict()
+            lazy = LazyBody(body_id, raw).to_dict()
+            if not (_contains(first, lazy) and _contains(lazy, raw)):
+                failures += 1
+                print(f"lazy body differs: {system.get('system_name')} / {body_id}")
+            second = Body.from_dict(body_id, first).to_dict()
+            # the first pass fills in defaults missing from older caches, after that it must be stable
+            if json.dumps(first, sort_keys=True) != json.dumps(second, sort_keys=True):
+                failures += 1
+                print(f"round trip mismatch: {system.get('system_name')} / {body_id}")
+            if not _contains(first, raw):
+                failures += 1
+                print(f"field lost or changed on load: {system.get('system_name')} / {body_id}")
+    return failures
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--systems", type=int, default=1_000, help="number of synthetic systems")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--cache-dir", help="use real cache files instead of synthetic systems")
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args(_ARGV)
+
+    systems = load_systems(args)
+    failures = round_trip(systems)
+    print(f"round trip: {len(systems)} systems, {failures} mismatches")
+
+    bodies = [Body.from_dict(body_id, raw) for system in systems for body_id, raw in system.get("bodies", {}).items()]
+    raws = [(body_id, raw) for system in systems for body_id, raw in system.get("bodies", {}).items()]
+
+    t_asdict = min(timeit.repeat(lambda: [_asdict_body(b) for b in bodies], number=1, repeat=args.repeat))
+    t_to_dict = min(timeit.repeat(lambda: [b.to_dict() for b in bodies], number=1, repeat=args.repeat))
+    t_from_dict = min(timeit.repeat(lambda: [Body.from_dict(i, r) for i, r in raws], number=1, repeat=args.repeat))
+    t_lazy = min(timeit.repeat(lambda: [LazyBody(i, r) for i, r in raws], number=1, repeat=args.repeat))
+    t_lazy_save = min(timeit.repeat(lambda: [LazyBody(i, r).to_dict() for i, r in raws], number=1, repeat=args.repeat))
+
+    n = len(bodies)
+    print(f"{n} bodies")
+    print(f"  asdict based   : {t_asdict / n * 1e6:7.2f} us/body")
+    print(f"  to_dict        : {t_to_dict / n * 1e6:7.2f} us/body  ({t_asdict / t_to_dict:.1f}x)")
+    print(f"  from_dict      : {t_from_dict / n * 1e6:7.2f} us/body")
+    print(f"  LazyBody       : {t_lazy / n * 1e6:7.2f} us/body  ({t_from_dict / t_lazy:.1f}x)")
+    print(f"  LazyBody+save  : {t_lazy_save / n * 1e6:7.2f} us/body  (nothing decoded)")
+
+
+if __name__ == "__main__":
+    main()
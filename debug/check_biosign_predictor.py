@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+check_biosign_predictor.py
+
+Replay synthetic systems into a Model from a journal thread while this (GUI) thread submits
+prediction requests to a BiosignPredictor on every refresh tick, as MainFrame does. Once a
+system is complete the predictions stored by the predictor - estimated with the topology
+copied into the request - must equal a synchronous estimate of the final bodies that derives
+its own topology.
+
+Reports how long the GUI thread spends per refresh for predictions and how long Model.lock is
+held - before, both were the whole estimate.
+
+  python debug/check_biosign_predictor.py --systems 40 --tick 0.005
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# EDXD.globals parses sys.argv on import - keep the benchmark options away from it
+_ARGV, sys.argv = sys.argv[1:], sys.argv[:1]
+
+import EDXD.data_handler.model as model_module
+from EDXD.data_handler.biosign_predictor import BiosignPredictor
+from EDXD.data_handler.helper.biosign_estimator import estimate_system_biosigns
+from EDXD.data_handler.model import Atmosphere, BodyPatch, Model
+
+STARS = [("K", "Va"), ("M", "V"), ("F", "Vab"), ("D", "VII")]
+PLANET_TYPES = ["High metal content body", "Rocky body", "Icy body", "Rocky ice body"]
+ATMOSPHERES = ["thin carbon dioxide atmosphere", "thin ammonia atmosphere", "thin sulphur dioxide atmosphere",
+               "thin water atmosphere", "thin argon atmosphere", "thin methane atmosphere"]
+
+
+def synthetic_patches(rnd: random.Random) -> list[BodyPatch]:
+    star_type, luminosity = rnd.choice(STARS)
+    patches = [BodyPatch("b_0", body_name="Synthetic A", body_type=star_type, luminosity=luminosity, is_star=True)]
+    for i in range(1, rnd.randint(8, 40)):
+        patches.append(BodyPatch(
+            f"b_{i}", body_name=f"Synthetic A {i}", body_type=rnd.choice(PLANET_TYPES),
+            landable=rnd.random() < 0.6, biosignals=rnd.choice([0, 0, 1, 2, 3, 5]),
+            atmosphere=Atmosphere(type="", raw=rnd.choice(ATMOSPHERES)), mean_temp=rnd.uniform(40, 500),
+            g_force=rnd.uniform(0.03, 0.6), pressure=rnd.uniform(0, 50000),
+            parents=[{"Star": 0}], parent_distance=rnd.uniform(1e9, 1e12),
+        ))
+    rnd.shuffle(patches)
+    return patches
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--systems", type=int, default=40)
+    ap.add_argument("--tick", type=float, default=0.005, help="seconds between refreshes")
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args(_ARGV)
+
+    model_module.CACHE_DIR = Path(tempfile.mkdtemp())
+    rnd = random.Random(args.seed)
+    model = Model()
+    predictor = BiosignPredictor(model, poll=0.05)
+    predictor.start()
+
+    mismatches = 0
+    submit_times, sync_times = [], []
+    for addr in range(1, args.systems + 1):
+        model.reset_system(f"Synthetic {addr}", addr)
+        patches = synthetic_patches(rnd)
+
+        def journal():
+            for patch in patches:
+                model.apply_patch(addr, patch)
+                time.sleep(rnd.uniform(0, args.tick))
+
+        feeder = threading.Thread(target=journal)
+        feeder.start()
+        while feeder.is_alive():
+            t0 = time.perf_counter()
+            predictor.submit()
+            submit_times.append(time.perf_counter() - t0)
+            time.sleep(args.tick)
+        feeder.join()
+        predictor.submit()
+
+        expected = estimate_system_biosigns(model.snapshot_bodies())
+        deadline = time.monotonic() + 5.0
+        while model.snapshot_biosign_predictions() != expected and time.monotonic() < deadline:
+            time.sleep(0.001)
+        if model.snapshot_biosign_predictions() != expected:
+            mismatches += 1
+            print(f"system {addr}: stored predictions differ from a synchronous estimate")
+
+        t0 = time.perf_counter()
+        with model.lock:                            # the former refresh path, memo cold for this system
+            estimate_system_biosigns(model.bodies, topology=model.topology)
+        sync_times.append(time.perf_counter() - t0)
+
+    print(f"{args.systems} systems, {mismatches} mismatches, {predictor.submitted} requests, "
+          f"{predictor.dropped} superseded, {predictor.estimated} estimated")
+    print(f"  GUI thread per refresh, predictor  : {sum(submit_times) / len(submit_times) * 1e3:7.3f} ms (max {max(submit_times) * 1e3:.3f})")
+    print(f"  GUI thread per refresh, synchronous: {sum(sync_times) / len(sync_times) * 1e3:7.3f} ms (max {max(sync_times) * 1e3:.3f}), Model.lock held throughout")
+    sys.exit(min(mismatches, 255))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+check_biosign_priors.py
+
+Write a synthetic system cache whose bodies carry species drawn from hidden per-bin rates,
+some of them with signals left unidentified. Build the priors from the first half of the
+systems, serially and on a process pool, round-trip them through the artifact and score the
+species of the other half: Brier score of the plain heuristic against the blended one, and
+the cost of a blended lookup.
+
+  python debug/check_biosign_priors.py --systems 2000 --workers 4
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# EDXD.globals parses sys.argv on import - keep the benchmark options away from it
+_ARGV, sys.argv = sys.argv[1:], sys.argv[:1]
+
+import EDXD.data_handler.helper.data_helper as dh
+from EDXD.data_handler.helper.bio_helper import SPECIES
+from EDXD.data_handler.helper.biosign_estimator import calculate_probabilities
+from EDXD.data_handler.helper.biosign_priors import build_priors, load_priors, save_priors, PRIORS_NAME
+from EDXD.data_handler.helper.system_params import PlanetType
+
+PLANET_TYPES = ["Rocky body", "High metal content body", "Icy body", "Rocky ice body"]
+ATMOSPHERES = ["thin carbon dioxide atmosphere", "thin ammonia atmosphere", "thin argon atmosphere", "None"]
+
+
+def synthetic_bins(rnd: random.Random, n_bins: int):
+    """(planet type, atmosphere, mean temp, gravity, {species: rate}) - the hidden truth."""
+    names = list(SPECIES)
+    bins = []
+    for _ in range(n_bins):
+        rates = {name: rnd.betavariate(0.6, 1.4) for name in rnd.sample(names, rnd.randint(3, 8))}
+        bins.append((rnd.choice(PLANET_TYPES), rnd.choice(ATMOSPHERES), rnd.uniform(60, 400), rnd.uniform(0.02, 1.5), rates))
+    return bins
+
+
+def synthetic_body(rnd: random.Random, hidden) -> dict:
+    planet_type, atmosphere, temp, gravity, rates = hidden
+    species = [name for name, rate in rates.items() if rnd.random() < rate] or [rnd.choice(list(rates))]
+    identified = species if rnd.random() < 0.8 else species[:-1]       # not everything gets scanned
+    return {
+        "body_type"     : planet_type,
+        "atmosphere"    : {"type": None, "raw": atmosphere, "composition": None},
+        "mean_temp"     : temp,
+        "g_force"       : gravity,
+        "pressure"      : 1000.0,
+        "biosignals"    : len(species),
+        "bio_found"     : {f"$Codex_{i}": {"species_localised": name} for i, name in enumerate(identified)},
+        "_truth"        : species,
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--systems", type=int, default=2_000)
+    ap.add_argument("--bins", type=int, default=60)
+    ap.add_argument("--workers", type=int, default=4)
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args(_ARGV)
+
+    rnd = random.Random(args.seed)
+    hidden = synthetic_bins(rnd, args.bins)
+    mismatches = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        train_dir = Path(tmp) / "system-data"
+        train_dir.mkdir()
+        test_bodies = []
+        for n in range(args.systems):
+            bodies = {}
+            for i in range(rnd.randint(1, 4)):
+                which = rnd.randrange(len(hidden))
+                body = synthetic_body(rnd, hidden[which])
+                bodies[f"b_{i}"] = body
+                if n % 2:
+                    test_bodies.append((which, body))
+            if not n % 2:
+                dh.save(train_dir / f"{n}.json", {"bodies": bodies})
+
+        t0 = time.perf_counter()
+        serial = build_priors(train_dir, workers=1)
+        t_serial = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        parallel = build_priors(train_dir, workers=args.workers)
+        t_parallel = time.perf_counter() - t0
+        artifact = Path(tmp) / PRIORS_NAME
+        save_priors(serial, artifact)
+        loaded = load_priors(artifact)
+        if serial.to_dict() != parallel.to_dict() or loaded is None or loaded.to_dict() != serial.to_dict():
+            mismatches += 1
+            print("serial, pool and artifact priors differ")
+        print(f"{serial.systems} systems, {serial.bodies} fully identified bodies, {len(serial.bins)} bins, "
+              f"artifact {artifact.stat().st_size / 1024:.1f} KiB, {os.cpu_count()} cpu(s)")
+        print(f"  build serial   : {t_serial * 1e3:8.1f} ms")
+        print(f"  build {args.workers} workers: {t_parallel * 1e3:8.1f} ms")
+
+    # every species of the hidden bin is a candidate; the truth is what the body carries
+    brier_heuristic = brier_blended = rows = 0
+    t_lookup = 0.0
+    for which, body in test_bodies:
+        planet_type, atmosphere, temp, gravity, rates = hidden[which]
+        names = list(rates)
+        scores = calculate_probabilities(names, PlanetType(planet_type), 0.01, temp, gravity)
+        t0 = time.perf_counter()
+        blended = loaded.blend(loaded.key(planet_type, atmosphere, temp, gravity), names, scores)
+        t_lookup += time.perf_counter() - t0
+        for name, heuristic, prob in zip(names, scores, blended):
+            found = name in body["_truth"]
+            brier_heuristic += (heuristic - found) ** 2
+            brier_blended += (prob - found) ** 2
+            rows += 1
+    print(f"{len(test_bodies)} held-out bodies, {rows} candidate species")
+    print(f"  Brier score heuristic : {brier_heuristic / rows:.4f}")
+    print(f"  Brier score blended   : {brier_blended / rows:.4f}")
+    print(f"  blend per body        : {t_lookup / len(test_bodies) * 1e6:6.2f} us")
+    if brier_blended > brier_heuristic:
+        mismatches += 1
+    sys.exit(min(mismatches, 255))
+
+
+if __name__ == "__main__":
+    main()
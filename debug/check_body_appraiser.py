@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+check_body_appraiser.py
+
+Golden check of body_appraiser against its former if-chain implementation (kept below): every
+star type and every planet type of the encoding tables, crossed with terraform states, first
+discoverer / first mapper flags, a spread of masses (0 for belts, missing, None) and both the
+scanned and the mapped value. appraise_values() has to match both appraise_body() calls and
+estimate_value() the former calculate_estimated_value(). Also times a revaluation pass.
+
+  python debug/check_body_appraiser.py
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import sys
+import time
+
+# EDXD.globals parses sys.argv on import - keep the benchmark options away from it
+_ARGV, sys.argv = sys.argv[1:], sys.argv[:1]
+
+from EDXD.data_handler.helper.body_appraiser import (
+    appraise_body, appraise_values, estimate_value, star_types, body_types, terraform_states,
+    encode_body_type, encode_star_type, encode_terraform_state,
+)
+
+MASSES = [None, 0, 0.0001, 0.01, 0.3, 1, 5.2, 100, 3000, "missing"]
+FLAGS = [None, True, False, "missing"]
+
+
+def scan_events():
+    for star_type, mass, discovered, mapped in itertools.product(star_types, MASSES, FLAGS, FLAGS):
+        yield _event({"StarType": star_type}, mass, discovered, mapped)
+    planet_classes = list(body_types) + [None]
+    for planet_class, terraform, mass, discovered, mapped in itertools.product(
+            planet_classes, ["missing", ""] + list(terraform_states), MASSES, FLAGS, FLAGS):
+        evt = _event({} if planet_class is None else {"PlanetClass": planet_class}, mass, discovered, mapped)
+        if terraform != "missing":
+            evt["TerraformState"] = terraform
+        yield evt
+
+
+def _event(evt: dict, mass, discovered, mapped) -> dict:
+    for key, value in (("MassEM", mass), ("WasDiscovered", discovered), ("WasMapped", mapped)):
+        if value != "missing":
+            evt[key] = value
+    return evt
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--repeat", type=int, default=5, help="passes over all events for the timing")
+    args = ap.parse_args(_ARGV)
+
+    events = list(scan_events())
+    mismatches = 0
+    for evt in events:
+        expected = (legacy_appraise_body(evt, just_scanned_value=True), legacy_appraise_body(evt, just_scanned_value=False))
+        got = (appraise_body(evt, just_scanned_value=True), appraise_body(evt, just_scanned_value=False))
+        if expected != got or appraise_values(evt) != expected:
+            mismatches += 1
+            print(f"differs: {evt} expected {expected} got {got} / {appraise_values(evt)}")
+
+    # the pure signature against the former entry point, on encoded values
+    pure = 0
+    for is_star, specific_type in [(True, t) for t in set(star_types.values())] + [(False, t) for t in set(body_types.values()) | {None}]:
+        for mass, terraform_state, first_discoverer, first_mapper, have_mapped in itertools.product(
+                [None, 0, 0.5, 12], [None, 0, 1, 2, 3], (False, True), (False, True), (False, True)):
+            options = {'haveMapped': have_mapped, 'efficiencyBonus': True,
+                       'isFirstDiscoverer': first_discoverer, 'isFirstMapper': first_mapper}
+            expected = legacy_calculate_estimated_value('Star' if is_star else 'Planet', specific_type, mass, terraform_state, options)
+            pure += 1
+            if estimate_value(is_star, specific_type, mass, terraform_state, first_discoverer, first_mapper, have_mapped) != expected:
+                mismatches += 1
+                print(f"estimate_value differs: {is_star} {specific_type} {mass} {terraform_state} {first_discoverer} {first_mapper} {have_mapped}")
+    print(f"{len(events)} scan events, {pure} encoded combinations, {mismatches} mismatches")
+
+    t0 = time.perf_counter()
+    for _ in range(args.repeat):
+        for evt in events:
+            legacy_appraise_body(evt, just_scanned_value=True)
+            legacy_appraise_body(evt, just_scanned_value=False)
+    t_legacy = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for _ in range(args.repeat):
+        for evt in events:
+            appraise_values(evt)
+    t_values = time.perf_counter() - t0
+    n = len(events) * args.repeat
+    print(f"  scanned + mapped value, former appraiser : {t_legacy / n * 1e6:6.2f} us/scan")
+    print(f"  scanned + mapped value, appraise_values  : {t_values / n * 1e6:6.2f} us/scan  ({t_legacy / t_values:.1f}x)")
+    sys.exit(min(mismatches, 255))
+
+
+# ---------------------------------------------------------------------------
+# the former appraiser, verbatim apart from the legacy_ prefix (encoders are unchanged)
+# ---------------------------------------------------------------------------
+def legacy_appraise_body(body_info, just_scanned_value=True):
+    if "StarType" in body_info:
+        main_type = 'Star'
+        specific_type = encode_star_type(body_info)
+    else:
+        # Planet
+        main_type = 'Planet'
+        specific_type = encode_body_type(body_info)
+
+    if "MassEM" in body_info:
+        mass = body_info['MassEM']
+    else:
+        mass = 0  # belts don't have a mass attribute
+
+    terraform_state = encode_terraform_state(body_info)
+
+    first_discoverer = "WasDiscovered" in body_info.keys()
+    if first_discoverer:
+        first_discoverer = not body_info['WasDiscovered']
+
+    first_mapper = "WasMapped" in body_info.keys()
+    if first_mapper:
+        first_mapper = not body_info['WasMapped']
+
+    options = {
+        'haveMapped': not just_scanned_value,  # Always indicate we mapped it so we can tell the max worth
+        'efficiencyBonus': True,
+#        'isFirstDiscoverer': not body_info['WasDiscovered'],
+        'isFirstDiscoverer': first_discoverer,
+        'isFirstMapper': first_mapper,
+    }
+
+    return legacy_calculate_estimated_value(main_type, specific_type, mass, terraform_state, options)
+
+
+def legacy_calculate_estimated_star_value(specific_type, mass):
+    value = 1200
+
+    # White Dwarf Star
+    if specific_type in [51, 501, 502, 503, 504, 505, 506, 507, 508, 509, 510, 511, 512, 513, 514]:
+        value = 14057
+
+    # Neutron Star, Black Hole
+    if specific_type in [91, 92]:
+        value = 22628
+
+    # Super-massive Black Hole
+    if specific_type in [93]:
+        # this is applying the same scaling to the 3.2 value as a normal black hole, not confirmed in game
+        value = 33.5678
+
+    return round(value + (mass * value / 66.25))
+
+
+def legacy_calculate_planet_bonus(specific_type, terraform_state):
+    bonus = 0
+
+    if terraform_state is not None and terraform_state > 0:
+        bonus = 93328
+
+    # Metal-rich body
+    if specific_type in [1]:
+        if terraform_state is not None and terraform_state > 0:
+            bonus = 65631
+
+    # High metal content world / Class II gas giant
+    if specific_type in [2, 72]:
+        if terraform_state is not None and terraform_state > 0:
+            bonus = 100677
+
+    # Earth-like world / Water world
+    if specific_type in [31, 41]:
+        if terraform_state is not None and terraform_state > 0:
+            bonus = 116295
+
+        if specific_type == 31:  # Earth Like...
+            bonus = 116295
+
+    return bonus
+
+
+def legacy_calculate_planet_value(specific_type):
+    value = 300
+
+    # Metal-rich body
+    if specific_type in [1]:
+        value = 21790
+
+    # Ammonia world
+    if specific_type in [51]:
+        value = 96932
+
+    # Class I gas giant
+    if specific_type in [71]:
+        value = 1656
+
+    # High metal content world / Class II gas giant
+    if specific_type in [2, 72]:
+        value = 9654
+
+    # Earth-like world / Water world
+    if specific_type in [31, 41]:
+        value = 64831
+
+    return value
+
+
+def legacy_calculate_estimated_planet_value(specific_type, mass, terraform_state, options):
+    value = legacy_calculate_planet_value(specific_type)
+    bonus = legacy_calculate_planet_bonus(specific_type, terraform_state)
+
+    # CALCULATION
+    q = 0.56591828
+    value = value + bonus
+    map_multiplier = 1.0
+
+    if options['haveMapped']:
+        map_multiplier = 3.3333333333
+
+        if options['isFirstDiscoverer'] and options['isFirstMapper']:
+            map_multiplier = 3.699622554
+
+        elif not options['isFirstDiscoverer'] and options['isFirstMapper']:
+            map_multiplier = 8.0956
+
+        if options['efficiencyBonus']:
+            map_multiplier *= 1.25
+
+    value = max((value + (value * pow(mass, 0.2) * q)) * map_multiplier, 500)
+
+    if options['isFirstDiscoverer']:
+        value *= 2.6
+
+    return round(value)
+
+
+def legacy_calculate_estimated_value(main_type, specific_type, mass, terraform_state, options):
+    if mass is None:
+        mass = 1
+
+    if main_type == 'Star' or main_type == 1:
+            return legacy_calculate_estimated_star_value(specific_type, mass)
+
+    if mass == 0:
+            options['haveMapped'] = True
+            return legacy_calculate_estimated_planet_value(specific_type, mass, terraform_state, options)
+
+    if main_type == 'Planet' or main_type == 2:
+        return legacy_calculate_estimated_planet_value(specific_type, mass, terraform_state, options)
+
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+check_same_system_events.py
+
+Feed journal events of one synthetic system through a JournalController, as the journal
+watcher does. Every event with a SystemAddress calls Model.reset_system - for the current
+system that must leave the bodies alone: events that do not touch a body keep every body
+revision, the model revision and the stored biosign predictions, and an event about one body
+only moves the revision of that body. A jump to another system starts over; jumping back
+reads the bodies from the cache again.
+
+After every event the render key BodyDetails takes from Model.get_body_revision is taken for
+each body, as MainFrame does on a refresh: a detail window showing a body that the event did
+not touch must skip its render.
+
+  python debug/check_same_system_events.py --planets 12
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+# EDXD.globals parses sys.argv on import - keep the check options away from it
+_ARGV, sys.argv = sys.argv[1:], sys.argv[:1]
+
+import EDXD.data_handler.journal_controller as controller_module
+import EDXD.data_handler.model as model_module
+from EDXD.data_handler.journal_controller import JournalController
+from EDXD.data_handler.model import Model
+from EDXD.globals import BODY_ID_PREFIX as bip
+from EDXD.gui.body_details import BodyDetails
+
+SYSTEM, OTHER = 1234567, 7654321
+NAME = "Synthetic"
+
+
+def arrival_events(rnd: random.Random, planets: int) -> list[dict]:
+    events = [
+        {"event": "FSDJump", "StarSystem": NAME, "SystemAddress": SYSTEM, "Body": NAME, "BodyID": 0, "BodyType": "Star"},
+        {"event": "Scan", "ScanType": "AutoScan", "BodyName": NAME, "BodyID": 0, "StarSystem": NAME, "SystemAddress": SYSTEM,
+         "DistanceFromArrivalLS": 0.0, "StarType": "K", "Luminosity": "Va", "StellarMass": 0.7, "Radius": 5e8,
+         "SurfaceTemperature": 4500.0, "WasDiscovered": True, "WasMapped": False},
+    ]
+    for i in range(1, planets + 1):
+        events.append({
+            "event": "Scan", "ScanType": "Detailed", "BodyName": f"{NAME} {i}", "BodyID": i, "StarSystem": NAME,
+            "SystemAddress": SYSTEM, "Parents": [{"Star": 0}], "DistanceFromArrivalLS": rnd.uniform(10, 5000),
+            "PlanetClass": rnd.choice(["High metal content body", "Rocky body", "Icy body"]),
+            "Atmosphere": "thin carbon dioxide atmosphere", "AtmosphereType": "CarbonDioxide",
+            "AtmosphereComposition": [{"Name": "CarbonDioxide", "Percent": 99.0}],
+            "Landable": True, "MassEM": rnd.uniform(0.01, 0.3), "Radius": rnd.uniform(1e6, 4e6),
+            "SurfaceTemperature": rnd.uniform(150, 250), "SurfacePressure": rnd.uniform(100, 5000),
+            "SemiMajorAxis": rnd.uniform(1e9, 1e12), "WasDiscovered": True, "WasMapped": False, "WasFootfalled": False,
+        })
+        events.append({
+            "event": "FSSBodySignals", "BodyName": f"{NAME} {i}", "BodyID": i, "SystemAddress": SYSTEM,
+            "Signals": [{"Type": "$SAA_SignalType_Biological;", "Count": rnd.randint(1, 4)}],
+        })
+    return events
+
+
+def quiet_events(planets: int) -> list[dict]:
+    """Events with the SystemAddress of the current system that change no body."""
+    return [
+        {"event": "FSSDiscoveryScan", "Progress": 1.0, "BodyCount": planets + 1, "NonBodyCount": 0,
+         "SystemName": NAME, "SystemAddress": SYSTEM},
+        {"event": "FSSAllBodiesFound", "SystemName": NAME, "SystemAddress": SYSTEM, "Count": planets + 1},
+        {"event": "SupercruiseExit", "StarSystem": NAME, "SystemAddress": SYSTEM, "Body": f"{NAME} 1", "BodyID": 1, "BodyType": "Planet"},
+        {"event": "SupercruiseEntry", "StarSystem": NAME, "SystemAddress": SYSTEM},
+    ]
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--planets", type=int, default=12)
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args(_ARGV)
+
+    scratch = Path(tempfile.mkdtemp())
+    model_module.CACHE_DIR = scratch
+    controller_module.SHIP_STATUS_FILE = scratch / "ship_status.json"
+    rnd = random.Random(args.seed)
+    model = Model()
+    controller = JournalController(q=None, model=model)
+    details = BodyDetails.__new__(BodyDetails)     # no window - only its render key is taken
+    details.parent = SimpleNamespace(prefs={})
+    filters = {"Iron": True, "Nickel": False}
+    rendered: dict[str, tuple] = {}                 # body_id -> key of the last render
+    renders: dict[str, int] = {}                    # body_id -> renders the last feed() caused
+
+    def refresh():
+        for body_id in model.snapshot_body_revisions():
+            body_revision = model.get_body_revision(body_id)
+            key = details._body_key(model.snapshot_bodies().get(body_id), filters, body_revision)
+            if key is None or key != rendered.get(body_id):
+                rendered[body_id] = key
+                renders[body_id] = renders.get(body_id, 0) + 1
+
+    def feed(events: list[dict]):
+        renders.clear()
+        for evt in events:
+            controller.process_event(evt=evt, update_gui=False, set_timestamp=False)
+            refresh()
+
+    mismatches = 0
+
+    def expect(ok: bool, what: str):
+        nonlocal mismatches
+        if not ok:
+            mismatches += 1
+            print(f"FAIL: {what}")
+
+    feed(arrival_events(rnd, args.planets))
+    predictions = {bip + "1": [{"name": "marker"}]}
+    model.biosign_predictions = predictions
+    revisions, revision = model.snapshot_body_revisions(), model.revision
+    bodies = model.snapshot_bodies()
+    expect(len(revisions) == args.planets + 1, f"{len(revisions)} body revisions after arrival, expected {args.planets + 1}")
+
+    feed(quiet_events(args.planets))
+    expect(model.snapshot_body_revisions() == revisions, "events without a body changed body revisions")
+    expect(model.revision == revision, f"events without a body moved the model revision {revision} -> {model.revision}")
+    expect(model.snapshot_biosign_predictions() is predictions, "events without a body dropped the biosign predictions")
+    expect(model.snapshot_bodies() == bodies, "events without a body changed the bodies")
+    expect(not renders, f"events without a body re-rendered {sorted(renders)}")
+
+    feed([{"event": "SAAScanComplete", "BodyName": f"{NAME} 2", "BodyID": 2, "SystemAddress": SYSTEM,
+           "ProbesUsed": 4, "EfficiencyTarget": 6}])
+    changed = {body_id for body_id, rev in model.snapshot_body_revisions().items() if revisions.get(body_id) != rev}
+    expect(changed == {bip + "2"}, f"mapping one body moved the revisions of {sorted(changed)}")
+    expect(renders == {bip + "2": 1}, f"mapping one body re-rendered {sorted(renders)}")
+    revisions = model.snapshot_body_revisions()
+
+    feed([{"event": "FSDJump", "StarSystem": "Elsewhere", "SystemAddress": OTHER, "Body": "Elsewhere", "BodyID": 0, "BodyType": "Star"}])
+    expect(set(model.snapshot_body_revisions()) == {bip + "0"}, "a jump to another system kept the bodies of the last one")
+    expect(not model.snapshot_biosign_predictions(), "a jump to another system kept the biosign predictions")
+
+    feed([{"event": "FSDJump", "StarSystem": NAME, "SystemAddress": SYSTEM, "Body": NAME, "BodyID": 0, "BodyType": "Star"}])
+    expect(set(model.snapshot_body_revisions()) == set(revisions), "jumping back did not read the bodies from the cache")
+
+    print(f"{args.planets + 1} bodies, {len(quiet_events(args.planets))} events without a body, {mismatches} mismatches")
+    sys.exit(min(mismatches, 255))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,486 @@
+#!/usr/bin/env python3
+"""
+check_species_rules.py
+
+Parity check of the table driven estimate_biosigns (species_rules.SPECIES_INDEX) against the
+former hand-written if-cascade, kept below as legacy_estimate_biosigns. The only intended
+difference is fixed in the reference too: the two B-class Roseum anemones were added with
+list.extend() and came out as single letters.
+
+The grid covers every planet type and atmosphere, temperatures and gravities on and around each
+rule boundary, and cycles volcanism, distance, system flags and parent stars through it. Every
+mismatch is printed (up to --show), the exit code is the number of mismatching inputs.
+
+  python debug/check_species_rules.py
+  python debug/check_species_rules.py --random 200000
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import random
+import sys
+import time
+from typing import Dict, List, Optional
+
+# EDXD.globals parses sys.argv on import - keep the benchmark options away from it
+_ARGV, sys.argv = sys.argv[1:], sys.argv[:1]
+
+from EDXD.data_handler.helper.biosign_estimator import Star, estimate_biosigns
+from EDXD.data_handler.helper.species_rules import SPECIES_RULES, STR_LIST_NONE
+from EDXD.data_handler.helper.system_params import (
+    StarClass, StarLuminosity, PlanetType,
+    PT_GROUP_HMC_ROCKY, PT_GROUP_ICE,
+    SC_WHITE_DWARFS
+)
+
+ATMOSPHERES = [
+    "None", "", "thin carbon dioxide atmosphere", "thin carbon dioxide rich atmosphere", "thin ammonia atmosphere",
+    "thin water atmosphere", "thin water rich atmosphere", "thin sulphur dioxide atmosphere", "thin sulfur dioxide atmosphere",
+    "thin methane atmosphere", "thin methane rich atmosphere", "thin argon atmosphere", "thin argon rich atmosphere",
+    "thin neon atmosphere", "thin neon rich atmosphere", "thin nitrogen atmosphere", "thin oxygen atmosphere",
+    "thin helium atmosphere", "thin ammonia and oxygen atmosphere", "carbon dioxide atmosphere",
+    "thick ammonia atmosphere", "hot thin carbon dioxide atmosphere", "hot thick water atmosphere",
+]
+VOLCANISM = [
+    "None", "", "minor water geysers volcanism", "major water magma volcanism", "carbon dioxide geysers volcanism",
+    "methane magma volcanism", "nitrogen magma volcanism", "ammonia magma volcanism", "minor silicate magma volcanism",
+    "silicate vapour geysers volcanism", "metallic magma volcanism", "rocky magma volcanism", "helium geysers volcanism",
+    "water and ammonia geysers volcanism",
+]
+GRAVITIES = [None, 0.0, 0.05, 0.16, 0.161, 0.2, 0.27, 0.275, 0.28, 0.281, 0.5, 1.5]
+DISTANCES = [None, 0.0, 500.0, 2500.0, 2501.0, 12000.0, 12001.0, 50000.0]
+STAR_CLASSES = [StarClass.O, StarClass.B, StarClass.A, StarClass.F, StarClass.G, StarClass.K, StarClass.M, StarClass.S,
+                StarClass.N, StarClass.BlackHole, StarClass.D, StarClass.DA, StarClass.L, StarClass.TTS, None]
+LUMINOSITIES = [StarLuminosity.I, StarLuminosity.II, StarLuminosity.III, StarLuminosity.IV, StarLuminosity.V,
+                StarLuminosity.VI, StarLuminosity.VII, None]
+
+
+def _temperatures() -> List[float]:
+    """Every temperature bound used by a rule, plus values just inside and outside it."""
+    bounds = {0.0, 20.0, 100.0, 600.0}
+    for rule in SPECIES_RULES:
+        if rule.temp is not None:
+            bounds.update(b for b in (rule.temp.lo, rule.temp.hi) if b is not None)
+    return sorted({t + d for t in bounds for d in (-0.5, 0.0, 0.5)})
+
+
+def _parent_star_sets() -> List[Dict[int, Star]]:
+    singles = [{0: Star(0, sc, lum)} for sc in STAR_CLASSES for lum in LUMINOSITIES]
+    pairs = [{0: Star(0, StarClass.A, StarLuminosity.III), 1: Star(1, StarClass.B, StarLuminosity.V)},
+             {0: Star(0, StarClass.O, StarLuminosity.I), 2: Star(2, StarClass.K, StarLuminosity.V)},
+             {0: Star(0, StarClass.M, StarLuminosity.V), 1: Star(1, StarClass.DA, StarLuminosity.VII)}]
+    return singles + pairs + [{}]
+
+
+FLAG_SETS = [
+    dict(),
+    dict(in_nebula=True),
+    dict(system_has_earth_like=True),
+    dict(system_has_ammonia_world=True),
+    dict(system_has_gas_giant_with_water_life=True, in_nebula=True),
+    dict(system_has_water_giant=True, system_has_gas_giant_with_ammonia_life=True),
+]
+
+
+def grid():
+    """Full grid over planet type x atmosphere x temperature x gravity, the rest is cycled through."""
+    volc, dist, flags, stars = (itertools.cycle(v) for v in (VOLCANISM, DISTANCES, FLAG_SETS, _parent_star_sets()))
+    for pt, atm, temp, g in itertools.product(PlanetType, ATMOSPHERES, _temperatures(), GRAVITIES):
+        yield dict(planet_type=pt, atmosphere=atm, mean_temp_k=temp, gravity=g, volcanism=next(volc),
+                   distance_from_star_ls=next(dist), parent_stars=next(stars), **next(flags))
+
+
+def random_inputs(n: int, seed: int):
+    rnd = random.Random(seed)
+    temps, stars = _temperatures(), _parent_star_sets()
+    for _ in range(n):
+        yield dict(planet_type=rnd.choice(list(PlanetType)), atmosphere=rnd.choice(ATMOSPHERES),
+                   mean_temp_k=rnd.choice(temps) if rnd.random() < 0.5 else rnd.uniform(20, 600),
+                   gravity=rnd.choice(GRAVITIES) if rnd.random() < 0.5 else rnd.uniform(0.01, 0.4),
+                   volcanism=rnd.choice(VOLCANISM), distance_from_star_ls=rnd.choice(DISTANCES),
+                   parent_stars=rnd.choice(stars), **rnd.choice(FLAG_SETS))
+
+
+def _call(fn, kwargs):
+    try:
+        return fn(**kwargs)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--random", type=int, default=50_000, help="random inputs on top of the grid")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--show", type=int, default=10, help="mismatches to print")
+    args = ap.parse_args(_ARGV)
+
+    cases = list(grid()) + list(random_inputs(args.random, args.seed))
+
+    t0 = time.perf_counter()
+    expected = [_call(legacy_estimate_biosigns, kw) for kw in cases]
+    t_legacy = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    actual = [_call(estimate_biosigns, kw) for kw in cases]
+    t_rules = time.perf_counter() - t0
+
+    mismatches = 0
+    for kw, exp, act in zip(cases, expected, actual):
+        if exp != act:
+            mismatches += 1
+            if mismatches <= args.show:
+                print(f"MISMATCH {kw}\n  cascade: {exp}\n  rules  : {act}")
+
+    n = len(cases)
+    print(f"{n} inputs, {sum(1 for e in expected if e)} with candidates, {mismatches} mismatches")
+    print(f"  if-cascade  : {t_legacy / n * 1e6:7.2f} us/call")
+    print(f"  rule index  : {t_rules / n * 1e6:7.2f} us/call  ({t_legacy / t_rules:.1f}x)")
+    sys.exit(min(mismatches, 255))
+
+
+# ---------------------------------------------------------------------------
+# the former if-cascade, verbatim apart from the extend() fix
+# ---------------------------------------------------------------------------
+def legacy_estimate_biosigns(
+        planet_type: PlanetType, atmosphere: str, mean_temp_k: float,
+        volcanism: Optional[str] = None, gravity: Optional[float] = None,
+        in_nebula: bool = False, system_has_earth_like: bool = False,
+        system_has_ammonia_world: bool = False, system_has_water_giant: bool = False,
+        system_has_gas_giant_with_water_life: bool = False,
+        system_has_gas_giant_with_ammonia_life: bool = False,
+        distance_from_star_ls: Optional[float] = None,
+        parent_stars: Optional[Dict[int, Star]] = None,
+) -> List[str]:
+    possible_species: List[str] = []
+
+    for parent_star_id, parent_star in parent_stars.items():
+        star_class = parent_star.star_class_enum
+        star_luminosity = parent_star.star_luminosity_enum
+
+        # Aleoida
+        if "thin" in atmosphere and planet_type in PT_GROUP_HMC_ROCKY and gravity is not None and gravity <= 0.28:
+            if "carbon dioxide" in atmosphere:
+                if 175 <= mean_temp_k <= 180:
+                    possible_species.append("Aleoida Arcus")
+                if 179 <= mean_temp_k <= 190:
+                    possible_species.append("Aleoida Coronamus")
+                if 190 <= mean_temp_k <= 197:
+                    possible_species.append("Aleoida Gravis")
+            if "ammonia" in atmosphere:
+                if 152 <= mean_temp_k <= 177:
+                    possible_species.append("Aleoida Laminiae")
+                if 170 <= mean_temp_k <= 177:
+                    possible_species.append("Aleoida Spica")
+
+        # Amphora Plant
+        if (
+                atmosphere in {None, "", "None", "none"} and StarClass.A == star_class and
+                (
+                        system_has_earth_like or
+                        system_has_ammonia_world or
+                        system_has_water_giant or
+                        system_has_gas_giant_with_water_life or
+                        system_has_gas_giant_with_ammonia_life
+                )
+        ):
+            possible_species.append("Amphora Plant")
+
+        # Anemone (Mapped to Clypeus genus)
+        if star_class in [StarClass.A, StarClass.B, StarClass.O]:
+            if star_class == StarClass.A:
+                if star_luminosity == StarLuminosity.III:
+                    if planet_type == PlanetType.ROCKY: possible_species.append("Croceum Anemone")
+                    if planet_type in [PlanetType.METAL_RICH, PlanetType.HMC]: possible_species.append("Rubeum Bioluminescent Anemone")
+            if star_class == StarClass.B:
+                if star_luminosity in [StarLuminosity.I, StarLuminosity.II, StarLuminosity.III] and planet_type in [PlanetType.METAL_RICH, PlanetType.HMC]:
+                    possible_species.append("Roseum Bioluminescent Anemone")  # was extend(), which added single letters
+                if star_luminosity in [StarLuminosity.I, StarLuminosity.II, StarLuminosity.III] and planet_type in [PlanetType.ROCKY]:
+                    possible_species.append("Roseum Anemone")  # was extend(), which added single letters
+                if star_luminosity in [StarLuminosity.IV, StarLuminosity.V] and planet_type in [PlanetType.METAL_RICH, PlanetType.HMC]:
+                    possible_species.append("Blatteum Bioluminescent Anemone")
+                if star_luminosity in [StarLuminosity.IV, StarLuminosity.V] and planet_type in [PlanetType.ROCKY]:
+                    possible_species.append("Luteolum Anemone")
+                if star_luminosity == StarLuminosity.VI:
+                    if planet_type in [PlanetType.METAL_RICH, PlanetType.HMC]: possible_species.append("Rubeum Bioluminescent Anemone")
+                    if planet_type == PlanetType.ROCKY: possible_species.append("Croceum Anemone")
+            if star_class == StarClass.O:
+                if planet_type in [PlanetType.ROCKY_ICE, PlanetType.ICY]:
+                    possible_species.append("Puniceum Anemone")
+                if planet_type in [PlanetType.METAL_RICH, PlanetType.HMC, PlanetType.ROCKY]:
+                    possible_species.append("Prasinum Bioluminescent Anemone")
+
+        # Bacterium
+        if "thin" in atmosphere:
+            if "helium" in atmosphere:
+                possible_species.append("Bacterium Nebulus")
+            if "neon" in atmosphere:
+                if any(opt in volcanism for opt in ("nitrogen", "ammonia")):
+                    possible_species.append("Bacterium Omentum")
+                elif any(opt in volcanism for opt in ("carbon", "methane")):
+                    possible_species.append("Bacterium Scopulum")
+                elif "water" in volcanism:
+                    possible_species.append("Bacterium Verrata")
+                else:
+                    possible_species.append("Bacterium Acies")
+            if "methane" in atmosphere:
+                possible_species.append("Bacterium Bullaris")
+            if "argon" in atmosphere:
+                possible_species.append("Bacterium Vesicula")
+            if "nitrogen" in atmosphere:
+                possible_species.append("Bacterium Informem")
+            if "oxygen" in atmosphere:
+                possible_species.append("Bacterium Volu")
+            if "ammonia" in atmosphere:
+                possible_species.append("Bacterium Alcyoneum")
+            if "carbon" in atmosphere:
+                possible_species.append("Bacterium Aurasus")
+            if any(opt in atmosphere for opt in ("water", "sulfur")):
+                possible_species.append("Bacterium Cerbrus")
+            if any(opt in volcanism for opt in ("helium", "metallic", "silicate")):
+                possible_species.append("Bacterium Tela")
+
+        # Bark Mound
+        if (atmosphere in STR_LIST_NONE
+                and (in_nebula or (volcanism not in STR_LIST_NONE))):
+            possible_species.append("Bark Mound")
+
+        # Brain Tree
+        if volcanism not in STR_LIST_NONE and atmosphere in STR_LIST_NONE:
+            if 200 <= mean_temp_k <= 500:
+                possible_species.append("Brain Tree Roseum")
+            if system_has_earth_like or system_has_gas_giant_with_water_life:
+                if planet_type in [PlanetType.METAL_RICH, PlanetType.HMC] and 300 <= mean_temp_k <= 500:
+                    possible_species.append("Brain Tree Aureum")
+                if planet_type == PlanetType.ROCKY and 200 <= mean_temp_k <= 300:
+                    possible_species.append("Brain Tree Gypseeum")
+                if planet_type in [PlanetType.HMC, PlanetType.ROCKY] and 300 <= mean_temp_k <= 500:
+                    possible_species.append("Brain Tree Lindigoticum")
+                if planet_type == PlanetType.ROCKY and 300 <= mean_temp_k <= 500:
+                    possible_species.append("Brain Tree Lividum")
+                if planet_type in [PlanetType.METAL_RICH, PlanetType.HMC]:
+                    possible_species.extend(["Brain Tree Ostrinum", "Brain Tree Puniceum"])
+                if planet_type == PlanetType.ROCKY_ICE and 100 <= mean_temp_k <= 270:
+                    possible_species.append("Brain Tree Viride")
+
+        # Cactoida
+        if "thin" in atmosphere and planet_type in PT_GROUP_HMC_ROCKY and gravity and gravity <= 0.28:
+            if (
+                    ("carbon" in atmosphere and "rich" not in atmosphere)
+                    or ("rich" in atmosphere and 180 <= mean_temp_k <= 195)
+            ):
+                possible_species.extend(["Cactoida Cortexum", "Cactoida Pullulanta"])
+            if "ammonia" in atmosphere:
+                possible_species.extend(["Cactoida Lapis", "Cactoida Peperatis"])
+            if "water" in atmosphere:
+                possible_species.append("Cactoida Vermis")
+
+        # Clypeus
+        if (planet_type in PT_GROUP_HMC_ROCKY
+                and ("thin" in atmosphere and any(opt in atmosphere for opt in ("water", "carbon")))
+                and mean_temp_k > 190 and gravity and gravity <= 0.27):
+            possible_species.extend(["Clypeus Lacrimam", "Clypeus Margaritus"])
+            if distance_from_star_ls and distance_from_star_ls > 2500:
+                possible_species.append("Clypeus Speculumi")
+
+        # Concha
+        if planet_type in PT_GROUP_HMC_ROCKY and (gravity and gravity <= 0.28) and "thin" in atmosphere:
+            if "ammonia" in atmosphere:
+                possible_species.append("Concha Aureolas")
+            if "nitrogen" in atmosphere:
+                possible_species.append("Concha Biconcavis")
+            if "carbon" in atmosphere:
+                if mean_temp_k < 190:
+                    possible_species.append("Concha Labiata")
+                if 180 <= mean_temp_k <= 195:
+                    possible_species.append("Concha Renibus")
+            if "water" in atmosphere:
+                possible_species.append("Concha Renibus")
+
+        # Crystalline Shard
+        if (atmosphere in STR_LIST_NONE
+                and star_class in [StarClass.A,
+                                   StarClass.F,
+                                   StarClass.G,
+                                   StarClass.K,
+                                   StarClass.M,
+                                   StarClass.S]
+                and (system_has_earth_like
+                     or system_has_ammonia_world
+                     or system_has_water_giant
+                     or system_has_gas_giant_with_water_life
+                     or system_has_gas_giant_with_ammonia_life)
+                and (distance_from_star_ls is None or distance_from_star_ls > 12000)):
+
+            possible_species.append("Crystalline Shard")
+
+        # Electricae
+        if planet_type == PlanetType.ICY and ("thin" in atmosphere and any(opt in atmosphere for opt in ("helium", "neon", "argon"))) and gravity and gravity <= 0.28:
+            if ((star_class == StarClass.A and star_luminosity in [StarLuminosity.V, StarLuminosity.VI, StarLuminosity.VII])
+                    or star_class in [StarClass.O, StarClass.B, StarClass.N, StarClass.BlackHole, *SC_WHITE_DWARFS]):
+                possible_species.append("Electricae Pluma")
+            if in_nebula:
+                possible_species.append("Electricae Radialem")
+
+        # Fonticulua
+        if atmosphere and "thin" in atmosphere and planet_type in PT_GROUP_ICE and gravity and gravity <= 0.28:
+            if "neon" in atmosphere:
+                possible_species.append("Fonticulua Segmentatus")
+            if "methane" in atmosphere:
+                possible_species.append("Fonticulua Digitos")
+            if "argon" in atmosphere:
+                if "rich" in atmosphere:
+                    possible_species.append("Fonticulua Upupam")
+                else:
+                    possible_species.append("Fonticulua Campestris")
+            if "nitrogen" in atmosphere:
+                possible_species.append("Fonticulua Lapida")
+            if "oxygen" in atmosphere:
+                possible_species.append("Fonticulua Fluctus")
+
+        # Frutexa
+        if "thin" in atmosphere:
+            if "ammonia" in atmosphere:
+                if planet_type == PlanetType.ROCKY:
+                    possible_species.extend(["Frutexa Flabellum", "Frutexa Flammasis"])
+                if planet_type == PlanetType.HMC:
+                    possible_species.append("Frutexa Metallicum")
+            if "carbon" in atmosphere and mean_temp_k < 195:
+                if planet_type == PlanetType.ROCKY:
+                    possible_species.extend(["Frutexa Fera", "Frutexa Acus"])
+                if planet_type == PlanetType.HMC:
+                    possible_species.append("Frutexa Metallicum")
+            if "sulfur" in atmosphere:
+                possible_species.append("Frutexa Collum")
+            if "water" in atmosphere and planet_type == PlanetType.ROCKY:
+                possible_species.append("Frutexa Sponsae")
+
+        # Fumerola
+        if volcanism not in STR_LIST_NONE and "thin" in atmosphere and gravity and gravity <= 0.28:
+            if (planet_type in PT_GROUP_ICE
+                    and "water" in volcanism):
+                possible_species.append("Fumerola Aquatis")
+            if (planet_type in PT_GROUP_ICE
+                    and any(opt in volcanism for opt in ("methane", "carbon"))):
+                possible_species.append("Fumerola Carbosis")
+            if (planet_type in PT_GROUP_HMC_ROCKY
+                    and any(opt in volcanism for opt in ("metallic", "rocky", "silicate"))):
+                possible_species.append("Fumerola Extremus")
+            if (planet_type in PT_GROUP_ICE
+                    and any(opt in volcanism for opt in ("nitrogen", "ammonia"))):
+                possible_species.append("Fumerola Nitris")
+
+        # Fungoida
+        if gravity and gravity <= 0.28 and "thin" in atmosphere:
+            if any(opt in atmosphere for opt in ("methane", "ammonia")):
+                possible_species.append("Fungoida Setisis")
+            if "argon" in atmosphere:
+                possible_species.append("Fungoida Bullarum")
+            if ("water" in atmosphere
+                    or ("carbon" in atmosphere and 180 <= mean_temp_k <= 195)):
+                possible_species.extend(["Fungoida Gelata", "Fungoida Stabitis"])
+
+        # Osseus
+        if "thin" in atmosphere and gravity and gravity <= 0.28:
+            if (planet_type == PlanetType.ROCKY_ICE
+                    and any(opt in atmosphere for opt in ("methane", "argon", "nitrogen"))):
+                possible_species.append("Osseus Pumice")
+            if planet_type in PT_GROUP_HMC_ROCKY:
+                if "carbon" in atmosphere:
+                    if 180 <= mean_temp_k <= 195:
+                        possible_species.extend(["Osseus Cornibus", "Osseus Pellebantus"])
+                    if 180 >= mean_temp_k <= 190:
+                        possible_species.append("Osseus Fractus")
+                if "water" in atmosphere:
+                    possible_species.append("Osseus Discus")
+                if "ammonia" in atmosphere:
+                    possible_species.append("Osseus Spiralis")
+
+        # Recepta
+        if "thin sulfur" in atmosphere and gravity and gravity < 0.28:
+            if planet_type in PT_GROUP_ICE:
+                possible_species.append("Recepta Conditivus")
+            if planet_type in PT_GROUP_HMC_ROCKY:
+                possible_species.append("Recepta Deltahedronix")
+            if planet_type in [*PT_GROUP_HMC_ROCKY, *PT_GROUP_ICE]:
+                possible_species.append("Recepta Umbrux")
+
+        # Sinuous Tuber
+        if volcanism not in STR_LIST_NONE and atmosphere in STR_LIST_NONE:
+            if "silicate magma" in volcanism:
+                possible_species.append("Roseum Sinuous Tubers")
+            if planet_type == PlanetType.ROCKY:
+                possible_species.extend(["Albidum Sinuous Tubers", "Caeruleum Sinuous Tubers", "Lindigoticum Sinuous Tubers"])
+            if planet_type in [PlanetType.METAL_RICH, PlanetType.HMC]:
+                possible_species.extend(["Blatteum Sinuous Tubers", "Prasinum Sinuous Tubers", "Violaceum Sinuous Tubers", "Viride Sinuous Tubers"])
+
+        # Stratum
+        if "thin" in atmosphere:
+            if (planet_type == PlanetType.HMC
+                    and mean_temp_k > 165):
+                possible_species.append("Stratum Tectonicas")
+            if planet_type == PlanetType.ROCKY:
+                if "ammonia" in atmosphere and mean_temp_k > 165:
+                    possible_species.extend(["Stratum Paleas", "Stratum Laminamus"])
+                if "water" in atmosphere:
+                    possible_species.append("Stratum Paleas")
+                if "carbon" in atmosphere:
+                    if mean_temp_k > 165:
+                        possible_species.append("Stratum Paleas")
+                    if mean_temp_k > 190:
+                        possible_species.extend(["Stratum Cucumisis", "Stratum Frigus"])
+                    if 165 <= mean_temp_k <= 190:
+                        possible_species.extend(["Stratum Limaxus", "Stratum Excutitus"])
+                if "sulfur" in atmosphere:
+                    if mean_temp_k > 165:
+                        possible_species.append("Stratum Araneamus")
+                    if mean_temp_k > 190:
+                        possible_species.extend(["Stratum Cucumisis", "Stratum Frigus"])
+                    if 165 <= mean_temp_k <= 190:
+                        possible_species.extend(["Stratum Limaxus", "Stratum Excutitus"])
+
+        # Tubus
+        if "thin" in atmosphere and gravity and gravity <= 0.16:
+            if planet_type == PlanetType.HMC and any(opt in atmosphere for opt in ("ammonia", "carbon")):
+                possible_species.append("Tubus Sororibus")
+            if planet_type == PlanetType.ROCKY:
+                if "ammonia" in atmosphere:
+                    possible_species.append("Tubus Rosarium")
+                if "carbon" in atmosphere:
+                    possible_species.append("Tubus Cavas")
+                if "carbon" in atmosphere and 160 <= mean_temp_k <= 190:
+                    possible_species.extend(["Tubus Compagibus", "Tubus Conifer"])
+
+        # Tussock
+        if planet_type in [PlanetType.ROCKY, PlanetType.HMC] and "thin" in atmosphere and gravity and gravity <= 0.28:
+            if "carbon" in atmosphere:
+                if 175 <= mean_temp_k <= 180:
+                    possible_species.append("Tussock Albata")
+                if 180 <= mean_temp_k <= 190:
+                    possible_species.append("Tussock Caputus")
+                if 160 <= mean_temp_k <= 170:
+                    possible_species.append("Tussock Ignis")
+                if 145 <= mean_temp_k <= 155:
+                    possible_species.append("Tussock Pennata")
+                if mean_temp_k < 195:
+                    possible_species.extend(["Tussock Pennatis", "Tussock Propagito"])
+                if 170 <= mean_temp_k <= 175:
+                    possible_species.append("Tussock Serrati")
+                if 190 <= mean_temp_k <= 195:
+                    possible_species.append("Tussock Triticum")
+                if 155 <= mean_temp_k <= 160:
+                    possible_species.append("Tussock Ventusa")
+            if any(opt in atmosphere for opt in ("methane", "argon")):
+                possible_species.append("Tussock Capillum")
+            if "ammonia" in atmosphere:
+                possible_species.extend(["Tussock Catena", "Tussock Cultro", "Tussock Divisa"])
+            if "sulfur" in atmosphere:
+                possible_species.append("Tussock Stigmasis")
+            if "water" in atmosphere:
+                possible_species.append("Tussock Virgam")
+
+    return possible_species
+
+
+if __name__ == "__main__":
+    main()
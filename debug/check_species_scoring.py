@@ -0,0 +1,493 @@
+#!/usr/bin/env python3
+"""
+check_species_scoring.py
+
+Parity check and benchmark of species_scoring against the former calculate_probability with its
+per-genus score_*_variant functions, kept below verbatim.
+
+* parity: every species name the rule tables and mode tables know (plus a few the scorer does not
+  know) against a grid of temperatures, pressures, gravities and planet types - the legacy
+  function, score_species, score_batch in pure Python and score_batch with NumPy (if installed)
+  must agree exactly
+* benchmark: the legacy per-row calls against score_batch on --rows random rows
+
+  python debug/check_species_scoring.py
+  python debug/check_species_scoring.py --rows 500000
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import random
+import sys
+import time
+from typing import Optional
+
+# EDXD.globals parses sys.argv on import - keep the benchmark options away from it
+_ARGV, sys.argv = sys.argv[1:], sys.argv[:1]
+
+from EDXD.data_handler.helper import species_scoring
+from EDXD.data_handler.helper.species_rules import SPECIES_RULES
+from EDXD.data_handler.helper.species_scoring import GENUS_MODES, score_batch, score_species, species_ids
+from EDXD.data_handler.helper.system_params import PlanetType
+
+
+def species_names() -> list[str]:
+    names = {name for rule in SPECIES_RULES for name in rule.species}
+    for keyword, modes in GENUS_MODES.items():
+        names.update(f"{keyword} {key.title()}" for key in modes)
+    # confirmed species come straight from the journal, some have no mode at all
+    names.update({"Bark Mounds", "Crystalline Shards", "Amphora Plant", "Radicoida Unica", "Unknown", ""})
+    return sorted(names)
+
+
+def grid(names: list[str]):
+    temps = [20.0, 95.0, 150.0, 165.0, 172.0, 177.0, 181.0, 188.0, 190.1, 195.0, 250.0, 350.0, 425.0, 1000.0]
+    pressures = [0.0, 0.0005, 0.001, 0.005, 0.02, 0.05, 0.08, 0.1, 1.0]
+    gravities = [0.03, 0.05, 0.09, 0.12, 0.15, 0.2, 0.25, 0.27, 0.4, 1.0]
+    planets = [PlanetType.ROCKY, PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY_ICE, PlanetType.METAL_RICH, PlanetType.WATER_WORLD]
+    return [(name, t, p, g, pt) for name, t, p, g, pt in itertools.product(names, temps, pressures, gravities, planets)]
+
+
+def random_rows(names: list[str], n: int, seed: int):
+    rnd = random.Random(seed)
+    planets = list(PlanetType)
+    return [(rnd.choice(names), rnd.uniform(20, 600), rnd.uniform(0, 0.12), rnd.uniform(0.02, 0.5), rnd.choice(planets))
+            for _ in range(n)]
+
+
+def _legacy(rows):
+    return [legacy_calculate_probability(species_name=name, planet_type=pt, pressure_atm=p, mean_temp_k=t, gravity=g)
+            for name, t, p, g, pt in rows]
+
+
+def _batch(rows, use_numpy: bool):
+    names, temps, pressures, gravities, planets = zip(*rows)
+    return score_batch(species_ids(names), temps, pressures, gravities, planets, use_numpy=use_numpy)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--rows", type=int, default=200_000, help="random rows for the benchmark")
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args(_ARGV)
+
+    names = species_names()
+    rows = grid(names) + random_rows(names, 20_000, args.seed)
+    expected = _legacy(rows)
+    variants = {
+        "score_species": [score_species(name, t, p, g, pt) for name, t, p, g, pt in rows],
+        "score_batch/python": _batch(rows, use_numpy=False),
+    }
+    if species_scoring.np is not None:
+        variants["score_batch/numpy"] = _batch(rows, use_numpy=True)
+    else:
+        print("NumPy not installed - checking the pure Python path only")
+
+    failures = 0
+    for label, actual in variants.items():
+        bad = [(row, e, a) for row, e, a in zip(rows, expected, actual) if e != a]
+        failures += len(bad)
+        print(f"{label:20s}: {len(rows)} rows, {len(bad)} mismatches")
+        for row, e, a in bad[:5]:
+            print(f"    {row}: legacy {e!r}, new {a!r}")
+
+    bench = random_rows(names, args.rows, args.seed + 1)
+    timings = {}
+    t0 = time.perf_counter(); _legacy(bench); timings["legacy per row"] = time.perf_counter() - t0
+    t0 = time.perf_counter(); _batch(bench, use_numpy=False); timings["batch, python"] = time.perf_counter() - t0
+    if species_scoring.np is not None:
+        t0 = time.perf_counter(); _batch(bench, use_numpy=True); timings["batch, numpy"] = time.perf_counter() - t0
+    print(f"{len(bench)} rows")
+    for label, elapsed in timings.items():
+        print(f"  {label:16s}: {elapsed / len(bench) * 1e6:6.2f} us/row  ({timings['legacy per row'] / elapsed:.1f}x)")
+    sys.exit(min(failures, 255))
+
+
+# ---------------------------------------------------------------------------
+# the former scoring, verbatim
+# ---------------------------------------------------------------------------
+def legacy_calculate_probability(
+        species_name: str,
+        planet_type: PlanetType,
+        pressure_atm: float,
+        mean_temp_k: float,
+        gravity: Optional[float] = None,
+) -> float:
+    # Calculates a relative probability score (0.5 to 1.0).
+    # Hard pre-checks already done at this point
+    score = 0.25
+
+    if "Aleoida" in species_name:
+        score += score_aleoida_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
+
+    if "Amphora" in species_name:
+        score += score_amphora_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
+
+    if "Anemone" in species_name:
+        score += score_anemone_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
+
+    if "Bacterium" in species_name:
+        score += score_bacteria_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
+
+    if "Bark" in species_name:
+        score += score_bark_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
+
+    if "Brain" in species_name:
+        score += score_brain_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
+
+    if "Cactoida" in species_name:
+        score += score_cactoida_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
+
+    if "Clypeus" in species_name:
+        score += score_clypeus_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
+
+    if "Concha" in species_name:
+        score += score_concha_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
+
+    if "Crystalline" in species_name:
+        score += score_crystal_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
+
+    if "Electricae" in species_name:
+        score += score_electricae_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
+
+    if "Fonticulua" in species_name:
+        score += score_fonticulua_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
+
+    if "Frutexa" in species_name:
+        score += score_frutexa_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
+
+    if "Fumerola" in species_name:
+        score += score_fumerola_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
+
+    if "Fungoida" in species_name:
+        score += score_fungoida_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
+
+    if "Osseus" in species_name:
+        score += score_osseus_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
+
+    if "Recepta" in species_name:
+        score += score_recepta_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
+
+    if "Sinuous Tubers" in species_name:
+        score += score_sinuous_tubers_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
+
+    if "Stratum" in species_name:
+        score += score_stratum_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
+
+    if "Tubus" in species_name:
+        score += score_tubus_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
+
+    if "Tussock" in species_name:
+        score += score_tussock_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type)
+
+    return min(score, 1.0)
+
+
+def score_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType, modes: dict) -> float:
+    score = 0.0
+    name_lower = species_name.lower()
+
+    # Identify the target mode for this species
+    target = None
+    for key, val in modes.items():
+        if key in name_lower:
+            target = val
+            break
+
+    # Safety fallback if species name is unrecognised
+    if target is None:
+        return 0.0
+
+    target_temp, tolerance_temp, target_press, tolerance_pressure, target_grav, tolerance_gravity, target_planet_type = target
+
+    # Check planet type(s)
+    if planet_type in target_planet_type:
+        score += 0.25
+    else:
+        score += 0.1
+
+    # Check Temperature (Tolerance: ±{tolerance_temp} K)
+    if target_temp is not None:
+        if abs(mean_temp_k - target_temp) <= tolerance_temp:
+            score += 0.16
+
+    # Check Pressure (Tolerance: ±{tolerance_pressure} atm)
+    if target_press is not None:
+        if abs(pressure_atm - target_press) <= tolerance_pressure:
+            score += 0.16
+
+    # Check Gravity (Tolerance: ±{tolerance_gravity} g)
+    if target_grav is not None:
+        if abs(gravity - target_grav) <= tolerance_gravity:
+            score += 0.16
+
+    return score
+
+def score_aleoida_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
+    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
+    modes = {
+        "arcus"     : (177.0, 5.0, 0.024, 0.005,  0.12, 0.05, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "coronamus" : (181.0, 5.0, 0.035, 0.005,  0.17, 0.05, [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "gravis"    : (190.1, 5.0, 0.074, 0.005,  0.21, 0.05, [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY, PlanetType.ROCKY_ICE]),
+        "laminiae"  : (171.0, 5.0, 0.001, 0.0005, 0.14, 0.05, [PlanetType.HMC, PlanetType.ROCKY]),
+        "spica"     : (173.0, 5.0, 0.001, 0.0005, 0.16, 0.05, [PlanetType.HMC, PlanetType.ROCKY])
+    }
+
+    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
+
+def score_amphora_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
+    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
+    modes = {
+        "plant"     : (1090.0, 70.0, None, None,  1.0, 0.9, [PlanetType.HMC, PlanetType.METAL_RICH, PlanetType.ROCKY])
+    }
+
+    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
+
+def score_anemone_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
+    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
+    modes = {
+        "blatteum bioluminescent"   : (1000.0, 500.0, 0.0035,  0.0035,  1.42,   0.66,   [PlanetType.HMC, PlanetType.METAL_RICH, PlanetType.ROCKY]),
+        "croceum"                   : (390.0,  50.0,  0.0035,  0.0035,  0.09,   0.05,   [PlanetType.HMC, PlanetType.ROCKY]),
+        "luteolum"                  : (349.0,  75.0,  0.0035,  0.0035,  0.1,    0.06,   [PlanetType.HMC, PlanetType.ROCKY]),
+        "prasinum bioluminescent"   : (1275.0, 475.0, 0.0035,  0.0035,  0.5665, 0.5295, [PlanetType.HMC, PlanetType.METAL_RICH, PlanetType.ROCKY]),
+        "puniceum"                  : (550.0,  150.0, 0.00075, 0.00075, 2.25,   0.35,   [PlanetType.ICY]),
+        "roseum"                    : (410.0,  30.0,  0.003,   0.003,   0.095,  0.051,  [PlanetType.HMC, PlanetType.ROCKY]),
+        "roseum bioluminescent"     : (970.0,  480.0, 0.0035,  0.0035,  1.305,  0.495,  [PlanetType.HMC, PlanetType.METAL_RICH, PlanetType.ROCKY]),
+        "rubeum bioluminescent"     : (895.0,  245.0, 0.0035,  0.0035,  1.17,   0.38,   [PlanetType.HMC, PlanetType.METAL_RICH, PlanetType.ROCKY])
+    }
+
+    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
+
+def score_bacteria_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
+    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity, PlanetType)
+    modes = {
+        "acies"     : (22.0,    20.0,   0.015,  0.005,  0.4,    0.1,    [PlanetType.ICY]),
+        "alcyoneum" : (168.0,   25.0,   0.001,  0.001,  0.15,   0.05,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "aurasus"   : (177.0,   25.0,   0.1,    0.05,   0.2,    0.01,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "bullaris"  : (95.0,    10.0,   0.045,  0.005,  0.05,   0.005,  [PlanetType.ICY]),
+        "cerbrus"   : (180.0,   30.0,   0.05,   0.005,  0.3,    0.05,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY, PlanetType.ROCKY_ICE]),
+        "informem"  : (75.0,    20.0,   0.01,   0.005,  0.27,   0.05,   [PlanetType.HMC, PlanetType.ICY]),
+        "nebulus"   : (20.0,    15.0,   0.08,   0.03,   0.5,    0.1,    [PlanetType.ICY]),
+        "omentum"   : (30.0,    20.0,   0.005,  0.002,  0.4,    0.1,    [PlanetType.ICY]),
+        "scopulum"  : (30.0,    20.0,   0.005,  0.002,  0.4,    0.1,    [PlanetType.ICY]),
+        "tela"      : (350.0,   50.0,   0.005,  0.002,  0.5,    0.1,    [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "verrata"   : (40.0,    20.0,   0.005,  0.002,  0.5,    0.1,    [PlanetType.ICY]),
+        "vesicula"  : (50.0,    20.0,   0.005,  0.002,  0.2,    0.05,   [PlanetType.HMC, PlanetType.ICY]),
+        "volu"      : (170.0,   25.0,   0.05,   0.005,  0.4,    0.1,    [PlanetType.HMC, PlanetType.ICY])
+    }
+
+    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
+
+def score_bark_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
+    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
+    modes = {
+        "mounds"     : (250.0, 45.0, 69.0, 69.0,  0.168, 0.142, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY])
+    }
+
+    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
+
+def score_brain_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
+    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
+    modes = {
+        "aureum"        : (571.0, 269.0, 0.00185, 0.00185,  0.198,  0.162,  [PlanetType.HMC, PlanetType.ROCKY]),
+        "gypseeum"      : (226.0, 26.0,  0.0035,  0.0035,   0.1,    0.06,   [PlanetType.ROCKY]),
+        "lindigoticum"  : (475.0, 25.0,  0.0004,  0.0004,   0.152,  0.108,  [PlanetType.HMC, PlanetType.ROCKY]),
+        "lividum"       : (503.0, 272.0, 0.0004,  0.0004,   0.084,  0.055,  [PlanetType.HMC, PlanetType.ROCKY]),
+        "ostrinum"      : (685.0, 222.0, 0.0004,  0.0004,   0.7675, 0.7325, [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "puniceum"      : (748.0, 292.0, 0.0004,  0.0004,   0.82,   0.78,   [PlanetType.HMC, PlanetType.ROCKY]),
+        "roseum"        : (392.5, 277.5, 0.0004,  0.0004,   0.201,  0.174,  [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "viride"        : (113.0, 13.0,  0.0004,  0.0004,   0.079,  0.044,  [PlanetType.ROCKY_ICE, PlanetType.ICY])
+    }
+
+    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
+
+def score_cactoida_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
+    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
+    modes = {
+        "cortexum"      : (188.0, 9.0,   0.06,   0.05,   0.2,  0.05, [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "lapis"         : (170.0, 15.0,  0.001,  0.001,  0.15, 0.05, [PlanetType.HMC, PlanetType.ROCKY]),
+        "peperatis"     : (170.0, 10.0,  0.0015, 0.007,  0.27, 0.1,  [PlanetType.HMC, PlanetType.ROCKY]),
+        "pullulanta"    : (188.0, 9.0,   0.06,   0.04,   0.15, 0.12, [PlanetType.HMC, PlanetType.ROCKY]),
+        "vermis"        : (250.0, 200.0, 0.05,   0.05,   0.15, 0.12, [PlanetType.HMC, PlanetType.ROCKY])
+    }
+
+    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
+
+def score_clypeus_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
+    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
+    modes = {
+        "lacrimam"     : (320.0, 130.0, 0.085, 0.015,  0.07,  0.031, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "margaritus"   : (310.0, 120.0, 0.085, 0.015,  0.145, 0.105, [PlanetType.HMC, PlanetType.ICY]),
+        "speculumi"    : (321.0, 131.0, 0.085, 0.015,  0.12,  0.085, [PlanetType.HMC, PlanetType.ROCKY])
+    }
+
+    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
+
+def score_concha_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
+    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
+    modes = {
+        "aureolas"      : (165.0, 20.0, 0.005, 0.007,  0.6,   0.6,  [PlanetType.HMC, PlanetType.ROCKY]),
+        "biconcavis"    : (46.0,  7.0,  0.005, 0.005,  0.15,  0.13, [PlanetType.HMC, PlanetType.ROCKY]),
+        "labiata"       : (175.0, 26.0, 0.007, 0.005,  0.15,  0.13, [PlanetType.ROCKY]),
+        "renibus"       : (188.0, 20.0, 0.07,  0.02,   0.045, 0.02, [PlanetType.HMC, PlanetType.ROCKY])
+    }
+
+    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
+
+def score_crystal_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
+    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
+    modes = {
+        "shards"     : (102.0, 22.0, 0.004, 0.004,  0.1055, 0.0805, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+    }
+
+    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
+
+def score_electricae_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
+    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
+    modes = {
+        "pluma"     : (250.0, 45.0, 0.10,    0.10,    0.168,  0.142,  [PlanetType.ICY]),
+        "radialem"  : (44.5,  15.5, 0.00549, 0.00451, 0.1495, 0.1005, [PlanetType.ICY])
+    }
+
+    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
+
+def score_fonticulua_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
+    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
+    modes = {
+        "campestris"    : (97.0,  47.0, 0.01549,  0.01451,  0.155,  0.105,  [PlanetType.ICY]),
+        "digitos"       : (97.0,  8.0,  0.067,    0.028,    0.0365, 0.0085, [PlanetType.ICY]),
+        "fluctus"       : (150.0, 5.0,  0.035,    0.015,    0.255,  0.015,  [PlanetType.ICY]),
+        "lapida"        : (67.5,  12.5, 0.009495, 0.008505, 0.255,  0.025,  [PlanetType.ICY]),
+        "segmentatus"   : (65.0,  5.0,  0.003,    0.001,    0.27,   0.01,   [PlanetType.ICY]),
+        "upupam"        : (81.0,  11.0, 0.055,    0.035,    0.148,  0.128,  [PlanetType.ICY])
+    }
+
+    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
+
+def score_frutexa_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
+    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
+    modes = {
+        "acus"       : (175.0, 15.0, 0.0255,  0.0245,  0.09,   0.05,   [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "collum"     : (135.0, 5.0,  0.00199, 0.00101, 0.255,  0.025,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "fera"       : (172.0, 18.0, 0.0485,  0.0465,  0.1275, 0.0925, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "flabellum"  : (165.0, 15.0, 0.00274, 0.00176, 0.15,   0.05,   [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "flammasis"  : (166.5, 8.5,  0.00174, 0.00076, 0.16,   0.06,   [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "metallicum" : (170.0, 25.0, 0.00499, 0.00401, 0.205,  0.065,  [PlanetType.HMC, PlanetType.ICY]),
+        "sponsae"    : (425.0, 25.0, 0.084,   0.014,   0.05,   0.005,  [PlanetType.HMC, PlanetType.ROCKY])
+    }
+
+    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
+
+def score_fumerola_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
+    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
+    modes = {
+        "aquatis"   : (80.0, 25.0, 0.013,    0.012,   0.2025, 0.0325, [PlanetType.ICY]),
+        "carbosis"  : (95.0, 20.0, 0.05,     0.049,   0.036,  0.011,  [PlanetType.ICY]),
+        "extremus"  : (91.5, 12.5, 0.04475,  0.03525, 0.0775, 0.0425, [PlanetType.ICY, PlanetType.ROCKY]),
+        "nitris"    : (77.0, 38.0, 0.00505,  0.00405, 0.0469, 0.0211, [PlanetType.ICY])
+    }
+
+    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
+
+def score_fungoida_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
+    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
+    modes = {
+        "bullarum"  : (77.5,  27.5, 0.013,    0.012,    0.25,   0.03,   [PlanetType.ICY, PlanetType.ROCKY_ICE]),
+        "gelata"    : (189.0, 18.0, 0.0655,   0.0335,   0.18,   0.05,   [PlanetType.ICY, PlanetType.ROCKY_ICE, PlanetType.HMC]),
+        "setisis"   : (165.5, 11.5, 0.005075, 0.004075, 0.1925, 0.0825, [PlanetType.ICY, PlanetType.ROCKY, PlanetType.HMC]),
+        "stabitis"  : (185.5, 24.5, 0.0655,   0.0335,   0.175,  0.055,  [PlanetType.ICY, PlanetType.ROCKY, PlanetType.HMC])
+    }
+
+    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
+
+def score_osseus_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
+    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
+    modes = {
+        "cornibus"     : (186.0, 6.0,  0.063,   0.36,    0.2,    0.07,   [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "discus"       : (429.0, 41.0, 0.0825,  0.0165,  0.0465, 0.0125, [PlanetType.HMC, PlanetType.ROCKY]),
+        "fractus"      : (185.0, 5.0,  0.0645,  0.0345,  0.19,   0.06,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "pellebantus"  : (193.0, 3.0,  0.0795,  0.0195,  0.23,   0.04,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "pumice"       : (82.5,  27.5, 0.01325, 0.01225, 0.2425, 0.0325, [PlanetType.ROCKY_ICE, PlanetType.ICY]),
+        "spiralis"     : (168.0, 8.0,  0.0025,  0.0015,  0.2,    0.07,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY])
+    }
+
+    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
+
+def score_recepta_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
+    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
+    modes = {
+        "conditivus"    : (171.0, 39.0, 0.005,    0.004,    0.2325, 0.0425, [PlanetType.HMC, PlanetType.ICY]),
+        "deltahedronix" : (138.0, 6.0,  0.005,    0.004,    0.2425, 0.0325, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "umbrux"        : (166.0, 34.0, 0.004975, 0.004025, 0.2375, 0.0375, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY])
+    }
+
+    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
+
+def score_sinuous_tubers_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
+    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
+    modes = {
+        "albidum"      : (350.0, 150.0, 0.00005,  0.00005,  0.187,  0.143,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "blatteum"     : (350.0, 150.0, 0.0005,   0.0005,   0.172,  0.128,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "caeruleum"    : (350.0, 150.0, 0.00235,  0.00235,  0.186,  0.144,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "lindigoticum" : (350.0, 150.0, None,     None,     0.138,  0.102,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "prasinum"     : (350.0, 150.0, 0.0045,   0.0045,   0.7065, 0.6635, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "roseum"       : (350.0, 150.0, 0.004,    0.004,    0.1865, 0.1435, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "violaceum"    : (350.0, 150.0, 0.0003,   0.0003,   0.16,   0.115,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "viride"       : (350.0, 150.0, 0.000285, 0.000285, 0.16,   0.117,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY])
+    }
+
+    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
+
+def score_stratum_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
+    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
+    modes = {
+        "araneamus"     : (208.5, 43.5, 0.00504,  0.00406,  0.375,  0.065,  [PlanetType.HMC, PlanetType.ROCKY]),
+        "cucumisis"     : (225.0, 35.0, 0.005,    0.005,    0.315,  0.105,  [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "excutitus"     : (177.5, 12.5, 0.02549,  0.02451,  0.25,   0.15,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "frigus"        : (220.0, 30.0, 0.010495, 0.009505, 0.35,   0.15,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "laminamus"     : (220.0, 30.0, 0.007,    0.006,    0.19,   0.09,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "limaxus"       : (177.5, 12.5, 0.025495, 0.024505, 0.265,  0.235,  [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "paleas"        : (176.5, 18.5, 0.0005,   0.0005,   0.16,   0.08,   [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY]),
+        "tectonicas"    : (170.0, 25.0, 0.00455,  0.00455,  0.2475, 0.2025, [PlanetType.HMC, PlanetType.ROCKY, PlanetType.ICY])
+    }
+
+    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
+
+def score_tubus_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
+    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
+    modes = {
+        "cavas"      : (170.0, 10.0, 0.019,   0.016,   0.9,   0.04,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "compagibus" : (170.0, 10.0, 0.0165,  0.0135,  0.095, 0.045, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "conifer"    : (170.0, 10.0, 0.019,   0.016,   0.095, 0.035, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "rosarium"   : (170.0, 10.0, 0.00149, 0.00051, 0.135, 0.015, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "sororibus"  : (170.0, 10.0, 0.0179,  0.0081,  0.115, 0.035, [PlanetType.HMC, PlanetType.ICY])
+    }
+
+    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
+
+def score_tussock_variant(species_name: str, mean_temp_k: float, pressure_atm: float, gravity: float, planet_type: PlanetType) -> float:
+    # Format: (Target_Temp_K, tolerance_temp Target_Pressure_atm, tolerance_pressure, Target_Gravity_g, tolerance_gravity)
+    modes = {
+        "albata"     : (177.5, 2.5,  0.0355,  0.0195,  0.175,  0.075,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "capillum"   : (100.0, 20.0, 0.01299, 0.01201, 0.24,   0.04,   [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY, PlanetType.ROCKY_ICE]),
+        "caputus"    : (183.0, 7.0,  0.065,   0.033,   0.2075, 0.0725, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "catena"     : (166.5, 8.5,  0.00199, 0.00101, 0.199,  0.081,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "cultro"     : (160.0, 20.0, 0.00249, 0.00151, 0.199,  0.081,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "divisa"     : (168.5, 8.5,  0.00249, 0.00151, 0.2,    0.08,   [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "ignis"      : (165.5, 4.5,  0.0149,  0.0121,  0.095,  0.035,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "pennata"    : (151.5, 2.5,  0.0053,  0.0018,  0.057,  0.014,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "pennatis"   : (177.0, 19.0, 0.05035, 0.04765, 0.134,  0.096,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "propagito"  : (176.5, 18.5, 0.02295, 0.02005, 0.1545, 0.1155, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "serrati"    : (172.0, 2.0,  0.025,   0.015,   0.1235, 0.0365, [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "stigmasis"  : (135.0, 3.0,  0.00199, 0.00101, 0.253,  0.023,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "triticum"   : (193.0, 2.0,  0.082,   0.017,   0.235,  0.045,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "ventusa"    : (155.0, 5.0,  0.009,   0.006,   0.07,   0.03,   [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY]),
+        "virgam"     : (425.0, 20.0, 0.0825,  0.0155,  0.053,  0.008,  [PlanetType.HMC, PlanetType.ICY, PlanetType.ROCKY])
+    }
+
+    return score_variant(species_name, mean_temp_k, pressure_atm, gravity, planet_type, modes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+check_system_topology.py
+
+Compare SystemTopology with the former per-estimate helpers of biosign_estimator (kept below):
+parent stars and distance to the parent star of every body of synthetic systems with moons,
+barycentres and stars that are scanned late. The topology is fed body by body in random order,
+like Model does while scanning, and checked after every update.
+
+The former distance walk never returned for a body whose parents are barycentres only (no star
+known yet); those cases are reported separately, the topology answers 0.0 for them.
+
+  python debug/check_system_topology.py --systems 2000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from typing import Dict
+
+# EDXD.globals parses sys.argv on import - keep the benchmark options away from it
+_ARGV, sys.argv = sys.argv[1:], sys.argv[:1]
+
+import EDXD.data_handler.helper.data_helper as dh
+from EDXD.data_handler.helper.biosign_estimator import _safe_get_enum
+from EDXD.data_handler.helper.system_params import StarClass, StarLuminosity
+from EDXD.data_handler.helper.system_topology import Star, SystemTopology
+from EDXD.data_handler.model import Body
+from EDXD.globals import BODY_ID_PREFIX
+
+bip = BODY_ID_PREFIX
+STAR_TYPES = [("K", "Va"), ("M", "V"), ("F", "Vab"), ("B", "III"), ("DA", "VII"), ("M_RedGiant", "III"), ("A", "")]
+
+
+def synthetic_system(rnd: random.Random) -> Dict[str, Body]:
+    bodies: Dict[str, Body] = {}
+    n_stars = rnd.randint(1, 3)
+    for i in range(n_stars):
+        s_type, lum = rnd.choice(STAR_TYPES)
+        bodies[f"{bip}{i}"] = Body(body_id=f"{bip}{i}", body_name=f"Syn {'ABC'[i]}", body_type=s_type, luminosity=lum,
+                                   is_star=True, parents=[{"Null": 99}] if n_stars > 1 else [])
+    next_id = n_stars
+    planets = []
+    for _ in range(rnd.randint(2, 12)):
+        roll = rnd.random()
+        if roll < 0.6:
+            parents = [{"Star": rnd.randrange(n_stars)}, {"Null": 99}]
+        elif roll < 0.8 and planets:
+            host = rnd.choice(planets)
+            parents = [{"Planet": host}] + bodies[f"{bip}{host}"].parents
+        elif roll < 0.9:
+            parents = [{"Null": 98}, {"Null": 99}]      # circumbinary, no star listed
+        else:
+            parents = [{"Star": n_stars + 5}]           # star not scanned (yet)
+        bodies[f"{bip}{next_id}"] = Body(body_id=f"{bip}{next_id}", body_name=f"Syn A {next_id}", body_type="Rocky body",
+                                         parents=parents, parent_distance=rnd.uniform(1e6, 1e9))
+        planets.append(next_id)
+        next_id += 1
+    return bodies
+
+
+# ---------------------------------------------------------------------------
+# the former helpers, verbatim apart from the step limit of the distance walk
+# ---------------------------------------------------------------------------
+class _Hangs(Exception):
+    pass
+
+
+def legacy_get_system_stars(model_bodies: Dict[str, Body]) -> Dict[int, Star]:
+    parent_stars: Dict[int, Star] = {}
+    for body_id in model_bodies:
+        body: Body = model_bodies[body_id]
+        if body.is_star:
+            star_id : int = int(body.body_id.split("_")[1])
+            star_luminosity_enum = None
+            s_type = body.body_type
+            star_class_enum = _safe_get_enum(s_type, StarClass, None)
+            if star_class_enum is None and "_" in s_type:
+                star_class_enum = _safe_get_enum(s_type.split("_")[0], StarClass, None)
+            lum_raw = body.luminosity or body.raw_luminosity
+            if lum_raw:
+                star_luminosity_enum = _safe_get_enum(dh.get_clean_luminosity(lum_raw), StarLuminosity, None)
+
+            parent_star = Star(int(star_id), star_class_enum, star_luminosity_enum)
+            parent_stars[star_id] = parent_star
+
+    return parent_stars
+
+
+def legacy_get_body_parent_stars(body: Body, potential_parent_stars: Dict[int, Star]) -> Dict[int, Star]:
+    body_parent_stars: Dict[int, Star] = {}
+    for parent_item in body.parents:
+        if list(parent_item.keys())[0] == "Star":
+            try:
+                body_parent_stars[list(parent_item.values())[0]] = potential_parent_stars[list(parent_item.values())[0]]
+            except KeyError:
+                pass
+    return body_parent_stars
+
+
+def legacy_get_distance_to_parent_star(model_bodies: Dict[str, Body], body_id: str) -> float:
+    for _ in range(100):
+        try:
+            body : Body = model_bodies[body_id]
+        except KeyError:
+            return 0.0
+
+        if len(body.parents) == 0:
+            return 0.0
+
+        is_last_parent_before_star = (not any("Planet" in parent for parent in body.parents)) and any("Star" in parent for parent in body.parents)
+        if is_last_parent_before_star:
+            return body.parent_distance
+
+        for parent in body.parents:
+            if list(parent)[0] == "Planet":
+                body_id = bip + str(list(parent.values())[0])
+                break
+    raise _Hangs(body_id)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--systems", type=int, default=2_000)
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args(_ARGV)
+
+    rnd = random.Random(args.seed)
+    checks = mismatches = hangs = 0
+    systems = []
+    for _ in range(args.systems):
+        full = synthetic_system(rnd)
+        systems.append(full)
+        order = list(full.values())
+        rnd.shuffle(order)
+        seen: Dict[str, Body] = {}
+        topology = SystemTopology()
+        for body in order:
+            seen[body.body_id] = body
+            topology.update_body(body)
+            stars = legacy_get_system_stars(seen)
+            for body_id, known in seen.items():
+                checks += 1
+                if legacy_get_body_parent_stars(known, stars) != topology.parent_stars(body_id):
+                    mismatches += 1
+                    print(f"parent stars differ: {body_id} {known.parents}")
+                try:
+                    expected = legacy_get_distance_to_parent_star(seen, body_id)
+                except _Hangs:
+                    hangs += 1
+                    expected = 0.0
+                if expected != topology.star_distance(body_id):
+                    mismatches += 1
+                    print(f"star distance differs: {body_id} {known.parents}")
+
+    print(f"{args.systems} systems, {checks} checks, {mismatches} mismatches, {hangs} former endless walks")
+
+    t0 = time.perf_counter()
+    for bodies in systems:
+        stars = legacy_get_system_stars(bodies)
+        for body_id, body in bodies.items():
+            legacy_get_body_parent_stars(body, stars)
+            try:
+                legacy_get_distance_to_parent_star(bodies, body_id)
+            except _Hangs:
+                pass
+    t_legacy = time.perf_counter() - t0
+    topologies = [SystemTopology.from_bodies(bodies.values()) for bodies in systems]
+    t0 = time.perf_counter()
+    for bodies, topology in zip(systems, topologies):
+        for body_id in bodies:
+            topology.parent_stars(body_id)
+            topology.star_distance(body_id)
+    t_topology = time.perf_counter() - t0
+    print(f"  per refresh, former helpers : {t_legacy / args.systems * 1e6:7.1f} us/system")
+    print(f"  per refresh, topology       : {t_topology / args.systems * 1e6:7.1f} us/system  ({t_legacy / t_topology:.1f}x)")
+    sys.exit(min(mismatches, 255))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+check_system_valuation.py
+
+Feed synthetic scans (FSS, DSS mapping, re-reads of unchanged bodies) into SystemValuation in
+random order and compare its running totals against a valuation built from scratch over the
+final bodies after every update. Then write the systems to a scratch cache directory and
+revalue it with appraise_bodies(), serially and on a process pool.
+
+  python debug/check_system_valuation.py --systems 300 --workers 4
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# EDXD.globals parses sys.argv on import - keep the benchmark options away from it
+_ARGV, sys.argv = sys.argv[1:], sys.argv[:1]
+
+import EDXD.data_handler.helper.data_helper as dh
+from EDXD.data_handler.helper.system_valuation import SystemValuation, appraise_bodies
+from EDXD.data_handler.model import Body, BodyPatch
+
+PLANET_CLASSES = ["Rocky body", "High metal content body", "Icy body", "Earthlike body", "Water world",
+                  "Ammonia world", "Sudarsky class I gas giant", "Metal rich body"]
+STAR_TYPES = ["K", "G", "M", "DA", "N", "H"]
+
+
+def scan_event(rnd: random.Random, body_id: int) -> dict:
+    evt = {"event": "Scan", "ScanType": rnd.choice(["AutoScan", "Detailed"]),
+           "WasDiscovered": rnd.random() < 0.7, "WasMapped": rnd.random() < 0.5}
+    if body_id == 0 or rnd.random() < 0.1:
+        evt["StarType"] = rnd.choice(STAR_TYPES)
+    else:
+        evt["PlanetClass"] = rnd.choice(PLANET_CLASSES)
+        evt["MassEM"] = rnd.choice([0, rnd.uniform(0.01, 300)])
+        evt["TerraformState"] = rnd.choice(["", "", "Terraformable"])
+    return evt
+
+
+def synthetic_updates(rnd: random.Random):
+    """(body_id, BodyPatch) in journal order: scans, some mappings, some repeats."""
+    updates = []
+    n = rnd.randint(3, 25)
+    for i in range(n):
+        body_id = f"b_{i}"
+        name = f"Syn {i}" + (" Belt Cluster 1" if rnd.random() < 0.05 else "")
+        updates.append(BodyPatch(body_id, scandata=scan_event(rnd, i), body_name=name,
+                                 is_star=i == 0, first_discovered=rnd.choice([1, 2])))
+    for i in rnd.sample(range(n), rnd.randint(0, n)):
+        updates.append(BodyPatch(f"b_{i}", mapped=True, first_mapped=rnd.choice([1, 2])))
+    for i in rnd.sample(range(n), rnd.randint(0, n)):
+        updates.append(BodyPatch(f"b_{i}"))                      # re-read, nothing changed
+    # mappings only after the scan of the same body
+    scans = {patch.body_id: patch for patch in updates[:n]}
+    rest = updates[n:]
+    rnd.shuffle(rest)
+    order = list(scans.values())
+    rnd.shuffle(order)
+    return order + rest
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--systems", type=int, default=300)
+    ap.add_argument("--workers", type=int, default=4)
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args(_ARGV)
+
+    rnd = random.Random(args.seed)
+    mismatches = updates = 0
+    systems = []
+    for _ in range(args.systems):
+        bodies = {}
+        valuation = SystemValuation()
+        for patch in synthetic_updates(rnd):
+            body = patch.apply_to(bodies.get(patch.body_id) or Body(body_id=patch.body_id))
+            bodies[patch.body_id] = body
+            valuation.update_body(body)
+            updates += 1
+            fresh = SystemValuation()
+            fresh.update_bodies(bodies.values())
+            if fresh.totals != valuation.totals:
+                mismatches += 1
+        systems.append(bodies)
+    print(f"{args.systems} systems, {updates} updates, {mismatches} mismatches against a fresh valuation")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = Path(tmp)
+        for n, bodies in enumerate(systems):
+            for body in bodies.values():
+                body.estimated_value = body.scan_value = 0      # as if the formulas had changed
+            dh.save(cache_dir / f"{n}.json", {"bodies": {body_id: body.to_dict() for body_id, body in bodies.items()}})
+        t0 = time.perf_counter()
+        serial = appraise_bodies(cache_dir, workers=1, write=False)
+        t_serial = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        parallel = appraise_bodies(cache_dir, workers=args.workers, write=False)
+        t_parallel = time.perf_counter() - t0
+        written = appraise_bodies(cache_dir, workers=args.workers, write=True)
+        again = appraise_bodies(cache_dir, workers=args.workers, write=False)
+        print(f"appraise_bodies (systems, revalued, changed) {serial}, {os.cpu_count()} cpu(s)")
+        print(f"  serial     : {t_serial * 1e3:8.1f} ms")
+        print(f"  {args.workers} workers  : {t_parallel * 1e3:8.1f} ms")
+        print(f"  changes left after writing: {again[2]}")
+        if not serial == parallel == written or again[2]:
+            mismatches += 1
+
+    sys.exit(min(mismatches, 255))
+
+
+if __name__ == "__main__":
+    main()